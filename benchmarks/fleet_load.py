@@ -0,0 +1,308 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""Load test the fleet commands against a farm of simulated switches.
+
+Run with `python -m benchmarks.fleet_load`. A `benchmarks.switch_farm` farm of
+500 switches is started, then each command is run against all of them:
+
+- cabling: `canu report network cabling`, once for every `--workers` value
+- firmware: `canu report network firmware`, which collects one switch at a time
+- bgp: the `canu validate network bgp` collector, `get_bgp_neighbors`, on every
+  switch through the fleet runner, once for every `--workers` value. The command
+  itself only checks the two spines it finds through the SLS API.
+- backup: `canu backup network` with an SLS file of the farm, nornir runs it
+  with 10 workers
+
+Each command runs in its own process with an empty CANU cache, so vendors are
+detected again. The farm records when it first and last heard from each
+switch. The report shows the throughput in switches per second and the
+percentiles of the time each switch took.
+
+The farm listens on ports 443 and 22, see `benchmarks.switch_farm`.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from os import path
+
+from tabulate import tabulate
+
+from benchmarks.switch_farm import FarmProcesses, Knobs, farm_arguments, farm_switches, write_farm_files
+
+COMMANDS = ("cabling", "firmware", "bgp", "backup")
+# Commands that take the number of concurrent switches
+CONCURRENT_COMMANDS = ("cabling", "bgp")
+BACKUP_WORKERS = 10
+CSM = "1.2"
+ASN = "65533"
+# Lines of the output shown when a command fails
+LOG_TAIL = 20
+
+
+def percentile(values, fraction):
+    """Return a percentile of a list of values, by the nearest rank.
+
+    Args:
+        values: Sorted list of values
+        fraction: Percentile as a fraction, e.g. 0.99
+
+    Returns:
+        The percentile, None for an empty list
+    """
+    if not values:
+        return None
+    return values[min(len(values) - 1, max(0, round(fraction * len(values)) - 1))]
+
+
+def command_line(command, workers, files, args):
+    """Return the command line of a command.
+
+    Args:
+        command: Name of the command
+        workers: Number of concurrent switches
+        files: Dictionary with the ips, sls, out and folder paths of the run
+        args: Parsed arguments
+
+    Returns:
+        List of arguments
+    """
+    canu = [sys.executable, "-m", "canu.cli"]
+    credentials = ["--username", args.username, "--password", args.password]
+    if command == "cabling":
+        return canu + [
+            "report",
+            "network",
+            "cabling",
+            "--ips-file",
+            files["ips"],
+            "--workers",
+            str(workers),
+            "--json",
+            "--out",
+            files["out"],
+            *credentials,
+        ]
+    if command == "firmware":
+        return canu + [
+            "report",
+            "network",
+            "firmware",
+            "--csm",
+            CSM,
+            "--ips-file",
+            files["ips"],
+            "--json",
+            "--out",
+            files["out"],
+            *credentials,
+        ]
+    if command == "bgp":
+        collector = [sys.executable, "-m", "benchmarks.fleet_load", "--bgp-collector", files["ips"]]
+        return collector + ["--workers", str(workers), *credentials]
+    return canu + ["backup", "network", "--sls-file", files["sls"], "--folder", files["folder"], *credentials]
+
+
+def run_command(farm, command, workers, files, args):
+    """Run a command against the farm and measure it.
+
+    Args:
+        farm: Running FarmProcesses
+        command: Name of the command
+        workers: Number of concurrent switches
+        files: Dictionary with the ips, sls, out and folder paths of the run
+        args: Parsed arguments
+
+    Returns:
+        Dictionary with the results of the run
+    """
+    farm.reset_stats()
+    env = dict(os.environ, CANU_CACHE_DIR=tempfile.mkdtemp(dir=files["folder"]))
+    log_file = path.join(files["folder"], f"{command}-{workers}.log")
+    start = time.time()
+    with open(log_file, "w") as log:
+        try:
+            returncode = subprocess.run(
+                command_line(command, workers, files, args),
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                env=env,
+                timeout=args.command_timeout,
+            ).returncode
+        except subprocess.TimeoutExpired:
+            returncode = "timeout"
+    seconds = time.time() - start
+    if returncode != 0:
+        with open(log_file) as log:
+            tail = log.readlines()[-LOG_TAIL:]
+        print(f"{command} exited with {returncode}:\n{''.join(tail)}", file=sys.stderr)
+
+    stats = farm.stats().values()
+    durations = sorted(stat["last"] - stat["first"] for stat in stats if stat["first"] is not None)
+    return {
+        "command": command,
+        "workers": workers,
+        "returncode": returncode,
+        "seconds": seconds,
+        "switches": len(durations),
+        "requests": sum(stat["requests"] for stat in stats),
+        "failures": sum(stat["failures"] for stat in stats),
+        "switches_per_second": len(durations) / seconds if seconds else 0,
+        "p50": percentile(durations, 0.5),
+        "p95": percentile(durations, 0.95),
+        "p99": percentile(durations, 0.99),
+        "max": durations[-1] if durations else None,
+        "log": log_file,
+    }
+
+
+def results_table(results):
+    """Format the results of the runs.
+
+    Args:
+        results: List of run results
+
+    Returns:
+        Table as a string
+    """
+
+    def seconds(value):
+        return "" if value is None else f"{value:.2f}"
+
+    rows = [
+        [
+            result["command"],
+            result["workers"],
+            result["returncode"],
+            result["switches"],
+            result["requests"],
+            result["failures"],
+            f"{result['seconds']:.1f}",
+            f"{result['switches_per_second']:.1f}",
+            seconds(result["p50"]),
+            seconds(result["p95"]),
+            seconds(result["p99"]),
+            seconds(result["max"]),
+        ]
+        for result in results
+    ]
+    return tabulate(
+        rows,
+        headers=["Command", "Workers", "Exit", "Switches", "Requests", "Failed", "Seconds", "Switch/s", "p50", "p95", "p99", "Max"],
+    )
+
+
+def collect_bgp(ips_file, workers, username, password):
+    """Run the BGP neighbor collector on every switch in a file, like a fleet command would.
+
+    Args:
+        ips_file: File with one switch IP address per line
+        workers: Number of concurrent switches
+        username: Switch username
+        password: Switch password
+
+    Returns:
+        Number of switches that failed
+    """
+    from canu.utils.aruba_session import aruba_session_pool
+    from canu.utils.fleet import run_on_switches
+    from canu.utils.ssh import ssh_connection_pool
+    from canu.validate.network.bgp.bgp import get_bgp_neighbors
+
+    credentials = {"username": username, "password": password}
+    with open(ips_file) as f:
+        ips = [line.strip() for line in f if line.strip()]
+    with aruba_session_pool(), ssh_connection_pool():
+        results, timing = run_on_switches(
+            lambda ip: get_bgp_neighbors(ip, credentials, ASN, "ALL"),
+            ips,
+            workers=workers,
+        )
+    failed = sum(1 for result in results if result.error is not None or result.value[1] is None)
+    print(f"Collected BGP neighbors of {len(ips) - failed} of {len(ips)} switches in {timing.wall_time:.2f}s")
+    return failed
+
+
+def main(argv=None):
+    """Start a switch farm, run the fleet commands against it and print the results.
+
+    Args:
+        argv: Command line arguments
+
+    Returns:
+        Exit code
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.fleet_load", description=__doc__.splitlines()[0])
+    farm_arguments(parser)
+    parser.add_argument("--commands", default=",".join(COMMANDS), help="Comma separated commands to run")
+    parser.add_argument("--workers", default="10,50", help="Comma separated concurrent switches for cabling and bgp")
+    parser.add_argument("--command-timeout", type=int, default=3600, help="Seconds to wait for a command")
+    parser.add_argument("--json", dest="json_file", help="Also write the results to this JSON file")
+    parser.add_argument("--bgp-collector", metavar="IPS_FILE", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.bgp_collector:
+        return 1 if collect_bgp(args.bgp_collector, int(args.workers), args.username, args.password) else 0
+
+    commands = args.commands.split(",")
+    unknown = sorted(set(commands) - set(COMMANDS))
+    if unknown:
+        parser.error(f"Unknown commands {unknown}, choose from {list(COMMANDS)}")
+    worker_counts = [int(workers) for workers in args.workers.split(",")]
+
+    switches = farm_switches(args.switches, args.vendors, args.base_ip, args.down_rate, args.seed)
+    knobs = Knobs(args.latency, args.jitter, args.error_rate)
+    credentials = {"username": args.username, "password": args.password}
+    results = []
+    with tempfile.TemporaryDirectory(prefix="canu-fleet-load-") as folder:
+        ips_file, sls_file = write_farm_files(switches, folder)
+        files = {"ips": ips_file, "sls": sls_file, "out": path.join(folder, "out.json"), "folder": folder}
+        try:
+            with FarmProcesses(switches, knobs, credentials, args.processes, seed=args.seed) as farm:
+                for command in commands:
+                    for workers in worker_counts if command in CONCURRENT_COMMANDS else [None]:
+                        result = run_command(farm, command, workers, files, args)
+                        if result["workers"] is None:
+                            result["workers"] = BACKUP_WORKERS if command == "backup" else 1
+                        result["log"] = path.basename(result["log"])
+                        results.append(result)
+                        print(
+                            f"  {command} with {result['workers']} workers: {result['seconds']:.1f}s, "
+                            f"{result['switches_per_second']:.1f} switches/s",
+                            file=sys.stderr,
+                        )
+        except RuntimeError as err:
+            print(err, file=sys.stderr)
+            return 1
+
+    print(results_table(results))
+    if args.json_file:
+        with open(args.json_file, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
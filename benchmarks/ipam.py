@@ -0,0 +1,162 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""Benchmark the sls_utils IPAM allocator on a /16 with thousands of reservations.
+
+Run with `python -m benchmarks.ipam`. The range allocator is compared with the set
+of every host address that `free_ipv4_addresses` used to build for each query.
+"""
+import ipaddress
+import sys
+import time
+
+from tabulate import tabulate
+
+from canu.utils.sls_utils.ipam import free_ipv4_ranges, free_ipv4_subnets
+from canu.utils.sls_utils.Networks import Network, Subnet
+from canu.utils.sls_utils.Reservations import Reservation
+
+NETWORK = ipaddress.IPv4Network("10.252.0.0/16")
+RESERVATION_COUNTS = (1000, 5000, 20000)
+SUBNET_COUNT = 200
+
+
+def large_subnet(reservation_count):
+    """Return a /16 subnet with reservations spread across it.
+
+    Args:
+        reservation_count: Number of reservations
+
+    Returns:
+        sls_utils.Subnet object
+    """
+    subnet = Subnet("bootstrap_dhcp", str(NETWORK), str(NETWORK[1]), 2)
+    step = (NETWORK.num_addresses - 4) // reservation_count
+    reservations = {}
+    for index in range(reservation_count):
+        address = NETWORK[2 + index * step]
+        reservations[f"node{index}"] = Reservation(f"node{index}", address, [], "")
+    subnet.reservations(reservations)
+    return subnet
+
+
+def large_network():
+    """Return a /16 network with many small subnets.
+
+    Returns:
+        sls_utils.Network object
+    """
+    network = Network("NMN", "ethernet", str(NETWORK))
+    subnets = {}
+    for index, block in enumerate(NETWORK.subnets(new_prefix=24)):
+        if index >= SUBNET_COUNT:
+            break
+        if index % 3:
+            subnets[f"subnet{index}"] = Subnet(f"subnet{index}", str(block), str(block[1]), index)
+    network.subnets(subnets)
+    return network
+
+
+def set_next_free(subnet):
+    """Find the next free address by building the set of every free host address.
+
+    Args:
+        subnet: sls_utils.Subnet object
+
+    Returns:
+        ipaddress.IPv4Address
+    """
+    used = {reservation.ipv4_address() for reservation in subnet.reservations().values()}
+    used.add(subnet.ipv4_gateway())
+    return min(set(subnet.ipv4_network().hosts()) - used)
+
+
+def timed(function, *args):
+    """Return the result of a call and how long it took.
+
+    Args:
+        function: Function to call
+        *args: Arguments of the function
+
+    Returns:
+        (result, seconds) tuple
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Run the IPAM benchmarks and print the results.
+
+    Returns:
+        0 when the allocator and the reference agree
+    """
+    rows = []
+    for reservation_count in RESERVATION_COUNTS:
+        subnet = large_subnet(reservation_count)
+        free_ranges, build = timed(free_ipv4_ranges, subnet)
+        start = time.perf_counter()
+        for reservation in subnet.reservations().values():
+            free_ranges.next_free(reservation.ipv4_address())
+        queries = (time.perf_counter() - start) / reservation_count
+        expected, reference = timed(set_next_free, subnet)
+        next_free = free_ranges.next_free()
+        if next_free != expected:
+            print(
+                f"/16, {reservation_count} reservations: the range allocator returned {next_free} "
+                f"as the next free address, the set of hosts returned {expected}",
+                file=sys.stderr,
+            )
+            return 1
+        rows.append(
+            [
+                f"/16, {reservation_count} reservations",
+                len(free_ranges),
+                f"{build * 1000:.1f} ms",
+                f"{queries * 1000000:.1f} us",
+                f"{reference * 1000:.1f} ms",
+            ],
+        )
+
+    network = large_network()
+    free_subnets, carve = timed(free_ipv4_subnets, network)
+    rows.append(
+        [
+            f"/16, {len(network.subnets())} subnets",
+            len(free_subnets),
+            f"{carve * 1000:.1f} ms",
+            "",
+            "",
+        ],
+    )
+
+    print(
+        tabulate(
+            rows,
+            headers=["Case", "Free ranges", "Build", "next_free", "Set of hosts"],
+        ),
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,450 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""Benchmark how the SHCD, CCJ and SLS stages scale with the size of the system.
+
+Run with `python -m benchmarks.scale`. Each stage runs on synthetic systems that
+are 10, 100 and 1000 copies of the Full Architecture golden config (see
+`benchmarks.synthetic`):
+
+- shcd: `shcd_to_sheets` and `node_model_from_shcd` on the SHCD workbook
+- paddle: loading the CCJ and `node_model_from_paddle`
+- combine: `combine_shcd_cabling` of the SHCD and CCJ node models
+- sls: `parse_sls_for_config` on the SLS dump
+- generate: `generate_switch_config` for every switch in the network, up to
+  sw-*-255 as larger switch numbers don't fit in the VSX system MAC
+
+Every stage runs in a fresh process with the on-disk cache turned off. Its
+inputs are prepared first, then the stage is timed and its peak RSS over the
+RSS it started with is recorded. The results are compared with
+`benchmarks/baseline.json`, and a stage that is slower or uses more memory than
+its baseline by more than the tolerance fails the run. Use `--save-baseline`
+to record new baselines after an intended change. The 1000x systems take a
+while, pick the scales and stages to run with `--scales` and `--stages`.
+"""
+import argparse
+import contextlib
+import gc
+import io
+import json
+import logging
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from os import path
+from pathlib import Path
+
+from tabulate import tabulate
+
+from benchmarks.synthetic import synthetic_ccj, synthetic_shcd, synthetic_sls
+
+STAGES = ("shcd", "paddle", "combine", "sls", "generate")
+SCALES = (10, 100, 1000)
+BASELINE_FILE = path.join(Path(__file__).resolve().parent, "baseline.json")
+BASELINE_VERSION = 1
+ARCHITECTURE = "network_v2"
+CSM = "1.2"
+
+MAX_SWITCH_NUMBER = 255
+
+# Differences smaller than these are noise, whatever the tolerance
+MIN_SECONDS = 0.25
+MIN_MEGABYTES = 5
+
+
+def _factory():
+    from network_modeling.NetworkNodeFactory import NetworkNodeFactory
+
+    return NetworkNodeFactory(architecture_version=ARCHITECTURE)
+
+
+def _shcd_nodes(folder, scale, factory):
+    from canu.validate.shcd.shcd import node_model_from_shcd, shcd_to_sheets
+
+    shcd_file, tabs, corners = synthetic_shcd(folder, scale)
+    nodes, _ = node_model_from_shcd(factory=factory, spreadsheet=shcd_file, sheets=shcd_to_sheets(shcd_file, tabs, corners))
+    return nodes
+
+
+def _paddle_nodes(ccj_file, factory):
+    from canu.validate.paddle.paddle import node_model_from_paddle
+
+    with open(ccj_file) as f:
+        nodes, _ = node_model_from_paddle(factory, json.load(f))
+    return nodes
+
+
+def _sls_networks(folder, scale):
+    with open(synthetic_sls(folder, scale)) as f:
+        return list(json.load(f)["Networks"].values())
+
+
+def setup_shcd(folder, scale):
+    """Prepare the SHCD stage.
+
+    Args:
+        folder: Folder of the synthetic systems
+        scale: Size of the system
+
+    Returns:
+        Function running the stage and returning the number of items processed
+    """
+    synthetic_shcd(folder, scale)
+    factory = _factory()
+    return lambda: len(_shcd_nodes(folder, scale, factory))
+
+
+def setup_paddle(folder, scale):
+    """Prepare the CCJ stage.
+
+    Args:
+        folder: Folder of the synthetic systems
+        scale: Size of the system
+
+    Returns:
+        Function running the stage and returning the number of items processed
+    """
+    ccj_file = synthetic_ccj(folder, scale)
+    factory = _factory()
+    return lambda: len(_paddle_nodes(ccj_file, factory))
+
+
+def setup_combine(folder, scale):
+    """Prepare the SHCD and cabling comparison stage, the CCJ stands in for the cabling found on the network.
+
+    Args:
+        folder: Folder of the synthetic systems
+        scale: Size of the system
+
+    Returns:
+        Function running the stage and returning the number of items processed
+    """
+    from canu.validate.shcd_cabling.shcd_cabling import combine_shcd_cabling
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        shcd_nodes = _shcd_nodes(folder, scale, _factory())
+        cabling_nodes = _paddle_nodes(synthetic_ccj(folder, scale), _factory())
+    return lambda: len(combine_shcd_cabling(shcd_nodes, cabling_nodes, None, [], CSM))
+
+
+def setup_sls(folder, scale):
+    """Prepare the SLS stage.
+
+    Args:
+        folder: Folder of the synthetic systems
+        scale: Size of the system
+
+    Returns:
+        Function running the stage and returning the number of items processed
+    """
+    from canu.utils.sls import parse_sls_for_config
+
+    networks = _sls_networks(folder, scale)
+    return lambda: len(parse_sls_for_config(networks)["NMN_IPs"])
+
+
+def setup_generate(folder, scale):
+    """Prepare the stage generating the config of every switch in the network.
+
+    Args:
+        folder: Folder of the synthetic systems
+        scale: Size of the system
+
+    Returns:
+        Function running the stage and returning the number of items processed
+    """
+    from canu.generate.network.config.config import render_switch_configs
+    from canu.generate.switch.config.config import get_shasta_name
+    from canu.utils.sls import parse_sls_for_config
+    from canu.utils.topology_index import TopologyIndex
+
+    factory = _factory()
+    with contextlib.redirect_stdout(io.StringIO()):
+        nodes = _shcd_nodes(folder, scale, factory)
+    sls_variables = parse_sls_for_config(_sls_networks(folder, scale))
+    # SLS only knows the edge switches of the golden config, as chn-switch-1 and chn-switch-2,
+    # and the VSX system MAC only has room for switch numbers up to 255
+    switch_names = [
+        node.common_name()
+        for node in nodes
+        if get_shasta_name(node.common_name(), factory.lookup_mapper()) in ("sw-cdu", "sw-leaf-bmc", "sw-leaf", "sw-spine")
+        and int(node.common_name().rsplit("-", 1)[-1]) <= MAX_SWITCH_NUMBER
+        or node.common_name() in ("sw-edge-001", "sw-edge-002")
+    ]
+    render_args = (
+        CSM,
+        ARCHITECTURE,
+        nodes,
+        factory,
+        sls_variables,
+        "full",
+        "aruba",
+        None,
+        "Arista",
+        "CHN",
+        "CSM",
+        False,
+        None,
+        False,
+        TopologyIndex(nodes),
+    )
+    return lambda: sum(1 for _ in render_switch_configs(switch_names, render_args))
+
+
+SETUPS = {
+    "shcd": setup_shcd,
+    "paddle": setup_paddle,
+    "combine": setup_combine,
+    "sls": setup_sls,
+    "generate": setup_generate,
+}
+
+
+def _reset_peak():
+    """Reset the peak RSS of the process, this is only possible on Linux.
+
+    Returns:
+        Current RSS in megabytes
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+    return _memory()[0]
+
+
+def _memory():
+    """Return the current and peak RSS of the process.
+
+    Without /proc both are the peak RSS of the whole process.
+
+    Returns:
+        current: RSS in megabytes
+        peak: Peak RSS in megabytes
+    """
+    try:
+        with open("/proc/self/status") as f:
+            status = dict(line.split(":", 1) for line in f if line.startswith(("VmRSS", "VmHWM")))
+        return int(status["VmRSS"].split()[0]) / 1024, int(status["VmHWM"].split()[0]) / 1024
+    except (OSError, KeyError, ValueError):
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+        return peak, peak
+
+
+def run_stage(stage, folder, scale):
+    """Prepare and time one stage, this runs in its own process.
+
+    Args:
+        stage: Name of the stage
+        folder: Folder of the synthetic systems
+        scale: Size of the system
+
+    Returns:
+        Dictionary with the seconds, peak_mb growth and number of items of the stage
+    """
+    os.environ["CANU_CACHE_DIR"] = ""
+    # The golden config makes the node models log warnings for every copy
+    logging.disable(logging.WARNING)
+    run = SETUPS[stage](folder, scale)
+    gc.collect()
+    before = _reset_peak()
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        items = run()
+        seconds = time.perf_counter() - start
+    return {"seconds": seconds, "peak_mb": max(_memory()[1] - before, 0), "items": items}
+
+
+def run_benchmarks(stages, scales, folder):
+    """Run every stage at every scale, each in a fresh process.
+
+    Args:
+        stages: Names of the stages to run
+        scales: Sizes of the systems
+        folder: Folder of the synthetic systems
+
+    Returns:
+        Dictionary of scale to stage to result
+    """
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    for scale in scales:
+        for stage in stages:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                result = executor.submit(run_stage, stage, folder, scale).result()
+            results.setdefault(str(scale), {})[stage] = result
+            print(
+                f"  {stage} at {scale}x: {result['seconds']:.2f}s, {result['peak_mb']:.0f} MB",
+                file=sys.stderr,
+            )
+    return results
+
+
+def load_baseline(baseline_file=BASELINE_FILE):
+    """Load the stored baseline results.
+
+    Args:
+        baseline_file: Path of the baseline file
+
+    Returns:
+        Dictionary of scale to stage to result, empty if there is no baseline
+    """
+    try:
+        with open(baseline_file) as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if baseline.get("version") != BASELINE_VERSION:
+        return {}
+    return baseline["results"]
+
+
+def save_baseline(results, baseline_file=BASELINE_FILE):
+    """Merge results into the stored baseline.
+
+    Args:
+        results: Dictionary of scale to stage to result
+        baseline_file: Path of the baseline file
+    """
+    baseline = load_baseline(baseline_file)
+    for scale, stages in results.items():
+        for stage, result in stages.items():
+            baseline.setdefault(scale, {})[stage] = {
+                "seconds": round(result["seconds"], 3),
+                "peak_mb": round(result["peak_mb"], 1),
+                "items": result["items"],
+            }
+    with open(baseline_file, "w") as f:
+        json.dump({"version": BASELINE_VERSION, "results": baseline}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def regressions(results, baseline, tolerance):
+    """Compare results with the baseline.
+
+    Args:
+        results: Dictionary of scale to stage to result
+        baseline: Dictionary of scale to stage to baseline result
+        tolerance: Allowed fraction over the baseline, e.g. 0.5 for 50%
+
+    Returns:
+        List of messages, one for each stage over its baseline
+    """
+    messages = []
+    for scale, stages in results.items():
+        for stage, result in stages.items():
+            expected = baseline.get(scale, {}).get(stage)
+            if expected is None:
+                continue
+            for key, unit, minimum in (("seconds", "s", MIN_SECONDS), ("peak_mb", " MB", MIN_MEGABYTES)):
+                limit = max(expected[key] * (1 + tolerance), expected[key] + minimum)
+                if result[key] > limit:
+                    messages.append(
+                        f"{stage} at {scale}x: {result[key]:.2f}{unit} is over the baseline {expected[key]:.2f}{unit}",
+                    )
+    return messages
+
+
+def results_table(results, baseline):
+    """Format the results with the baseline and how each stage grew from the previous scale.
+
+    Args:
+        results: Dictionary of scale to stage to result
+        baseline: Dictionary of scale to stage to baseline result
+
+    Returns:
+        Table as a string
+    """
+    rows = []
+    previous = {}
+    for scale in sorted(results, key=int):
+        for stage, result in results[scale].items():
+            expected = baseline.get(scale, {}).get(stage)
+            growth = ""
+            if stage in previous and previous[stage]["seconds"]:
+                growth = f"{result['seconds'] / previous[stage]['seconds']:.1f}x"
+            rows.append(
+                [
+                    stage,
+                    f"{scale}x",
+                    result["items"],
+                    f"{result['seconds']:.3f}",
+                    f"{expected['seconds']:.3f}" if expected else "",
+                    growth,
+                    f"{result['peak_mb']:.1f}",
+                    f"{expected['peak_mb']:.1f}" if expected else "",
+                ],
+            )
+            previous[stage] = result
+    return tabulate(
+        rows,
+        headers=["Stage", "Scale", "Items", "Seconds", "Baseline", "Growth", "Peak MB", "Baseline"],
+    )
+
+
+def main(argv=None):
+    """Run the scaling benchmarks and print the results.
+
+    Args:
+        argv: Command line arguments
+
+    Returns:
+        0 when every stage is within its baseline, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.scale", description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default=",".join(str(scale) for scale in SCALES), help="Comma separated sizes")
+    parser.add_argument("--stages", default=",".join(STAGES), help="Comma separated stages")
+    parser.add_argument("--folder", help="Folder for the synthetic systems, they are reused between runs")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="Baseline file")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed fraction over the baseline")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    stages = args.stages.split(",")
+    unknown = sorted(set(stages) - set(STAGES))
+    if unknown:
+        parser.error(f"Unknown stages {unknown}, choose from {list(STAGES)}")
+    scales = [int(scale) for scale in args.scales.split(",")]
+
+    folder = args.folder or path.join(tempfile.gettempdir(), "canu-benchmarks")
+    results = run_benchmarks(stages, scales, folder)
+    baseline = load_baseline(args.baseline)
+    print(results_table(results, baseline))
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        return 0
+
+    failed = regressions(results, baseline, args.tolerance)
+    for message in failed:
+        print(message, file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
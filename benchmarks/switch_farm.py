@@ -0,0 +1,992 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""Simulated Aruba, Dell and Mellanox switches for load testing the fleet commands.
+
+Every switch listens on its own loopback address (127.1.0.1, 127.1.0.2, ...) and
+serves the HTTPS APIs and the SSH shell CANU uses for its vendor:
+
+- Aruba: the `/rest/v10.04` login, system, LLDP, ARP, firmware and BGP endpoints
+  and an AOS-CX shell
+- Dell: the RESTCONF version and hostname endpoints and an OS10 shell
+- Mellanox: the JSON API and an Onyx shell
+
+The canned responses are the fixtures of the `tests/test_report_*` and
+`tests/test_validate_network_bgp.py` tests, with each switch answering with its
+own hostname and system MAC. Every request and command waits `latency` seconds,
+plus or minus up to `jitter`, and fails with a probability of `error_rate`. A
+failed HTTPS request answers 503 and a failed SSH command closes the session.
+
+CANU always connects to ports 443 and 22, so the farm needs to be able to bind
+them: run it as root, or allow unprivileged ports with
+`sysctl net.ipv4.ip_unprivileged_port_start=22`.
+
+Run `python -m benchmarks.switch_farm` to serve a farm until interrupted, or use
+`benchmarks.fleet_load` to drive the fleet commands against one.
+"""
+import argparse
+import base64
+import datetime
+import http.server
+import ipaddress
+import json
+import logging
+import multiprocessing
+import random
+import re
+import resource
+import selectors
+import socket
+import ssl
+import sys
+import tempfile
+import threading
+import time
+from os import path
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import paramiko
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from tests.test_report_switch_cabling import (
+    arp_neighbors_json,
+    arp_neighbors_mellanox,
+    lldp_json_mellanox,
+    lldp_neighbors_json,
+    mac_address_table,
+    mac_address_table_mellanox,
+    mlag_mellanox,
+    netmiko_commands_dell,
+)
+from tests.test_report_switch_firmware import dell_firmware_mock, netmiko_commands_mellanox
+from tests.test_validate_network_bgp import all_established, all_established_cmn, bgp_status_mellanox
+
+project_root = Path(__file__).resolve().parent.parent
+switch_backups = path.join(project_root, "tests", "data", "switch_backups")
+
+HTTPS_PORT = 443
+SSH_PORT = 22
+BASE_IP = "127.1.0.1"
+VENDORS = ("aruba", "dell", "mellanox")
+ROLES = ("sw-leaf-bmc", "sw-leaf", "sw-cdu")
+ARUBA_API = "/rest/v10.04/"
+MELLANOX_API = "/admin/launch"
+SESSION_COOKIE = "id=canu-switch-farm"
+
+# From test_get_firmware_aruba_function
+aruba_firmware = {
+    "current_version": "Virtual.10.06.0001",
+    "primary_version": "",
+    "secondary_version": "",
+    "default_image": "",
+    "booted_image": "",
+}
+aruba_platform = "X86-64"
+mellanox_platform = "MSN2100"
+
+# Commands of get_lldp_dell, in the order of the netmiko_commands_dell outputs
+dell_commands = (
+    "terminal length 0",
+    "show lldp neighbors detail",
+    "show version",
+    "system hostname",
+    "show ip arp",
+    "show mac address-table",
+)
+# Commands of get_firmware_mellanox, in the order of the netmiko_commands_mellanox outputs
+mellanox_commands = ("show version concise", "show system type", "show hosts | include Hostname")
+backup_commands = {
+    "aruba": "show running-config",
+    "dell": "show running-configuration",
+    "mellanox": "show running-config expanded",
+}
+version_banners = {
+    "aruba": "ArubaOS-CX Virtual.10.06.0001\n",
+    "dell": "Dell EMC Networking OS10 Enterprise\n",
+    "mellanox": "Onyx 3.9.1014\n",
+}
+# Paging and terminal settings sent by netmiko and scrapli
+quiet_commands = ("terminal ", "no page", "no cli session paging", "screen-length")
+
+
+class Knobs:
+    """Latency, jitter and failure rate of the simulated switches."""
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0):
+        """Create the knobs.
+
+        Args:
+            latency: Mean seconds each request and command takes
+            jitter: Up to this many seconds are added to or removed from the latency
+            error_rate: Probability that a request or command fails
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+
+    def as_dict(self):
+        """Return the knobs as a dictionary, to pass them to another process.
+
+        Returns:
+            Dictionary of the knobs
+        """
+        return {"latency": self.latency, "jitter": self.jitter, "error_rate": self.error_rate}
+
+
+class SimulatedSwitch:
+    """The canned responses and statistics of one simulated switch."""
+
+    def __init__(self, ip, hostname, vendor, knobs, credentials, seed=None):
+        """Create a switch.
+
+        Args:
+            ip: IPv4 address of the switch
+            hostname: Hostname of the switch, e.g. 'sw-leaf-001'
+            vendor: 'aruba', 'dell' or 'mellanox'
+            knobs: Knobs of the switch
+            credentials: Dictionary with the username and password the switch accepts
+            seed: Seed of the random latency and failures
+        """
+        self.ip = ip
+        self.hostname = hostname
+        self.vendor = vendor
+        self.knobs = knobs
+        self.credentials = credentials
+        self.random = random.Random(seed)
+        self.system_mac = "02:00:" + ":".join(f"{octet:02x}" for octet in ipaddress.IPv4Address(ip).packed)
+        self.lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Forget the requests seen so far."""
+        with self.lock:
+            self.first = None
+            self.last = None
+            self.requests = 0
+            self.failures = 0
+
+    def stats(self):
+        """Return the statistics of the switch since the last reset.
+
+        Returns:
+            Dictionary with the time of the first and last request, and the number of requests and failures
+        """
+        with self.lock:
+            return {"first": self.first, "last": self.last, "requests": self.requests, "failures": self.failures}
+
+    def _begin(self):
+        """Wait for the latency of a request and decide if it fails.
+
+        Returns:
+            start: Time the request started
+            failed: True if the request should fail
+        """
+        start = time.time()
+        with self.lock:
+            delay = self.knobs.latency + self.random.uniform(-self.knobs.jitter, self.knobs.jitter)
+            failed = self.random.random() < self.knobs.error_rate
+        if delay > 0:
+            time.sleep(delay)
+        return start, failed
+
+    def _end(self, start, failed, window=True):
+        end = time.time()
+        with self.lock:
+            if window:
+                self.first = start if self.first is None else min(self.first, start)
+                self.last = end if self.last is None else max(self.last, end)
+            self.requests += 1
+            self.failures += failed
+
+    def touch(self):
+        """Count the current time as activity, e.g. an SSH login, without counting a request."""
+        now = time.time()
+        with self.lock:
+            self.first = now if self.first is None else min(self.first, now)
+            self.last = now if self.last is None else max(self.last, now)
+
+    def check_password(self, username, password):
+        """Check the credentials of a login.
+
+        Args:
+            username: Username
+            password: Password
+
+        Returns:
+            True if the credentials are accepted
+        """
+        return username == self.credentials["username"] and password == self.credentials["password"]
+
+    def http(self, method, url, headers, body):
+        """Answer an HTTPS request.
+
+        Args:
+            method: HTTP method
+            url: Path and query of the request
+            headers: Request headers
+            body: Request body as bytes
+
+        Returns:
+            status: HTTP status
+            payload: JSON payload, None for an empty body
+            cookie: Cookie to set, or None
+        """
+        parts = urlsplit(url)
+        route = unquote(parts.path)
+        query = parse_qs(parts.query)
+        # Pooled sessions are logged out when the command ends, that isn't part of collecting from the switch
+        logout = route.endswith("/logout") or query.get("action") == ["json-logout"]
+        start, failed = self._begin()
+        try:
+            if failed:
+                return 503, None, None
+            if self.vendor == "aruba" and route.startswith(ARUBA_API):
+                return self._aruba(method, route[len(ARUBA_API) :], query, headers, body)
+            if self.vendor == "dell" and route.startswith("/restconf/data/"):
+                return self._dell(route[len("/restconf/data/") :], headers)
+            if self.vendor == "mellanox" and route == MELLANOX_API:
+                return self._mellanox(method, query.get("action", [""])[0], headers, body)
+            return 404, None, None
+        finally:
+            self._end(start, failed, window=not logout)
+
+    def _aruba(self, method, route, query, headers, body):
+        if route == "login" and method == "POST":
+            form = parse_qs(body.decode())
+            if self.check_password(form.get("username", [""])[0], form.get("password", [""])[0]):
+                return 200, None, SESSION_COOKIE
+            return 401, None, None
+        if route == "logout":
+            return 200, None, None
+        if SESSION_COOKIE not in headers.get("Cookie", ""):
+            return 401, None, None
+
+        if route == "system":
+            system = {"hostname": self.hostname, "platform_name": aruba_platform, "system_mac": self.system_mac}
+            attributes = query.get("attributes", [",".join(system)])[0].split(",")
+            return 200, {key: system[key] for key in attributes if key in system}, None
+        if route == "system/interfaces/*/lldp_neighbors":
+            return 200, lldp_neighbors_json, None
+        if route == "system/vrfs/default/neighbors":
+            return 200, arp_neighbors_json, None
+        if route == "firmware":
+            return 200, aruba_firmware, None
+        bgp = re.fullmatch(r"system/vrfs/(\w+)/bgp_routers/\d+/bgp_neighbors", route)
+        if bgp:
+            return 200, all_established if bgp.group(1) == "default" else all_established_cmn, None
+        return 404, None, None
+
+    def _dell(self, route, headers):
+        scheme, _, encoded = headers.get("Authorization", "").partition(" ")
+        username, _, password = base64.b64decode(encoded or b"").decode().partition(":")
+        if scheme != "Basic" or not self.check_password(username, password):
+            return 401, None, None
+
+        if route == "system-sw-state/sw-version/sw-build-version":
+            version = dell_firmware_mock["dell-system-software:sw-version"]["sw-version"]
+            return 200, {"dell-system-software:sw-build-version": version}, None
+        if route == "system-sw-state/sw-version":
+            return 200, dell_firmware_mock, None
+        if route == "dell-system:system/hostname":
+            return 200, {"dell-system:hostname": self.hostname}, None
+        return 404, None, None
+
+    def _mellanox(self, method, action, headers, body):
+        if action == "json-logout":
+            return 200, None, None
+        if action != "json-login":
+            return 404, None, None
+        request = json.loads(body or b"{}")
+        if method == "GET":
+            return 200, {"status": "OK"}, None
+        if "cmd" not in request:
+            if self.check_password(request.get("username"), request.get("password")):
+                return 200, {"status": "OK", "status_msg": "Successfully logged-in"}, SESSION_COOKIE
+            return 200, {"status": "ERROR", "status_msg": "Invalid username or password"}, None
+        if SESSION_COOKIE not in headers.get("Cookie", ""):
+            return 200, {"status": "ERROR", "status_msg": "Not logged in"}, None
+
+        command = request["cmd"]
+        if command == "show lldp interfaces ethernet remote":
+            return 200, lldp_json_mellanox, None
+        if command == "show interfaces mlag-port-channel summary | include LACP":
+            return 200, mlag_mellanox, None
+        if command == "show mac-address-table":
+            return 200, mac_address_table_mellanox, None
+        if command == "show hosts | include Hostname":
+            return 200, {"status": "OK", "data": [{"Hostname": self.hostname}]}, None
+        if command == "show system type":
+            return 200, {"status": "OK", "data": {"value": [mellanox_platform]}}, None
+        if command == 'show ip arp | exclude "Total number of entries"':
+            return 200, arp_neighbors_mellanox, None
+        if command.startswith("show ip bgp"):
+            return 200, bgp_status_mellanox, None
+        return 200, {"status": "ERROR", "status_message": f"Unrecognized command: {command}", "data": []}, None
+
+    def command(self, command):
+        """Answer a command sent to the SSH shell.
+
+        Args:
+            command: The command
+
+        Returns:
+            Output of the command, None if the session should be closed
+        """
+        start, failed = self._begin()
+        try:
+            if failed:
+                return None
+            return self._command(command.strip())
+        finally:
+            self._end(start, failed)
+
+    def _command(self, command):
+        if not command or command.startswith(quiet_commands):
+            return ""
+        if command == backup_commands[self.vendor]:
+            return running_config(self.vendor, self.hostname)
+        if self.vendor == "aruba":
+            if command == "show mac-address-table":
+                return mac_address_table
+        elif self.vendor == "dell":
+            if command == "system hostname":
+                return self.hostname
+            if command in dell_commands:
+                output = netmiko_commands_dell[dell_commands.index(command)]
+                return version_banners["dell"] + output if command == "show version" else output
+        elif self.vendor == "mellanox":
+            if command == "show hosts | include Hostname":
+                return f"Hostname        : {self.hostname}\n"
+            if command in mellanox_commands:
+                return netmiko_commands_mellanox[mellanox_commands.index(command)]
+        if command == "show version":
+            return version_banners[self.vendor]
+        return f"% Unknown command: {command}\n"
+
+
+_running_configs = {}
+
+
+def running_config(vendor, hostname):
+    """Return the running config of a switch, from the backups used by the tests.
+
+    Args:
+        vendor: Switch vendor
+        hostname: Switch hostname
+
+    Returns:
+        The running config
+    """
+    folder = path.join(switch_backups, "aruba" if vendor == "aruba" else "dellanox")
+    role = hostname.rsplit("-", 1)[0]
+    filename = path.join(folder, f"{role}-001.cfg")
+    if not path.exists(filename):
+        filename = path.join(folder, "sw-leaf-001.cfg")
+    if filename not in _running_configs:
+        _running_configs[filename] = Path(filename).read_text()
+    return _running_configs[filename]
+
+
+class _HttpHandler(http.server.BaseHTTPRequestHandler):
+    """HTTP/1.1 handler answering from the switch the connection was made to."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+    def do_GET(self):  # noqa: N802
+        self._respond("GET")
+
+    def do_POST(self):  # noqa: N802
+        self._respond("POST")
+
+    def _respond(self, method):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, payload, cookie = self.server.http(method, self.path, self.headers, body)
+        data = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if cookie:
+            self.send_header("Set-Cookie", f"{cookie}; Path=/")
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class _SshServer(paramiko.ServerInterface):
+    """Accepts the switch credentials and a single interactive shell."""
+
+    def __init__(self, switch):
+        self.switch = switch
+        self.shell = threading.Event()
+
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_auth_password(self, username, password):
+        self.switch.touch()
+        if self.switch.check_password(username, password):
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def check_channel_request(self, kind, chanid):
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_channel_pty_request(self, channel, term, width, height, pixelwidth, pixelheight, modes):
+        return True
+
+    def check_channel_shell_request(self, channel):
+        self.shell.set()
+        return True
+
+
+def _prompt(switch, mode):
+    if switch.vendor == "mellanox":
+        return f"{switch.hostname} [standalone: master] {'(config) # ' if mode == 'config' else mode + ' '}"
+    return f"{switch.hostname}{'(config)' if mode == 'config' else ''}# "
+
+
+def run_shell(channel, switch):
+    """Run the CLI of a switch on an SSH channel until the client leaves.
+
+    Input is echoed like a terminal, and 'enable', 'configure terminal', 'exit' and
+    'end' change the prompt. Mellanox sessions start unprivileged.
+
+    Args:
+        channel: Paramiko channel of the shell
+        switch: SimulatedSwitch
+    """
+    mode = ">" if switch.vendor == "mellanox" else "#"
+    line = ""
+    previous = ""
+    channel.sendall(f"\r\n{_prompt(switch, mode)}")
+    while True:
+        data = channel.recv(4096)
+        if not data:
+            return
+        echo = []
+        for char in data.decode(errors="replace"):
+            if char == "\n" and previous == "\r":
+                previous = char
+                continue
+            previous = char
+            if char not in "\r\n":
+                line += char
+                echo.append(char)
+                continue
+
+            echo.append("\r\n")
+            channel.sendall("".join(echo))
+            echo = []
+            command, line = line.strip(), ""
+            if command == "enable":
+                mode = "#"
+                output = ""
+            elif command in ("configure terminal", "config terminal", "conf t"):
+                mode = "config"
+                output = ""
+            elif command in ("exit", "end") and mode == "config":
+                mode = "#"
+                output = ""
+            elif command in ("exit", "logout"):
+                return
+            else:
+                output = switch.command(command)
+                if output is None:
+                    return
+            if output:
+                output = output.replace("\r\n", "\n").replace("\n", "\r\n")
+                if not output.endswith("\r\n"):
+                    output += "\r\n"
+            channel.sendall(f"{output}{_prompt(switch, mode)}")
+        if echo:
+            channel.sendall("".join(echo))
+
+
+class SwitchFarm:
+    """Serves a list of simulated switches, one thread accepts connections for all of them."""
+
+    def __init__(self, switches, https_port=HTTPS_PORT, ssh_port=SSH_PORT):
+        """Create the farm.
+
+        Args:
+            switches: List of SimulatedSwitch
+            https_port: Port of the HTTPS APIs
+            ssh_port: Port of the SSH shells
+        """
+        self.switches = switches
+        self.https_port = https_port
+        self.ssh_port = ssh_port
+        self.selector = selectors.DefaultSelector()
+        self.sockets = []
+        self.stopped = threading.Event()
+        self.thread = None
+        self.folder = tempfile.TemporaryDirectory(prefix="canu-switch-farm-")
+        self.ssl_context = self._ssl_context()
+        self.host_key = paramiko.ECDSAKey.generate()
+
+    def _ssl_context(self):
+        key = ec.generate_private_key(ec.SECP256R1())
+        name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "canu-switch-farm")])
+        now = datetime.datetime.now(datetime.timezone.utc)
+        certificate = (
+            x509.CertificateBuilder()
+            .subject_name(name)
+            .issuer_name(name)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - datetime.timedelta(days=1))
+            .not_valid_after(now + datetime.timedelta(days=1))
+            .sign(key, hashes.SHA256())
+        )
+        certificate_file = path.join(self.folder.name, "farm.pem")
+        with open(certificate_file, "wb") as f:
+            f.write(
+                key.private_bytes(
+                    serialization.Encoding.PEM,
+                    serialization.PrivateFormat.PKCS8,
+                    serialization.NoEncryption(),
+                ),
+            )
+            f.write(certificate.public_bytes(serialization.Encoding.PEM))
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(certificate_file)
+        return context
+
+    def start(self):
+        """Listen on the addresses of every switch and start accepting connections.
+
+        Raises:
+            PermissionError: The ports can't be bound, see the module docstring
+        """
+        # Port checks like nornir's tcp_ping connect without talking SSH
+        logging.getLogger("paramiko").setLevel(logging.CRITICAL)
+        # Two listening sockets per switch, plus the connections
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        wanted = 4 * len(self.switches) + 256
+        if soft < wanted:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (min(wanted, hard), hard))
+
+        try:
+            for switch in self.switches:
+                for port, handler in ((self.https_port, self._serve_https), (self.ssh_port, self._serve_ssh)):
+                    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                    listener.bind((switch.ip, port))
+                    listener.listen(128)
+                    listener.setblocking(False)
+                    self.sockets.append(listener)
+                    self.selector.register(listener, selectors.EVENT_READ, (handler, switch))
+        except PermissionError as err:
+            self.stop()
+            raise PermissionError(
+                f"Can't listen on ports {self.https_port} and {self.ssh_port}: {err}. "
+                "Run as root or lower net.ipv4.ip_unprivileged_port_start.",
+            ) from err
+        self.thread = threading.Thread(target=self._accept, name="switch-farm", daemon=True)
+        self.thread.start()
+
+    def _accept(self):
+        while not self.stopped.is_set():
+            for key, _ in self.selector.select(timeout=0.2):
+                handler, switch = key.data
+                try:
+                    connection, _ = key.fileobj.accept()
+                except OSError:
+                    continue
+                connection.setblocking(True)
+                threading.Thread(target=handler, args=(connection, switch), daemon=True).start()
+
+    def _serve_https(self, connection, switch):
+        try:
+            with self.ssl_context.wrap_socket(connection, server_side=True) as tls:
+                _HttpHandler(tls, (switch.ip, self.https_port), switch)
+        except (OSError, ssl.SSLError):
+            connection.close()
+
+    def _serve_ssh(self, connection, switch):
+        transport = paramiko.Transport(connection)
+        transport.add_server_key(self.host_key)
+        server = _SshServer(switch)
+        try:
+            transport.start_server(server=server)
+            channel = transport.accept(timeout=30)
+            if channel is not None and server.shell.wait(timeout=30):
+                run_shell(channel, switch)
+        except (OSError, EOFError, paramiko.SSHException):
+            pass
+        finally:
+            transport.close()
+
+    def stop(self):
+        """Stop accepting connections and close the listening sockets."""
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+        for listener in self.sockets:
+            self.selector.unregister(listener)
+            listener.close()
+        self.sockets = []
+        self.folder.cleanup()
+
+    def reset_stats(self):
+        """Forget the requests seen by every switch."""
+        for switch in self.switches:
+            switch.reset_stats()
+
+    def stats(self):
+        """Return the statistics of every switch.
+
+        Returns:
+            Dictionary of switch IP to its statistics
+        """
+        return {switch.ip: switch.stats() for switch in self.switches}
+
+
+def farm_switches(count, vendors=None, base_ip=BASE_IP, down_rate=0.0, seed=0):
+    """Describe the switches of a farm.
+
+    The first two switches are the spines, the rest are leaf-bmc, leaf and CDU
+    switches in turn. Switches that are down are described but not served.
+
+    Args:
+        count: Number of switches
+        vendors: Dictionary of vendor to its weight, all Aruba by default
+        base_ip: IPv4 address of the first switch
+        down_rate: Fraction of the switches that are down
+        seed: Seed for the vendors and the down switches
+
+    Returns:
+        List of dictionaries with the ip, hostname, vendor and down of each switch
+    """
+    vendors = vendors or {"aruba": 1}
+    chooser = random.Random(seed)
+    numbers = {}
+    address = ipaddress.IPv4Address(base_ip)
+    switches = []
+    for index in range(count):
+        # Avoid network and broadcast looking addresses
+        while address.packed[-1] in (0, 255):
+            address += 1
+        role = "sw-spine" if index < 2 else ROLES[(index - 2) % len(ROLES)]
+        numbers[role] = numbers.get(role, 0) + 1
+        switches.append(
+            {
+                "ip": str(address),
+                "hostname": f"{role}-{numbers[role]:03d}",
+                "vendor": chooser.choices(list(vendors), weights=list(vendors.values()))[0],
+                "down": chooser.random() < down_rate,
+            },
+        )
+        address += 1
+    return switches
+
+
+def farm_sls(switches):
+    """Build an SLS dump with the HMN addresses and brands of the farm switches, for `canu backup network`.
+
+    Args:
+        switches: Switches from `farm_switches`
+
+    Returns:
+        SLS dump with Networks and Hardware
+    """
+    brands = {"aruba": "Aruba", "dell": "Dell", "mellanox": "Mellanox"}
+    reservations = [{"Name": switch["hostname"], "IPAddress": switch["ip"]} for switch in switches]
+    hardware = {}
+    for index, switch in enumerate(switches):
+        xname = f"x3000c0w{index + 1}"
+        hardware[xname] = {
+            "Xname": xname,
+            "Type": "comptype_mgmt_switch",
+            "ExtraProperties": {"Aliases": [switch["hostname"]], "Brand": brands[switch["vendor"]]},
+        }
+    return {
+        "Networks": {
+            "HMN": {
+                "Name": "HMN",
+                "ExtraProperties": {
+                    "CIDR": "127.0.0.0/8",
+                    "Subnets": [
+                        {
+                            "Name": "network_hardware",
+                            "CIDR": "127.0.0.0/8",
+                            "VlanID": 4,
+                            "Gateway": "127.0.0.1",
+                            "IPReservations": reservations,
+                        },
+                    ],
+                },
+            },
+        },
+        "Hardware": hardware,
+    }
+
+
+def _serve_shard(switches, knobs, credentials, https_port, ssh_port, seed, pipe):
+    """Serve some of the switches of a farm in this process, controlled through a pipe.
+
+    Args:
+        switches: Switches from `farm_switches` to serve
+        knobs: Knobs as a dictionary
+        credentials: Dictionary with the username and password the switches accept
+        https_port: Port of the HTTPS APIs
+        ssh_port: Port of the SSH shells
+        seed: Seed of the random latency and failures
+        pipe: Connection receiving 'reset', 'stats' and 'stop'
+    """
+    farm = SwitchFarm(
+        [
+            SimulatedSwitch(switch["ip"], switch["hostname"], switch["vendor"], Knobs(**knobs), credentials, seed + index)
+            for index, switch in enumerate(switches)
+        ],
+        https_port,
+        ssh_port,
+    )
+    try:
+        farm.start()
+    except OSError as err:
+        pipe.send(("error", str(err)))
+        return
+    pipe.send(("ready", None))
+    while True:
+        message = pipe.recv()
+        if message == "reset":
+            farm.reset_stats()
+            pipe.send(("ok", None))
+        elif message == "stats":
+            pipe.send(("ok", farm.stats()))
+        else:
+            farm.stop()
+            pipe.send(("ok", None))
+            return
+
+
+class FarmProcesses:
+    """Runs a farm split over worker processes, so serving it isn't limited to one CPU."""
+
+    def __init__(
+        self,
+        switches,
+        knobs,
+        credentials,
+        processes=1,
+        https_port=HTTPS_PORT,
+        ssh_port=SSH_PORT,
+        seed=0,
+    ):
+        """Describe the farm.
+
+        Args:
+            switches: Switches from `farm_switches`, the ones that are down are not served
+            knobs: Knobs of the switches
+            credentials: Dictionary with the username and password the switches accept
+            processes: Number of processes
+            https_port: Port of the HTTPS APIs
+            ssh_port: Port of the SSH shells
+            seed: Seed of the random latency and failures
+        """
+        up = [switch for switch in switches if not switch["down"]]
+        self.shards = [up[index::processes] for index in range(processes)]
+        self.knobs = knobs
+        self.credentials = credentials
+        self.https_port = https_port
+        self.ssh_port = ssh_port
+        self.seed = seed
+        self.workers = []
+
+    def _ask(self, message):
+        replies = []
+        for _, pipe in self.workers:
+            pipe.send(message)
+        for _, pipe in self.workers:
+            replies.append(pipe.recv()[1])
+        return replies
+
+    def __enter__(self):
+        """Start the processes and wait until every switch is listening.
+
+        Returns:
+            self
+
+        Raises:
+            RuntimeError: A process couldn't serve its switches
+        """
+        context = multiprocessing.get_context("spawn")
+        for index, shard in enumerate(self.shards):
+            pipe, child = context.Pipe()
+            process = context.Process(
+                target=_serve_shard,
+                args=(
+                    shard,
+                    self.knobs.as_dict(),
+                    self.credentials,
+                    self.https_port,
+                    self.ssh_port,
+                    self.seed + index * len(shard),
+                    child,
+                ),
+                daemon=True,
+            )
+            process.start()
+            self.workers.append((process, pipe))
+        errors = []
+        for _, pipe in self.workers:
+            status, error = pipe.recv()
+            if status == "error":
+                errors.append(error)
+        if errors:
+            self.__exit__(None, None, None)
+            raise RuntimeError(errors[0])
+        return self
+
+    def reset_stats(self):
+        """Forget the requests seen by every switch."""
+        self._ask("reset")
+
+    def stats(self):
+        """Return the statistics of every switch.
+
+        Returns:
+            Dictionary of switch IP to its statistics
+        """
+        stats = {}
+        for shard in self._ask("stats"):
+            stats.update(shard)
+        return stats
+
+    def __exit__(self, *exc_info):
+        """Stop every process.
+
+        Args:
+            *exc_info: Exception information
+        """
+        for process, pipe in self.workers:
+            if process.is_alive():
+                try:
+                    pipe.send("stop")
+                    pipe.recv()
+                except (OSError, EOFError):
+                    pass
+            process.join(timeout=5)
+        self.workers = []
+
+
+def parse_vendors(text):
+    """Parse a vendor mix like 'aruba=8,dell=1,mellanox=1'.
+
+    Args:
+        text: Comma separated vendor=weight pairs, a weight of 1 if it is left out
+
+    Returns:
+        Dictionary of vendor to weight
+
+    Raises:
+        ValueError: Unknown vendor
+    """
+    vendors = {}
+    for item in text.split(","):
+        vendor, _, weight = item.partition("=")
+        if vendor not in VENDORS:
+            raise ValueError(f"Unknown vendor {vendor}, choose from {list(VENDORS)}")
+        vendors[vendor] = float(weight or 1)
+    return vendors
+
+
+def farm_arguments(parser):
+    """Add the options describing a farm to an argument parser.
+
+    Args:
+        parser: argparse.ArgumentParser
+    """
+    parser.add_argument("--switches", type=int, default=500, help="Number of switches")
+    parser.add_argument("--vendors", type=parse_vendors, default="aruba", help="Vendor mix, e.g. aruba=8,dell=1,mellanox=1")
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds each request and command takes")
+    parser.add_argument("--jitter", type=float, default=0.01, help="Seconds the latency varies by")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests and commands that fail")
+    parser.add_argument("--down-rate", type=float, default=0.0, help="Fraction of switches that refuse connections")
+    parser.add_argument("--processes", type=int, default=1, help="Processes serving the farm")
+    parser.add_argument("--base-ip", default=BASE_IP, help="IPv4 address of the first switch")
+    parser.add_argument("--username", default="admin", help="Username the switches accept")
+    parser.add_argument("--password", default="admin", help="Password the switches accept")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the vendors, down switches and failures")
+
+
+def write_farm_files(switches, folder):
+    """Write the IP addresses and SLS dump of a farm.
+
+    Args:
+        switches: Switches from `farm_switches`
+        folder: Folder for the files
+
+    Returns:
+        ips_file: File with one switch IP address per line
+        sls_file: SLS dump of the switches
+    """
+    ips_file = path.join(folder, "switch_ips.txt")
+    sls_file = path.join(folder, "sls_file.json")
+    Path(ips_file).write_text("".join(f"{switch['ip']}\n" for switch in switches))
+    Path(sls_file).write_text(json.dumps(farm_sls(switches), indent=2))
+    return ips_file, sls_file
+
+
+def main(argv=None):
+    """Serve a switch farm until interrupted.
+
+    Args:
+        argv: Command line arguments
+
+    Returns:
+        Exit code
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.switch_farm", description=__doc__.splitlines()[0])
+    farm_arguments(parser)
+    parser.add_argument("--https-port", type=int, default=HTTPS_PORT, help="Port of the HTTPS APIs")
+    parser.add_argument("--ssh-port", type=int, default=SSH_PORT, help="Port of the SSH shells")
+    parser.add_argument("--folder", default=".", help="Folder for the switch IP and SLS files")
+    args = parser.parse_args(argv)
+
+    switches = farm_switches(args.switches, args.vendors, args.base_ip, args.down_rate, args.seed)
+    ips_file, sls_file = write_farm_files(switches, args.folder)
+    knobs = Knobs(args.latency, args.jitter, args.error_rate)
+    credentials = {"username": args.username, "password": args.password}
+    try:
+        with FarmProcesses(switches, knobs, credentials, args.processes, args.https_port, args.ssh_port, args.seed):
+            print(f"Serving {len(switches)} switches, IPs in {ips_file}, SLS in {sls_file}", file=sys.stderr)
+            while True:
+                time.sleep(3600)
+    except RuntimeError as err:
+        print(err, file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
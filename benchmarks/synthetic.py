@@ -0,0 +1,290 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""Generate synthetic SHCD workbooks, CCJ files and SLS dumps of large systems.
+
+Each system is the Full Architecture golden config from `tests/data` repeated
+`scale` times. Every copy is a separate pod: its nodes, racks and SLS
+reservations are renumbered, so names never collide and a 1000x system has
+about 11000 switches. Copy 0 keeps the original names, so a 1x system is the
+golden config itself.
+
+Generated files are written to a directory and reused while the source files
+are unchanged.
+"""
+import copy
+import ipaddress
+import json
+import math
+import re
+from os import makedirs, path
+from pathlib import Path
+
+from openpyxl import Workbook, load_workbook
+
+from canu.utils.cache import content_hash, file_hash
+
+project_root = Path(__file__).resolve().parent.parent
+data_folder = path.join(project_root, "tests", "data")
+
+SOURCE_SHCD = path.join(data_folder, "Full_Architecture_Golden_Config_1.1.5.xlsx")
+SOURCE_CCJ = path.join(data_folder, "Full_Architecture_Golden_Config_1.1.5.json")
+SOURCE_SLS = path.join(data_folder, "sls_input_file_csm_1.2.json")
+SOURCE_TABS = {
+    "SWITCH_TO_SWITCH": ("J14", "T44"),
+    "NON_COMPUTE_NODES": ("J14", "T48"),
+    "HARDWARE_MANAGEMENT": ("J14", "T28"),
+    "COMPUTE_NODES": ("J14", "T27"),
+}
+# The golden config table starts in column J and has 11 columns
+FIRST_COLUMN = 10
+NAME_COLUMNS = (0, 6)
+RACK_COLUMNS = (1, 7)
+
+# Node numbers of each copy start at copy * NODE_STRIDE, the golden config has fewer than 10 of each node
+NODE_STRIDE = 10
+# The golden config uses racks x3000 to x3003
+FIRST_RACK = 3000
+RACK_STRIDE = 4
+NODE_PREFIXES = ("sw-", "ncn-", "uan", "cn", "lm", "gateway", "cec", "cmm", "pdu")
+
+NODE_NUMBER = re.compile(r"^(.*?)(\d+)$")
+RACK_NUMBER = re.compile(r"x(\d{4})")
+CABINET_NAME = re.compile(r"^cabinet_(\d+)$")
+
+
+def replica_rack(rack, replica):
+    """Return the rack of a copy of the golden config.
+
+    Args:
+        rack: Rack in the golden config, e.g. 'x3001'
+        replica: Number of the copy
+
+    Returns:
+        Rack of the copy, e.g. 'x3005' for copy 1
+    """
+    if not replica or not isinstance(rack, str):
+        return rack
+    return RACK_NUMBER.sub(lambda match: f"x{int(match.group(1)) + replica * RACK_STRIDE}", rack)
+
+
+def replica_name(name, replica):
+    """Return the name of a node in a copy of the golden config.
+
+    Names that are not nodes, e.g. 'SITE' or 'can-switch-1', are left as they are.
+
+    Args:
+        name: Node name in the golden config, e.g. 'sw-leaf-002' or 'cmm-x3002-001'
+        replica: Number of the copy
+
+    Returns:
+        Node name in the copy, e.g. 'sw-leaf-012' for copy 1
+    """
+    if not replica or not isinstance(name, str) or not name.startswith(NODE_PREFIXES):
+        return name
+    name = replica_rack(name, replica)
+    match = NODE_NUMBER.match(name)
+    if match is None:
+        return name
+    prefix, number = match.groups()
+    return f"{prefix}{replica * NODE_STRIDE + int(number):0{len(number)}d}"
+
+
+def synthetic_folder(folder, scale, *sources):
+    """Return the folder of the generated files, keyed by the scale and the source files.
+
+    Args:
+        folder: Base folder for the generated files
+        scale: Number of copies of the golden config
+        *sources: Source files the generated file depends on
+
+    Returns:
+        Path of the folder
+    """
+    key = content_hash(str(scale), *(file_hash(source) for source in sources), Path(__file__).read_text())
+    directory = path.join(folder, f"{scale}x-{key[:12]}")
+    makedirs(directory, exist_ok=True)
+    return directory
+
+
+def synthetic_shcd(folder, scale):
+    """Write an SHCD workbook with `scale` copies of the golden config cabling.
+
+    Args:
+        folder: Base folder for the generated files
+        scale: Number of copies of the golden config
+
+    Returns:
+        shcd_file: Path of the workbook
+        tabs: Comma separated tabs to read
+        corners: Comma separated corners of each tab
+    """
+    shcd_file = path.join(synthetic_folder(folder, scale, SOURCE_SHCD), "shcd.xlsx")
+    source = load_workbook(SOURCE_SHCD, read_only=True, data_only=True)
+
+    tables = {}
+    for tab, (start, end) in SOURCE_TABS.items():
+        rows = [[cell.value for cell in row] for row in source[tab][f"{start}:{end}"]]
+        tables[tab] = (rows[0], rows[1:])
+    source.close()
+
+    corners = []
+    for _header, rows in tables.values():
+        corners += ["J14", f"T{14 + len(rows) * scale}"]
+
+    if not path.exists(shcd_file):
+        workbook = Workbook(write_only=True)
+        padding = [None] * (FIRST_COLUMN - 1)
+        for tab, (header, rows) in tables.items():
+            sheet = workbook.create_sheet(tab)
+            for _ in range(13):
+                sheet.append([])
+            sheet.append(padding + header)
+            for replica in range(scale):
+                for row in rows:
+                    row = list(row)
+                    for column in NAME_COLUMNS:
+                        row[column] = replica_name(row[column], replica)
+                    for column in RACK_COLUMNS:
+                        row[column] = replica_rack(row[column], replica)
+                    sheet.append(padding + row)
+        workbook.save(f"{shcd_file}.tmp")
+        Path(f"{shcd_file}.tmp").replace(shcd_file)
+
+    return shcd_file, ",".join(tables), ",".join(corners)
+
+
+def synthetic_ccj(folder, scale):
+    """Write a CCJ file with `scale` copies of the golden config topology.
+
+    Args:
+        folder: Base folder for the generated files
+        scale: Number of copies of the golden config
+
+    Returns:
+        Path of the CCJ file
+    """
+    ccj_file = path.join(synthetic_folder(folder, scale, SOURCE_CCJ), "ccj.json")
+    if path.exists(ccj_file):
+        return ccj_file
+
+    with open(SOURCE_CCJ) as f:
+        ccj = json.load(f)
+    nodes = ccj.pop("topology")
+    node_count = len(nodes)
+
+    topology = []
+    for replica in range(scale):
+        for node in nodes:
+            node = copy.deepcopy(node)
+            node["common_name"] = replica_name(node["common_name"], replica)
+            node["id"] += replica * node_count
+            if node.get("location"):
+                node["location"]["rack"] = replica_rack(node["location"]["rack"], replica)
+            for port in node["ports"]:
+                port["destination_node_id"] += replica * node_count
+            topology.append(node)
+    ccj["topology"] = topology
+
+    with open(f"{ccj_file}.tmp", "w") as f:
+        json.dump(ccj, f)
+    Path(f"{ccj_file}.tmp").replace(ccj_file)
+    return ccj_file
+
+
+def _replicate_subnet(subnet, scale):
+    """Add the reservations of every copy of the nodes to a subnet, widening it to fit.
+
+    Args:
+        subnet: SLS subnet
+        scale: Number of copies of the golden config
+
+    Returns:
+        The widened subnet CIDR
+    """
+    cidr = ipaddress.IPv4Network(subnet["CIDR"], strict=False)
+    reservations = subnet.get("IPReservations") or []
+    nodes = [reservation for reservation in reservations if replica_name(reservation["Name"], 1) != reservation["Name"]]
+    if not nodes or scale == 1:
+        return cidr
+
+    base = int(cidr.network_address)
+    offsets = [int(ipaddress.IPv4Address(reservation["IPAddress"])) - base for reservation in nodes]
+    # Each copy gets its own block of addresses laid out like the golden config
+    block = 2 ** math.ceil(math.log2(max(offsets) + 1))
+    for replica in range(1, scale):
+        for index, reservation in enumerate(nodes):
+            offset = offsets[index]
+            reservation = copy.deepcopy(reservation)
+            reservation["Name"] = replica_name(reservation["Name"], replica)
+            reservation["IPAddress"] = str(ipaddress.IPv4Address(base + replica * block + offset))
+            reservation.pop("IPAddress6", None)
+            reservations.append(reservation)
+
+    prefix = min(cidr.prefixlen, 32 - math.ceil(math.log2(block * scale)))
+    cidr = ipaddress.IPv4Network((cidr.network_address, prefix), strict=False)
+    subnet["CIDR"] = str(cidr)
+    return cidr
+
+
+def synthetic_sls(folder, scale):
+    """Write an SLS dump with reservations for `scale` copies of the golden config nodes.
+
+    Subnets and networks are widened to hold the extra reservations, so at the
+    larger scales they overlap each other. That doesn't matter to config
+    generation, which reads the reservations of each network on its own.
+
+    Args:
+        folder: Base folder for the generated files
+        scale: Number of copies of the golden config
+
+    Returns:
+        Path of the SLS file
+    """
+    sls_file = path.join(synthetic_folder(folder, scale, SOURCE_SLS), "sls.json")
+    if path.exists(sls_file):
+        return sls_file
+
+    with open(SOURCE_SLS) as f:
+        sls = json.load(f)
+
+    for network in sls["Networks"].values():
+        properties = network.get("ExtraProperties") or {}
+        widest = ipaddress.IPv4Network(properties["CIDR"], strict=False) if properties.get("CIDR") else None
+        subnets = properties.get("Subnets") or []
+        for subnet in subnets:
+            cidr = _replicate_subnet(subnet, scale)
+            if widest is not None and cidr.prefixlen < widest.prefixlen:
+                widest = cidr
+                properties["CIDR"] = str(widest)
+        # Mountain cabinets have a subnet each, named after their rack
+        cabinets = [subnet for subnet in subnets if CABINET_NAME.match(subnet["Name"])]
+        for replica in range(1, scale):
+            for cabinet in cabinets:
+                cabinet = copy.deepcopy(cabinet)
+                rack = int(CABINET_NAME.match(cabinet["Name"]).group(1)) + replica * RACK_STRIDE
+                cabinet["Name"] = f"cabinet_{rack}"
+                subnets.append(cabinet)
+
+    with open(f"{sls_file}.tmp", "w") as f:
+        json.dump(sls, f)
+    Path(f"{sls_file}.tmp").replace(sls_file)
+    return sls_file
@@ -59,6 +59,11 @@ will faciliate paddling through network topology plumbing.
 
 cp -pv pyinstaller.py pyinstaller.spec
 
+# Precompile the switch templates so the binary does not compile them on every run.
+# Use the Jinja version pinned in pyproject.toml, the binary only loads bytecode of its own Jinja.
+%python_exec -m pip install jinja2==3.1.6
+%python_exec -m canu.utils.templates
+
 %install
 %python_exec -m pip install dist/*.whl
 
@@ -22,16 +22,15 @@
 """CANU backup commands."""
 import click
 
-from canu.backup.network import network
 from canu.style import Style
 
 
 @click.group(
-    cls=Style.CanuHelpColorsGroup,
+    cls=Style.CanuLazyHelpColorsGroup,
+    lazy_subcommands={
+        "network": "canu.backup.network.network:network",
+    },
 )
 @click.pass_context
 def backup(ctx):
     """Canu backup commands."""
-
-
-backup.add_command(network.network)
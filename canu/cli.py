@@ -32,13 +32,10 @@ import requests
 import urllib3
 from ruamel.yaml import YAML
 
-from canu.backup import backup
-from canu.config import config
-from canu.generate import generate
-from canu.report import report
 from canu.style import Style
-from canu.test import test
-from canu.validate import validate
+from canu.utils.aruba_session import aruba_session_pool
+from canu.utils.ssh import ssh_connection_pool
+from canu.utils.trace import profiling
 
 yaml = YAML()
 
@@ -64,23 +61,52 @@ CONTEXT_SETTING = {
 }
 
 
+# Command groups are imported when they are used, so `canu --help` and offline
+# commands don't pay for netmiko, nornir, openpyxl, jinja2 and kubernetes.
 @click.group(
     context_settings=CONTEXT_SETTING,
-    cls=Style.CanuHelpColorsGroup,
+    cls=Style.CanuLazyHelpColorsGroup,
+    lazy_subcommands={
+        "backup": "canu.backup.backup:backup",
+        "config": "canu.config.config:config",
+        "generate": "canu.generate.generate:generate",
+        "report": "canu.report.report:report",
+        "validate": "canu.validate.validate:validate",
+        "test": "canu.test.test:test",
+    },
+    lazy_short_help={
+        "test": "Run tests against the network.",
+    },
 )
 @click.version_option(version)
+@click.option(
+    "--profile",
+    "profile_",
+    help="Time each phase of the command, write a Chrome trace to PATH and print a summary",
+    type=click.Path(dir_okay=False, writable=True),
+    metavar="PATH",
+)
 @click.pass_context
-def cli(ctx):
-    """CANU (CSM Automatic Network Utility) floats through a Shasta network and makes setup and config breeze."""
-    ctx.ensure_object(dict)
+def cli(ctx, profile_):
+    """CANU (CSM Automatic Network Utility) floats through a Shasta network and makes setup and config breeze.
 
+    Use '--profile PATH' before a command to see where its time goes, for example
+    'canu --profile trace.json report network cabling ...'. The trace opens in chrome://tracing or Perfetto.
 
-cli.add_command(backup.backup)
-cli.add_command(config.config)
-cli.add_command(generate.generate)
-cli.add_command(report.report)
-cli.add_command(validate.validate)
-cli.add_command(test.test)
+    \f
+    # noqa: D301
+
+    Args:
+        ctx: CANU context settings
+        profile_: Path of the Chrome trace-event JSON file, profiling is off when None
+    """
+    ctx.ensure_object(dict)
+    if profile_:
+        # Entered first so the spans of closing the pooled sessions are recorded too
+        ctx.with_resource(profiling(profile_))
+    # Share one Aruba REST login and one SSH connection per switch across the whole command
+    ctx.with_resource(aruba_session_pool())
+    ctx.with_resource(ssh_connection_pool())
 
 
 @cli.command(
@@ -22,18 +22,16 @@
 """CANU config commands."""
 import click
 
-from canu.config.network import network
-from canu.config.pvlan import pvlan
 from canu.style import Style
 
 
 @click.group(
-    cls=Style.CanuHelpColorsGroup,
+    cls=Style.CanuLazyHelpColorsGroup,
+    lazy_subcommands={
+        "network": "canu.config.network.network:network",
+        "pvlan": "canu.config.pvlan.pvlan:pvlan",
+    },
 )
 @click.pass_context
 def config(ctx):
     """Canu config commands."""
-
-
-config.add_command(network.network)
-config.add_command(pvlan.pvlan)
@@ -28,7 +28,6 @@ from datetime import datetime
 import click
 import click_spinner
 import urllib3
-from jinja2 import Environment, FileSystemLoader, StrictUndefined
 from nornir import InitNornir
 from nornir.core.filter import F
 from nornir_salt.plugins.functions import ResultSerializer
@@ -36,11 +35,9 @@ from nornir_salt.plugins.tasks import tcp_ping
 from nornir_scrapli.tasks import send_config
 
 from canu.backup.network.network import backup_switches
-from canu.generate.switch.config.config import parse_sls_for_config
 from canu.utils.inventory import inventory
-
-import sys
-from pathlib import Path
+from canu.utils.sls import sls_model
+from canu.utils.templates import template_environment
 
 # Define the network configuration profiles and their corresponding templates
 PROFILES = {
@@ -260,21 +257,10 @@ def network(
         sls_file.seek(0)
         input_json = json.load(sls_file)
         sls_json = [network[x] for network in [input_json.get("Networks", {})] for x in network]
-        sls_variables = parse_sls_for_config(sls_json)
-
-        # Get project root directory
-        if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):  # pragma: no cover
-            project_root = sys._MEIPASS
-        else:
-            project_root = Path(__file__).resolve().parent.parent.parent.parent
-
-        network_templates_folder = f"{project_root}/network_modeling/configs/templates"
+        sls_variables = sls_model(sls_json).config_variables
 
         # Initialize Jinja2 environment
-        env = Environment(
-            loader=FileSystemLoader(network_templates_folder),
-            undefined=StrictUndefined,
-        )
+        env = template_environment("unescaped")
 
         # Generate configuration for each host
         configs_to_apply = {}
@@ -32,10 +32,12 @@ from nornir_salt.plugins.functions import ResultSerializer
 from nornir_salt.plugins.tasks import tcp_ping
 from nornir_scrapli.tasks import send_command, send_config
 
-from canu.generate.switch.config.config import generate_switch_config, parse_sls_for_config
+from canu.generate.switch.config.config import generate_switch_config
 from canu.validate.paddle.paddle import node_model_from_paddle
 from network_modeling.NetworkNodeFactory import NetworkNodeFactory
 from canu.utils.inventory import inventory
+from canu.utils.sls import sls_model
+from canu.utils.topology_index import TopologyIndex
 from canu.backup.network.network import backup_switches
 
 
@@ -535,7 +537,7 @@ def pvlan(
             sls_file.seek(0)  # Reset file pointer
             input_json = json.load(sls_file)
             sls_json = [network[x] for network in [input_json.get("Networks", {})] for x in network]
-            sls_variables = parse_sls_for_config(sls_json)
+            sls_variables = sls_model(sls_json).config_variables
         except (json.JSONDecodeError, UnicodeDecodeError):
             click.secho(f"Invalid SLS JSON format", fg="red")
             return
@@ -557,6 +559,7 @@ def pvlan(
                     if node_name not in switch_names:
                         switch_names.append(node_name)
 
+        topology = TopologyIndex(network_node_list)
         for switch_name in switch_names:
             if any(x in switch_name.lower() for x in ["edge", "cdu"]):
                 continue  # Skip edge and CDU switches
@@ -585,6 +588,7 @@ def pvlan(
                     bond_app_nodes=False,
                     enable_nmn_isolation=True,
                     nmn_pvlan=private_vlan,  # This enables private VLAN in templates
+                    topology=topology,
                 )
 
                 # Extract only private VLAN related configuration from the generated config
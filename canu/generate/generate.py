@@ -22,18 +22,16 @@
 """CANU generate commands."""
 import click
 
-from canu.generate.network import network
-from canu.generate.switch import switch
 from canu.style import Style
 
 
 @click.group(
-    cls=Style.CanuHelpColorsGroup,
+    cls=Style.CanuLazyHelpColorsGroup,
+    lazy_subcommands={
+        "network": "canu.generate.network.network:network",
+        "switch": "canu.generate.switch.switch:switch",
+    },
 )
 @click.pass_context
 def generate(ctx):
     """Canu generate commands."""
-
-
-generate.add_command(network.network)
-generate.add_command(switch.switch)
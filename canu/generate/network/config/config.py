@@ -23,6 +23,8 @@
 import json
 import logging
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from importlib import metadata
 from os import environ, makedirs, path
 from pathlib import Path
 
@@ -33,8 +35,17 @@ from click_option_group import RequiredMutuallyExclusiveOptionGroup, optgroup
 from jinja2 import Environment, FileSystemLoader, StrictUndefined
 from ruamel.yaml import YAML
 
-from canu.generate.switch.config.config import generate_switch_config, get_shasta_name, parse_sls_for_config
+from canu.generate.switch.config.config import (
+    generate_switch_config,
+    get_shasta_name,
+    switch_is_primary,
+)
 from canu.style import Style
+from canu.utils.cache import content_hash, file_hash, load_json_cache, save_json_cache
+from canu.utils.sls import sls_model
+from canu.utils.topology_index import TopologyIndex
+from canu.utils.trace import process_map
+from canu.utils.yaml_load import load_yaml
 from canu.validate.paddle.paddle import node_model_from_paddle
 from canu.validate.shcd.shcd import node_model_from_shcd, shcd_to_sheets
 from network_modeling.NetworkNodeFactory import NetworkNodeFactory
@@ -57,6 +68,10 @@ canu_config_file = path.join(project_root, "canu", "canu.yaml")
 
 log = logging.getLogger("generate_network_config")
 
+# Input fingerprints of the generated configs, kept next to them so a rerun skips unchanged switches
+MANIFEST_FILE = ".canu_manifest.json"
+MANIFEST_VERSION = 1
+
 # Import templates
 network_templates_folder = path.join(
     project_root,
@@ -191,6 +206,19 @@ csm_options = canu_config["csm_versions"]
     type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR"]),
     default="ERROR",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    help="Number of switch configs to render in parallel processes",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Regenerate every switch config, including the ones whose inputs have not changed",
+)
 @click.pass_context
 def config(
     ctx,
@@ -212,6 +240,8 @@ def config(
     enable_nmn_isolation,
     log_,
     nmn_pvlan,
+    jobs,
+    force,
 ):
     """Generate the config of all switches (Aruba, Dell, or Mellanox) on the network using the SHCD.
 
@@ -251,6 +281,11 @@ def config(
 
     Use the '--folder FOLDERNAME' flag to output all the switch configs to a folder.
 
+    Use the '--jobs N' flag to render N switch configs at a time in separate processes, the generated files are identical to a serial run.
+
+    A manifest of the inputs of each switch config is kept in the folder, a rerun only regenerates the switches whose
+    SHCD / CCJ connections, SLS data, templates, custom config or flags changed. Use the '--force' flag to regenerate every switch.
+
     ----------
     \f
     # noqa: D301, B950
@@ -275,6 +310,8 @@ def config(
         log_: Level of logging.
         nmn_pvlan: VLAN ID used for Isolated NMN PVLAN
         enable_nmn_isolation: Enable/disable NMN isolation.
+        jobs: Number of switch configs to render in parallel processes
+        force: Regenerate every switch config
 
     Raises:
         ClickException: If --enable-nmn-isolation is used without --nmn-pvlan, or if --nmn-pvlan is used without --enable-nmn-isolation.
@@ -405,7 +442,7 @@ def config(
                 fg="white",
                 bg="red",
             )
-    sls_variables = parse_sls_for_config(sls_json)
+    sls_variables = sls_model(sls_json).config_variables
 
     # make folder
     if not path.exists(folder):
@@ -423,8 +460,7 @@ def config(
         "worker",
         "edge",
     }
-    config_devices = set()
-    all_unknown = []
+    switch_names = []
     for node in network_node_list:
         switch_name = node.common_name()
         node_shasta_name = get_shasta_name(switch_name, factory.lookup_mapper())
@@ -440,34 +476,73 @@ def config(
             or node_shasta_name == "sw-edge"
             and float(csm) >= 1.2
         ):
-            switch_config, devices, unknown = generate_switch_config(
-                csm,
-                architecture,
-                network_node_list,
-                factory,
-                switch_name,
-                sls_variables,
-                template_folder,
-                vendor_folder,
-                custom_config,
-                edge,
-                bgp_control_plane,
-                vrf,
-                bond_app_nodes,
-                nmn_pvlan,
-                enable_nmn_isolation,
+            switch_names.append(switch_name)
+
+    render_args = (
+        csm,
+        architecture,
+        network_node_list,
+        factory,
+        sls_variables,
+        template_folder,
+        vendor_folder,
+        custom_config,
+        edge,
+        bgp_control_plane,
+        vrf,
+        bond_app_nodes,
+        nmn_pvlan,
+        enable_nmn_isolation,
+        TopologyIndex(network_node_list),
+    )
+
+    # Skip the switches whose inputs and generated config are unchanged since the last run
+    manifest_file = path.join(folder, MANIFEST_FILE)
+    fingerprints = config_fingerprints(switch_names, render_args)
+    manifest = {} if force else load_json_cache(manifest_file, MANIFEST_VERSION) or {}
+    unchanged = {
+        switch_name
+        for switch_name in switch_names
+        if config_unchanged(folder, switch_name, fingerprints[switch_name], manifest.get(switch_name))
+    }
+    rendered = render_switch_configs([name for name in switch_names if name not in unchanged], render_args, jobs)
+
+    # Results come back in switch order so the merged devices and unknown list match a serial run
+    config_devices = set()
+    all_unknown = []
+    new_manifest = {}
+    for switch_name in switch_names:
+        if switch_name in unchanged:
+            new_manifest[switch_name] = manifest[switch_name]
+            all_unknown.extend(manifest[switch_name]["unknown"])
+            config_devices.update(manifest[switch_name]["devices"])
+            click.secho(f"{switch_name} Config Unchanged", fg="bright_white")
+            continue
+
+        _, (switch_config, devices, unknown) = next(rendered)
+        all_unknown.extend(unknown)
+        config_devices.update(devices)
+        with open(f"{folder}/{switch_name}.cfg", "w+") as f:
+            f.write(switch_config)
+        new_manifest[switch_name] = {
+            "fingerprint": fingerprints[switch_name],
+            "config": content_hash(switch_config),
+            "devices": sorted(devices),
+            "unknown": unknown,
+        }
+        if "# Custom configurations" in switch_config:
+            click.secho(
+                f"{switch_name} Customized Configurations have been detected in the generated switch configurations",
+                fg="yellow",
             )
-            all_unknown.extend(unknown)
-            config_devices.update(devices)
-            with open(f"{folder}/{switch_name}.cfg", "w+") as f:
-                f.write(switch_config)
-            if "# Custom configurations" in switch_config:
-                click.secho(
-                    f"{switch_name} Customized Configurations have been detected in the generated switch configurations",
-                    fg="yellow",
-                )
-            else:
-                click.secho(f"{switch_name} Config Generated", fg="bright_white")
+        else:
+            click.secho(f"{switch_name} Config Generated", fg="bright_white")
+    save_json_cache(manifest_file, MANIFEST_VERSION, new_manifest)
+    if unchanged:
+        click.secho(
+            f"Skipped {len(unchanged)} of {len(switch_names)} unchanged switch configs, use --force to regenerate them.",
+            fg="bright_white",
+        )
     missing_devices = all_devices.difference(config_devices)
     dash = "-" * 60
     if len(missing_devices) > 0:
@@ -501,3 +576,163 @@ def config(
         click.secho(dash)
         for x in all_unknown:
             click.secho(x, fg="bright_white")
+
+
+def config_fingerprints(switch_names, render_args):
+    """Return a fingerprint of the inputs of each switch config.
+
+    A fingerprint covers the CANU version, the flags, the model definitions, the parsed SLS
+    data, the templates of the CSM version and the custom config of the switch. It also covers the
+    connections of the switch, its pair and their neighbors, by name so that node ids shifting
+    after an unrelated SHCD change do not count as a change. The whole SLS data is included as
+    every template receives the full IP reservation tables.
+
+    Args:
+        switch_names: List of switch names
+        render_args: Tuple of the generate_switch_config arguments that are the same for every switch
+
+    Returns:
+        Dictionary of switch name to fingerprint
+    """
+    (
+        csm,
+        architecture,
+        network_node_list,
+        factory,
+        sls_variables,
+        template_folder,
+        vendor_folder,
+        custom_config,
+        *flags,
+        topology,
+    ) = render_args
+    csm_templates = sorted(
+        str(template) for template in Path(network_templates_folder, csm).rglob("*") if template.is_file()
+    )
+    shared = content_hash(
+        metadata.version("canu"),
+        json.dumps([csm, architecture, template_folder, vendor_folder, flags], default=str),
+        factory.fingerprint(),
+        json.dumps(sls_variables, sort_keys=True, default=str),
+        file_hash(*csm_templates),
+        path.basename(custom_config) if custom_config else "",
+    )
+    custom_configs = (load_yaml(custom_config) or {}) if custom_config else {}
+
+    fingerprints = {}
+    for switch_name in switch_names:
+        switch_inputs = [connection_inputs(topology, switch_name), custom_configs.get(switch_name)]
+        fingerprints[switch_name] = content_hash(shared, json.dumps(switch_inputs, sort_keys=True, default=str))
+    return fingerprints
+
+
+def connection_inputs(topology, switch_name):
+    """Return the nodes a switch config is generated from, with node ids replaced by names.
+
+    Args:
+        topology: TopologyIndex of the node list
+        switch_name: Switch name
+
+    Returns:
+        Dictionary of node name to serialized node, for the switch, its pair and their neighbors
+    """
+    _, primary, secondary = switch_is_primary(switch_name)
+    names = {name for name in (switch_name, primary, secondary) if name in topology}
+    for name in list(names):
+        for port in topology.node(name)["ports"]:
+            names.add(topology.node_by_id(port["destination_node_id"])["common_name"])
+
+    nodes = {}
+    for name in names:
+        node = dict(topology.node(name))
+        del node["id"]
+        node["ports"] = [
+            {
+                **{key: value for key, value in port.items() if key != "destination_node_id"},
+                "destination_node": topology.node_by_id(port["destination_node_id"])["common_name"],
+            }
+            for port in node["ports"]
+        ]
+        nodes[name] = node
+    return nodes
+
+
+def config_unchanged(folder, switch_name, fingerprint, manifest_entry):
+    """Return True if a switch config was generated from the same inputs and has not been edited since.
+
+    Args:
+        folder: Folder of the generated configs
+        switch_name: Switch name
+        fingerprint: Fingerprint of the current inputs of the switch config
+        manifest_entry: Manifest entry of the switch from the last run, may be None
+
+    Returns:
+        True if the switch config can be skipped
+    """
+    if not manifest_entry or manifest_entry.get("fingerprint") != fingerprint:
+        return False
+    try:
+        with open(path.join(folder, f"{switch_name}.cfg"), "r") as f:
+            return content_hash(f.read()) == manifest_entry.get("config")
+    except OSError:
+        return False
+
+
+# Arguments shared by every switch rendered in a worker process, set once per worker by _init_render_worker
+_render_args = None
+
+
+def _init_render_worker(render_args, log_level):
+    """Store the shared generate_switch_config arguments in a worker process.
+
+    Args:
+        render_args: Tuple of the generate_switch_config arguments that are the same for every switch
+        log_level: Level of logging used by the parent process
+    """
+    global _render_args
+    _render_args = render_args
+    logging.basicConfig(format="%(name)s - %(levelname)s: %(message)s", level=log_level)
+
+
+def _render_switch(switch_name, render_args=None):
+    """Render the config of a single switch.
+
+    Args:
+        switch_name: Switch name
+        render_args: Shared generate_switch_config arguments, defaults to the ones stored in the worker
+
+    Returns:
+        switch_name: Switch name
+        switch_output: Tuple of (switch_config, devices, unknown) from generate_switch_config
+    """
+    csm, architecture, network_node_list, factory, *switch_args = render_args or _render_args
+    return switch_name, generate_switch_config(csm, architecture, network_node_list, factory, switch_name, *switch_args)
+
+
+def render_switch_configs(switch_names, render_args, jobs=1):
+    """Render the config of each switch, in parallel processes when jobs is more than 1.
+
+    The node model, topology index, factory and SLS variables are sent to each worker once, and the
+    results are yielded in the same order as switch_names in both modes.
+
+    Args:
+        switch_names: List of switch names to render
+        render_args: Tuple of the generate_switch_config arguments that are the same for every switch
+        jobs: Number of worker processes
+
+    Yields:
+        Tuple of (switch_name, (switch_config, devices, unknown)) for each switch
+    """
+    jobs = min(jobs, len(switch_names))
+    if jobs <= 1:
+        for switch_name in switch_names:
+            yield _render_switch(switch_name, render_args)
+        return
+
+    log.debug(f"Rendering {len(switch_names)} switch configs with {jobs} processes")
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_render_worker,
+        initargs=(render_args, logging.getLogger().level),
+    ) as executor:
+        yield from process_map(executor, _render_switch, switch_names)
@@ -24,16 +24,14 @@ import click
 
 from canu.style import Style
 
-from .config import config
-
 
 @click.group(
-    cls=Style.CanuHelpColorsGroup,
+    cls=Style.CanuLazyHelpColorsGroup,
+    lazy_subcommands={
+        "config": "canu.generate.network.config.config:config",
+    },
 )
 @click.pass_context
 def network(ctx):
     """Canu generate network commands."""
     pass
-
-
-network.add_command(config.config)
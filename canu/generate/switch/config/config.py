@@ -38,15 +38,17 @@ import requests
 import urllib3
 from click_option_group import RequiredMutuallyExclusiveOptionGroup, optgroup
 from hier_config import HConfig, Host
-from jinja2 import Environment, FileSystemLoader, StrictUndefined, select_autoescape
 from netutils.mac import is_valid_mac
 from ruamel.yaml import YAML
-from ttp import ttp
 
 from canu.style import Style
+from canu.utils.sls import sls_model
+from canu.utils.templates import template_environment
+from canu.utils.topology_index import TopologyIndex
+from canu.utils.ttp_parsers import parse_text
 from canu.utils.yaml_load import load_yaml
 from canu.validate.paddle.paddle import node_model_from_paddle
-from canu.validate.shcd.shcd import node_model_from_shcd, shcd_to_sheets, switch_unused_ports
+from canu.validate.shcd.shcd import node_model_from_shcd, shcd_to_sheets
 from network_modeling.NetworkNodeFactory import NetworkNodeFactory
 
 yaml = YAML()
@@ -89,18 +91,8 @@ mellanox_interface = path.join(
     "mellanox_interface.txt",
 )
 
-# Import templates
-network_templates_folder = path.join(
-    project_root,
-    "network_modeling",
-    "configs",
-    "templates",
-)
-env = Environment(
-    autoescape=select_autoescape(),
-    loader=FileSystemLoader(network_templates_folder),
-    undefined=StrictUndefined,
-)
+# Import templates, compiled templates are cached between runs
+env = template_environment("switch")
 
 TEMPLATES = {}
 
@@ -456,7 +448,7 @@ def config(
                 fg="white",
                 bg="red",
             )
-    sls_variables = parse_sls_for_config(sls_json)
+    sls_variables = sls_model(sls_json).config_variables
 
     switch_config, devices, unknown = generate_switch_config(
         csm,
@@ -545,12 +537,10 @@ def add_custom_config(custom_config, switch_config, host, switch_os, custom_file
             mellanox_config += "\n" + str(line)
 
         # parse out mellanox interfaces from custom config file
-        parser = ttp(data=mellanox_config, template=mellanox_interface)
-        parser.parse()
-        interfaces = parser.result()
+        interfaces = parse_text(mellanox_interface, mellanox_config)
 
         # mellanox overwrite port configuration
-        for port in interfaces[0][0]:
+        for port in interfaces:
             override_port = port["interface"]
             for line in switch_config_hier.all_children_sorted():
                 # match interfaces from custom config file
@@ -594,6 +584,7 @@ def generate_switch_config(
     bond_app_nodes,
     nmn_pvlan,
     enable_nmn_isolation,
+    topology=None,
 ):
     """Generate switch config.
 
@@ -613,12 +604,16 @@ def generate_switch_config(
         bond_app_nodes: Generates bonded configuration for application nodes connected the NMN.
         nmn_pvlan: VLAN ID used for Isolated NMN PVLAN
         enable_nmn_isolation: Enable/disable NMN isolation.
+        topology: TopologyIndex of network_node_list, pass one in to share it across switches
 
 
 
     Returns:
         switch_config: The generated switch configuration
     """
+    if topology is None:
+        topology = TopologyIndex(network_node_list)
+
     node_shasta_name = get_shasta_name(switch_name, factory.lookup_mapper())
 
     templates = TEMPLATES or {
@@ -871,9 +866,9 @@ def generate_switch_config(
         network_node_list,
         factory,
         sls_variables,
+        topology,
     )
-    unused_ports = switch_unused_ports(network_node_list)
-    variables["UNUSED_PORTS"] = unused_ports[switch_name]
+    variables["UNUSED_PORTS"] = topology.unused_ports(switch_name)
 
     if switch_name not in sls_variables["HMN_IPs"].keys() and "sw-edge" not in switch_name:
         click.secho(f"Cannot find {switch_name} in CSI / SLS nodes.", fg="red")
@@ -911,7 +906,7 @@ def generate_switch_config(
         variables["LOOPBACK_IP"] = "10.2.0." + last_octet
     if node_shasta_name in ["sw-spine", "sw-leaf", "sw-cdu"]:
         # Get connections to switch pair
-        pair_connections = get_pair_connections(cabling["nodes"], switch_name)
+        pair_connections = get_pair_connections(cabling["nodes"], switch_name, topology)
         length_connections = len(pair_connections)
 
         if length_connections == 3:
@@ -925,20 +920,11 @@ def generate_switch_config(
 
     # get VLANs and IPs for CDU switches
     if "sw-cdu" in node_shasta_name:
-        nodes_by_name = {}
-        nodes_by_id = {}
         destination_rack_list = []
         variables["NMN_MTN_VLANS"] = []
         variables["HMN_MTN_VLANS"] = []
 
-        for node in network_node_list:
-            node_tmp = node.serialize()
-            name = node_tmp["common_name"]
-            nodes_by_name[name] = node_tmp
-            nodes_by_id[node_tmp["id"]] = node_tmp
-        for port in nodes_by_name[switch_name]["ports"]:
-            destination_rack = nodes_by_id[port["destination_node_id"]]["location"]["rack"]
-
+        for destination_rack in topology.destination_racks(switch_name):
             destination_rack_list.append(int(re.search(r"\d+", destination_rack)[0]))
         for cabinets in sls_variables["NMN_MTN_CABINETS"] + sls_variables["HMN_MTN_CABINETS"]:
             ip_address = netaddr.IPNetwork(cabinets["CIDR"])
@@ -946,7 +932,7 @@ def generate_switch_config(
             sls_rack_int = int(re.search(r"\d+", (cabinets["Name"]))[0])
             if sls_rack_int in destination_rack_list:
                 if cabinets in sls_variables["NMN_MTN_CABINETS"]:
-                    variables["NMN_MTN_VLANS"].append(cabinets)
+                    variables["NMN_MTN_VLANS"].append(dict(cabinets))
                     variables["NMN_MTN_VLANS"][-1]["PREFIX_LENGTH"] = ip_address.prefixlen
                     if is_primary[0]:
                         ip = str(ip_address[2])
@@ -956,7 +942,7 @@ def generate_switch_config(
                         variables["NMN_MTN_VLANS"][-1]["IP"] = ip
 
                 if cabinets in sls_variables["HMN_MTN_CABINETS"]:
-                    variables["HMN_MTN_VLANS"].append(cabinets)
+                    variables["HMN_MTN_VLANS"].append(dict(cabinets))
                     variables["HMN_MTN_VLANS"][-1]["PREFIX_LENGTH"] = ip_address.prefixlen
                     if is_primary[0]:
                         ip = str(ip_address[2])
@@ -1032,12 +1018,13 @@ def generate_switch_config(
     return switch_config, devices, unknown
 
 
-def get_pair_connections(nodes, switch_name):
+def get_pair_connections(nodes, switch_name, topology=None):
     """Given a hostname and nodes, return connections to the primary or secondary switch.
 
     Args:
         nodes: List of nodes connected to the switch
         switch_name: Switch hostname
+        topology: (Optional) TopologyIndex, when passed the pair ports are read from its adjacency map
 
     Returns:
         List of connections to the paired switch
@@ -1049,6 +1036,9 @@ def get_pair_connections(nodes, switch_name):
     else:
         pair_hostname = primary
 
+    if topology is not None:
+        return topology.pair_ports(switch_name, pair_hostname)
+
     connections = []
     for x in nodes:
         if pair_hostname in x["config"]["DESCRIPTION"]:
@@ -1064,6 +1054,7 @@ def get_switch_nodes(
     network_node_list,
     factory,
     sls_variables,
+    topology=None,
 ):
     """Get the nodes connected to the switch ports.
 
@@ -1073,23 +1064,20 @@ def get_switch_nodes(
         network_node_list: List of nodes from the SHCD / Paddle
         factory: Node factory object
         sls_variables: Dictionary containing SLS variables.
+        topology: (Optional) TopologyIndex of network_node_list, built here when not passed
 
     Returns:
         List of nodes connected to the switch
         List of unknown nodes
     """
     nodes = []
-    nodes_by_name = {}
-    nodes_by_id = {}
     unknown = []
 
-    # Make 2 dictionaries for easy node lookup
-    for node in network_node_list:
-        node_tmp = node.serialize()
-        name = node_tmp["common_name"]
-
-        nodes_by_name[name] = node_tmp
-        nodes_by_id[node_tmp["id"]] = node_tmp
+    # Name and id lookups are shared by every switch through the topology index
+    if topology is None:
+        topology = TopologyIndex(network_node_list)
+    nodes_by_name = topology.nodes_by_name
+    nodes_by_id = topology.nodes_by_id
 
     if switch_name not in nodes_by_name.keys():
         click.secho(
@@ -1593,425 +1581,6 @@ def groupby_vlan_range(vlan_list):
     return ",".join(values)
 
 
-def parse_sls_for_config(input_json):
-    """Parse the `sls_file.json` file or the JSON from SLS `/networks` API for config variables.
-
-    Args:
-        input_json: JSON from the SLS `/networks` API
-
-    Returns:
-        sls_variables: Dictionary containing SLS variables.
-    """
-    networks_list = []
-
-    sls_variables = {
-        "SWITCH_ASN": None,
-        "CAN": None,
-        "CAN_VLAN": None,
-        "CAN_NETMASK": None,
-        "CAN_PREFIX_LEN": None,
-        "CAN_NETWORK_IP": None,
-        "CHN": None,
-        "CHN6": None,
-        "CHN_VLAN": None,
-        "CHN_NETMASK": None,
-        "CHN_PREFIX_LEN": None,
-        "CHN_PREFIX_LEN6": None,
-        "CHN_NETWORK_IP": None,
-        "CHN_ASN": None,
-        "CMN": None,
-        "CMN6": None,
-        "CMN_VLAN": None,
-        "CMN_NETMASK": None,
-        "CMN_PREFIX_LEN": None,
-        "CMN_PREFIX_LEN6": None,
-        "CMN_NETWORK_IP": None,
-        "CMN_ASN": None,
-        "HMN": None,
-        "HMN_VLAN": None,
-        "HMN_NETMASK": None,
-        "HMN_NETWORK_IP": None,
-        "HMN_PREFIX_LEN": None,
-        "MTL": None,
-        "MTL_NETMASK": None,
-        "MTL_NETWORK_IP": None,
-        "MTL_PREFIX_LEN": None,
-        "NMN": None,
-        "NMN_VLAN": None,
-        "NMN_NETMASK": None,
-        "NMN_NETWORK_IP": None,
-        "NMN_PREFIX_LEN": None,
-        "NMN_ASN": None,
-        "HMN_MTN": None,
-        "HMN_MTN_NETMASK": None,
-        "HMN_MTN_NETWORK_IP": None,
-        "HMN_MTN_PREFIX_LEN": None,
-        "NMN_MTN": None,
-        "NMN_MTN_NETMASK": None,
-        "NMN_MTN_NETWORK_IP": None,
-        "NMN_MTN_PREFIX_LEN": None,
-        "HMNLB": None,
-        "HMNLB_NETMASK": None,
-        "HMNLB_NETWORK_IP": None,
-        "HMNLB_PREFIX_LEN": None,
-        "HMNLB_TFTP": None,
-        "HMNLB_DNS": None,
-        "NMNLB": None,
-        "NMNLB_NETMASK": None,
-        "NMNLB_NETWORK_IP": None,
-        "NMNLB_PREFIX_LEN": None,
-        "NMNLB_TFTP": None,
-        "NMNLB_DNS": None,
-        "ISTIO": None,
-        "ISTIO_LOCAL": None,
-        "SPIRE_CLUSTER": None,
-        "SPIRE_LOCAL": None,
-        "FLUENTBIT_AGGREGATOR": None,
-        "RGW_VIP": None,
-        "KUBEAPI_VIP": None,
-        "CAN_IP_GATEWAY": None,
-        "CHN_IP_GATEWAY": None,
-        "CHN_IP_GATEWAY6": None,
-        "CMN_IP_GATEWAY": None,
-        "CMN_IP_GATEWAY6": None,
-        "HMN_IP_GATEWAY": None,
-        "MTL_IP_GATEWAY": None,
-        "NMN_IP_GATEWAY": None,
-        "ncn_w001": None,
-        "ncn_w002": None,
-        "ncn_w003": None,
-        "ncn_m001_hmn": None,
-        "ncn_m001_nmn": None,
-        "CAN_IP_PRIMARY": None,
-        "CAN_IP_SECONDARY": None,
-        "CHN_IP_PRIMARY": None,
-        "CHN_IP_SECONDARY": None,
-        "CHN_IP_PRIMARY6": None,
-        "CHN_IP_SECONDARY6": None,
-        "CMN_IP_PRIMARY": None,
-        "CMN_IP_SECONDARY": None,
-        "CAN_IPs": defaultdict(),
-        "CHN_IPs": defaultdict(),
-        "CHN_IPs6": defaultdict(),
-        "CMN_IPs": defaultdict(),
-        "CMN_IPs6": defaultdict(),
-        "HMN_IPs": defaultdict(),
-        "MTL_IPs": defaultdict(),
-        "NMN_IPs": defaultdict(),
-        "NMN_MTN_CABINETS": [],
-        "NMN_MTN_CABINETS_NETMASK": [],
-        "HMN_MTN_CABINETS": [],
-        "SPINE_SWITCH_IPs": [],
-        "NMN_NCN": [],
-        "ALL_SWITCH_IPs": [],
-        "IPV6_ENABLED": None,
-    }
-
-    # Figure out up front if IPv6 support should be enabled or not.
-    cmn_network = list(filter(lambda network: network.get("Name") == "CMN", input_json))
-    chn_network = list(filter(lambda network: network.get("Name") == "CHN", input_json))
-
-    if cmn_network and chn_network:
-        cmn_has_ipv6 = bool(cmn_network[0].get("ExtraProperties", {}).get("CIDR6"))
-        chn_has_ipv6 = bool(chn_network[0].get("ExtraProperties", {}).get("CIDR6"))
-
-        if cmn_has_ipv6 and chn_has_ipv6:
-            sls_variables["IPV6_ENABLED"] = True
-        else:
-            sls_variables["IPV6_ENABLED"] = False
-            log.debug(
-                f"Missing IPv6 data. cmn_has_ipv6: {cmn_has_ipv6}, chn_has_ipv6: {chn_has_ipv6}",
-            )
-
-    for sls_network in input_json:
-        name = sls_network.get("Name", "")
-
-        if name == "CAN":
-            sls_variables["CAN"] = netaddr.IPNetwork(
-                sls_network.get("ExtraProperties", {}).get(
-                    "CIDR",
-                    "",
-                ),
-            )
-            sls_variables["CAN_NETMASK"] = sls_variables["CAN"].netmask
-            sls_variables["CAN_PREFIX_LEN"] = sls_variables["CAN"].prefixlen
-            sls_variables["CAN_NETWORK_IP"] = sls_variables["CAN"].ip
-            for subnets in sls_network.get("ExtraProperties", {}).get("Subnets", {}):
-                if subnets["Name"] == "bootstrap_dhcp":
-                    sls_variables["CAN_IP_GATEWAY"] = subnets["Gateway"]
-                    sls_variables["CAN_VLAN"] = subnets["VlanID"]
-                    for ip in subnets["IPReservations"]:
-                        if ip["Name"] == "can-switch-1":
-                            sls_variables["CAN_IP_PRIMARY"] = ip["IPAddress"]
-                        elif ip["Name"] == "can-switch-2":
-                            sls_variables["CAN_IP_SECONDARY"] = ip["IPAddress"]
-                if subnets["Name"] == "bootstrap_dhcp":
-                    for ip in subnets["IPReservations"]:
-                        if "ncn-w" in ip["Name"]:
-                            sls_variables["CAN_IPs"][ip["Name"]] = ip["IPAddress"]
-
-        if name == "CHN":
-            sls_variables["CHN"] = netaddr.IPNetwork(
-                sls_network.get("ExtraProperties", {}).get(
-                    "CIDR",
-                    "",
-                ),
-            )
-            if sls_variables["IPV6_ENABLED"]:
-                sls_variables["CHN6"] = netaddr.IPNetwork(
-                    sls_network.get("ExtraProperties", {}).get(
-                        "CIDR6",
-                        "",
-                    ),
-                )
-                sls_variables["CHN_PREFIX_LEN6"] = sls_variables["CHN6"].prefixlen
-            sls_variables["CHN_NETMASK"] = sls_variables["CHN"].netmask
-            sls_variables["CHN_PREFIX_LEN"] = sls_variables["CHN"].prefixlen
-            sls_variables["CHN_NETWORK_IP"] = sls_variables["CHN"].ip
-            sls_variables["CHN_ASN"] = sls_network.get("ExtraProperties", {}).get(
-                "MyASN",
-                {},
-            )
-            for subnets in sls_network.get("ExtraProperties", {}).get("Subnets", {}):
-                if subnets["Name"] == "bootstrap_dhcp":
-                    sls_variables["CHN_IP_GATEWAY"] = subnets["Gateway"]
-                    if sls_variables["IPV6_ENABLED"]:
-                        sls_variables["CHN_IP_GATEWAY6"] = subnets["Gateway6"]
-                    sls_variables["CHN_VLAN"] = subnets["VlanID"]
-                    for ip in subnets["IPReservations"]:
-                        if ip["Name"] == "chn-switch-1":
-                            sls_variables["CHN_IP_PRIMARY"] = ip["IPAddress"]
-                            if sls_variables["IPV6_ENABLED"]:
-                                sls_variables["CHN_IP_PRIMARY6"] = ip["IPAddress6"]
-                        elif ip["Name"] == "chn-switch-2":
-                            sls_variables["CHN_IP_SECONDARY"] = ip["IPAddress"]
-                            if sls_variables["IPV6_ENABLED"]:
-                                sls_variables["CHN_IP_SECONDARY6"] = ip["IPAddress6"]
-                if subnets["Name"] == "bootstrap_dhcp":
-                    for ip in subnets["IPReservations"]:
-                        sls_variables["CHN_IPs"][ip["Name"]] = ip["IPAddress"]
-                        if sls_variables["IPV6_ENABLED"]:
-                            sls_variables["CHN_IPs6"][ip["Name"]] = ip["IPAddress6"]
-
-        elif name == "CMN":
-            sls_variables["CMN"] = netaddr.IPNetwork(
-                sls_network.get("ExtraProperties", {}).get(
-                    "CIDR",
-                    "",
-                ),
-            )
-            if sls_variables["IPV6_ENABLED"]:
-                sls_variables["CMN6"] = netaddr.IPNetwork(
-                    sls_network.get("ExtraProperties", {}).get(
-                        "CIDR6",
-                        "",
-                    ),
-                )
-                sls_variables["CMN_PREFIX_LEN6"] = sls_variables["CMN6"].prefixlen
-            sls_variables["CMN_NETMASK"] = sls_variables["CMN"].netmask
-            sls_variables["CMN_PREFIX_LEN"] = sls_variables["CMN"].prefixlen
-            sls_variables["CMN_NETWORK_IP"] = sls_variables["CMN"].ip
-            sls_variables["CMN_ASN"] = sls_network.get("ExtraProperties", {}).get(
-                "MyASN",
-                {},
-            )
-            for subnets in sls_network.get("ExtraProperties", {}).get("Subnets", {}):
-                if subnets["Name"] == "bootstrap_dhcp":
-                    sls_variables["CMN_IP_GATEWAY"] = subnets["Gateway"]
-                    if sls_variables["IPV6_ENABLED"]:
-                        sls_variables["CMN_IP_GATEWAY6"] = subnets["Gateway6"]
-                    sls_variables["CMN_VLAN"] = subnets["VlanID"]
-                if subnets["Name"] == "network_hardware":
-                    for ip in subnets["IPReservations"]:
-                        if "sw" in ip["Name"]:
-                            sls_variables["CMN_IPs"][ip["Name"]] = ip["IPAddress"]
-                            if sls_variables["IPV6_ENABLED"]:
-                                sls_variables["CMN_IPs6"][ip["Name"]] = ip["IPAddress6"]
-                if subnets["Name"] == "bootstrap_dhcp":
-                    for ip in subnets["IPReservations"]:
-                        if "ncn-w" in ip["Name"]:
-                            sls_variables["CMN_IPs"][ip["Name"]] = ip["IPAddress"]
-        elif name == "HMN":
-            sls_variables["HMN"] = netaddr.IPNetwork(
-                sls_network.get("ExtraProperties", {}).get(
-                    "CIDR",
-                    "",
-                ),
-            )
-            sls_variables["HMN_NETMASK"] = sls_variables["HMN"].netmask
-            sls_variables["HMN_PREFIX_LEN"] = sls_variables["HMN"].prefixlen
-            sls_variables["HMN_NETWORK_IP"] = sls_variables["HMN"].ip
-            for subnets in sls_network.get("ExtraProperties", {}).get("Subnets", {}):
-                if subnets["Name"] == "network_hardware":
-                    sls_variables["HMN_IP_GATEWAY"] = subnets["Gateway"]
-                    sls_variables["HMN_VLAN"] = subnets["VlanID"]
-                    for ip in subnets["IPReservations"]:
-                        sls_variables["HMN_IPs"][ip["Name"]] = ip["IPAddress"]
-                if subnets["Name"] == "bootstrap_dhcp":
-                    for ip in subnets["IPReservations"]:
-                        if "ncn-w" in ip["Name"]:
-                            sls_variables["HMN_IPs"][ip["Name"]] = ip["IPAddress"]
-                        elif ip["Name"] == "ncn-m001":
-                            sls_variables["ncn_m001_hmn"] = ip["IPAddress"]
-        elif name == "MTL":
-            sls_variables["MTL"] = netaddr.IPNetwork(
-                sls_network.get("ExtraProperties", {}).get(
-                    "CIDR",
-                    "",
-                ),
-            )
-            sls_variables["MTL_NETMASK"] = sls_variables["MTL"].netmask
-            sls_variables["MTL_PREFIX_LEN"] = sls_variables["MTL"].prefixlen
-            sls_variables["MTL_NETWORK_IP"] = sls_variables["MTL"].ip
-            for subnets in sls_network.get("ExtraProperties", {}).get("Subnets", {}):
-                if subnets["Name"] == "network_hardware":
-                    sls_variables["MTL_IP_GATEWAY"] = subnets["Gateway"]
-                    for ip in subnets["IPReservations"]:
-                        sls_variables["MTL_IPs"][ip["Name"]] = ip["IPAddress"]
-                elif subnets["Name"] == "bootstrap_dhcp":
-                    for ip in subnets["IPReservations"]:
-                        if ip["Name"].startswith("ncn-"):
-                            sls_variables["MTL_IPs"][ip["Name"]] = ip["IPAddress"]
-
-        elif name == "NMN":
-            sls_variables["NMN"] = netaddr.IPNetwork(
-                sls_network.get("ExtraProperties", {}).get(
-                    "CIDR",
-                    "",
-                ),
-            )
-            sls_variables["NMN_NETMASK"] = sls_variables["NMN"].netmask
-            sls_variables["NMN_PREFIX_LEN"] = sls_variables["NMN"].prefixlen
-            sls_variables["NMN_NETWORK_IP"] = sls_variables["NMN"].ip
-            sls_variables["SWITCH_ASN"] = sls_network.get("ExtraProperties", {}).get(
-                "PeerASN",
-                {},
-            )
-            sls_variables["NMN_ASN"] = sls_network.get("ExtraProperties", {}).get(
-                "MyASN",
-                {},
-            )
-            for subnets in sls_network.get("ExtraProperties", {}).get("Subnets", {}):
-                if subnets["Name"] == "bootstrap_dhcp":
-                    for ip in subnets["IPReservations"]:
-                        if ip["Name"] == "ncn-w001":
-                            sls_variables["ncn_w001"] = ip["IPAddress"]
-                        elif ip["Name"] == "ncn-w002":
-                            sls_variables["ncn_w002"] = ip["IPAddress"]
-                        elif ip["Name"] == "ncn-w003":
-                            sls_variables["ncn_w003"] = ip["IPAddress"]
-                        elif ip["Name"] == "ncn-m001":
-                            sls_variables["ncn_m001_nmn"] = ip["IPAddress"]
-                        elif ip["Name"] == "rgw-vip":
-                            sls_variables["RGW_VIP"] = ip["IPAddress"]
-                        elif ip["Name"] == "kubeapi-vip":
-                            sls_variables["KUBEAPI_VIP"] = ip["IPAddress"]
-                if subnets["Name"] == "bootstrap_dhcp":
-                    for ip in subnets["IPReservations"]:
-                        if ip["Name"].startswith("ncn-"):
-                            sls_variables["NMN_IPs"][ip["Name"]] = ip["IPAddress"]
-                elif subnets["Name"] == "network_hardware":
-                    sls_variables["NMN_IP_GATEWAY"] = subnets["Gateway"]
-                    sls_variables["NMN_VLAN"] = subnets["VlanID"]
-                    for ip in subnets["IPReservations"]:
-                        sls_variables["NMN_IPs"][ip["Name"]] = ip["IPAddress"]
-        elif name == "NMN_MTN":
-            sls_variables["NMN_MTN"] = netaddr.IPNetwork(
-                sls_network.get("ExtraProperties", {}).get(
-                    "CIDR",
-                    "",
-                ),
-            )
-            sls_variables["NMN_MTN_NETMASK"] = sls_variables["NMN_MTN"].netmask
-            sls_variables["NMN_MTN_PREFIX_LEN"] = sls_variables["NMN_MTN"].prefixlen
-            sls_variables["NMN_MTN_NETWORK_IP"] = sls_variables["NMN_MTN"].ip
-            sls_variables["NMN_MTN_CABINETS"] = list(
-                sls_network.get("ExtraProperties", {}).get("Subnets", {}),
-            )
-            for subnets in sls_network.get("ExtraProperties", {}).get("Subnets", []):
-                cidr = netaddr.IPNetwork(subnets.get("CIDR"))
-                sls_variables["NMN_MTN_CABINETS_NETMASK"].append({"Netmask": str(cidr.netmask)})
-        elif name == "HMN_MTN":
-            sls_variables["HMN_MTN"] = netaddr.IPNetwork(
-                sls_network.get("ExtraProperties", {}).get(
-                    "CIDR",
-                    "",
-                ),
-            )
-            sls_variables["HMN_MTN_NETMASK"] = sls_variables["HMN_MTN"].netmask
-            sls_variables["HMN_MTN_PREFIX_LEN"] = sls_variables["HMN_MTN"].prefixlen
-            sls_variables["HMN_MTN_NETWORK_IP"] = sls_variables["HMN_MTN"].ip
-            sls_variables["HMN_MTN_CABINETS"] = list(
-                sls_network.get("ExtraProperties", {}).get("Subnets", {}),
-            )
-        elif name == "HMNLB":
-            sls_variables["HMNLB"] = netaddr.IPNetwork(
-                sls_network.get("ExtraProperties", {}).get(
-                    "CIDR",
-                    "",
-                ),
-            )
-            for subnets in sls_network.get("ExtraProperties", {}).get("Subnets", {}):
-                if subnets["Name"] == "hmn_metallb_address_pool":
-                    for ip in subnets["IPReservations"]:
-                        if ip["Name"] == "cray-tftp":
-                            sls_variables["HMNLB_TFTP"] = ip["IPAddress"]
-                        elif ip["Name"] == "unbound":
-                            sls_variables["HMNLB_DNS"] = ip["IPAddress"]
-            sls_variables["HMNLB_NETMASK"] = sls_variables["HMNLB"].netmask
-            sls_variables["HMNLB_PREFIX_LEN"] = sls_variables["HMNLB"].prefixlen
-            sls_variables["HMNLB_NETWORK_IP"] = sls_variables["HMNLB"].ip
-            sls_variables["HMNLB_CABINETS"] = list(
-                sls_network.get("ExtraProperties", {}).get("Subnets", {}),
-            )
-        elif name == "NMNLB":
-            sls_variables["NMNLB"] = netaddr.IPNetwork(
-                sls_network.get("ExtraProperties", {}).get(
-                    "CIDR",
-                    "",
-                ),
-            )
-            for subnets in sls_network.get("ExtraProperties", {}).get("Subnets", {}):
-                if subnets["Name"] == "nmn_metallb_address_pool":
-                    for ip in subnets["IPReservations"]:
-                        if ip["Name"] == "cray-tftp":
-                            sls_variables["NMNLB_TFTP"] = ip["IPAddress"]
-                        elif ip["Name"] == "unbound":
-                            sls_variables["NMNLB_DNS"] = ip["IPAddress"]
-                        elif ip["Name"] == "istio-ingressgateway":
-                            sls_variables["ISTIO"] = ip["IPAddress"]
-                        elif ip["Name"] == "istio-ingressgateway-local":
-                            sls_variables["ISTIO_LOCAL"] = ip["IPAddress"]
-                        elif ip["Name"] == "rsyslog-agg-service":
-                            sls_variables["FLUENTBIT_AGGREGATOR"] = ip["IPAddress"]
-                        elif ip["Name"] == "spire-local":
-                            sls_variables["SPIRE_LOCAL"] = ip["IPAddress"]
-                        elif ip["Name"] == "spire":
-                            sls_variables["SPIRE_CLUSTER"] = ip["IPAddress"]
-
-            sls_variables["NMNLB_NETMASK"] = sls_variables["NMNLB"].netmask
-            sls_variables["NMNLB_PREFIX_LEN"] = sls_variables["NMNLB"].prefixlen
-            sls_variables["NMNLB_NETWORK_IP"] = sls_variables["NMNLB"].ip
-            sls_variables["NMNLB_CABINETS"] = list(
-                sls_network.get("ExtraProperties", {}).get("Subnets", {}),
-            )
-        for subnets in sls_network.get("ExtraProperties", {}).get("Subnets", {}):
-            vlan = subnets.get("VlanID", "")
-            networks_list.append([name, vlan])
-
-    networks_list = {tuple(x) for x in networks_list}
-
-    for name, ip in sls_variables["NMN_IPs"].items():
-        if name.startswith("sw-spine"):
-            sls_variables["SPINE_SWITCH_IPs"].append(ip)
-        if name.startswith("ncn-"):
-            sls_variables["NMN_NCN"].append(ip)
-        if name.startswith("sw-"):
-            sls_variables["ALL_SWITCH_IPs"].append(ip)
-
-    return sls_variables
-
-
 def get_primary_port(
     nodes_by_name,
     switch_name,
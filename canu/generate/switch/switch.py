@@ -22,18 +22,17 @@
 """CANU generate switch commands."""
 import click
 
-from canu.generate.switch.config import config
 from canu.style import Style
 
 
 @click.group(
-    cls=Style.CanuHelpColorsGroup,
+    cls=Style.CanuLazyHelpColorsGroup,
+    lazy_subcommands={
+        "config": "canu.generate.switch.config.config:config",
+    },
     help_headers_color="yellow",
     help_options_color="blue",
 )
 @click.pass_context
 def switch(ctx):
     """Canu generate switch commands."""
-
-
-switch.add_command(config.config)
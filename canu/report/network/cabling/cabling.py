@@ -43,6 +43,11 @@ from canu.report.switch.cabling.cabling import (
     print_lldp,
 )
 from canu.style import Style
+from canu.utils.fleet import FleetRun, fleet_options
+from canu.utils.neighbor_index import NeighborIndex, index_arp
+from canu.utils.stream import JsonStream
+from canu.utils.trace import span
+from canu.utils.vendor import refresh_vendor_option
 
 log = logging.getLogger("report_cabling")
 
@@ -79,6 +84,8 @@ log = logging.getLogger("report_cabling")
     default="switch",
     show_default=True,
 )
+@click.option("--json", "json_", is_flag=True, help="Output JSON, one record per switch or equipment")
+@click.option("--ndjson", is_flag=True, help="Output newline delimited JSON, one record per line")
 @click.option(
     "--kea-lease-file",
     help="Kea leases in JSON format from API call used for MAC-to-hostname lookups.",
@@ -103,6 +110,7 @@ log = logging.getLogger("report_cabling")
     is_flag=True,
     default=False,
 )
+@fleet_options
 @click.option(
     "--log",
     "log_",
@@ -116,6 +124,7 @@ log = logging.getLogger("report_cabling")
     type=click.File("w"),
     default="-",
 )
+@refresh_vendor_option
 @click.pass_context
 def cabling(
     ctx,
@@ -124,10 +133,14 @@ def cabling(
     username,
     password,
     view,
+    json_,
+    ndjson,
     kea_lease_file,
     sls_file,
     smd_file,
     heuristic_lookups,
+    workers,
+    timeout,
     log_,
     out,
 ):
@@ -155,6 +168,9 @@ def cabling(
     2. The '--view equipment' option displays a table for each mac address connection. This means that servers
     and switches will both display incoming and outgoing connections.
 
+    With '--json' or '--ndjson' a record is written for each switch as soon as it has been collected,
+    or for each mac address in the equipment view, followed by a record for every switch with an error.
+
     If the neighbor name is not in LLDP, the IP and vlan information are displayed
     by looking up the MAC address in the ARP table and mac address table.
 
@@ -174,10 +190,14 @@ def cabling(
         username: Switch username
         password: Switch password
         view: View of the cabling results.
+        json_: Bool indicating json output
+        ndjson: Bool indicating newline delimited json output
         kea_lease_file: Name of the JSON file containing Kea leases
         sls_file: Name of the JSON file containing SLS system data
         smd_file: Name of the JSON file containing SMD ethernetInterfaces
         heuristic_lookups: Turn off annotations to LLDP data based on common device use
+        workers: Number of switches to connect to concurrently
+        timeout: Seconds to wait for a single switch
         log_: Level of logging.
         out: Name of the output file
     """
@@ -226,37 +246,91 @@ def cabling(
     errors = []
     ips_length = len(ips)
     if ips:
+        stream = None
+        status = sys.stdout
+        if json_ or ndjson:
+            stream = JsonStream(out, {"view": view}, "records", ndjson=ndjson)
+            # Keep the spinner and progress out of JSON written to stdout
+            status = sys.stderr
+
+        def _progress(result, completed, total):
+            print(
+                f"  Collected {result.item} - Switch {completed} of {total}        ",
+                end="\r",
+                file=status,
+            )
+
+        # Hash the Kea, SLS and SMD data once for every switch
+        neighbor_index = NeighborIndex(kea_json=kea_json, sls_json=sls_json, smd_json=smd_json)
+        equipment = EquipmentTable()
+
         with click_spinner.spinner(
             beep=False,
             disable=False,
             force=False,
-            stream=sys.stdout,
+            stream=status,
         ):
-            for i, ip in enumerate(ips, start=1):
-                print(
-                    f"  Connecting to {ip} - Switch {i} of {ips_length}        ",
-                    end="\r",
-                )
-                try:
-                    switch_info, switch_dict, arp = get_lldp(
-                        str(ip),
-                        credentials,
-                        return_error=True,
+            print(
+                f"  Connecting to {ips_length} switches using {min(workers, ips_length)} workers        ",
+                end="\r",
+                file=status,
+            )
+            run = FleetRun(
+                lambda ip: get_lldp(str(ip), credentials, return_error=True),
+                ips,
+                workers=workers,
+                timeout=timeout,
+                exceptions=(
+                    requests.exceptions.HTTPError,
+                    requests.exceptions.ConnectionError,
+                    requests.exceptions.RequestException,
+                    NetmikoTimeoutException,
+                    NetmikoAuthenticationException,
+                    TimeoutError,
+                ),
+                progress=_progress,
+            )
+
+            # Each switch is annotated and handed on as soon as it and every switch before it are collected
+            for result in run:
+                ip = result.item
+                if result.error is not None:
+                    errors.append(
+                        [
+                            str(ip),
+                            switch_error_message(result.error, ip, timeout),
+                        ],
                     )
+                    continue
 
+                switch_info, switch_dict, arp = result.value
+
+                with span("annotate", "switch", switch=str(ip)):
                     # Annotate LLDP data with Kea lease data via MAC lookup.
                     if kea_json is not None:
-                        add_kea_metadata_to_lldp(switch_dict, kea_json)
+                        add_kea_metadata_to_lldp(switch_dict, kea_json, neighbor_index)
                     # Annotate LLDP data with SLS file data via MAC lookup.
                     if sls_json is not None:
-                        add_sls_metadata_to_lldp(switch_dict, sls_json)
+                        add_sls_metadata_to_lldp(switch_dict, sls_json, neighbor_index)
                     # Annotate LLDP data with SMD ethernetInterfaces data
                     if smd_json is not None:
-                        add_smd_metadata_to_lldp(switch_dict, smd_json)
+                        add_smd_metadata_to_lldp(switch_dict, smd_json, neighbor_index)
                     # Annotate LLDP data with heuristics
                     if heuristic_lookups:
-                        add_heuristic_metadata_to_lldp(switch_info, switch_dict)
-
+                        add_heuristic_metadata_to_lldp(switch_info, switch_dict, neighbor_index)
+
+                if view == "equipment":
+                    equipment.add_switch(switch_info, switch_dict, arp)
+                elif stream is not None:
+                    stream.write(
+                        {
+                            "ip": str(ip),
+                            "switch_info": switch_info,
+                            "lldp": switch_dict,
+                            "arp": arp,
+                        },
+                    )
+                else:
                     switch_data.append(
                         [
                             switch_info,
@@ -264,42 +338,20 @@ def cabling(
                             arp,
                         ],
                     )
-                except (
-                    requests.exceptions.HTTPError,
-                    requests.exceptions.ConnectionError,
-                    requests.exceptions.RequestException,
-                    NetmikoTimeoutException,
-                    NetmikoAuthenticationException,
-                ) as err:
-                    exception_type = type(err).__name__
-                    error_message = "Unchecked"
-                    if exception_type == "HTTPError":
-                        error_message = (
-                            f"Error connecting to switch {ip}, check the entered username, IP address and password."
-                        )
-                    if exception_type == "ConnectionError":
-                        error_message = (
-                            f"Error connecting to switch {ip}, check the entered username, IP address and password."
-                        )
-                    if exception_type == "RequestException":
-                        error_message = f"Error connecting to switch {ip}."
-                    if exception_type == "NetmikoTimeoutException":
-                        error_message = f"Timeout error connecting to switch {ip}, check the entered username, IP address and password."  # noqa: B950
-                    if exception_type == "NetmikoAuthenticationException":
-                        error_message = f"Auth error connecting to switch {ip}, check the entered username, IP address and password."  # noqa: B950
 
-                    errors.append(
-                        [
-                            str(ip),
-                            error_message,
-                        ],
-                    )
+        click.secho(str(run.timing), fg="bright_white", err=True)
+
+        if stream is not None:
+            if view == "equipment":
+                stream.write_all(equipment.records())
+            stream.write_all({"ip": ip, "error": error} for ip, error in errors)
+            stream.close()
+            return
 
         if view == "switch":
             switch_table(switch_data, heuristic_lookups, out)
         elif view == "equipment":
-            equipment_json = equipment_table(switch_data)
-            print_equipment(equipment_json, out)
+            print_equipment(equipment.table(), out)
 
         dash = "-" * 100
         if len(errors) > 0:
@@ -309,32 +361,65 @@ def cabling(
                 click.echo("{:<15s} - {}".format(error[0], error[1]), file=out)
 
 
-def equipment_table(switch_data):
-    """Generate a dictionary of MAC addresses and what each address is connected to.
+def switch_error_message(error, ip, timeout):
+    """Return the message shown in the errors table for a switch that could not be collected.
 
     Args:
-        switch_data: A dictionary containing data for each equipment.
-            switch_data[i][0] -> Dictionary with switch platform_name, hostname and IP address
-            switch_data[i][1] -> Dictionary with LLDP information
-            switch_data[i][2] -> ARP dictionary
+        error: Exception raised while collecting the switch
+        ip: IPv4 address of the switch
+        timeout: Seconds waited for the switch
 
     Returns:
-        equipment_json: Dictionary with mac addresses as keys.
+        String with the error message
+    """
+    exception_type = type(error).__name__
+    error_message = "Unchecked"
+    if exception_type == "HTTPError":
+        error_message = f"Error connecting to switch {ip}, check the entered username, IP address and password."
+    if exception_type == "ConnectionError":
+        error_message = f"Error connecting to switch {ip}, check the entered username, IP address and password."
+    if exception_type == "RequestException":
+        error_message = f"Error connecting to switch {ip}."
+    if exception_type == "NetmikoTimeoutException":
+        error_message = f"Timeout error connecting to switch {ip}, check the entered username, IP address and password."  # noqa: B950
+    if exception_type == "NetmikoAuthenticationException":
+        error_message = f"Auth error connecting to switch {ip}, check the entered username, IP address and password."  # noqa: B950
+    if exception_type == "TimeoutError":
+        error_message = f"Timeout error collecting from switch {ip}, no response after {timeout} seconds."
+    return error_message
+
+
+class EquipmentTable:
+    """Equipment view of the cabling, built up one switch at a time.
+
+    Each switch is folded into the table as soon as it is collected, so its LLDP
+    data can be dropped straight away. The result is the same as running
+    `equipment_table` over every switch at the end.
     """
-    equipment_json = defaultdict(lambda: defaultdict(dict))
-
-    # Go through equipment and make the "TO" connections
-    for i in range(len(switch_data)):
-        # Add the mac address to equipment_json
-        equipment_json[switch_data[i][0]["system_mac"]].update(
-            {"hostname": switch_data[i][0]["hostname"]},
-        )
 
-        for port in switch_data[i][1]:
+    def __init__(self):
+        """Create an empty EquipmentTable."""
+        self.equipment_json = defaultdict(lambda: defaultdict(dict))
+        self.switch_macs = {}
+        self.arp = defaultdict(list)
+
+    def add_switch(self, switch_info, switch_dict, arp):
+        """Add the "TO" connections of a switch and the "FROM" connections they make.
+
+        Args:
+            switch_info: Dictionary with switch platform_name, hostname and IP address
+            switch_dict: Dictionary with LLDP information
+            arp: ARP dictionary
+        """
+        system_mac = switch_info["system_mac"]
+        self.switch_macs[system_mac] = None
+        equipment = self.equipment_json[system_mac]
+        # A neighbor name already reported by an earlier switch takes precedence over the hostname
+        equipment.setdefault("hostname", switch_info["hostname"])
+
+        for port in switch_dict:
             port_entries = []
-            for entry in range(len(switch_data[i][1][port])):
-                switch_entry = switch_data[i][1][port][entry]
-
+            for switch_entry in switch_dict[port]:
                 connection = {
                     "neighbor": switch_entry["chassis_name"],
                     "neighbor_description": switch_entry["chassis_description"],
@@ -345,44 +430,81 @@ def equipment_table(switch_data):
                 }
                 port_entries.append(connection)
 
-            equipment_json[switch_data[i][0]["system_mac"]]["connections_to"][port] = port_entries
-
-    # Go through a second time and make the "FROM" connections
-    for equipment in equipment_json.copy():
-        for port in equipment_json[equipment]["connections_to"]:
-            for entry in range(len(equipment_json[equipment]["connections_to"][port])):
-                equipment_entry = equipment_json[equipment]["connections_to"][port][entry]
-
-                neighbor_mac = equipment_entry["neighbor_chassis_mac"]
-                neighbor_port = equipment_entry["neighbor_port"]
+            equipment["connections_to"][port] = port_entries
 
-                equipment_json[neighbor_mac]["hostname"] = equipment_entry["neighbor"]
-                equipment_json[neighbor_mac]["description"] = equipment_entry["neighbor_description"]
+            for equipment_entry in port_entries:
+                neighbor = self.equipment_json[equipment_entry["neighbor_chassis_mac"]]
+                neighbor["hostname"] = equipment_entry["neighbor"]
+                neighbor["description"] = equipment_entry["neighbor_description"]
 
                 connection_dict = {
-                    "hostname": equipment_json[equipment]["hostname"],
-                    "description": equipment_json[equipment]["description"],
+                    "hostname": equipment["hostname"],
+                    "description": equipment["description"],
                     "port": port,
                     "port_description": equipment_entry["neighbor_port_description"],
                 }
 
-                equipment_json[neighbor_mac]["connections_from"].update(
-                    {neighbor_port: connection_dict},
+                neighbor["connections_from"].update(
+                    {equipment_entry["neighbor_port"]: connection_dict},
                 )
 
-    # Go through a third time to add all ARP info to equipment_json
-    for i in range(len(switch_data)):
-        for mac in switch_data[i][2]:
-            arp_mac = switch_data[i][2][mac]
-            if arp_mac["mac"] in equipment_json.keys():
-                arp_list = f"{arp_mac['ip_address']}:{list(arp_mac['port'])[0]}"
+        arp_lookup = index_arp(arp)
+        for mac in arp_lookup:
+            self.arp[mac].extend(arp_lookup.arp_entries(mac))
+
+    def table(self):
+        """Return the equipment table, switches first and then their neighbors.
+
+        Returns:
+            equipment_json: Dictionary with mac addresses as keys.
+        """
+        equipment_json = defaultdict(lambda: defaultdict(dict))
+        for mac in self.switch_macs:
+            equipment_json[mac] = self.equipment_json[mac]
+        for mac, equipment in self.equipment_json.items():
+            if mac not in equipment_json:
+                equipment_json[mac] = equipment
+
+        # Add the ARP info of every mac address in the table
+        for mac in equipment_json:
+            if mac in self.arp:
+                equipment_json[mac]["arp"] = self.arp[mac]
+        return equipment_json
+
+    def records(self):
+        """Return the equipment table as JSON records.
+
+        Yields:
+            Dictionary for each mac address with its hostname, ARP and connections
+        """
+        for mac, equipment in self.table().items():
+            description = equipment.get("description")
+            yield {
+                "mac": mac,
+                "hostname": equipment.get("hostname"),
+                "description": description if isinstance(description, str) else "",
+                "arp": list(dict.fromkeys(equipment.get("arp", []))),
+                "connections_to": dict(equipment.get("connections_to", {})),
+                "connections_from": dict(equipment.get("connections_from", {})),
+            }
 
-                if len(equipment_json[arp_mac["mac"]]["arp"]) == 0:
-                    equipment_json[arp_mac["mac"]]["arp"] = [arp_list]
-                else:
-                    equipment_json[arp_mac["mac"]]["arp"].append(arp_list)
 
-    return equipment_json
+def equipment_table(switch_data):
+    """Generate a dictionary of MAC addresses and what each address is connected to.
+
+    Args:
+        switch_data: A dictionary containing data for each equipment.
+            switch_data[i][0] -> Dictionary with switch platform_name, hostname and IP address
+            switch_data[i][1] -> Dictionary with LLDP information
+            switch_data[i][2] -> ARP dictionary
+
+    Returns:
+        equipment_json: Dictionary with mac addresses as keys.
+    """
+    equipment = EquipmentTable()
+    for switch_info, switch_dict, arp in switch_data:
+        equipment.add_switch(switch_info, switch_dict, arp)
+    return equipment.table()
 
 
 def print_equipment(equipment_json, out="-"):
@@ -39,7 +39,7 @@ from ruamel.yaml import YAML
 
 from canu.report.switch.firmware.firmware import get_firmware_aruba, get_firmware_dell, get_firmware_mellanox
 from canu.style import Style
-from canu.utils.vendor import switch_vendor
+from canu.utils.vendor import forget_vendor, refresh_vendor_option, switch_vendor, update_vendor_cache
 
 yaml = YAML()
 
@@ -101,6 +101,7 @@ csm_options = canu_config["csm_versions"]
     default="-",
 )
 # @click.option("--verbose", "-v", is_flag=True, help="Verbose mode")
+@refresh_vendor_option
 @click.pass_context
 def firmware(ctx, csm, ips, ips_file, username, password, json_, out):
     """Report the firmware versions of all switches (Aruba, Dell, or Mellanox) on the network.
@@ -185,6 +186,7 @@ def firmware(ctx, csm, ips, ips_file, username, password, json_, out):
                         )
 
                     firmware_range = config["csm"][csm][vendor][switch_info["platform_name"]]
+                    update_vendor_cache(ip, vendor, switch_info)
                     if switch_firmware["current_version"] >= max(firmware_range):
                         match_emoji = emoji.emojize(":canoe:")
                         firmware_match = "Pass"
@@ -224,6 +226,7 @@ def firmware(ctx, csm, ips, ips_file, username, password, json_, out):
                     NetmikoAuthenticationException,
                     KeyError,
                 ) as err:
+                    forget_vendor(ip)
                     exception_type = type(err).__name__
 
                     if exception_type == "HTTPError":
@@ -22,20 +22,17 @@
 """CANU commands report on the switch network."""
 import click
 
-from canu.report.network.cabling import cabling
-from canu.report.network.firmware import firmware
-from canu.report.network.version import version
 from canu.style import Style
 
 
 @click.group(
-    cls=Style.CanuHelpColorsGroup,
+    cls=Style.CanuLazyHelpColorsGroup,
+    lazy_subcommands={
+        "cabling": "canu.report.network.cabling.cabling:cabling",
+        "firmware": "canu.report.network.firmware.firmware:firmware",
+        "version": "canu.report.network.version.version:version",
+    },
 )
 @click.pass_context
 def network(ctx):
     """Commands that report on the entire network."""
-
-
-network.add_command(cabling.cabling)
-network.add_command(firmware.firmware)
-network.add_command(version.version)
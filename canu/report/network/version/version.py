@@ -29,11 +29,11 @@ from nornir import InitNornir
 from nornir.core.filter import F
 from nornir_salt.plugins.tasks import netmiko_send_commands
 from nornir_scrapli.tasks import send_command
-from ttp import ttp
 
 from canu.style import Style
 from canu.utils.host_alive import host_alive
 from canu.utils.inventory import inventory
+from canu.utils.ttp_parsers import parse_texts
 
 
 @click.command(
@@ -144,42 +144,32 @@ def version(ctx, username, password, sls_file, sls_address, network, log_):
             commands="show running-configuration | grep banner",
         )
 
-    for switches in aruba_banner_check.keys():
-        parser = ttp(
-            data=str(aruba_banner_check[switches][0]),
-            template=banner_ttp_aruba,
-        )
-        parser.parse()
-        version[switches] = parser.result()
-
-    for switches in mellanox_banner_check.keys():
-        parser = ttp(
-            data=str(mellanox_banner_check[switches][1]),
-            template=banner_ttp_mellanox,
-        )
-        parser.parse()
-        version[switches] = parser.result()
-
-    for switches in dell_banner_check.keys():
-        parser = ttp(data=str(dell_banner_check[switches][1]), template=banner_ttp_dell)
-        parser.parse()
-        version[switches] = parser.result()
+    # Each banner template is compiled once and parses the banners of every switch
+    for template, banner_check, output in (
+        (banner_ttp_aruba, aruba_banner_check, 0),
+        (banner_ttp_mellanox, mellanox_banner_check, 1),
+        (banner_ttp_dell, dell_banner_check, 1),
+    ):
+        switches = list(banner_check.keys())
+        banners = parse_texts(template, [banner_check[switch][output] for switch in switches])
+        for index, switch in enumerate(switches):
+            version[switch] = banners[index]
 
     click.secho(
         "{:<17} {:<17} {:<5}".format("SWITCH", "CANU VERSION", "CSM VERSION"),
         fg="bright_white",
     )
     for key, value in version.items():
-        if not value[0][0]:
-            version[key][0][0] = {
+        if not value:
+            value = version[key] = {
                 "canu_version": "BANNER NOT FOUND",
                 "csm_version": "N/A",
             }
             click.secho(
                 "{:<17} {:<17} {:<5}".format(
                     key,
-                    value[0][0]["canu_version"],
-                    value[0][0]["csm_version"],
+                    value["canu_version"],
+                    value["csm_version"],
                 ),
                 fg="red",
             )
@@ -187,8 +177,8 @@ def version(ctx, username, password, sls_file, sls_address, network, log_):
             click.secho(
                 "{:<17} {:<17} {:<5}".format(
                     key,
-                    value[0][0]["canu_version"],
-                    value[0][0]["csm_version"],
+                    value["canu_version"],
+                    value["csm_version"],
                 ),
                 fg="green",
             )
@@ -22,18 +22,16 @@
 """CANU report commands."""
 import click
 
-from canu.report.network import network
-from canu.report.switch import switch
 from canu.style import Style
 
 
 @click.group(
-    cls=Style.CanuHelpColorsGroup,
+    cls=Style.CanuLazyHelpColorsGroup,
+    lazy_subcommands={
+        "network": "canu.report.network.network:network",
+        "switch": "canu.report.switch.switch:switch",
+    },
 )
 @click.pass_context
 def report(ctx):
     """Canu report commands."""
-
-
-report.add_command(network.network)
-report.add_command(switch.switch)
@@ -35,11 +35,13 @@ import urllib3
 from netmiko import NetmikoAuthenticationException, NetmikoTimeoutException
 
 from canu.style import Style
-from canu.utils.heuristics import heuristic_lookup
-from canu.utils.mac import find_mac
-from canu.utils.sls_utils import Managers
+from canu.utils.aruba_session import aruba_login, aruba_logout
+from canu.utils.mac import find_mac, find_macs
+from canu.utils.neighbor_index import NeighborIndex, index_arp
+from canu.utils.snapshot import load_lldp_snapshot, save_lldp_snapshot
 from canu.utils.ssh import netmiko_command, netmiko_commands
-from canu.utils.vendor import switch_vendor
+from canu.utils.trace import TracedSession, span
+from canu.utils.vendor import forget_vendor, refresh_vendor_option, switch_vendor, update_vendor_cache
 
 # To disable warnings about unsecured HTTPS requests
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -96,6 +98,7 @@ log = logging.getLogger("report_cabling")
     type=click.File("w"),
     default="-",
 )
+@refresh_vendor_option
 @click.pass_context
 def cabling(
     ctx,
@@ -202,13 +205,17 @@ def cabling(
     print_lldp(switch_info, switch_dict, arp, heuristic_lookups, out)
 
 
-def get_lldp(ip, credentials, return_error=False):
+def get_lldp(ip, credentials, return_error=False, max_age=None):
     """Get lldp of an Aruba, Dell, or Mellanox switch.
 
+    Every successful collection is saved as a snapshot. When max_age is set, a
+    snapshot younger than max_age seconds is returned instead of polling the switch.
+
     Args:
         ip: IPv4 address of the switch
         credentials: Dictionary with username and password of the switch
         return_error: Bool if the error should be printed or returned
+        max_age: Oldest snapshot in seconds to use, None to always poll the switch
 
     Returns:
         switch_info: Dictionary with switch platform_name, hostname and IP address
@@ -219,26 +226,39 @@ def get_lldp(ip, credentials, return_error=False):
         NetmikoTimeoutException: Timeout error connecting to switch
         NetmikoAuthenticationException: Authentication error connecting to switch
     """
+    if max_age is not None:
+        snapshot = load_lldp_snapshot(ip, max_age)
+        if snapshot is not None:
+            return snapshot
+
     log.debug("Collecting LLDP data")
     try:
         vendor = switch_vendor(ip, credentials, return_error)
 
         if vendor is None:
             return None, None, None
-        elif vendor == "aruba":
-            switch_info, switch_dict, arp = get_lldp_aruba(
-                ip,
-                credentials,
-                return_error,
-            )
-        elif vendor == "dell":
-            switch_info, switch_dict, arp = get_lldp_dell(ip, credentials, return_error)
-        elif vendor == "mellanox":
-            switch_info, switch_dict, arp = get_lldp_mellanox(
-                ip,
-                credentials,
-                return_error,
-            )
+
+        # The self time of the span is the parsing, the REST and SSH commands have their own spans
+        with span("lldp", "switch", switch=str(ip), vendor=vendor):
+            if vendor == "aruba":
+                switch_info, switch_dict, arp = get_lldp_aruba(
+                    ip,
+                    credentials,
+                    return_error,
+                )
+            elif vendor == "dell":
+                switch_info, switch_dict, arp = get_lldp_dell(ip, credentials, return_error)
+            elif vendor == "mellanox":
+                switch_info, switch_dict, arp = get_lldp_mellanox(
+                    ip,
+                    credentials,
+                    return_error,
+                )
+
+        if switch_info is not None:
+            update_vendor_cache(ip, vendor, switch_info)
+        else:
+            forget_vendor(ip)
 
     except (
         requests.exceptions.HTTPError,
@@ -247,6 +267,7 @@ def get_lldp(ip, credentials, return_error=False):
         NetmikoTimeoutException,
         NetmikoAuthenticationException,
     ) as error:
+        forget_vendor(ip)
         if return_error:
             raise error
 
@@ -260,15 +281,13 @@ def get_lldp(ip, credentials, return_error=False):
 
     if arp or arp is not None:
         log.debug("Adding ARP metadata to switch LLDP data")
+        arp_lookup = index_arp(arp)
         for _, port in switch_dict.items():
             for index, _ in enumerate(port):
-                arp_list = [
-                    f"{arp[mac]['ip_address']}:{list(arp[mac]['port'])[0]}"
-                    for mac in arp
-                    if arp[mac]["mac"] == port[index]["mac_addr"]
-                ]
-                arp_list = ", ".join(arp_list)
-                port[index]["arp_data"] = arp_list
+                port[index]["arp_data"] = ", ".join(arp_lookup.arp_entries(port[index]["mac_addr"]))
+
+    if switch_info is not None:
+        save_lldp_snapshot(ip, switch_info, switch_dict, arp)
 
     return switch_info, switch_dict, arp
 
@@ -289,15 +308,9 @@ def get_lldp_aruba(ip, credentials, return_error=False):
     Raises:
         error: Error
     """
-    session = requests.Session()
     try:
         # Login
-        login = session.post(
-            f"https://{ip}/rest/v10.04/login",
-            data=credentials,
-            verify=False,
-        )
-        login.raise_for_status()
+        session = aruba_login(ip, credentials)
 
     except (
         requests.exceptions.HTTPError,
@@ -374,7 +387,7 @@ def get_lldp_aruba(ip, credentials, return_error=False):
                 lldp_dict[interface].append(lldp_neighbor)
 
         # Logout
-        session.post(f"https://{ip}/rest/v10.04/logout", verify=False)
+        aruba_logout(session)
 
         # Get the mac-address-table to help fill in port data if not reported over LLDP
         command = "show mac-address-table"
@@ -390,13 +403,14 @@ def get_lldp_aruba(ip, credentials, return_error=False):
                 mac_address_table[table_port] = table_mac
 
         # Add the mac-address-table data to the lldp_dict
+        vendors = find_macs(mac_address_table.values())
         for device_port, mac in mac_address_table.items():
             if device_port not in lldp_dict.keys():
                 lldp_dict[device_port] = [
                     {
                         "chassis_id": "",
                         "mac_addr": mac,
-                        "chassis_description": find_mac(mac),
+                        "chassis_description": vendors[mac],
                         "port_description": "",
                         "chassis_name": "",
                         "port_id": mac,
@@ -531,13 +545,14 @@ def get_lldp_dell(ip, credentials, return_error):
                 mac_address_table[table_port] = table_mac
 
         # Add the mac-address-table data to the lldp_dict
+        vendors = find_macs(mac_address_table.values())
         for device_port, mac in mac_address_table.items():
             if device_port not in lldp_dict.keys():
                 lldp_dict[device_port] = [
                     {
                         "chassis_id": "",
                         "mac_addr": mac,
-                        "chassis_description": find_mac(mac),
+                        "chassis_description": vendors[mac],
                         "port_description": "",
                         "chassis_name": "",
                         "port_id": mac,
@@ -648,7 +663,7 @@ def get_lldp_mellanox(ip, credentials, return_error):
         HTTPError: IP not Mellanox switch, or credentials bad.
         ConnectionError: Bad IP address.
     """
-    session = requests.Session()
+    session = TracedSession()
 
     # Login
     login = session.post(
@@ -792,6 +807,7 @@ def get_lldp_mellanox(ip, credentials, return_error):
                     pass
 
         # Add the mac-address-table data to the lldp_dict
+        vendors = find_macs(mac for mac_list in address_table_dict.values() for mac in mac_list)
         for device_port, mac_list in address_table_dict.items():
             if device_port not in lldp_dict.keys():
                 for mac in mac_list:
@@ -799,7 +815,7 @@ def get_lldp_mellanox(ip, credentials, return_error):
                         {
                             "chassis_id": "",
                             "mac_addr": mac,
-                            "chassis_description": find_mac(mac),
+                            "chassis_description": vendors[mac],
                             "port_description": "",
                             "chassis_name": "",
                             "port_id": mac,
@@ -905,28 +921,17 @@ def get_lldp_mellanox(ip, credentials, return_error):
     return switch_json, lldp_dict, arp
 
 
-def add_kea_metadata_to_lldp(switch_info, kea_json):
-    """Annotate existing switch LLDP data with data from Kea leases.
+def add_kea_metadata_to_lldp(switch_info, kea_json, index=None):
+    """Annotate existing switch LLDP data with data from Kea.
 
     Args:
         switch_info: Dictionary with switch platform_name, hostname and IP address.
         kea_json: JSON export from Kea API call.
+        index: Optional NeighborIndex already built from kea_json
     """
     log.debug("Adding Kea metadata to switch LLDP data")
-
-    # Create mac-to-name lookup table from Kea data
-    kea_lookup = defaultdict()
-    for lease in kea_json[0]["arguments"]["leases"]:
-        lease_dict = {
-            lease.get("hw-address"): {
-                "hostname": lease.get("hostname"),
-                "mac_address": lease.get("hw-address"),
-                "vlan": lease.get("subnet-id"),
-                "ipv4address": lease.get("ip-address"),
-            },
-        }
-        kea_lookup.update(lease_dict)
-    log.debug(f"Kea lookup table: {kea_lookup}")
+    if index is None:
+        index = NeighborIndex(kea_json=kea_json)
 
     # Fill in missing names with Kea MAC data
     for _, v in switch_info.items():
@@ -935,7 +940,7 @@ def add_kea_metadata_to_lldp(switch_info, kea_json):
         lldp_mac = v[0].get("mac_addr")
         if lldp_mac is None:
             continue
-        kea_record = kea_lookup.get(lldp_mac)
+        kea_record = index.kea_lease(lldp_mac)
         if kea_record is None:
             continue
         hostname = kea_record.get("hostname")
@@ -946,64 +951,42 @@ def add_kea_metadata_to_lldp(switch_info, kea_json):
         log.debug(f"Kea hostname is {hostname} for LLDP MAC {lldp_mac}")
 
 
-def add_sls_metadata_to_lldp(switch_info, sls_json):
+def add_sls_metadata_to_lldp(switch_info, sls_json, index=None):
     """Annotate existing switch LLDP data with data from SLS.
 
     Args:
         switch_info: Dictionary with switch platform_name, hostname and IP address.
         sls_json: JSON export from SLS API call.
+        index: Optional NeighborIndex already built from sls_json
     """
     log.debug("Adding SLS metadata to switch LLDP data")
-
-    sls_ip_lookup = defaultdict()
-    # Create a clone of the original file because Managers manipulate live data.
-    original_networks = json.loads(json.dumps(sls_json.get("Networks")))
-    networks = Managers.NetworkManager(original_networks)
-    for network in networks.values():
-        for subnet in network.subnets().values():
-            for reservation in subnet.reservations().values():
-                sls_ip_lookup.update(
-                    {str(reservation.ipv4_address()): reservation.name()},
-                )
-    log.debug(f"SLS lookup table: {sls_ip_lookup}")
+    if index is None:
+        index = NeighborIndex(sls_json=sls_json)
 
     for _, v in switch_info.items():
         if v[0].get("chassis_name"):
             continue
         arp_data = v[0]["arp_data"]
-        for ip, hostname in sls_ip_lookup.items():
-            if f"{ip}:vlan" not in arp_data:
-                continue
-            v[0]["chassis_name"] = hostname
-            v[0]["data_sources"] += ""
-            v[0]["data_sources"] = f'{v[0]["data_sources"]}, SLS'
+        hostname = index.sls_name_for_arp_data(arp_data)
+        if hostname is None:
+            continue
+        v[0]["chassis_name"] = hostname
+        v[0]["data_sources"] = f'{v[0]["data_sources"]}, SLS'
 
-            log.debug(f"SLS hostname is {hostname} for ARP data {arp_data}")
-            break
+        log.debug(f"SLS hostname is {hostname} for ARP data {arp_data}")
 
 
-def add_smd_metadata_to_lldp(switch_info, smd_json):
+def add_smd_metadata_to_lldp(switch_info, smd_json, index=None):
     """Annotate existing switch LLDP data with data from SMD ethernetInterfaces.
 
     Args:
         switch_info: Dictionary with switch platform_name, hostname and IP address
         smd_json: JSON exported from SMD/HSM ethernetInterfaces
+        index: Optional NeighborIndex already built from smd_json
     """
     log.debug("Adding SMD metadata to switch LLDP data")
-
-    # Create mac-to-name lookup table from SMD data
-    smd_lookup = defaultdict()
-    for device in smd_json:
-        device_dict = {
-            device.get("MACAddress"): {
-                "hostname": device.get("ComponentID"),
-                "mac_address": device.get("MACAddress"),
-                "vlan": None,
-                "ipv4address": "TODO",
-            },
-        }
-        smd_lookup.update(device_dict)
-    log.debug(f"SMD lookup table: {smd_lookup}")
+    if index is None:
+        index = NeighborIndex(smd_json=smd_json)
 
     # Fill in missing names with SMD data
     for _, v in switch_info.items():
@@ -1012,7 +995,7 @@ def add_smd_metadata_to_lldp(switch_info, smd_json):
         lldp_mac = v[0].get("mac_addr")
         if lldp_mac is None:
             continue
-        smd_record = smd_lookup.get(lldp_mac)
+        smd_record = index.smd_interface(lldp_mac)
         if smd_record is None:
             continue
         hostname = smd_record.get("hostname")
@@ -1023,7 +1006,7 @@ def add_smd_metadata_to_lldp(switch_info, smd_json):
         log.debug(f"SMD hostname is {hostname} for LLDP MAC {lldp_mac}")
 
 
-def add_heuristic_metadata_to_lldp(switch_info, switch_dict):
+def add_heuristic_metadata_to_lldp(switch_info, switch_dict, index=None):
     """Annotate existing switch LLDP data with common MAC-use heuristics.
 
     Often standardized hardware is used for systems.  Based on the vendor of MAC
@@ -1032,25 +1015,22 @@ def add_heuristic_metadata_to_lldp(switch_info, switch_dict):
     Args:
         switch_info: Dictionary with switch platform_name, hostname and IP address source of LLDP data
         switch_dict: Dictionary with switch collected LLDP data.
+        index: Optional NeighborIndex
     """
     log.debug("Adding heuristic metadata to switch LLDP data")
+    if index is None:
+        index = NeighborIndex()
+
     for _, v in switch_dict.items():
         if v[0].get("chassis_name"):
             continue
         lldp_mac = v[0].get("mac_addr")
         if lldp_mac is None:
             continue
-        heuristic_record = None
-        for lookup_mac, switch_types in heuristic_lookup.items():
-            if lookup_mac not in lldp_mac:
-                continue
-            for switch_type, heuristic in switch_types.items():
-                if switch_type not in switch_info["hostname"]:
-                    continue
-                heuristic_record = heuristic["hint"]
-
-        if heuristic_record is None:
+        heuristic = index.heuristic(lldp_mac, switch_info["hostname"])
+        if heuristic is None:
             continue
+        heuristic_record = heuristic["hint"]
         v[0]["data_sources"] = f'{v[0]["data_sources"]}, Heuristic'
         v[0]["chassis_description"] = f'{v[0]["chassis_description"]} {heuristic_record}'
         log.debug(f"MAC {lldp_mac} often a {heuristic_record}")
@@ -1077,17 +1057,14 @@ def print_lldp(switch_info, lldp_dict, arp, heuristic_lookups, out="-"):
         "DATA SOURCES",
     ]
 
+    neighbor_index = NeighborIndex(arp=arp)
     table = []
     for port_number, port in lldp_dict.items():
         for index, _entry in enumerate(port):
             # If the device cannot be discovered by lldp, look it up in the ARP.
             arp_list = []
             if port[index]["chassis_name"] == "":
-                arp_list = [
-                    f"{arp[mac]['ip_address']}:{list(arp[mac]['port'])[0]}"
-                    for mac in arp
-                    if arp[mac]["mac"] == port[index]["mac_addr"]
-                ]
+                arp_list = neighbor_index.arp_entries(port[index]["mac_addr"])
             arp_list = ", ".join(arp_list)
             description = port[index]["port_description"]
             if description == port[index]["port_id"]:
@@ -1111,16 +1088,11 @@ def print_lldp(switch_info, lldp_dict, arp, heuristic_lookups, out="-"):
                 if neighbor_port.find(":") != -1:  # Cheap MAC find
                     neighbor_mac = neighbor_port
             if heuristic_lookups:
-                for h_mac, switch_data in heuristic_lookup.items():
-                    if h_mac not in neighbor_port:
-                        continue
-                    for switch_type, heuristic in switch_data.items():
-                        if switch_type not in switch_info["hostname"]:
-                            continue
-                        neighbor_port = heuristic["port"]
-                        if "Heuristic" not in port[index]["data_sources"]:
-                            port[index]["data_sources"] = f'{port[index]["data_sources"]}, Heuristic'
-                        break
+                heuristic = neighbor_index.heuristic(neighbor_port, switch_info["hostname"])
+                if heuristic is not None:
+                    neighbor_port = heuristic["port"]
+                    if "Heuristic" not in port[index]["data_sources"]:
+                        port[index]["data_sources"] = f'{port[index]["data_sources"]}, Heuristic'
 
             neighbor_info = f'{port[index]["chassis_description"][:54]} {lag_mac} {str(arp_list)}'
             if neighbor_description:
@@ -34,8 +34,10 @@ from netmiko import NetmikoAuthenticationException, NetmikoTimeoutException
 from ruamel.yaml import YAML
 
 from canu.style import Style
+from canu.utils.aruba_session import aruba_login, aruba_logout
 from canu.utils.ssh import netmiko_commands
-from canu.utils.vendor import switch_vendor
+from canu.utils.trace import TracedSession
+from canu.utils.vendor import refresh_vendor_option, switch_vendor
 
 yaml = YAML()
 
@@ -88,6 +90,7 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
     type=click.File("w"),
     default="-",
 )
+@refresh_vendor_option
 @click.pass_context
 def firmware(ctx, csm, ip, username, password, json_, verbose, out):
     """Report the firmware of a switch (Aruba, Dell, or Mellanox) on the network.
@@ -232,15 +235,9 @@ def get_firmware_aruba(ip, credentials, return_error=False):
     Raises:
         error: Error
     """
-    session = requests.Session()
     try:
         # Login
-        login = session.post(
-            f"https://{ip}/rest/v10.04/login",
-            data=credentials,
-            verify=False,
-        )
-        login.raise_for_status()
+        session = aruba_login(ip, credentials)
 
     except (
         requests.exceptions.HTTPError,
@@ -282,7 +279,7 @@ def get_firmware_aruba(ip, credentials, return_error=False):
         switch_info = response.json()
 
         # Logout
-        session.post(f"https://{ip}/rest/v10.04/logout", verify=False)
+        aruba_logout(session)
 
         return switch_firmware, switch_info
 
@@ -317,7 +314,7 @@ def get_firmware_dell(ip, credentials, return_error=False):
         "booted_image": "",
     }
 
-    session = requests.Session()
+    session = TracedSession()
     try:
         # GET firmware version
         auth = (credentials["username"], credentials["password"])
@@ -22,18 +22,16 @@
 """CANU report switch commands."""
 import click
 
-from canu.report.switch.cabling import cabling
-from canu.report.switch.firmware import firmware
 from canu.style import Style
 
 
 @click.group(
-    cls=Style.CanuHelpColorsGroup,
+    cls=Style.CanuLazyHelpColorsGroup,
+    lazy_subcommands={
+        "cabling": "canu.report.switch.cabling.cabling:cabling",
+        "firmware": "canu.report.switch.firmware.firmware:firmware",
+    },
 )
 @click.pass_context
 def switch(ctx):
     """Report switch commands."""
-
-
-switch.add_command(cabling.cabling)
-switch.add_command(firmware.firmware)
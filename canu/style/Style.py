@@ -20,7 +20,9 @@
 # ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 # OTHER DEALINGS IN THE SOFTWARE.
 """Style to keep styling in one place."""
+import importlib
 
+from click.utils import make_default_short_help
 from click_help_colors import HelpColorsCommand, HelpColorsGroup
 
 
@@ -58,3 +60,59 @@ class CanuHelpColorsGroup(HelpColorsGroup):
         super().__init__(*args, **kwargs)
         self.help_headers_color = "blue"
         self.help_options_color = "yellow"
+
+
+class CanuLazyHelpColorsGroup(CanuHelpColorsGroup):
+    """A help colors group that imports each subcommand only when it is used.
+
+    Running a command only imports the modules (and dependencies like netmiko,
+    nornir or openpyxl) of the groups and command on its path.
+
+    Attributes
+    ----------
+    lazy_subcommands : dict
+        Command name to the "module:attribute" path of the command.
+    lazy_short_help : dict
+        Command name to the short help listed for a command that is not imported yet,
+        for leaf commands that would otherwise be imported just to list them.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, lazy_short_help=None, **kwargs) -> None:
+        """Set the lazily imported subcommands."""
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+        self.lazy_short_help = lazy_short_help or {}
+
+    def list_commands(self, ctx):
+        """Return the names of the added and lazy subcommands."""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        """Return a subcommand, importing it the first time it is used."""
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+            command = getattr(importlib.import_module(module_name), attribute)
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        """List the subcommands, using lazy_short_help for commands that are not imported."""
+        commands = []
+        for name in self.list_commands(ctx):
+            if name not in self.commands and name in self.lazy_short_help:
+                commands.append((name, None))
+                continue
+            command = self.get_command(ctx, name)
+            if command is not None and not command.hidden:
+                commands.append((name, command))
+
+        if commands:
+            limit = formatter.width - 6 - max(len(name) for name, _ in commands)
+            rows = []
+            for name, command in commands:
+                if command is None:
+                    rows.append((name, make_default_short_help(self.lazy_short_help[name], limit)))
+                else:
+                    rows.append((name, command.get_short_help_str(limit)))
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
@@ -20,7 +20,7 @@
 # ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 # OTHER DEALINGS IN THE SOFTWARE.
 """parse aruba bgp config and test for missing neighbors."""
-from ttp import ttp
+from canu.utils.ttp_parsers import parse_text
 
 
 def bgp_config(result, vlan_ips, vrf, mtn_acls=None, services_acl=None):
@@ -76,9 +76,7 @@ router bgp {{ asn }}
 </group>
     """
     # Parse the aruba "show run bgp" command
-    result_parsed = ttp(str(result), aruba_aoscx_show_run_bgp)
-    result_parsed.parse()
-    output = result_parsed.result()
+    output = parse_text(aruba_aoscx_show_run_bgp, str(result))
 
     exception = None
     result = "PASS"
@@ -86,8 +84,8 @@ router bgp {{ asn }}
 
     # Get BGP peers from switch config
     bgp_peers = {}
-    bgp_peers.update(output[0][0]["bgp_cfg"]["vrfs"][vrf]["peers"])
-    bgp_peers.update(output[0][0]["bgp_cfg"]["vrfs"]["default"]["peers"])
+    bgp_peers.update(output["bgp_cfg"]["vrfs"][vrf]["peers"])
+    bgp_peers.update(output["bgp_cfg"]["vrfs"]["default"]["peers"])
 
     # Get the worker nodes CMN and NMN IPs
     # If those are not in the BGP config on the switch add them to the list.
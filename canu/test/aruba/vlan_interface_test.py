@@ -20,7 +20,7 @@
 # ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 # OTHER DEALINGS IN THE SOFTWARE.
 """parse aruba interface config and verify IPs are correct."""
-from ttp import ttp
+from canu.utils.ttp_parsers import parse_text
 
 
 def vlan_interface_config(result, vlan_ips, vrf=None, mtn_acls=None, services_acl=None):
@@ -55,13 +55,11 @@ interface vlan {{ vlan }}
 </group>
     """
     # Parse the aruba "show run"
-    result_parsed = ttp(str(result), aruba_aoscx_show_run_interface)
-    result_parsed.parse()
-    output = result_parsed.result()
+    output = parse_text(aruba_aoscx_show_run_interface, str(result))
 
     # Get the vlan config and hostname
-    vlan_config = output[0][0]["config"]["vlan"]
-    hostname = output[0][0]["config"]["hostname"]
+    vlan_config = output["config"]["vlan"]
+    hostname = output["config"]["hostname"]
 
     exception = []
     result = "PASS"
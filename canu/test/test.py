@@ -29,22 +29,18 @@ from pathlib import Path
 import click
 import yaml
 from jinja2 import Environment
-from jinja2 import FileSystemLoader
-from jinja2 import select_autoescape
-from jinja2 import StrictUndefined
 from nornir import InitNornir
 from nornir.core.filter import F
 from nornir_salt.plugins.functions import ResultSerializer, TabulateFormatter
 from nornir_salt.plugins.processors import TestsProcessor
 from nornir_salt.plugins.tasks import netmiko_send_commands, scrapli_send_commands
 
-from canu.generate.switch.config.config import parse_sls_for_config
 from canu.style import Style
 from canu.utils.host_alive import host_alive
 from canu.utils.inventory import inventory
 from canu.utils.json_load import load_json
-from canu.utils.sls import sls_dump
-from canu.utils.sls_utils.Managers import NetworkManager
+from canu.utils.sls import sls_dump, sls_model
+from canu.utils.templates import template_environment
 
 # Get project root directory
 if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):  # pragma: no cover
@@ -196,9 +192,7 @@ def test(
 
     def render_template(sls_json, template_path):
         """Hack to grab `canu generate switch config` variables."""
-        sls_variables = parse_sls_for_config(
-            [network[x] for network in [sls_json.get("Networks", {})] for x in network],
-        )
+        sls_variables = sls_model(sls_json).config_variables
         variables = {
             "NCN_W001": sls_variables["ncn_w001"],
             "NCN_W002": sls_variables["ncn_w002"],
@@ -299,17 +293,7 @@ def test(
         }
 
         # Import templates
-        network_templates_folder = path.join(
-            project_root,
-            "network_modeling",
-            "configs",
-            "templates",
-        )
-        env = Environment(
-            autoescape=select_autoescape(),
-            loader=FileSystemLoader(network_templates_folder),
-            undefined=StrictUndefined,
-        )
+        env = template_environment("switch")
         template = env.get_template(path.join(template_path))
         rendered_template = template.render(variables=variables)
 
@@ -331,12 +315,11 @@ def test(
     else:
         sls_json = sls_dump(path="dumpstate")
 
-    # Rendering any templates needs to be done before  NetworkManager munges sls_json.
-    # There's a bug in NeworkManager where the ExtraProperties in json is lost.
+    # The templates, the NetworkManager and the inventory all share one parse of the SLS data
     mtn_acls = render_template(sls_json, "1.7/aruba/common/mtn_acl.j2")
     services_acl = render_template(sls_json, "1.7/aruba/common/services_acl.j2")
 
-    networks = NetworkManager(sls_json["Networks"])
+    networks = sls_model(sls_json).network_manager
 
     vlan_ips = get_vlan_ips(["HMN", "CMN", "NMN"])
 
@@ -344,8 +327,8 @@ def test(
         username,
         password,
         network,
-        sls_file,
         sls_inventory=True,
+        dumpstate=sls_json,
     )
     sls_variables["CSM_VRF"] = vrf
     nr = InitNornir(
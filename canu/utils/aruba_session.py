@@ -0,0 +1,202 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""CANU Aruba REST session pool.
+
+Every Aruba AOS-CX REST call needs an authenticated session, and the switch only
+allows a handful of them at once. Inside a pool scope (one per CANU command) the
+first login to a switch is kept and reused by every later REST call to that switch,
+and all of the sessions are logged out when the scope ends. Outside of a pool scope
+the sessions behave like a plain `requests.Session` that is logged out after use.
+"""
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+
+import requests
+
+from canu.utils.trace import TracedSession
+
+log = logging.getLogger("aruba_session")
+
+API_VERSION = "v10.04"
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+class ArubaSession(TracedSession):
+    """A `requests.Session` logged in to the REST API of a single Aruba switch."""
+
+    def __init__(self, ip, credentials):
+        """Create an ArubaSession.
+
+        Args:
+            ip: IPv4 address of the switch
+            credentials: Dictionary with username and password of the switch
+        """
+        super().__init__()
+        self.verify = False
+        self.ip = ip
+        self.credentials = credentials
+        self.logged_in = False
+        self.pooled = False
+        self.lock = threading.Lock()
+
+    def url(self, path):
+        """Return the full REST URL for a path on this switch.
+
+        Args:
+            path: Path after the API version, for example 'system/interfaces'
+
+        Returns:
+            The full URL
+        """
+        return f"https://{self.ip}/rest/{API_VERSION}/{path.lstrip('/')}"
+
+    def login(self):
+        """Log in to the switch, raising `requests.exceptions.HTTPError` if the credentials are rejected."""
+        log.debug(f"Logging in to {self.ip}")
+        response = super().request("POST", self.url("login"), data=self.credentials, verify=False)
+        response.raise_for_status()
+        self.logged_in = True
+
+    def logout(self):
+        """Log out of the switch, ignoring any errors since the session is finished either way."""
+        if not self.logged_in:
+            return
+        self.logged_in = False
+        try:
+            super().request("POST", self.url("logout"), verify=False)
+        except requests.exceptions.RequestException as err:
+            log.debug(f"Error logging out of {self.ip}: {err}")
+
+    def request(self, method, url, *args, **kwargs):
+        """Send a request, logging in again once if the switch expired the session.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            *args: Positional arguments passed to `requests.Session.request`
+            **kwargs: Keyword arguments passed to `requests.Session.request`
+
+        Returns:
+            The `requests.Response`
+        """
+        response = super().request(method, url, *args, **kwargs)
+        if response.status_code == 401 and self.logged_in and not url.endswith(("/login", "/logout")):
+            log.debug(f"Session on {self.ip} expired, logging in again")
+            self.logged_in = False
+            self.login()
+            response = super().request(method, url, *args, **kwargs)
+        return response
+
+
+def aruba_login(ip, credentials):
+    """Get a logged in Aruba REST session for a switch.
+
+    Inside a pool scope an existing session for the switch is reused, otherwise a new
+    session is logged in. A pooled session with other credentials is logged out and replaced.
+
+    Args:
+        ip: IPv4 address of the switch
+        credentials: Dictionary with username and password of the switch
+
+    Returns:
+        ArubaSession logged in to the switch
+    """
+    if _pool is None:
+        session = ArubaSession(ip, credentials)
+        session.login()
+        return session
+
+    key = (ip, credentials["username"])
+    replaced = None
+    with _pool_lock:
+        session = _pool.get(key)
+        if session is None or session.credentials != credentials:
+            replaced = session
+            session = ArubaSession(ip, credentials)
+            session.pooled = True
+            _pool[key] = session
+
+    # Log out of a session replaced by one with new credentials, it is no longer in the pool
+    if replaced is not None:
+        with replaced.lock:
+            replaced.logout()
+        replaced.close()
+
+    with session.lock:
+        if not session.logged_in:
+            session.login()
+    return session
+
+
+def aruba_logout(session):
+    """Release an Aruba REST session.
+
+    Pooled sessions stay logged in until the pool scope ends.
+
+    Args:
+        session: ArubaSession from `aruba_login`
+    """
+    if not session.pooled:
+        session.logout()
+        session.close()
+
+
+def close_aruba_sessions():
+    """Log out of every pooled Aruba REST session."""
+    if _pool is None:
+        return
+    with _pool_lock:
+        sessions = list(_pool.values())
+        _pool.clear()
+    for session in sessions:
+        session.logout()
+        session.close()
+
+
+@contextmanager
+def aruba_session_pool():
+    """Share Aruba REST sessions between every call made inside the scope.
+
+    Nested scopes reuse the outermost pool.
+
+    Yields:
+        None
+    """
+    global _pool
+
+    if _pool is not None:
+        yield
+        return
+
+    _pool = {}
+    try:
+        yield
+    finally:
+        close_aruba_sessions()
+        _pool = None
+
+
+atexit.register(close_aruba_sessions)
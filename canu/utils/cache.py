@@ -0,0 +1,172 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""CANU on-disk cache utils.
+
+Everything CANU caches between runs lives under one directory, by default
+`$XDG_CACHE_HOME/canu` (`~/.cache/canu`). Set `CANU_CACHE_DIR` to move it, or
+to an empty string to turn all on-disk caching off.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from os import path
+
+log = logging.getLogger("cache")
+
+
+def cache_dir(*parts):
+    """Return the CANU cache directory, creating it if needed.
+
+    Args:
+        *parts: Optional sub-directories of the cache directory
+
+    Returns:
+        Path of the cache directory, or None if caching is disabled or the directory can't be created
+    """
+    base = os.environ.get("CANU_CACHE_DIR")
+    if base is None:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME") or path.join(path.expanduser("~"), ".cache")
+        base = path.join(xdg_cache, "canu")
+    if not base:
+        return None
+
+    directory = path.join(base, *parts)
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError as err:
+        log.debug(f"Caching disabled, could not create {directory}: {err}")
+        return None
+    return directory
+
+
+def cache_path(*parts):
+    """Return the path of a file in the CANU cache directory.
+
+    Args:
+        *parts: Sub-directories and file name inside the cache directory
+
+    Returns:
+        Path of the cache file, or None if caching is disabled
+    """
+    directory = cache_dir(*parts[:-1])
+    if directory is None:
+        return None
+    return path.join(directory, parts[-1])
+
+
+def content_hash(*contents):
+    """Return a hex digest identifying some content.
+
+    Args:
+        *contents: Strings or bytes to hash, in order
+
+    Returns:
+        SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    for content in contents:
+        if isinstance(content, str):
+            content = content.encode()
+        digest.update(content)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def file_hash(*filenames):
+    """Return a hex digest of the contents of one or more files.
+
+    Args:
+        *filenames: Paths of the files to hash, in order
+
+    Returns:
+        SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    for filename in filenames:
+        with open(filename, "rb") as f:
+            while chunk := f.read(1024 * 1024):
+                digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def atomic_write(filename, data):
+    """Write a file so readers never see it half written.
+
+    Args:
+        filename: Path of the file
+        data: String or bytes to write
+
+    Returns:
+        True if the file was written
+    """
+    mode = "wb" if isinstance(data, bytes) else "w"
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=path.dirname(filename), prefix=".tmp-")
+        with os.fdopen(fd, mode) as f:
+            f.write(data)
+        os.replace(tmp_name, filename)
+    except OSError as err:
+        log.debug(f"Could not write cache file {filename}: {err}")
+        return False
+    return True
+
+
+def load_json_cache(filename, version):
+    """Load a JSON cache file written by `save_json_cache`.
+
+    Args:
+        filename: Path of the cache file, may be None
+        version: Expected cache format version
+
+    Returns:
+        The cached data, or None if the file is missing, unreadable or from another version
+    """
+    if filename is None or not path.exists(filename):
+        return None
+    try:
+        with open(filename, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError) as err:
+        log.debug(f"Ignoring unreadable cache file {filename}: {err}")
+        return None
+    if not isinstance(cache, dict) or cache.get("version") != version:
+        return None
+    return cache.get("data")
+
+
+def save_json_cache(filename, version, data):
+    """Save data to a JSON cache file.
+
+    Args:
+        filename: Path of the cache file, may be None
+        version: Cache format version
+        data: JSON serializable data
+
+    Returns:
+        True if the cache was written
+    """
+    if filename is None:
+        return False
+    return atomic_write(filename, json.dumps({"version": version, "data": data}, indent=2))
@@ -0,0 +1,70 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""CANU deadline utils for bounding the time spent on a single switch.
+
+A fleet run gives each switch a deadline in the worker thread collecting it.
+REST requests and SSH connections made in that thread use the time left as their
+timeout, so a switch that stops answering ends its thread instead of holding a
+worker until the operating system gives up on the connection.
+"""
+import threading
+import time
+from contextlib import contextmanager
+
+# Shortest timeout handed to a connection, so a call made after the deadline fails quickly
+MIN_TIMEOUT = 1.0
+
+_local = threading.local()
+
+
+@contextmanager
+def switch_deadline(seconds):
+    """Set the deadline of the switch collected in this thread.
+
+    Args:
+        seconds: Seconds from now, 0 or None for no deadline
+
+    Yields:
+        Nothing
+    """
+    previous = getattr(_local, "deadline", None)
+    _local.deadline = time.monotonic() + seconds if seconds else None
+    try:
+        yield
+    finally:
+        _local.deadline = previous
+
+
+def time_left(default=None):
+    """Return the timeout for a call made for the current switch.
+
+    Args:
+        default: Timeout to use without a deadline, and the longest one to use with a deadline
+
+    Returns:
+        Seconds left before the deadline, at least MIN_TIMEOUT and at most default
+    """
+    deadline = getattr(_local, "deadline", None)
+    if deadline is None:
+        return default
+    left = max(MIN_TIMEOUT, deadline - time.monotonic())
+    return left if default is None else min(default, left)
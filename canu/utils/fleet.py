@@ -0,0 +1,270 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""CANU fleet utils for running a collection function against many switches at once."""
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import click
+
+from canu.utils.deadline import switch_deadline
+from canu.utils.trace import span
+
+log = logging.getLogger("fleet")
+
+DEFAULT_WORKERS = 10
+DEFAULT_TIMEOUT = 300
+
+# How often (seconds) the collector wakes up to check for switches that are over their timeout
+POLL_INTERVAL = 0.5
+
+
+def fleet_options(function):
+    """Add the shared '--workers' and '--timeout' options to a multi-switch command.
+
+    Args:
+        function: The click command function to decorate
+
+    Returns:
+        The decorated click command function
+    """
+    function = click.option(
+        "--timeout",
+        help=(
+            "Seconds to wait for a single switch before reporting it as an error (0 to wait forever). "
+            "REST and SSH connections to the switch time out when it is reached."
+        ),
+        type=click.IntRange(min=0),
+        default=DEFAULT_TIMEOUT,
+        show_default=True,
+    )(function)
+    function = click.option(
+        "--workers",
+        help="Number of switches to connect to concurrently",
+        type=click.IntRange(min=1),
+        default=DEFAULT_WORKERS,
+        show_default=True,
+    )(function)
+    return function
+
+
+class FleetResult:
+    """The outcome of running the collection function against a single switch."""
+
+    __slots__ = ("item", "value", "error", "elapsed")
+
+    def __init__(self, item, value=None, error=None, elapsed=0.0):
+        """Create a FleetResult.
+
+        Args:
+            item: The item (normally a switch IP) the function was called with
+            value: Return value of the function, None on error
+            error: Exception raised by the function, None on success
+            elapsed: Seconds spent on this switch
+        """
+        self.item = item
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+
+
+class FleetTiming:
+    """Wall-clock versus serial timing for a fleet run."""
+
+    __slots__ = ("switches", "workers", "wall_time", "serial_time")
+
+    def __init__(self, switches, workers, wall_time, serial_time):
+        """Create a FleetTiming.
+
+        Args:
+            switches: Number of switches collected
+            workers: Number of concurrent workers used
+            wall_time: Seconds the whole run took
+            serial_time: Sum of the seconds spent on each switch
+        """
+        self.switches = switches
+        self.workers = workers
+        self.wall_time = wall_time
+        self.serial_time = serial_time
+
+    def __str__(self):
+        """Summarize the timing in one line.
+
+        Returns:
+            String with the wall-clock time, serial time and speedup
+        """
+        speedup = self.serial_time / self.wall_time if self.wall_time else 1.0
+        return (
+            f"Collected {self.switches} switches in {self.wall_time:.2f}s "
+            f"(serial {self.serial_time:.2f}s, {speedup:.1f}x speedup, {self.workers} workers)"
+        )
+
+
+class FleetRun:
+    """Iterate over the results of running a collection function against many switches.
+
+    Results are yielded in the same order as the items as soon as every earlier
+    switch has finished, so a caller can process and discard each switch while the
+    rest are still being collected. Only results that arrive out of order are held
+    back. `timing` is set once the iteration is complete.
+    """
+
+    def __init__(
+        self,
+        function,
+        items,
+        workers=DEFAULT_WORKERS,
+        timeout=DEFAULT_TIMEOUT,
+        exceptions=(Exception,),
+        progress=None,
+    ):
+        """Create a FleetRun, nothing is started until it is iterated.
+
+        Args:
+            function: Function taking a single item and returning the collected data
+            items: List of items (normally switch IPs)
+            workers: Maximum number of switches to connect to concurrently
+            timeout: Seconds to wait for a single switch, 0 or None to wait forever
+            exceptions: Tuple of exception types to record instead of raising
+            progress: Optional function called with (result, completed, total) as each switch finishes
+        """
+        self.function = function
+        self.items = list(items)
+        self.workers = workers
+        self.timeout = timeout
+        self.exceptions = exceptions
+        self.progress = progress
+        self.timing = None
+
+    def __iter__(self):
+        """Call `function(item)` for every item using a bounded pool of worker threads.
+
+        Yields:
+            FleetResult for each item, in the same order as the items
+        """
+        function = self.function
+        exceptions = self.exceptions
+        timeout = self.timeout
+        items = self.items
+        total = len(items)
+        started = {}
+        held = {}
+        next_index = 0
+        serial_time = 0.0
+
+        def _task(index, item):
+            started[index] = time.monotonic()
+            try:
+                with switch_deadline(timeout), span("switch", "fleet", switch=str(item)):
+                    value = function(item)
+            except exceptions as error:
+                return FleetResult(item, error=error, elapsed=time.monotonic() - started[index])
+            return FleetResult(item, value=value, elapsed=time.monotonic() - started[index])
+
+        wall_start = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=max(1, min(self.workers, total or 1)))
+        try:
+            futures = {executor.submit(_task, index, item): index for index, item in enumerate(items)}
+            pending = set(futures)
+            completed = 0
+            while pending:
+                done, pending = wait(
+                    pending,
+                    timeout=POLL_INTERVAL if timeout else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                finished = [(futures[future], future.result()) for future in done]
+
+                if timeout:
+                    now = time.monotonic()
+                    for future in list(pending):
+                        index = futures[future]
+                        if index in started and now - started[index] > timeout:
+                            log.debug(f"{items[index]} exceeded the {timeout}s timeout")
+                            pending.discard(future)
+                            future.cancel()
+                            finished.append(
+                                (
+                                    index,
+                                    FleetResult(
+                                        items[index],
+                                        error=TimeoutError(f"No response after {timeout} seconds"),
+                                        elapsed=now - started[index],
+                                    ),
+                                ),
+                            )
+
+                for index, result in finished:
+                    held[index] = result
+                    serial_time += result.elapsed
+                    completed += 1
+                    if self.progress:
+                        self.progress(result, completed, total)
+
+                # Hand over every result that is now in order
+                while next_index in held:
+                    yield held.pop(next_index)
+                    next_index += 1
+        finally:
+            # Do not block on switches that timed out. Their connections use the switch deadline
+            # as their timeout, so their threads end soon after it.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        self.timing = FleetTiming(
+            switches=total,
+            workers=self.workers,
+            wall_time=time.monotonic() - wall_start,
+            serial_time=serial_time,
+        )
+        log.info(str(self.timing))
+
+
+def run_on_switches(
+    function,
+    items,
+    workers=DEFAULT_WORKERS,
+    timeout=DEFAULT_TIMEOUT,
+    exceptions=(Exception,),
+    progress=None,
+):
+    """Call `function(item)` for every item using a bounded pool of worker threads.
+
+    Results are returned in the same order as `items` regardless of which switch
+    answered first. Exceptions listed in `exceptions` are stored on the result so
+    the caller can build its errors table, anything else is re-raised. A switch that
+    takes longer than `timeout` seconds is abandoned and given a `TimeoutError`.
+
+    Args:
+        function: Function taking a single item and returning the collected data
+        items: List of items (normally switch IPs)
+        workers: Maximum number of switches to connect to concurrently
+        timeout: Seconds to wait for a single switch, 0 or None to wait forever
+        exceptions: Tuple of exception types to record instead of raising
+        progress: Optional function called with (result, completed, total) as each switch finishes
+
+    Returns:
+        results: List of FleetResult in the same order as items
+        timing: FleetTiming for the run
+    """
+    run = FleetRun(function, items, workers=workers, timeout=timeout, exceptions=exceptions, progress=progress)
+    results = list(run)
+    return results, run.timing
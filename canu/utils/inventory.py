@@ -21,7 +21,7 @@
 # OTHER DEALINGS IN THE SOFTWARE.
 """Create Nornir Inventory from SLS."""
 from canu.utils.json_load import load_json
-from canu.utils.sls import pull_sls_hardware, pull_sls_networks
+from canu.utils.sls import pull_sls_hardware, pull_sls_networks, sls_model
 
 
 def inventory(
@@ -34,13 +34,10 @@ def inventory(
 ):
     """Build Nornir inventory from sls_input."""
     inventory = {"groups": {}, "hosts": {}}
-    if sls_file:
-        sls_json = load_json(file=sls_file)
-        sls_variables = pull_sls_networks(sls_json)
-        sls_hardware = pull_sls_hardware(sls_json)
-    elif dumpstate:
-        sls_variables = pull_sls_networks(dumpstate)
-        sls_hardware = pull_sls_hardware(dumpstate)
+    if sls_file or dumpstate:
+        model = sls_model(load_json(file=sls_file) if sls_file else dumpstate)
+        sls_variables = dict(model.inventory_variables)
+        sls_hardware = model.hardware
     else:
         sls_variables = pull_sls_networks()
         sls_hardware = pull_sls_hardware()
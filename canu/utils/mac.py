@@ -19,13 +19,26 @@
 # OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
 # ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 # OTHER DEALINGS IN THE SOFTWARE.
-"""CANU mac utils."""
+"""CANU mac utils.
+
+MAC vendors are looked up in a compact binary OUI index built from the
+`network_modeling/mac_vendors` text file: a sorted array of 3 byte OUI
+prefixes, a table of offsets and a string table of vendor names. The index is
+written to the CANU cache directory once, memory-mapped and searched by
+bisection, so looking up a vendor costs no start-up time and no per-process
+dictionary build.
+"""
+import logging
+import mmap
+import struct
 import sys
+import threading
 from os import path
 from pathlib import Path
 
-from aiohttp import client_exceptions
-from mac_vendor_lookup import BaseMacLookup, InvalidMacError, MacLookup
+from canu.utils.cache import atomic_write, cache_path, file_hash
+
+log = logging.getLogger("mac")
 
 # Get project root directory
 if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):  # pragma: no cover
@@ -37,8 +50,147 @@ else:
 # Mac vendors are stored so they can be looked up even when there is no network connectivity
 mac_vendors_file = path.join(project_root, "network_modeling", "mac_vendors")
 
-BaseMacLookup.cache_path = mac_vendors_file
-mac = MacLookup()
+# Index layout: header, count x 3 byte prefixes, (count + 1) x uint32 offsets, vendor strings
+OUI_INDEX_MAGIC = b"CANUOUI1"
+OUI_INDEX_HEADER = struct.Struct("<8sI")
+OUI_PREFIX_SIZE = 3
+OUI_OFFSET = struct.Struct("<I")
+
+_oui_index = None
+_oui_index_lock = threading.Lock()
+
+
+def build_oui_index(vendors_file=mac_vendors_file):
+    """Build the binary OUI index from a mac vendors text file.
+
+    Each line of the file is 'PREFIX:Vendor name'. When a prefix is listed more
+    than once the last line wins.
+
+    Args:
+        vendors_file: Path of the mac vendors text file
+
+    Returns:
+        Bytes of the OUI index
+    """
+    vendors = {}
+    with open(vendors_file, "rb") as f:
+        for line in f.read().splitlines():
+            prefix, _, vendor = line.partition(b":")
+            if len(prefix) != OUI_PREFIX_SIZE * 2:
+                continue
+            try:
+                vendors[bytes.fromhex(prefix.decode())] = vendor
+            except ValueError:
+                continue
+
+    prefixes = sorted(vendors)
+    offsets = [0]
+    for prefix in prefixes:
+        offsets.append(offsets[-1] + len(vendors[prefix]))
+
+    return b"".join(
+        [
+            OUI_INDEX_HEADER.pack(OUI_INDEX_MAGIC, len(prefixes)),
+            b"".join(prefixes),
+            struct.pack(f"<{len(offsets)}I", *offsets),
+            b"".join(vendors[prefix] for prefix in prefixes),
+        ],
+    )
+
+
+class OuiIndex:
+    """Read-only view of a binary OUI index, usually a memory-mapped file."""
+
+    def __init__(self, buffer):
+        """Check the header and locate the tables of the index.
+
+        Args:
+            buffer: Bytes or mmap of the OUI index
+
+        Raises:
+            ValueError: If the buffer is not an OUI index
+        """
+        magic, count = OUI_INDEX_HEADER.unpack_from(buffer, 0)
+        if magic != OUI_INDEX_MAGIC:
+            raise ValueError("Not a CANU OUI index")
+        self.buffer = buffer
+        self.count = count
+        self.prefixes = OUI_INDEX_HEADER.size
+        self.offsets = self.prefixes + count * OUI_PREFIX_SIZE
+        self.strings = self.offsets + (count + 1) * OUI_OFFSET.size
+
+    def __len__(self):
+        """Return the number of prefixes in the index."""
+        return self.count
+
+    def _prefix(self, index):
+        start = self.prefixes + index * OUI_PREFIX_SIZE
+        return self.buffer[start : start + OUI_PREFIX_SIZE]
+
+    def lookup(self, prefix):
+        """Return the vendor of a 3 byte OUI prefix.
+
+        Args:
+            prefix: OUI prefix as 3 bytes
+
+        Returns:
+            Vendor name, or None if the prefix is not in the index
+        """
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._prefix(middle) < prefix:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self.count or self._prefix(low) != prefix:
+            return None
+        start = OUI_OFFSET.unpack_from(self.buffer, self.offsets + low * OUI_OFFSET.size)[0]
+        end = OUI_OFFSET.unpack_from(self.buffer, self.offsets + (low + 1) * OUI_OFFSET.size)[0]
+        return self.buffer[self.strings + start : self.strings + end].decode("utf8")
+
+
+def oui_index():
+    """Return the shared OUI index, building and caching it on first use.
+
+    The index file is keyed by the contents of the mac vendors file. When caching
+    is disabled, or the file can't be mapped, the index is built in memory.
+
+    Returns:
+        OuiIndex object
+    """
+    global _oui_index
+    with _oui_index_lock:
+        if _oui_index is None:
+            index_file = cache_path("oui", f"{file_hash(mac_vendors_file)}.idx")
+            if index_file is not None and not path.exists(index_file):
+                atomic_write(index_file, build_oui_index())
+            try:
+                with open(index_file, "rb") as f:
+                    _oui_index = OuiIndex(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            except (TypeError, OSError, ValueError, struct.error) as err:
+                log.debug(f"Building the OUI index in memory: {err}")
+                _oui_index = OuiIndex(build_oui_index())
+        return _oui_index
+
+
+def mac_prefix(mac_address):
+    """Return the OUI prefix of a mac address.
+
+    Args:
+        mac_address: Mac address in any of the usual formats, e.g. aa:bb:cc:dd:ee:ff or aabb.ccdd.eeff
+
+    Returns:
+        OUI prefix as 3 bytes, or None if it is not a valid mac address
+    """
+    mac = str(mac_address).replace(":", "").replace("-", "").replace(".", "").upper()
+    if len(mac) < OUI_PREFIX_SIZE * 2 or len(mac) > 12:
+        return None
+    try:
+        int(mac, 16)
+        return bytes.fromhex(mac[: OUI_PREFIX_SIZE * 2])
+    except ValueError:
+        return None
 
 
 def find_mac(mac_address):
@@ -50,24 +202,56 @@ def find_mac(mac_address):
     Returns:
         String containing the mac vendor name
     """
-    try:
-        mac_vendor = mac.lookup(str(mac_address))
-    except (KeyError, ValueError, InvalidMacError):
-        # When the vendor can't be found, send back an empty string
-        mac_vendor = ""
+    prefix = mac_prefix(mac_address)
+    if prefix is None:
+        return ""
+    # When the vendor can't be found, send back an empty string
+    return oui_index().lookup(prefix) or ""
+
 
-    return mac_vendor
+def find_macs(mac_addresses):
+    """Return the vendors of many mac addresses.
+
+    Args:
+        mac_addresses: Iterable of mac addresses to be looked up
+
+    Returns:
+        Dictionary of each mac address to its vendor name, an empty string when it is not found
+    """
+    index = oui_index()
+    vendors = {}
+    by_prefix = {}
+    for mac_address in mac_addresses:
+        if mac_address in vendors:
+            continue
+        prefix = mac_prefix(mac_address)
+        if prefix is None:
+            vendors[mac_address] = ""
+        else:
+            if prefix not in by_prefix:
+                by_prefix[prefix] = index.lookup(prefix) or ""
+            vendors[mac_address] = by_prefix[prefix]
+    return vendors
 
 
 def update_mac_vendors():
     """Update the mac address vendor file.
 
-    If the mac vendor file needs to get updated, run this function.
+    If the mac vendor file needs to get updated, run this function. The OUI index
+    is rebuilt from the new file on the next lookup.
     """
+    global _oui_index
+    # The downloader is only needed here, importing it pulls in aiohttp
+    from aiohttp import client_exceptions
+    from mac_vendor_lookup import BaseMacLookup, MacLookup
+
+    BaseMacLookup.cache_path = mac_vendors_file
     try:
-        mac.update_vendors()  # This can take a few seconds for the download and it will be stored in the new path
+        MacLookup().update_vendors()  # This can take a few seconds for the download and it will be stored in the new path
     except (
         client_exceptions.ClientConnectorError,
         client_exceptions.ClientPayloadError,
     ):
         pass
+    with _oui_index_lock:
+        _oui_index = None
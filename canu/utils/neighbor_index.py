@@ -0,0 +1,207 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""CANU neighbor index used to annotate LLDP data.
+
+Annotating a switch used to rescan the whole ARP table, every SLS reservation and
+every heuristic OUI for each port. The NeighborIndex hashes each data source once
+per run so each port annotation is a handful of dictionary lookups.
+"""
+import logging
+
+from canu.utils.heuristics import heuristic_lookup
+from canu.utils.sls import sls_model
+
+log = logging.getLogger("neighbor_index")
+
+
+def _oui(mac):
+    """Return the lower case OUI prefix ('14:02:ec') of a colon separated MAC address."""
+    return str(mac)[:8].lower()
+
+
+class ArpLookup(dict):
+    """ARP entries hashed by MAC address."""
+
+    def arp_entries(self, mac):
+        """Return the ARP entries of a MAC address as 'ip:port' strings.
+
+        Args:
+            mac: MAC address
+
+        Returns:
+            List of 'ip:port' strings in ARP table order, empty when the MAC address is not in the ARP table
+        """
+        return [f"{entry['ip_address']}:{list(entry['port'])[0]}" for entry in self.get(mac, [])]
+
+
+def index_arp(arp):
+    """Hash ARP entries by MAC address.
+
+    Args:
+        arp: ARP dictionary as returned by `get_lldp`
+
+    Returns:
+        ArpLookup of MAC address to its ARP entries
+    """
+    arp_lookup = ArpLookup()
+    for entry in (arp or {}).values():
+        arp_lookup.setdefault(entry["mac"], []).append(entry)
+    return arp_lookup
+
+
+class NeighborIndex:
+    """Hashed lookups from MAC and IP addresses to the names CANU knows them by.
+
+    Build one per run with the Kea, SLS and SMD exports, or one per switch with its ARP table.
+    """
+
+    def __init__(self, kea_json=None, sls_json=None, smd_json=None, arp=None):
+        """Create a NeighborIndex.
+
+        Args:
+            kea_json: JSON export from Kea API call
+            sls_json: JSON export from SLS API call
+            smd_json: JSON exported from SMD/HSM ethernetInterfaces
+            arp: ARP dictionary of a single switch
+        """
+        self.kea = self._index_kea(kea_json) if kea_json is not None else {}
+        self.sls = self._index_sls(sls_json) if sls_json is not None else {}
+        self.smd = self._index_smd(smd_json) if smd_json is not None else {}
+        self.heuristics = {_oui(oui): switch_types for oui, switch_types in heuristic_lookup.items()}
+        self.arp = index_arp(arp)
+
+    @staticmethod
+    def _index_kea(kea_json):
+        kea_lookup = {}
+        for lease in kea_json[0]["arguments"]["leases"]:
+            kea_lookup[lease.get("hw-address")] = {
+                "hostname": lease.get("hostname"),
+                "mac_address": lease.get("hw-address"),
+                "vlan": lease.get("subnet-id"),
+                "ipv4address": lease.get("ip-address"),
+            }
+        log.debug(f"Kea lookup table: {kea_lookup}")
+        return kea_lookup
+
+    @staticmethod
+    def _index_sls(sls_json):
+        sls_lookup = {}
+        ipv4_index = sls_model(sls_json).network_manager.ipv4_index()
+        # Later reservations of the same IP win, but keep the order it was first seen in.
+        for position, (ip, reserved) in enumerate(ipv4_index.reservations.items()):
+            sls_lookup[str(ip)] = (position, reserved[-1][2].name())
+        log.debug(f"SLS lookup table: {sls_lookup}")
+        return sls_lookup
+
+    @staticmethod
+    def _index_smd(smd_json):
+        smd_lookup = {}
+        for device in smd_json:
+            smd_lookup[device.get("MACAddress")] = {
+                "hostname": device.get("ComponentID"),
+                "mac_address": device.get("MACAddress"),
+                "vlan": None,
+                "ipv4address": "TODO",
+            }
+        log.debug(f"SMD lookup table: {smd_lookup}")
+        return smd_lookup
+
+    def arp_entries(self, mac):
+        """Return the ARP entries of a MAC address.
+
+        Args:
+            mac: MAC address
+
+        Returns:
+            List of 'ip:port' strings
+        """
+        return self.arp.arp_entries(mac)
+
+    def kea_lease(self, mac):
+        """Return the Kea lease of a MAC address.
+
+        Args:
+            mac: MAC address
+
+        Returns:
+            Dictionary with hostname, mac_address, vlan and ipv4address, or None
+        """
+        return self.kea.get(mac)
+
+    def smd_interface(self, mac):
+        """Return the SMD ethernetInterface of a MAC address.
+
+        Args:
+            mac: MAC address
+
+        Returns:
+            Dictionary with hostname and mac_address, or None
+        """
+        return self.smd.get(mac)
+
+    def sls_name(self, ip):
+        """Return the SLS reservation name of an IP address.
+
+        Args:
+            ip: IPv4 address
+
+        Returns:
+            Reservation name, or None
+        """
+        record = self.sls.get(str(ip))
+        return record[1] if record else None
+
+    def sls_name_for_arp_data(self, arp_data):
+        """Return the SLS reservation name matching annotated ARP data.
+
+        When several ARP entries are reserved in SLS, the one listed first in SLS wins.
+
+        Args:
+            arp_data: Comma separated 'ip:port' string as stored in an LLDP entry
+
+        Returns:
+            Reservation name, or None
+        """
+        best = None
+        for entry in arp_data.split(", ") if arp_data else []:
+            ip, _, port = entry.rpartition(":")
+            if not port.startswith("vlan"):
+                continue
+            record = self.sls.get(ip)
+            if record is not None and (best is None or record[0] < best[0]):
+                best = record
+        return best[1] if best else None
+
+    def heuristic(self, mac, hostname):
+        """Return the heuristic for a MAC address seen on a switch.
+
+        Args:
+            mac: MAC address of the neighbor
+            hostname: Hostname of the switch the neighbor is connected to
+
+        Returns:
+            Dictionary with the 'hint' and 'port' of the heuristic, or None
+        """
+        for switch_type, heuristic in self.heuristics.get(_oui(mac), {}).items():
+            if switch_type in hostname:
+                return heuristic
+        return None
@@ -22,13 +22,21 @@
 """Retrieve SLS token."""
 import base64
 import json
+import logging
 import os
 import sys
 from collections import defaultdict
+from functools import cached_property
 
+import netaddr
 import requests
 import urllib3
-from kubernetes import client, config
+
+from canu.utils.cache import content_hash
+
+log = logging.getLogger("sls")
+
+_sls_models = {}
 
 
 def sls_dump(path):
@@ -85,6 +93,9 @@ def sls_dump(path):
     secret = None
     cenv = os.getenv("CRAYENV", "notk8s")
     if cenv != "k8s":
+        # kubernetes is only needed here, importing it lazily keeps canu-inventory startup fast
+        from kubernetes import client, config
+
         try:
             config.load_kube_config()
             v1 = client.CoreV1Api()
@@ -175,10 +186,19 @@ def pull_sls_networks(sls_file=None):
         API token.
     """
     if sls_file:
-        sls_networks = [network[x] for network in [sls_file.get("Networks", {})] for x in network]
-    if not sls_file:
-        sls_networks = sls_dump("networks")
+        return dict(sls_model(sls_file).inventory_variables)
+    return parse_sls_for_inventory(sls_dump("networks"))
+
+
+def parse_sls_for_inventory(sls_networks):
+    """Parse the networks of SLS for the variables used to build inventories.
 
+    Args:
+        sls_networks: List of networks from SLS
+
+    Returns:
+        sls_variables: Dictionary containing SLS variables.
+    """
     sls_variables = {
         "SWITCH_ASN": None,
         "CAN": None,
@@ -338,8 +358,489 @@ def pull_sls_hardware(sls_file=None):
         API token.
     """
     if sls_file:
-        sls_hardware = [hardware[x] for hardware in [sls_file.get("Hardware", {})] for x in hardware]
-        return sls_hardware
-    if not sls_file:
-        sls_hardware = sls_dump("hardware")
-        return sls_hardware
+        return list(sls_model(sls_file).hardware)
+    return sls_dump("hardware")
+
+
+def parse_sls_for_config(input_json):
+    """Parse the `sls_file.json` file or the JSON from SLS `/networks` API for config variables.
+
+    Args:
+        input_json: JSON from the SLS `/networks` API
+
+    Returns:
+        sls_variables: Dictionary containing SLS variables.
+    """
+    networks_list = []
+
+    sls_variables = {
+        "SWITCH_ASN": None,
+        "CAN": None,
+        "CAN_VLAN": None,
+        "CAN_NETMASK": None,
+        "CAN_PREFIX_LEN": None,
+        "CAN_NETWORK_IP": None,
+        "CHN": None,
+        "CHN6": None,
+        "CHN_VLAN": None,
+        "CHN_NETMASK": None,
+        "CHN_PREFIX_LEN": None,
+        "CHN_PREFIX_LEN6": None,
+        "CHN_NETWORK_IP": None,
+        "CHN_ASN": None,
+        "CMN": None,
+        "CMN6": None,
+        "CMN_VLAN": None,
+        "CMN_NETMASK": None,
+        "CMN_PREFIX_LEN": None,
+        "CMN_PREFIX_LEN6": None,
+        "CMN_NETWORK_IP": None,
+        "CMN_ASN": None,
+        "HMN": None,
+        "HMN_VLAN": None,
+        "HMN_NETMASK": None,
+        "HMN_NETWORK_IP": None,
+        "HMN_PREFIX_LEN": None,
+        "MTL": None,
+        "MTL_NETMASK": None,
+        "MTL_NETWORK_IP": None,
+        "MTL_PREFIX_LEN": None,
+        "NMN": None,
+        "NMN_VLAN": None,
+        "NMN_NETMASK": None,
+        "NMN_NETWORK_IP": None,
+        "NMN_PREFIX_LEN": None,
+        "NMN_ASN": None,
+        "HMN_MTN": None,
+        "HMN_MTN_NETMASK": None,
+        "HMN_MTN_NETWORK_IP": None,
+        "HMN_MTN_PREFIX_LEN": None,
+        "NMN_MTN": None,
+        "NMN_MTN_NETMASK": None,
+        "NMN_MTN_NETWORK_IP": None,
+        "NMN_MTN_PREFIX_LEN": None,
+        "HMNLB": None,
+        "HMNLB_NETMASK": None,
+        "HMNLB_NETWORK_IP": None,
+        "HMNLB_PREFIX_LEN": None,
+        "HMNLB_TFTP": None,
+        "HMNLB_DNS": None,
+        "NMNLB": None,
+        "NMNLB_NETMASK": None,
+        "NMNLB_NETWORK_IP": None,
+        "NMNLB_PREFIX_LEN": None,
+        "NMNLB_TFTP": None,
+        "NMNLB_DNS": None,
+        "ISTIO": None,
+        "ISTIO_LOCAL": None,
+        "SPIRE_CLUSTER": None,
+        "SPIRE_LOCAL": None,
+        "FLUENTBIT_AGGREGATOR": None,
+        "RGW_VIP": None,
+        "KUBEAPI_VIP": None,
+        "CAN_IP_GATEWAY": None,
+        "CHN_IP_GATEWAY": None,
+        "CHN_IP_GATEWAY6": None,
+        "CMN_IP_GATEWAY": None,
+        "CMN_IP_GATEWAY6": None,
+        "HMN_IP_GATEWAY": None,
+        "MTL_IP_GATEWAY": None,
+        "NMN_IP_GATEWAY": None,
+        "ncn_w001": None,
+        "ncn_w002": None,
+        "ncn_w003": None,
+        "ncn_m001_hmn": None,
+        "ncn_m001_nmn": None,
+        "CAN_IP_PRIMARY": None,
+        "CAN_IP_SECONDARY": None,
+        "CHN_IP_PRIMARY": None,
+        "CHN_IP_SECONDARY": None,
+        "CHN_IP_PRIMARY6": None,
+        "CHN_IP_SECONDARY6": None,
+        "CMN_IP_PRIMARY": None,
+        "CMN_IP_SECONDARY": None,
+        "CAN_IPs": defaultdict(),
+        "CHN_IPs": defaultdict(),
+        "CHN_IPs6": defaultdict(),
+        "CMN_IPs": defaultdict(),
+        "CMN_IPs6": defaultdict(),
+        "HMN_IPs": defaultdict(),
+        "MTL_IPs": defaultdict(),
+        "NMN_IPs": defaultdict(),
+        "NMN_MTN_CABINETS": [],
+        "NMN_MTN_CABINETS_NETMASK": [],
+        "HMN_MTN_CABINETS": [],
+        "SPINE_SWITCH_IPs": [],
+        "NMN_NCN": [],
+        "ALL_SWITCH_IPs": [],
+        "IPV6_ENABLED": None,
+    }
+
+    # Figure out up front if IPv6 support should be enabled or not.
+    cmn_network = list(filter(lambda network: network.get("Name") == "CMN", input_json))
+    chn_network = list(filter(lambda network: network.get("Name") == "CHN", input_json))
+
+    if cmn_network and chn_network:
+        cmn_has_ipv6 = bool(cmn_network[0].get("ExtraProperties", {}).get("CIDR6"))
+        chn_has_ipv6 = bool(chn_network[0].get("ExtraProperties", {}).get("CIDR6"))
+
+        if cmn_has_ipv6 and chn_has_ipv6:
+            sls_variables["IPV6_ENABLED"] = True
+        else:
+            sls_variables["IPV6_ENABLED"] = False
+            log.debug(
+                f"Missing IPv6 data. cmn_has_ipv6: {cmn_has_ipv6}, chn_has_ipv6: {chn_has_ipv6}",
+            )
+
+    for sls_network in input_json:
+        name = sls_network.get("Name", "")
+
+        if name == "CAN":
+            sls_variables["CAN"] = netaddr.IPNetwork(
+                sls_network.get("ExtraProperties", {}).get(
+                    "CIDR",
+                    "",
+                ),
+            )
+            sls_variables["CAN_NETMASK"] = sls_variables["CAN"].netmask
+            sls_variables["CAN_PREFIX_LEN"] = sls_variables["CAN"].prefixlen
+            sls_variables["CAN_NETWORK_IP"] = sls_variables["CAN"].ip
+            for subnets in sls_network.get("ExtraProperties", {}).get("Subnets", {}):
+                if subnets["Name"] == "bootstrap_dhcp":
+                    sls_variables["CAN_IP_GATEWAY"] = subnets["Gateway"]
+                    sls_variables["CAN_VLAN"] = subnets["VlanID"]
+                    for ip in subnets["IPReservations"]:
+                        if ip["Name"] == "can-switch-1":
+                            sls_variables["CAN_IP_PRIMARY"] = ip["IPAddress"]
+                        elif ip["Name"] == "can-switch-2":
+                            sls_variables["CAN_IP_SECONDARY"] = ip["IPAddress"]
+                if subnets["Name"] == "bootstrap_dhcp":
+                    for ip in subnets["IPReservations"]:
+                        if "ncn-w" in ip["Name"]:
+                            sls_variables["CAN_IPs"][ip["Name"]] = ip["IPAddress"]
+
+        if name == "CHN":
+            sls_variables["CHN"] = netaddr.IPNetwork(
+                sls_network.get("ExtraProperties", {}).get(
+                    "CIDR",
+                    "",
+                ),
+            )
+            if sls_variables["IPV6_ENABLED"]:
+                sls_variables["CHN6"] = netaddr.IPNetwork(
+                    sls_network.get("ExtraProperties", {}).get(
+                        "CIDR6",
+                        "",
+                    ),
+                )
+                sls_variables["CHN_PREFIX_LEN6"] = sls_variables["CHN6"].prefixlen
+            sls_variables["CHN_NETMASK"] = sls_variables["CHN"].netmask
+            sls_variables["CHN_PREFIX_LEN"] = sls_variables["CHN"].prefixlen
+            sls_variables["CHN_NETWORK_IP"] = sls_variables["CHN"].ip
+            sls_variables["CHN_ASN"] = sls_network.get("ExtraProperties", {}).get(
+                "MyASN",
+                {},
+            )
+            for subnets in sls_network.get("ExtraProperties", {}).get("Subnets", {}):
+                if subnets["Name"] == "bootstrap_dhcp":
+                    sls_variables["CHN_IP_GATEWAY"] = subnets["Gateway"]
+                    if sls_variables["IPV6_ENABLED"]:
+                        sls_variables["CHN_IP_GATEWAY6"] = subnets["Gateway6"]
+                    sls_variables["CHN_VLAN"] = subnets["VlanID"]
+                    for ip in subnets["IPReservations"]:
+                        if ip["Name"] == "chn-switch-1":
+                            sls_variables["CHN_IP_PRIMARY"] = ip["IPAddress"]
+                            if sls_variables["IPV6_ENABLED"]:
+                                sls_variables["CHN_IP_PRIMARY6"] = ip["IPAddress6"]
+                        elif ip["Name"] == "chn-switch-2":
+                            sls_variables["CHN_IP_SECONDARY"] = ip["IPAddress"]
+                            if sls_variables["IPV6_ENABLED"]:
+                                sls_variables["CHN_IP_SECONDARY6"] = ip["IPAddress6"]
+                if subnets["Name"] == "bootstrap_dhcp":
+                    for ip in subnets["IPReservations"]:
+                        sls_variables["CHN_IPs"][ip["Name"]] = ip["IPAddress"]
+                        if sls_variables["IPV6_ENABLED"]:
+                            sls_variables["CHN_IPs6"][ip["Name"]] = ip["IPAddress6"]
+
+        elif name == "CMN":
+            sls_variables["CMN"] = netaddr.IPNetwork(
+                sls_network.get("ExtraProperties", {}).get(
+                    "CIDR",
+                    "",
+                ),
+            )
+            if sls_variables["IPV6_ENABLED"]:
+                sls_variables["CMN6"] = netaddr.IPNetwork(
+                    sls_network.get("ExtraProperties", {}).get(
+                        "CIDR6",
+                        "",
+                    ),
+                )
+                sls_variables["CMN_PREFIX_LEN6"] = sls_variables["CMN6"].prefixlen
+            sls_variables["CMN_NETMASK"] = sls_variables["CMN"].netmask
+            sls_variables["CMN_PREFIX_LEN"] = sls_variables["CMN"].prefixlen
+            sls_variables["CMN_NETWORK_IP"] = sls_variables["CMN"].ip
+            sls_variables["CMN_ASN"] = sls_network.get("ExtraProperties", {}).get(
+                "MyASN",
+                {},
+            )
+            for subnets in sls_network.get("ExtraProperties", {}).get("Subnets", {}):
+                if subnets["Name"] == "bootstrap_dhcp":
+                    sls_variables["CMN_IP_GATEWAY"] = subnets["Gateway"]
+                    if sls_variables["IPV6_ENABLED"]:
+                        sls_variables["CMN_IP_GATEWAY6"] = subnets["Gateway6"]
+                    sls_variables["CMN_VLAN"] = subnets["VlanID"]
+                if subnets["Name"] == "network_hardware":
+                    for ip in subnets["IPReservations"]:
+                        if "sw" in ip["Name"]:
+                            sls_variables["CMN_IPs"][ip["Name"]] = ip["IPAddress"]
+                            if sls_variables["IPV6_ENABLED"]:
+                                sls_variables["CMN_IPs6"][ip["Name"]] = ip["IPAddress6"]
+                if subnets["Name"] == "bootstrap_dhcp":
+                    for ip in subnets["IPReservations"]:
+                        if "ncn-w" in ip["Name"]:
+                            sls_variables["CMN_IPs"][ip["Name"]] = ip["IPAddress"]
+        elif name == "HMN":
+            sls_variables["HMN"] = netaddr.IPNetwork(
+                sls_network.get("ExtraProperties", {}).get(
+                    "CIDR",
+                    "",
+                ),
+            )
+            sls_variables["HMN_NETMASK"] = sls_variables["HMN"].netmask
+            sls_variables["HMN_PREFIX_LEN"] = sls_variables["HMN"].prefixlen
+            sls_variables["HMN_NETWORK_IP"] = sls_variables["HMN"].ip
+            for subnets in sls_network.get("ExtraProperties", {}).get("Subnets", {}):
+                if subnets["Name"] == "network_hardware":
+                    sls_variables["HMN_IP_GATEWAY"] = subnets["Gateway"]
+                    sls_variables["HMN_VLAN"] = subnets["VlanID"]
+                    for ip in subnets["IPReservations"]:
+                        sls_variables["HMN_IPs"][ip["Name"]] = ip["IPAddress"]
+                if subnets["Name"] == "bootstrap_dhcp":
+                    for ip in subnets["IPReservations"]:
+                        if "ncn-w" in ip["Name"]:
+                            sls_variables["HMN_IPs"][ip["Name"]] = ip["IPAddress"]
+                        elif ip["Name"] == "ncn-m001":
+                            sls_variables["ncn_m001_hmn"] = ip["IPAddress"]
+        elif name == "MTL":
+            sls_variables["MTL"] = netaddr.IPNetwork(
+                sls_network.get("ExtraProperties", {}).get(
+                    "CIDR",
+                    "",
+                ),
+            )
+            sls_variables["MTL_NETMASK"] = sls_variables["MTL"].netmask
+            sls_variables["MTL_PREFIX_LEN"] = sls_variables["MTL"].prefixlen
+            sls_variables["MTL_NETWORK_IP"] = sls_variables["MTL"].ip
+            for subnets in sls_network.get("ExtraProperties", {}).get("Subnets", {}):
+                if subnets["Name"] == "network_hardware":
+                    sls_variables["MTL_IP_GATEWAY"] = subnets["Gateway"]
+                    for ip in subnets["IPReservations"]:
+                        sls_variables["MTL_IPs"][ip["Name"]] = ip["IPAddress"]
+                elif subnets["Name"] == "bootstrap_dhcp":
+                    for ip in subnets["IPReservations"]:
+                        if ip["Name"].startswith("ncn-"):
+                            sls_variables["MTL_IPs"][ip["Name"]] = ip["IPAddress"]
+
+        elif name == "NMN":
+            sls_variables["NMN"] = netaddr.IPNetwork(
+                sls_network.get("ExtraProperties", {}).get(
+                    "CIDR",
+                    "",
+                ),
+            )
+            sls_variables["NMN_NETMASK"] = sls_variables["NMN"].netmask
+            sls_variables["NMN_PREFIX_LEN"] = sls_variables["NMN"].prefixlen
+            sls_variables["NMN_NETWORK_IP"] = sls_variables["NMN"].ip
+            sls_variables["SWITCH_ASN"] = sls_network.get("ExtraProperties", {}).get(
+                "PeerASN",
+                {},
+            )
+            sls_variables["NMN_ASN"] = sls_network.get("ExtraProperties", {}).get(
+                "MyASN",
+                {},
+            )
+            for subnets in sls_network.get("ExtraProperties", {}).get("Subnets", {}):
+                if subnets["Name"] == "bootstrap_dhcp":
+                    for ip in subnets["IPReservations"]:
+                        if ip["Name"] == "ncn-w001":
+                            sls_variables["ncn_w001"] = ip["IPAddress"]
+                        elif ip["Name"] == "ncn-w002":
+                            sls_variables["ncn_w002"] = ip["IPAddress"]
+                        elif ip["Name"] == "ncn-w003":
+                            sls_variables["ncn_w003"] = ip["IPAddress"]
+                        elif ip["Name"] == "ncn-m001":
+                            sls_variables["ncn_m001_nmn"] = ip["IPAddress"]
+                        elif ip["Name"] == "rgw-vip":
+                            sls_variables["RGW_VIP"] = ip["IPAddress"]
+                        elif ip["Name"] == "kubeapi-vip":
+                            sls_variables["KUBEAPI_VIP"] = ip["IPAddress"]
+                if subnets["Name"] == "bootstrap_dhcp":
+                    for ip in subnets["IPReservations"]:
+                        if ip["Name"].startswith("ncn-"):
+                            sls_variables["NMN_IPs"][ip["Name"]] = ip["IPAddress"]
+                elif subnets["Name"] == "network_hardware":
+                    sls_variables["NMN_IP_GATEWAY"] = subnets["Gateway"]
+                    sls_variables["NMN_VLAN"] = subnets["VlanID"]
+                    for ip in subnets["IPReservations"]:
+                        sls_variables["NMN_IPs"][ip["Name"]] = ip["IPAddress"]
+        elif name == "NMN_MTN":
+            sls_variables["NMN_MTN"] = netaddr.IPNetwork(
+                sls_network.get("ExtraProperties", {}).get(
+                    "CIDR",
+                    "",
+                ),
+            )
+            sls_variables["NMN_MTN_NETMASK"] = sls_variables["NMN_MTN"].netmask
+            sls_variables["NMN_MTN_PREFIX_LEN"] = sls_variables["NMN_MTN"].prefixlen
+            sls_variables["NMN_MTN_NETWORK_IP"] = sls_variables["NMN_MTN"].ip
+            sls_variables["NMN_MTN_CABINETS"] = list(
+                sls_network.get("ExtraProperties", {}).get("Subnets", {}),
+            )
+            for subnets in sls_network.get("ExtraProperties", {}).get("Subnets", []):
+                cidr = netaddr.IPNetwork(subnets.get("CIDR"))
+                sls_variables["NMN_MTN_CABINETS_NETMASK"].append({"Netmask": str(cidr.netmask)})
+        elif name == "HMN_MTN":
+            sls_variables["HMN_MTN"] = netaddr.IPNetwork(
+                sls_network.get("ExtraProperties", {}).get(
+                    "CIDR",
+                    "",
+                ),
+            )
+            sls_variables["HMN_MTN_NETMASK"] = sls_variables["HMN_MTN"].netmask
+            sls_variables["HMN_MTN_PREFIX_LEN"] = sls_variables["HMN_MTN"].prefixlen
+            sls_variables["HMN_MTN_NETWORK_IP"] = sls_variables["HMN_MTN"].ip
+            sls_variables["HMN_MTN_CABINETS"] = list(
+                sls_network.get("ExtraProperties", {}).get("Subnets", {}),
+            )
+        elif name == "HMNLB":
+            sls_variables["HMNLB"] = netaddr.IPNetwork(
+                sls_network.get("ExtraProperties", {}).get(
+                    "CIDR",
+                    "",
+                ),
+            )
+            for subnets in sls_network.get("ExtraProperties", {}).get("Subnets", {}):
+                if subnets["Name"] == "hmn_metallb_address_pool":
+                    for ip in subnets["IPReservations"]:
+                        if ip["Name"] == "cray-tftp":
+                            sls_variables["HMNLB_TFTP"] = ip["IPAddress"]
+                        elif ip["Name"] == "unbound":
+                            sls_variables["HMNLB_DNS"] = ip["IPAddress"]
+            sls_variables["HMNLB_NETMASK"] = sls_variables["HMNLB"].netmask
+            sls_variables["HMNLB_PREFIX_LEN"] = sls_variables["HMNLB"].prefixlen
+            sls_variables["HMNLB_NETWORK_IP"] = sls_variables["HMNLB"].ip
+            sls_variables["HMNLB_CABINETS"] = list(
+                sls_network.get("ExtraProperties", {}).get("Subnets", {}),
+            )
+        elif name == "NMNLB":
+            sls_variables["NMNLB"] = netaddr.IPNetwork(
+                sls_network.get("ExtraProperties", {}).get(
+                    "CIDR",
+                    "",
+                ),
+            )
+            for subnets in sls_network.get("ExtraProperties", {}).get("Subnets", {}):
+                if subnets["Name"] == "nmn_metallb_address_pool":
+                    for ip in subnets["IPReservations"]:
+                        if ip["Name"] == "cray-tftp":
+                            sls_variables["NMNLB_TFTP"] = ip["IPAddress"]
+                        elif ip["Name"] == "unbound":
+                            sls_variables["NMNLB_DNS"] = ip["IPAddress"]
+                        elif ip["Name"] == "istio-ingressgateway":
+                            sls_variables["ISTIO"] = ip["IPAddress"]
+                        elif ip["Name"] == "istio-ingressgateway-local":
+                            sls_variables["ISTIO_LOCAL"] = ip["IPAddress"]
+                        elif ip["Name"] == "rsyslog-agg-service":
+                            sls_variables["FLUENTBIT_AGGREGATOR"] = ip["IPAddress"]
+                        elif ip["Name"] == "spire-local":
+                            sls_variables["SPIRE_LOCAL"] = ip["IPAddress"]
+                        elif ip["Name"] == "spire":
+                            sls_variables["SPIRE_CLUSTER"] = ip["IPAddress"]
+
+            sls_variables["NMNLB_NETMASK"] = sls_variables["NMNLB"].netmask
+            sls_variables["NMNLB_PREFIX_LEN"] = sls_variables["NMNLB"].prefixlen
+            sls_variables["NMNLB_NETWORK_IP"] = sls_variables["NMNLB"].ip
+            sls_variables["NMNLB_CABINETS"] = list(
+                sls_network.get("ExtraProperties", {}).get("Subnets", {}),
+            )
+        for subnets in sls_network.get("ExtraProperties", {}).get("Subnets", {}):
+            vlan = subnets.get("VlanID", "")
+            networks_list.append([name, vlan])
+
+    networks_list = {tuple(x) for x in networks_list}
+
+    for name, ip in sls_variables["NMN_IPs"].items():
+        if name.startswith("sw-spine"):
+            sls_variables["SPINE_SWITCH_IPs"].append(ip)
+        if name.startswith("ncn-"):
+            sls_variables["NMN_NCN"].append(ip)
+        if name.startswith("sw-"):
+            sls_variables["ALL_SWITCH_IPs"].append(ip)
+
+    return sls_variables
+
+
+class SlsModel:
+    """Structured view of one SLS dump, parsed once and shared by every command.
+
+    Each group of variables is computed on first use and memoized: the switch
+    config variables, the inventory variables, the hardware records and the
+    `NetworkManager`. The model keeps its own copy of the SLS data, so callers
+    that modify the JSON they loaded can't change it.
+    """
+
+    def __init__(self, sls_json):
+        """Keep the networks and hardware of the SLS data.
+
+        Args:
+            sls_json: SLS dump, or the list of networks from the SLS `/networks` API
+        """
+        if isinstance(sls_json, list):
+            self.networks = {network.get("Name", ""): network for network in sls_json}
+            self.hardware_records = {}
+        else:
+            self.networks = sls_json.get("Networks", {})
+            self.hardware_records = sls_json.get("Hardware", {})
+
+    @cached_property
+    def config_variables(self):
+        """Variables used to render switch configs, see `parse_sls_for_config`."""
+        return parse_sls_for_config(list(self.networks.values()))
+
+    @cached_property
+    def inventory_variables(self):
+        """Variables used to build inventories, see `parse_sls_for_inventory`."""
+        return parse_sls_for_inventory(list(self.networks.values()))
+
+    @cached_property
+    def hardware(self):
+        """List of the SLS hardware records."""
+        return list(self.hardware_records.values())
+
+    @cached_property
+    def network_manager(self):
+        """`NetworkManager` of the SLS networks."""
+        from canu.utils.sls_utils.Managers import NetworkManager
+
+        # NetworkManager changes the data it is given, so it gets a copy
+        return NetworkManager(json.loads(json.dumps(self.networks)))
+
+
+def sls_model(sls_json):
+    """Return the shared model of SLS data.
+
+    Models are memoized for the process and keyed by a hash of the SLS content,
+    so every command and template rendering from the same data shares one parse.
+
+    Args:
+        sls_json: SLS dump, or the list of networks from the SLS `/networks` API
+
+    Returns:
+        SlsModel object
+    """
+    sls_text = json.dumps(sls_json)
+    key = content_hash(sls_text)
+    if key not in _sls_models:
+        _sls_models[key] = SlsModel(json.loads(sls_text))
+    return _sls_models[key]
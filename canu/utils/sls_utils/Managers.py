@@ -37,7 +37,194 @@ else:
     project_root = Path(__file__).resolve().parent.parent.parent.parent
 
 
-class NetworkManager(UserDict):
+class IPv4Index:
+    """Longest-prefix index of SLS networks, subnets and reservations.
+
+    Networks and subnets are hashed by prefix length, so finding the most specific
+    one containing an address is one dictionary lookup per prefix length in use.
+    Reservations are hashed by address. Managers build the index on first use and
+    drop it when they, or the networks, subnets and reservation dictionaries in
+    them, tell them they changed. Reservation objects changed in place are not tracked.
+    """
+
+    def __init__(self, networks=(), subnets=()):
+        """Index networks with their subnets, and subnets outside of any network.
+
+        Args:
+            networks: Iterable of sls_utils.Network
+            subnets: Iterable of sls_utils.Subnet
+        """
+        self.interfaces = {}
+        self.networks = {}
+        self.subnets = {}
+        self.reservations = {}
+        for network in networks:
+            self.__add(self.networks, network.ipv4_network(), (network, None))
+            self.interfaces.setdefault(network.ipv4_address(), network)
+            for subnet in network.subnets().values():
+                self.__add_subnet(network, subnet)
+        for subnet in subnets:
+            self.interfaces.setdefault(subnet.ipv4_address(), subnet)
+            self.__add_subnet(None, subnet)
+        self.network_prefixes = sorted(self.networks, reverse=True)
+        self.subnet_prefixes = sorted(self.subnets, reverse=True)
+
+    def __add_subnet(self, network, subnet):
+        self.__add(self.subnets, subnet.ipv4_network(), (network, subnet))
+        for reservation in subnet.reservations().values():
+            self.reservations.setdefault(reservation.ipv4_address(), []).append(
+                (network, subnet, reservation),
+            )
+
+    @staticmethod
+    def __add(table, ipv4_network, entry):
+        prefixes = table.setdefault(ipv4_network.prefixlen, {})
+        prefixes.setdefault(int(ipv4_network.network_address), []).append(entry)
+
+    @staticmethod
+    def __longest(table, prefix_lengths, address):
+        for prefixlen in prefix_lengths:
+            entries = table[prefixlen].get(address >> (32 - prefixlen) << (32 - prefixlen))
+            if entries:
+                return entries
+        return []
+
+    def by_interface(self, ipv4_interface):
+        """Return the first network or subnet with exactly this CIDR.
+
+        Args:
+            ipv4_interface: IPv4 CIDR, e.g. 10.252.0.0/17
+
+        Returns:
+            sls_utils.Network or sls_utils.Subnet, or None
+        """
+        return self.interfaces.get(ipaddress.IPv4Interface(ipv4_interface))
+
+    def owner(self, ipv4_address):
+        """Return the network, subnet and reservation an IPv4 address belongs to.
+
+        The subnet is the most specific one containing the address. When several
+        subnets have that CIDR, the one reserving the address wins, otherwise the
+        first one in SLS order.
+
+        Args:
+            ipv4_address: IPv4 address
+
+        Returns:
+            (network, subnet, reservation) tuple, with None for anything not found
+        """
+        ipv4_address = ipaddress.IPv4Address(ipv4_address)
+        reserved = self.reservations.get(ipv4_address, [])
+        reservation = reserved[-1][2] if reserved else None
+
+        subnets = self.__longest(self.subnets, self.subnet_prefixes, int(ipv4_address))
+        network, subnet = subnets[0] if subnets else (None, None)
+        reserved_subnets = [entry[1] for entry in reserved]
+        for candidate in subnets:
+            if candidate[1] in reserved_subnets:
+                network, subnet = candidate
+                break
+
+        if network is None:
+            networks = self.__longest(self.networks, self.network_prefixes, int(ipv4_address))
+            network = networks[0][0] if networks else None
+        return network, subnet, reservation
+
+    def network(self, ipv4_address):
+        """Return the most specific network containing an IPv4 address.
+
+        Args:
+            ipv4_address: IPv4 address
+
+        Returns:
+            sls_utils.Network, or None
+        """
+        return self.owner(ipv4_address)[0]
+
+    def subnet(self, ipv4_address):
+        """Return the most specific subnet containing an IPv4 address.
+
+        Args:
+            ipv4_address: IPv4 address
+
+        Returns:
+            sls_utils.Subnet, or None
+        """
+        return self.owner(ipv4_address)[1]
+
+    def reservation(self, ipv4_address):
+        """Return the reservation of an IPv4 address, the last one listed if it is reserved more than once.
+
+        Args:
+            ipv4_address: IPv4 address
+
+        Returns:
+            sls_utils.Reservation, or None
+        """
+        reserved = self.reservations.get(ipaddress.IPv4Address(ipv4_address))
+        return reserved[-1][2] if reserved else None
+
+
+class IndexedManager(UserDict):
+    """Dictionary of networks or subnets with an IPv4 index dropped whenever one of them changes.
+
+    The manager watches its networks and subnets, which tell it about changes to
+    their addresses, subnets and reservations, so reads never rescan them.
+    """
+
+    def watch_all(self):
+        """Watch every network or subnet and drop the IPv4 index."""
+        self._ipv4_index = None
+        for value in self.data.values():
+            value.watch(self)
+
+    def changed(self):
+        """Drop the IPv4 index when a network or subnet changed."""
+        self._ipv4_index = None
+
+    def __setitem__(self, key, value):
+        """Set a network or subnet and drop the IPv4 index.
+
+        Args:
+            key (str): Name of the network or subnet
+            value: sls_utils.Network or sls_utils.Subnet
+        """
+        if key in self.data:
+            self.data[key].unwatch(self)
+        self.data[key] = value
+        value.watch(self)
+        self.changed()
+
+    def __delitem__(self, key):
+        """Delete a network or subnet and drop the IPv4 index.
+
+        Args:
+            key (str): Name of the network or subnet
+        """
+        self.data.pop(key).unwatch(self)
+        self.changed()
+
+    def __copy__(self):
+        """Return a shallow copy watching the same networks or subnets.
+
+        Returns:
+            Manager of the same class
+        """
+        inst = super().__copy__()
+        inst.watch_all()
+        return inst
+
+    def __setstate__(self, state):
+        """Unpickle the manager and watch its networks or subnets again.
+
+        Args:
+            state: Dictionary of the attributes
+        """
+        self.__dict__.update(state)
+        self.watch_all()
+
+
+class NetworkManager(IndexedManager):
     """Provide a means to search and set SLS Network info."""
 
     def __init__(self, network_dict=None):
@@ -62,6 +249,17 @@ class NetworkManager(UserDict):
             name: (network if isinstance(network, Network) else Network.network_from_sls_data(network))
             for name, network in network_dict.items()
         }
+        self.watch_all()
+
+    def ipv4_index(self):
+        """Return the IPv4 index of the networks, subnets and reservations, building it when stale.
+
+        Returns:
+            ipv4_index (IPv4Index): Index of the networks
+        """
+        if self._ipv4_index is None:
+            self._ipv4_index = IPv4Index(networks=self.data.values())
+        return self._ipv4_index
 
     def get(self, key):
         """Override dict get to search by Name or IP address.
@@ -86,17 +284,10 @@ class NetworkManager(UserDict):
         Returns:
             value (sls_utils.Network): Network or None which has the IPv4 address
         """
-        value = None
         try:
-            ipv4_key = ipaddress.IPv4Interface(key)
+            return self.ipv4_index().by_interface(key)
         except ValueError:
-            return value
-
-        for network in self.data.values():
-            if network.ipv4_address() == ipv4_key:
-                value = network
-                break
-        return value
+            return None
 
     def to_sls(self):
         """Return full SLS Networks Schema-validated JSON.
@@ -128,7 +319,7 @@ class NetworkManager(UserDict):
         )
 
 
-class SubnetManager(UserDict):
+class SubnetManager(IndexedManager):
     """A SubnetManager is a convenience wrapper around Subnets."""
 
     def __init__(self, subnet_dict=None):
@@ -150,6 +341,17 @@ class SubnetManager(UserDict):
             name: (subnet if isinstance(subnet, Subnet) else Subnet.subnet_from_sls_data(subnet))
             for (name, subnet) in subnet_dict.items()
         }
+        self.watch_all()
+
+    def ipv4_index(self):
+        """Return the IPv4 index of the subnets and reservations, building it when stale.
+
+        Returns:
+            ipv4_index (IPv4Index): Index of the subnets
+        """
+        if self._ipv4_index is None:
+            self._ipv4_index = IPv4Index(subnets=self.data.values())
+        return self._ipv4_index
 
     def get(self, key):
         """Override Dict get to search by Name or IP address.
@@ -174,17 +376,10 @@ class SubnetManager(UserDict):
         Returns:
             value (sls_utils.Subnet): Subnet which has the IPv4 address or None
         """
-        value = None
         try:
-            ipv4_key = ipaddress.IPv4Interface(key)
+            return self.ipv4_index().by_interface(key)
         except ValueError:
-            return value
-
-        for subnet in self.data.values():
-            if subnet.ipv4_address() == ipv4_key:
-                value = subnet
-                break
-        return value
+            return None
 
     def to_sls(self):
         """Return full SLS Networks JSON.
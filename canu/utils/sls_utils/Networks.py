@@ -21,6 +21,7 @@
 # OTHER DEALINGS IN THE SOFTWARE.
 """Classes for management of SLS Networks and Subnets."""
 import ipaddress
+import weakref
 from collections import defaultdict
 
 from .Reservations import Reservation
@@ -30,7 +31,267 @@ from .Reservations import Reservation
 # https://mypy.readthedocs.io/en/stable/cheat_sheet_py3.html
 
 
-class Network:
+class Watched:
+    """Something that tells its watchers, e.g. the managers holding it, when it changes.
+
+    Watchers are held weakly and must have a `changed()` method.
+    """
+
+    def watchers(self):
+        """Return the dictionary of the weak references to the watchers, keyed by their id.
+
+        Returns:
+            Dictionary of id to weakref.ref
+        """
+        if "_watchers" not in self.__dict__:
+            self._watchers = {}
+        return self._watchers
+
+    def watch(self, watcher):
+        """Tell a watcher about every later change.
+
+        Args:
+            watcher: Object with a `changed()` method
+        """
+        self.watchers()[id(watcher)] = weakref.ref(watcher)
+
+    def unwatch(self, watcher):
+        """Stop telling a watcher about changes.
+
+        Args:
+            watcher: Object passed to `watch`
+        """
+        self.watchers().pop(id(watcher), None)
+
+    def changed(self):
+        """Tell every watcher that this changed."""
+        for key, ref in list(self.watchers().items()):
+            watcher = ref()
+            if watcher is None:
+                del self.watchers()[key]
+            else:
+                watcher.changed()
+
+    def __getstate__(self):
+        """Copy and pickle without the watchers, they don't watch the copy.
+
+        Returns:
+            Dictionary of the attributes
+        """
+        state = self.__dict__.copy()
+        state.pop("_watchers", None)
+        return state
+
+
+class TrackedDict(defaultdict):
+    """Dictionary of subnets or reservations that tells the network or subnet holding it when it changes.
+
+    It is a defaultdict without a default factory, like the subnets of a Network always were.
+    Subnets put in the dictionary are watched by its owner, so changes to them are passed on.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Create a TrackedDict.
+
+        Args:
+            *args: Positional arguments passed to dict
+            **kwargs: Keyword arguments passed to dict
+        """
+        super().__init__(None, *args, **kwargs)
+        self.owner = None
+
+    def adopt(self, owner):
+        """Make a network or subnet the owner of the dictionary and its subnets.
+
+        Args:
+            owner: Network or Subnet holding the dictionary
+        """
+        self.owner = owner
+        for value in self.values():
+            self.__add(value)
+
+    def disown(self):
+        """Stop the owner watching the dictionary and its subnets, when it is replaced."""
+        for value in self.values():
+            self.__remove(value)
+        self.owner = None
+
+    def __add(self, value):
+        if self.owner is not None and isinstance(value, Watched):
+            value.watch(self.owner)
+
+    def __remove(self, value):
+        if self.owner is not None and isinstance(value, Watched):
+            value.unwatch(self.owner)
+
+    def __changed(self):
+        if self.owner is not None:
+            self.owner.changed()
+
+    def __reduce__(self):
+        """Copy and pickle the items only, the copy has no owner until it is adopted.
+
+        Returns:
+            Tuple of the class and its arguments
+        """
+        return (type(self), (dict(self),))
+
+    def copy(self):
+        """Return a shallow copy.
+
+        Returns:
+            TrackedDict with the same items
+        """
+        return type(self)(self)
+
+    __copy__ = copy
+
+    def __or__(self, other):
+        """Return a copy updated with another mapping.
+
+        Args:
+            other: Mapping to merge
+
+        Returns:
+            TrackedDict with the items of both
+        """
+        merged = self.copy()
+        merged.update(other)
+        return merged
+
+    def __ror__(self, other):
+        """Return a copy of another mapping updated with this one.
+
+        Args:
+            other: Mapping to merge
+
+        Returns:
+            TrackedDict with the items of both
+        """
+        merged = type(self)(other)
+        merged.update(self)
+        return merged
+
+    def __setitem__(self, key, value):
+        """Set a key.
+
+        Args:
+            key: Key to set
+            value: Value of the key
+        """
+        if key in self:
+            self.__remove(self[key])
+        super().__setitem__(key, value)
+        self.__add(value)
+        self.__changed()
+
+    def __delitem__(self, key):
+        """Delete a key.
+
+        Args:
+            key: Key to delete
+        """
+        self.__remove(self[key])
+        super().__delitem__(key)
+        self.__changed()
+
+    def __ior__(self, other):
+        """Update the dictionary with the |= operator.
+
+        Args:
+            other: Mapping to update the dictionary with
+
+        Returns:
+            The dictionary
+        """
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        """Update the dictionary, see dict.update.
+
+        Args:
+            *args: Positional arguments passed to dict.update
+            **kwargs: Keyword arguments passed to dict.update
+        """
+        for key, value in dict(*args, **kwargs).items():
+            if key in self:
+                self.__remove(self[key])
+            super().__setitem__(key, value)
+            self.__add(value)
+        self.__changed()
+
+    def setdefault(self, key, default=None):
+        """Return the value of a key, setting it to default if it is missing.
+
+        Args:
+            key: Key to look up
+            default: Value to set when the key is missing
+
+        Returns:
+            The value of the key
+        """
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        """Remove a key and return its value, see dict.pop.
+
+        Args:
+            key: Key to remove
+            *default: Optional value returned when the key is missing
+
+        Returns:
+            The value of the key
+        """
+        if key not in self:
+            return super().pop(key, *default)
+        value = super().pop(key)
+        self.__remove(value)
+        self.__changed()
+        return value
+
+    def popitem(self):
+        """Remove and return the last key and value, see dict.popitem.
+
+        Returns:
+            (key, value) tuple
+        """
+        item = super().popitem()
+        self.__remove(item[1])
+        self.__changed()
+        return item
+
+    def clear(self):
+        """Remove every key."""
+        for value in self.values():
+            self.__remove(value)
+        super().clear()
+        self.__changed()
+
+
+def tracked(value, owner):
+    """Return the subnets or reservations of a network or subnet as a TrackedDict owned by it.
+
+    A plain dictionary is copied into a TrackedDict, so changes made later to the dictionary
+    that was passed in don't reach the network. Anything that is not a dictionary is kept as it is.
+
+    Args:
+        value: Dictionary, or any other container, of subnets or reservations
+        owner: Network or Subnet holding the value
+
+    Returns:
+        TrackedDict, or the value
+    """
+    if isinstance(value, dict):
+        if not isinstance(value, TrackedDict):
+            value = TrackedDict(value)
+        value.adopt(owner)
+    return value
+
+
+class Network(Watched):
     """Represent a Network from and SLS data structure."""
 
     def __init__(self, name, network_type, ipv4_address):
@@ -47,7 +308,7 @@ class Network:
 
         self.__type = network_type
         self.__mtu = None
-        self.__subnets = defaultdict()
+        self.__subnets = tracked(TrackedDict(), self)
         self.__bgp_asns = [None, None]  # [MyASN, PeerASN]
 
     @classmethod
@@ -137,6 +398,7 @@ class Network:
         """
         if network_address is not None:
             self._ipv4_address = ipaddress.IPv4Interface(network_address)
+            self.changed()
         return self._ipv4_address
 
     def ipv4_network(self):
@@ -177,13 +439,20 @@ class Network:
         """List of subnet objects in the network.
 
         Args:
-            network_subnets: A dict of subnets in the network for the setter
+            network_subnets: A dict of subnets in the network for the setter, stored as a copy
+                so later changes must be made through the getter
 
         Returns:
             subnets: A dict of subnets in the network for the getter
         """
         if network_subnets is not None:
-            self.__subnets = network_subnets
+            if isinstance(self.__subnets, TrackedDict):
+                self.__subnets.disown()
+            self.__subnets = tracked(network_subnets, self)
+            self.changed()
+        elif isinstance(self.__subnets, TrackedDict) and self.__subnets.owner is None:
+            # A copied or unpickled network adopts its copied subnets
+            self.__subnets.adopt(self)
         return self.__subnets
 
     def bgp(self, my_bgp_asn=None, peer_bgp_asn=None):
@@ -295,7 +564,7 @@ class Subnet(Network):
         self.__ipv4_reservation_start_address = None
         self.__ipv4_reservation_end_address = None
         self.__pool_name = None
-        self.__reservations = {}
+        self.__reservations = tracked(TrackedDict(), self)
 
     @classmethod
     def subnet_from_sls_data(cls, sls_data):
@@ -463,13 +732,18 @@ class Subnet(Network):
         """List of reservations for the subnet.
 
         Args:
-            subnet_reservations (list): List of reservations for setter
+            subnet_reservations (list): List of reservations for setter, a dict is stored as a copy
+                so later changes must be made through the getter
 
         Returns:
             reservations (list): Lit of reservations for getter
         """
         if subnet_reservations is not None:
-            self.__reservations = subnet_reservations
+            self.__reservations = tracked(subnet_reservations, self)
+            self.changed()
+        elif isinstance(self.__reservations, TrackedDict) and self.__reservations.owner is None:
+            # A copied or unpickled subnet adopts its copied reservations
+            self.__reservations.adopt(self)
         return self.__reservations
 
     def to_sls(self):
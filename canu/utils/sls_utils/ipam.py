@@ -19,9 +19,15 @@
 # OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
 # ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 # OTHER DEALINGS IN THE SOFTWARE.
-"""Extremely rudimentary and purpose-driven IPAM."""
+"""Extremely rudimentary and purpose-driven IPAM.
+
+Free address space is kept as sorted, disjoint address ranges rather than sets of
+addresses, so a /16 with thousands of reservations is a few thousand ranges and
+every query is a bisection.
+"""
 import ipaddress
 import math
+from bisect import bisect_left, bisect_right
 
 from canu.utils.sls_utils.Networks import Network, Subnet
 
@@ -29,6 +35,231 @@ from canu.utils.sls_utils.Networks import Network, Subnet
 DEBUG = False
 
 
+class IPv4Ranges:
+    """Free IPv4 address space as sorted, disjoint and inclusive address ranges."""
+
+    def __init__(self, first=None, last=None):
+        """Start with the free range from first to last, or with no free space.
+
+        Args:
+            first: First free IPv4 address
+            last: Last free IPv4 address, defaults to first
+        """
+        self.starts = []
+        self.ends = []
+        if first is not None:
+            first, last = _address_range(first, last)
+            if first <= last:
+                self.starts.append(first)
+                self.ends.append(last)
+
+    @classmethod
+    def from_network(cls, network):
+        """Return the ranges of a whole network, network and broadcast addresses included.
+
+        Args:
+            network (ipaddress.IPv4Network): Network to be allocated from
+
+        Returns:
+            IPv4Ranges object
+        """
+        network = ipaddress.IPv4Network(network)
+        return cls(network.network_address, network.broadcast_address)
+
+    def __iter__(self):
+        """Iterate over the free ranges in address order.
+
+        Yields:
+            (first, last) tuples of ipaddress.IPv4Address
+        """
+        for index, start in enumerate(self.starts):
+            yield ipaddress.IPv4Address(start), ipaddress.IPv4Address(self.ends[index])
+
+    def __len__(self):
+        """Return the number of free ranges."""
+        return len(self.starts)
+
+    def __contains__(self, address):
+        """Return True if an address is free.
+
+        Args:
+            address: IPv4 address
+
+        Returns:
+            True if the address is free
+        """
+        return self.is_free(address)
+
+    def count(self):
+        """Return the number of free addresses.
+
+        Returns:
+            Number of free addresses
+        """
+        return sum(self.ends) - sum(self.starts) + len(self.starts)
+
+    def is_free(self, first, last=None):
+        """Return True if every address from first to last is free.
+
+        Args:
+            first: First IPv4 address, or an IPv4 network
+            last: Last IPv4 address, defaults to first
+
+        Returns:
+            True if the whole range is free
+        """
+        first, last = _address_range(first, last)
+        index = bisect_right(self.starts, first) - 1
+        return index >= 0 and self.ends[index] >= last
+
+    def reserve(self, first, last=None):
+        """Remove the addresses from first to last from the free space.
+
+        Addresses that are already used, or outside the free space, are ignored.
+
+        Args:
+            first: First IPv4 address, or an IPv4 network
+            last: Last IPv4 address, defaults to first
+
+        Returns:
+            True if any free address was reserved
+        """
+        first, last = _address_range(first, last)
+        # Ranges low up to high overlap the reservation
+        low = bisect_left(self.ends, first)
+        high = bisect_right(self.starts, last)
+        if low >= high:
+            return False
+        starts, ends = [], []
+        if self.starts[low] < first:
+            starts.append(self.starts[low])
+            ends.append(first - 1)
+        if self.ends[high - 1] > last:
+            starts.append(last + 1)
+            ends.append(self.ends[high - 1])
+        self.starts[low:high] = starts
+        self.ends[low:high] = ends
+        return True
+
+    def reserve_all(self, addresses):
+        """Remove many addresses from the free space in one pass over the ranges.
+
+        Args:
+            addresses: Iterable of IPv4 addresses
+
+        Returns:
+            Number of free addresses that were reserved
+        """
+        used = sorted({_address_int(address) for address in addresses})
+        free = self.count()
+        starts, ends = [], []
+        position = 0
+        for index, start in enumerate(self.starts):
+            end = self.ends[index]
+            position = bisect_left(used, start, position)
+            while position < len(used) and used[position] <= end:
+                if used[position] > start:
+                    starts.append(start)
+                    ends.append(used[position] - 1)
+                start = used[position] + 1
+                position += 1
+            if start <= end:
+                starts.append(start)
+                ends.append(end)
+        self.starts, self.ends = starts, ends
+        return free - self.count()
+
+    def next_free(self, start=None):
+        """Return the first free address at or after start.
+
+        Args:
+            start: IPv4 address to search from, defaults to the beginning
+
+        Returns:
+            ipaddress.IPv4Address, or None if there is no free address
+        """
+        if start is None:
+            index, address = 0, 0
+        else:
+            address = _address_int(start)
+            index = bisect_left(self.ends, address)
+        if index >= len(self.starts):
+            return None
+        return ipaddress.IPv4Address(max(address, self.starts[index]))
+
+    def last_free(self, end=None):
+        """Return the last free address at or before end.
+
+        Args:
+            end: IPv4 address to search back from, defaults to the end
+
+        Returns:
+            ipaddress.IPv4Address, or None if there is no free address
+        """
+        if end is None:
+            index, address = len(self.starts) - 1, int(ipaddress.IPv4Address("255.255.255.255"))
+        else:
+            address = _address_int(end)
+            index = bisect_right(self.starts, address) - 1
+        if index < 0:
+            return None
+        return ipaddress.IPv4Address(min(address, self.ends[index]))
+
+    def free_subnets(self):
+        """Return the largest CIDR blocks that cover the free space, smallest blocks first.
+
+        Returns:
+            List of ipaddress.IPv4Network
+        """
+        subnets = []
+        for first, last in self:
+            subnets.extend(ipaddress.summarize_address_range(first, last))
+        # Use the smallest block possible
+        return sorted(subnets, key=prefixlength, reverse=True)
+
+    def addresses(self):
+        """Iterate over every free address in order.
+
+        Yields:
+            ipaddress.IPv4Address
+        """
+        for index, start in enumerate(self.starts):
+            for address in range(start, self.ends[index] + 1):
+                yield ipaddress.IPv4Address(address)
+
+
+def _address_range(first, last=None):
+    """Return the integer bounds of an address, address range or network.
+
+    Args:
+        first: First IPv4 address, or an IPv4 network
+        last: Last IPv4 address, defaults to first
+
+    Returns:
+        (first, last) tuple of ints
+    """
+    if isinstance(first, ipaddress.IPv4Network):
+        return int(first.network_address), int(first.broadcast_address)
+    first = _address_int(first)
+    last = first if last is None else _address_int(last)
+    return first, last
+
+
+def _address_int(address):
+    """Return an IPv4 address as an int.
+
+    Args:
+        address: IPv4 address as an ipaddress.IPv4Address, string or int
+
+    Returns:
+        Address as an int
+    """
+    # Building an IPv4Address from another one goes through its string
+    if isinstance(address, ipaddress.IPv4Address):
+        return int(address)
+    return int(ipaddress.IPv4Address(address))
+
+
 def free_ipv4_subnets(network):
     """Return available subnets not currently in used by the network.
 
@@ -53,14 +284,9 @@ def free_ipv4_subnets(network):
 
     if DEBUG:
         print("NETWORK: ", network.name(), network.ipv4_network())
-    available_subnets = [ipaddress.IPv4Network(network.ipv4_network())]
-
-    # Ensure smallest sized subnets are first (and thus first matched)
-    subnets = sorted(subnets.values(), key=prefixlength, reverse=True)
-    if DEBUG:
-        print("SORTED SUBNETS: ", [x.ipv4_network() for x in subnets])
+    available = IPv4Ranges.from_network(network.ipv4_network())
 
-    for subnet in subnets:
+    for subnet in subnets.values():
         used_subnet = subnet.ipv4_network()
 
         temp_subnet = is_supernet_hacked(network.ipv4_network(), subnet)
@@ -76,46 +302,24 @@ def free_ipv4_subnets(network):
                 subnet.ipv4_network(),
             )
 
-        found = False
-        for i in range(len((available_subnets))):
-            try:
-                if not used_subnet.subnet_of(available_subnets[i]):
-                    found = False
-                    continue
-            except AttributeError:
-                if not temp_is_subnet_of(used_subnet, available_subnets[i]):
-                    found = False
-                    continue
-
-            found = True
-            if DEBUG:
-                print("FOUND:  ", used_subnet, "is subnet of", available_subnets[i])
-            new_subnets = list(available_subnets[i].address_exclude(used_subnet))
-            if DEBUG:
-                print("    new_subnets: ", new_subnets)
-            available_subnets.pop(i)
-            available_subnets += new_subnets
-            available_subnets.sort(
-                key=prefixlength,
-                reverse=True,
-            )  # Use the smallest block possible
-            if DEBUG:
-                print("    final:  ", available_subnets)
-            break
-        if not found:
+        if not available.is_free(used_subnet):
             raise Exception(
                 "An appropriate subnet could not be found. "
                 "Often this is overlapping subnets or a subnet outside the network.",
             )
+        available.reserve(used_subnet)
 
+    available_subnets = available.free_subnets()
     if DEBUG:
         print("Remaining: ", available_subnets)
 
     return available_subnets
 
 
-def free_ipv4_addresses(subnet):
-    """Return a set of available IPv4 addresses not currently used in a subnet.
+def free_ipv4_ranges(subnet):
+    """Return the IPv4 address ranges not currently used in a subnet.
+
+    The network and broadcast addresses, the gateway and every reservation are used.
 
     NOTICE:  This function ignores DHCP Ranges / Pools in the subnet which likely
              need recalculation.
@@ -124,7 +328,7 @@ def free_ipv4_addresses(subnet):
         subnet (sls_utils.Subnet): SLS Subnet object
 
     Returns:
-        free_ips (set): Remaining IP addresses not used in the network (unordered)
+        free_ranges (IPv4Ranges): Remaining IP address ranges not used in the subnet
 
     Raises:
         ValueError: If input is not a Subnet
@@ -133,80 +337,72 @@ def free_ipv4_addresses(subnet):
         raise ValueError(f"{__name__} argument must be a Subnet")
 
     subnet_ipv4_network = subnet.ipv4_network()
+    free_ranges = IPv4Ranges.from_network(subnet_ipv4_network)
 
-    # Every available IPv4 address in the subnet
-    all_hosts_in_subnet = list(subnet_ipv4_network.hosts())
-    all_hosts_in_subnet = set(all_hosts_in_subnet)
+    # Like ipaddress hosts(), /31 and /32 networks have no network or broadcast address
+    if subnet_ipv4_network.num_addresses > 2:
+        free_ranges.reserve(subnet_ipv4_network.network_address)
+        free_ranges.reserve(subnet_ipv4_network.broadcast_address)
 
     # All the IPv4 addresses used in the subnet by Reservations
-    reservations = subnet.reservations().values()
-    all_used_hosts_in_subnet = set({r.ipv4_address() for r in reservations})
-    all_used_hosts_in_subnet.add(subnet.ipv4_gateway())
+    used = [reservation.ipv4_address() for reservation in subnet.reservations().values()]
+    used.append(subnet.ipv4_gateway())
+    free_ranges.reserve_all(address for address in used if address is not None)
+
+    return free_ranges
+
+
+def free_ipv4_addresses(subnet):
+    """Return a set of available IPv4 addresses not currently used in a subnet.
+
+    Every free address is materialized, prefer `free_ipv4_ranges` for large subnets.
 
-    # Available IPv4 addresses in the subnet
-    unused_hosts_in_subnet = all_hosts_in_subnet.difference(all_used_hosts_in_subnet)
+    NOTICE:  This function ignores DHCP Ranges / Pools in the subnet which likely
+             need recalculation.
 
-    return unused_hosts_in_subnet
+    Args:
+        subnet (sls_utils.Subnet): SLS Subnet object
+
+    Returns:
+        free_ips (set): Remaining IP addresses not used in the network (unordered)
+    """
+    return set(free_ipv4_ranges(subnet).addresses())
 
 
 def next_free_ipv4_address(subnet, requested_ipv4_address=None):
-    """Return a set of available IPv4 addresses not currently used in a subnet.
+    """Return the first IPv4 address not currently used in a subnet.
 
     Args:
         subnet (sls_utils.Subnet): An SLS Subnet object
         requested_ipv4_address (str): A requested IPv4 address
 
     Returns:
-        next_free_ip (ipaddress.IPv4Network): Remaining IP addresses not used in the network
-
-    Raises:
-        ValueError: If input is not a Subnet
+        next_free_ip (ipaddress.IPv4Address): The requested address if it is free, else the first free address
     """
-    if not isinstance(subnet, Subnet):
-        raise ValueError(f"{__name__} argument must be a Subnet")
-
-    if isinstance(requested_ipv4_address, str):
-        requested_ipv4_address = ipaddress.IPv4Address(requested_ipv4_address)
-
-    next_free_ip = None
-    free_ips = free_ipv4_addresses(subnet)
+    free_ranges = free_ipv4_ranges(subnet)
     if requested_ipv4_address is not None:
-        if requested_ipv4_address in free_ips:
-            return requested_ipv4_address
-    else:
-        next_free_ip = sorted(free_ips)[0]
-
-    return next_free_ip
+        if requested_ipv4_address in free_ranges:
+            return ipaddress.IPv4Address(requested_ipv4_address)
+        return None
+    return free_ranges.next_free()
 
 
 def last_free_ipv4_address(subnet, requested_ipv4_address=None):
-    """Return a set of available IPv4 addresses not currently used in a subnet.
+    """Return the last IPv4 address not currently used in a subnet.
 
     Args:
         subnet (sls_utils.Subnet): An SLS Subnet object
         requested_ipv4_address (str): A requested IPv4 address
 
     Returns:
-        next_free_ip (ipaddress.IPv4Network): Remaining IP addresses not used in the network
-
-    Raises:
-        ValueError: If input is not a Subnet
+        last_free_ip (ipaddress.IPv4Address): The requested address if it is free, else the last free address
     """
-    if not isinstance(subnet, Subnet):
-        raise ValueError(f"{__name__} argument must be a Subnet")
-
-    if isinstance(requested_ipv4_address, str):
-        requested_ipv4_address = ipaddress.IPv4Address(requested_ipv4_address)
-
-    last_free_ip = None
-    free_ips = free_ipv4_addresses(subnet)
+    free_ranges = free_ipv4_ranges(subnet)
     if requested_ipv4_address is not None:
-        if requested_ipv4_address in free_ips:
-            return requested_ipv4_address
-    else:
-        last_free_ip = sorted(free_ips)[-1]
-
-    return last_free_ip
+        if requested_ipv4_address in free_ranges:
+            return ipaddress.IPv4Address(requested_ipv4_address)
+        return None
+    return free_ranges.last_free()
 
 
 def is_supernet_hacked(network_address, subnet):
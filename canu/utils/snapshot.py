@@ -0,0 +1,140 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""CANU switch snapshot store.
+
+Every time CANU collects LLDP, ARP and mac-address-table data from a switch the
+raw result is written to the cache directory as a versioned, timestamped snapshot.
+Commands run with '--from-snapshot' read those snapshots instead of polling the
+switch again, as long as they are younger than '--max-age'.
+"""
+import logging
+import time
+
+import click
+
+from canu.utils.cache import cache_path, load_json_cache, save_json_cache
+
+log = logging.getLogger("snapshot")
+
+SNAPSHOT_VERSION = 1
+DEFAULT_MAX_AGE = 60 * 60
+
+
+def snapshot_options(function):
+    """Add the shared '--from-snapshot' and '--max-age' options to a command that collects LLDP.
+
+    Args:
+        function: The click command function to decorate
+
+    Returns:
+        The decorated click command function
+    """
+    function = click.option(
+        "--max-age",
+        help="Oldest snapshot in seconds that '--from-snapshot' will use before polling the switch again",
+        type=click.IntRange(min=0),
+        default=DEFAULT_MAX_AGE,
+        show_default=True,
+    )(function)
+    function = click.option(
+        "--from-snapshot",
+        help="Use the LLDP/ARP data saved by the last CANU command that polled each switch",
+        is_flag=True,
+        default=False,
+    )(function)
+    return function
+
+
+def _snapshot_file(kind, ip):
+    return cache_path("snapshots", kind, f"{ip}.json")
+
+
+def save_snapshot(kind, ip, data):
+    """Save a snapshot of data collected from a switch.
+
+    Args:
+        kind: Type of snapshot, for example 'lldp'
+        ip: Switch ip
+        data: JSON serializable data
+
+    Returns:
+        True if the snapshot was written
+    """
+    snapshot = {"ip": str(ip), "collected_at": time.time(), "data": data}
+    try:
+        return save_json_cache(_snapshot_file(kind, ip), SNAPSHOT_VERSION, snapshot)
+    except (TypeError, ValueError) as err:
+        log.debug(f"Could not save {kind} snapshot of {ip}: {err}")
+        return False
+
+
+def load_snapshot(kind, ip, max_age=DEFAULT_MAX_AGE):
+    """Load a snapshot of data collected from a switch.
+
+    Args:
+        kind: Type of snapshot, for example 'lldp'
+        ip: Switch ip
+        max_age: Oldest snapshot in seconds to accept
+
+    Returns:
+        The snapshot data, or None if there is no usable snapshot
+    """
+    snapshot = load_json_cache(_snapshot_file(kind, ip), SNAPSHOT_VERSION)
+    if snapshot is None:
+        return None
+    age = time.time() - snapshot.get("collected_at", 0)
+    if age > max_age:
+        log.debug(f"Ignoring {kind} snapshot of {ip}, it is {age:.0f}s old")
+        return None
+    log.debug(f"Using {kind} snapshot of {ip} from {age:.0f}s ago")
+    return snapshot["data"]
+
+
+def save_lldp_snapshot(ip, switch_info, lldp_dict, arp):
+    """Save the LLDP, ARP and mac-address-table data collected from a switch.
+
+    Args:
+        ip: Switch ip
+        switch_info: Dictionary with switch platform_name, hostname and IP address
+        lldp_dict: Dictionary with LLDP information
+        arp: ARP dictionary
+
+    Returns:
+        True if the snapshot was written
+    """
+    return save_snapshot("lldp", ip, {"switch_info": switch_info, "lldp": lldp_dict, "arp": arp})
+
+
+def load_lldp_snapshot(ip, max_age=DEFAULT_MAX_AGE):
+    """Load the LLDP, ARP and mac-address-table data last collected from a switch.
+
+    Args:
+        ip: Switch ip
+        max_age: Oldest snapshot in seconds to accept
+
+    Returns:
+        Tuple of switch_info, lldp_dict and arp, or None if there is no usable snapshot
+    """
+    snapshot = load_snapshot("lldp", ip, max_age)
+    if snapshot is None:
+        return None
+    return snapshot["switch_info"], snapshot["lldp"], snapshot["arp"]
@@ -19,9 +19,24 @@
 # OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
 # ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 # OTHER DEALINGS IN THE SOFTWARE.
-"""CANU ssh utils."""
+"""CANU ssh utils.
 
-from netmiko import ConnectHandler
+Inside an SSH connection pool scope (one per CANU command) each switch keeps a
+single authenticated netmiko connection that every command sent to it reuses.
+Connections idle for longer than `SSH_IDLE_TIMEOUT` are closed, and everything
+is disconnected when the scope ends. Outside of a pool scope every call opens
+and closes its own connection.
+"""
+import atexit
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from canu.utils.deadline import time_left
+from canu.utils.trace import span
+
+log = logging.getLogger("ssh")
 
 device = {
     "aruba": "aruba_os",
@@ -30,29 +45,211 @@ device = {
     "autodetect": "autodetect",
 }
 
+# Seconds a pooled connection can sit unused before it is closed
+SSH_IDLE_TIMEOUT = 120
 
-def netmiko_command(ip, credentials, command, device_type="autodetect"):
-    """Send a single command to a switch using netmiko.
+# netmiko's own send_command read timeout, used when there is no switch deadline
+NETMIKO_READ_TIMEOUT = 10.0
+
+_pool = None
+_pool_lock = threading.Lock()
+
+# Netmiko device_type found by SSHDetect, used instead of "autodetect" on later connections
+_detected_device_types = {}
+
+
+class _PooledConnection:
+    """A netmiko connection shared by every command sent to one switch."""
+
+    def __init__(self, connection, device_type):
+        self.connection = connection
+        self.device_type = device_type
+        self.lock = threading.Lock()
+        self.last_used = time.monotonic()
+        # Set once the connection is taken out of the pool, users must fetch a new one
+        self.evicted = False
+
+
+def remember_device_type(ip, device_type):
+    """Remember the netmiko device_type detected for a switch.
 
     Args:
         ip: Switch ip
-        credentials: Switch credentials
-        command: Command to be run on the switch
-        device_type: The switch type
+        device_type: Netmiko device_type, for example 'dell_os10'
+    """
+    if device_type and device_type != "autodetect":
+        _detected_device_types[str(ip)] = device_type
+
+
+def connect_timeouts():
+    """Return the netmiko connection timeouts for the current switch.
 
     Returns:
-        output: Text output from the command run.
+        Dictionary of netmiko timeout arguments, empty when there is no switch deadline
     """
+    timeout = time_left()
+    if timeout is None:
+        return {}
+    return {"conn_timeout": timeout, "auth_timeout": timeout, "banner_timeout": timeout}
+
+
+def _connect(ip, credentials, netmiko_device_type):
+    # netmiko is imported on first connection, the CLI imports this module to open the pool scope
+    from netmiko import ConnectHandler
+
     switch = {
-        "device_type": device[device_type],
+        "device_type": netmiko_device_type,
         "host": ip,
         "username": credentials["username"],
         "password": credentials["password"],
+        **connect_timeouts(),
     }
+    log.debug(f"Opening {netmiko_device_type} SSH connection to {ip}")
+    # Includes the login and netmiko's prompt detection
+    with span("connect", "ssh", switch=str(ip), device_type=netmiko_device_type):
+        return ConnectHandler(**switch)
+
+
+def _disconnect(connection):
+    try:
+        connection.disconnect()
+    except Exception as err:
+        log.debug(f"Error disconnecting from {connection.host}: {err}")
+
+
+def _evict_idle_connections():
+    now = time.monotonic()
+    evicted = []
+    with _pool_lock:
+        for key, pooled in list(_pool.items()):
+            # A connection in use, or about to be used, keeps its lock and is skipped
+            if now - pooled.last_used > SSH_IDLE_TIMEOUT and pooled.lock.acquire(blocking=False):
+                del _pool[key]
+                pooled.evicted = True
+                evicted.append(pooled)
+    for pooled in evicted:
+        try:
+            if pooled.connection is not None:
+                log.debug(f"Closing idle SSH connection to {pooled.connection.host}")
+                _disconnect(pooled.connection)
+                pooled.connection = None
+        finally:
+            pooled.lock.release()
+
+
+def _acquire_pooled(key, netmiko_device_type):
+    """Return the locked pool entry of a switch, creating it when there is none."""
+    while True:
+        with _pool_lock:
+            pooled = _pool.get(key)
+            if pooled is None:
+                pooled = _PooledConnection(None, netmiko_device_type)
+                _pool[key] = pooled
+        pooled.lock.acquire()
+        if not pooled.evicted:
+            return pooled
+        # Evicted between the lookup and the lock, look it up again
+        pooled.lock.release()
+
+
+@contextmanager
+def netmiko_connection(ip, credentials, device_type="autodetect"):
+    """Get a netmiko connection to a switch.
+
+    Inside a pool scope an open connection to the switch is reused. A request for
+    'autodetect' reuses whatever connection is already open, otherwise the
+    device_type must match.
+
+    Args:
+        ip: Switch ip
+        credentials: Switch credentials
+        device_type: The switch type
+
+    Yields:
+        net_connect: Netmiko connection
+    """
+    netmiko_device_type = device[device_type]
+    if netmiko_device_type == "autodetect":
+        netmiko_device_type = _detected_device_types.get(str(ip), netmiko_device_type)
+
+    if _pool is None:
+        net_connect = _connect(ip, credentials, netmiko_device_type)
+        try:
+            yield net_connect
+        finally:
+            _disconnect(net_connect)
+        return
+
+    _evict_idle_connections()
+    key = (str(ip), credentials["username"])
+    pooled = _acquire_pooled(key, netmiko_device_type)
+    try:
+        if pooled.connection is not None:
+            reusable = device_type == "autodetect" or pooled.device_type == netmiko_device_type
+            if not reusable or not pooled.connection.is_alive():
+                _disconnect(pooled.connection)
+                pooled.connection = None
+        if pooled.connection is None:
+            pooled.connection = _connect(ip, credentials, netmiko_device_type)
+            pooled.device_type = netmiko_device_type
+        yield pooled.connection
+    finally:
+        pooled.last_used = time.monotonic()
+        pooled.lock.release()
+
+
+def close_ssh_connections():
+    """Disconnect every pooled SSH connection."""
+    if _pool is None:
+        return
+    with _pool_lock:
+        connections = [pooled.connection for pooled in _pool.values() if pooled.connection is not None]
+        _pool.clear()
+    for connection in connections:
+        _disconnect(connection)
+
+
+@contextmanager
+def ssh_connection_pool():
+    """Share SSH connections between every netmiko call made inside the scope.
+
+    Nested scopes reuse the outermost pool.
+
+    Yields:
+        None
+    """
+    global _pool
+
+    if _pool is not None:
+        yield
+        return
+
+    _pool = {}
+    try:
+        yield
+    finally:
+        close_ssh_connections()
+        _pool = None
+
+
+atexit.register(close_ssh_connections)
+
 
-    with ConnectHandler(**switch) as net_connect:
-        output = net_connect.send_command(command)
-        net_connect.disconnect()
+def netmiko_command(ip, credentials, command, device_type="autodetect"):
+    """Send a single command to a switch using netmiko.
+
+    Args:
+        ip: Switch ip
+        credentials: Switch credentials
+        command: Command to be run on the switch
+        device_type: The switch type
+
+    Returns:
+        output: Text output from the command run.
+    """
+    with netmiko_connection(ip, credentials, device_type) as net_connect:
+        with span(command, "ssh", switch=str(ip)):
+            output = net_connect.send_command(command, read_timeout=time_left(NETMIKO_READ_TIMEOUT))
 
     return output
 
@@ -69,18 +266,12 @@ def netmiko_commands(ip, credentials, commands, device_type="autodetect"):
     Returns:
         output: Text output from the command run.
     """
-    switch = {
-        "device_type": device[device_type],
-        "host": ip,
-        "username": credentials["username"],
-        "password": credentials["password"],
-    }
     output = []
-    with ConnectHandler(**switch) as net_connect:
+    with netmiko_connection(ip, credentials, device_type) as net_connect:
         net_connect.enable()
         for command in commands:
-            command_output = net_connect.send_command(command, read_timeout=60)
+            with span(command, "ssh", switch=str(ip)):
+                command_output = net_connect.send_command(command, read_timeout=time_left(60))
             output.append(command_output)
-        net_connect.disconnect()
 
     return output
@@ -0,0 +1,123 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""CANU stream utils for writing large JSON documents one record at a time.
+
+A `JsonStream` writes a JSON object whose last member is an array of records.
+Each record is serialized and written as soon as it is produced, so the memory
+used is bounded by a single record rather than the whole document. The output is
+byte-for-byte the same as `json.dumps(document, indent=2)`. In NDJSON mode the
+header object is the first line and every record is written on its own line.
+"""
+import json
+
+
+class JsonStream:
+    """Incremental writer for a JSON object ending with an array of records."""
+
+    def __init__(self, out, header, key, ndjson=False, indent=2):
+        """Create a JsonStream, nothing is written until the first record or close.
+
+        Args:
+            out: File object to write to
+            header: Dictionary of the members written before the array
+            key: Name of the array member
+            ndjson: Write newline delimited JSON instead of a single document
+            indent: Indentation of the JSON document
+        """
+        self.out = out
+        self.header = header
+        self.key = key
+        self.ndjson = ndjson
+        self.indent = indent
+        self.count = 0
+        self.closed = False
+        self._started = False
+
+    def _start(self):
+        self._started = True
+        if self.ndjson:
+            self.out.write(json.dumps(self.header) + "\n")
+            return
+
+        header = json.dumps(self.header, indent=self.indent)
+        prefix = header[:-2] + ",\n" if self.header else "{\n"
+        self.out.write(f"{prefix}{' ' * self.indent}{json.dumps(self.key)}: [")
+
+    def write(self, record):
+        """Serialize and write one record of the array.
+
+        Args:
+            record: JSON serializable record
+        """
+        if not self._started:
+            self._start()
+
+        if self.ndjson:
+            self.out.write(json.dumps(record) + "\n")
+        else:
+            padding = "\n" + " " * (self.indent * 2)
+            text = json.dumps(record, indent=self.indent).replace("\n", padding)
+            self.out.write(f"{',' if self.count else ''}{padding}{text}")
+        self.count += 1
+
+    def write_all(self, records):
+        """Write every record of an iterable as it is produced.
+
+        Args:
+            records: Iterable of JSON serializable records
+
+        Returns:
+            Number of records written
+        """
+        for record in records:
+            self.write(record)
+        return self.count
+
+    def close(self):
+        """Finish the array and the enclosing object."""
+        if self.closed:
+            return
+        if not self._started:
+            self._start()
+        if not self.ndjson:
+            closing = f"\n{' ' * self.indent}]" if self.count else "]"
+            self.out.write(f"{closing}\n}}\n")
+        self.closed = True
+
+    def __enter__(self):
+        """Use the stream as a context manager.
+
+        Returns:
+            The JsonStream
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the stream unless the block raised.
+
+        Args:
+            exc_type: Exception type raised in the block
+            exc_value: Exception raised in the block
+            traceback: Traceback of the exception
+        """
+        if exc_type is None:
+            self.close()
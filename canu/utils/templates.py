@@ -0,0 +1,190 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""CANU switch template utils.
+
+Compiling the Jinja switch templates from source is a large part of generating a
+switch config. Compiled templates are kept in a bytecode cache in the CANU cache
+directory, and `precompile_templates` builds a read-only cache that ships next to
+the templates, e.g. in the frozen binary. Jinja checks each cached template against
+a checksum of its source, so a stale cache is recompiled rather than used.
+
+To build the shipped cache: `python -m canu.utils.templates`
+"""
+import logging
+import os
+import sys
+from os import path
+from pathlib import Path
+
+import jinja2
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, StrictUndefined, Template, select_autoescape
+
+from canu.utils.cache import cache_dir, content_hash
+
+log = logging.getLogger("templates")
+
+# Get project root directory
+if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):  # pragma: no cover
+    project_root = sys._MEIPASS
+else:
+    prog = __file__
+    project_root = Path(__file__).resolve().parent.parent.parent
+
+network_templates_folder = path.join(project_root, "network_modeling", "configs", "templates")
+precompiled_templates_folder = path.join(project_root, "network_modeling", "configs", "compiled")
+
+# Jinja options of each template environment. Compiled templates depend on them,
+# so each environment keeps its bytecode in its own directory.
+ENVIRONMENTS = {
+    "switch": {"autoescape": select_autoescape()},
+    "unescaped": {},
+}
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """Jinja bytecode cache that falls back to a read-only precompiled cache."""
+
+    def __init__(self, directory, precompiled_directory=None):
+        """Set the cache directories.
+
+        Args:
+            directory: Writable cache directory, or None to not write any bytecode
+            precompiled_directory: Read-only directory of precompiled bytecode
+        """
+        self.directory = directory
+        self.precompiled_directory = precompiled_directory
+        self.pattern = "__jinja2_%s.cache"
+
+    def get_cache_key(self, name, filename=None):
+        """Return the cache key of a template.
+
+        The key uses the template name and the Jinja version. The template folder
+        moves between installs and every run of the frozen binary, and bytecode
+        compiled by another Jinja release must not be loaded.
+
+        Args:
+            name: Template name relative to the template folder
+            filename: Template file name, unused
+
+        Returns:
+            Hex digest of the Jinja version and template name
+        """
+        return content_hash(f"{jinja2.__version__}:{name}")
+
+    def load_bytecode(self, bucket):
+        """Load a compiled template from the cache, then from the precompiled cache.
+
+        Args:
+            bucket: Jinja bucket of the template
+        """
+        for directory in (self.directory, self.precompiled_directory):
+            if directory is None:
+                continue
+            filename = path.join(directory, self.pattern % (bucket.key,))
+            try:
+                with open(filename, "rb") as f:
+                    bucket.load_bytecode(f)
+            except OSError:
+                continue
+            if bucket.code is not None:
+                return
+
+    def dump_bytecode(self, bucket):
+        """Save a compiled template to the cache.
+
+        Args:
+            bucket: Jinja bucket of the template
+        """
+        if self.directory is None:
+            return
+        try:
+            super().dump_bytecode(bucket)
+        except OSError as err:
+            log.debug(f"Could not cache compiled template {bucket.key}: {err}")
+
+
+class TracedTemplate(Template):
+    """Jinja template that times each render as a 'render' span."""
+
+    def render(self, *args, **kwargs):
+        """Render the template.
+
+        Args:
+            *args: Positional arguments passed to `jinja2.Template.render`
+            **kwargs: Template variables
+
+        Returns:
+            The rendered template
+        """
+        # The trace utils need click and requests, the RPM build precompiles the templates with only jinja2
+        from canu.utils.trace import span
+
+        with span("render", "template", template=self.name):
+            return super().render(*args, **kwargs)
+
+
+def template_environment(name, directory=None):
+    """Return a Jinja environment for the network templates with a bytecode cache.
+
+    Args:
+        name: Name of the environment options in ENVIRONMENTS
+        directory: Bytecode cache directory, defaults to the CANU cache directory
+
+    Returns:
+        Jinja Environment
+    """
+    if directory is None:
+        directory = cache_dir("jinja", name)
+    env = Environment(
+        loader=FileSystemLoader(network_templates_folder),
+        undefined=StrictUndefined,
+        bytecode_cache=TemplateBytecodeCache(directory, path.join(precompiled_templates_folder, name)),
+        **ENVIRONMENTS[name],
+    )
+    env.template_class = TracedTemplate
+    return env
+
+
+def precompile_templates(target=precompiled_templates_folder):
+    """Compile every network template into a bytecode cache directory.
+
+    Args:
+        target: Directory to write the bytecode of each environment to
+
+    Returns:
+        Number of templates compiled
+    """
+    compiled = 0
+    for name in ENVIRONMENTS:
+        directory = path.join(target, name)
+        os.makedirs(directory, exist_ok=True)
+        env = template_environment(name, directory)
+        # Only read the bytecode that is being built
+        env.bytecode_cache.precompiled_directory = None
+        for template_name in env.list_templates(extensions=["j2"]):
+            env.get_template(template_name)
+            compiled += 1
+    return compiled
+
+
+if __name__ == "__main__":  # pragma: no cover
+    print(f"Compiled {precompile_templates()} templates to {precompiled_templates_folder}")
@@ -0,0 +1,182 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""CANU topology index used to generate switch configs.
+
+Generating a switch config used to serialize every node in the network model to find
+the neighbors of that one switch, so generating the whole network was O(switches x
+nodes). The TopologyIndex serializes the node list once and keeps hashed name, id,
+rack and port adjacency maps that every switch of the run can share.
+"""
+import natsort
+
+
+def switch_unused_ports(node_list):
+    """Create a dictionary of unused ports.
+
+    Args:
+        node_list: A list of nodes
+
+    Returns:
+        unused_ports: Dictionary of switches and their unused ports
+    """
+    unused_ports = {}
+    for node in node_list:
+        if "sw" in node.common_name() and "sw-hsn" not in node.common_name():
+
+            unused_ports[node.common_name()] = []
+            unused_block = []
+            logical_index = 1
+            for port in node.ports():
+                if port is None:
+                    unused_ports[node.common_name()].append(logical_index)
+                    unused_block.append(logical_index)
+                    logical_index += 1
+                    continue
+                if unused_block:
+                    unused_block = []  # reset
+                logical_index += 1
+            unused_ports[node.common_name()].pop()
+    return unused_ports
+
+
+class TopologyIndex:
+    """Read-only lookups over a network node list, built once per run.
+
+    The index is not updated after it is built, so one instance can be shared by every
+    switch config generated from the same node list, including by worker processes.
+    """
+
+    def __init__(self, network_node_list):
+        """Serialize the node list once and hash it.
+
+        Args:
+            network_node_list: List of nodes from the SHCD / Paddle
+        """
+        self._nodes_by_name = {}
+        self._nodes_by_id = {}
+        for node in network_node_list:
+            node_tmp = node.serialize()
+            self._nodes_by_name[node_tmp["common_name"]] = node_tmp
+            self._nodes_by_id[node_tmp["id"]] = node_tmp
+
+        # Source node name -> destination node name -> source ports, in port order
+        self._adjacency = {}
+        for name, node_tmp in self._nodes_by_name.items():
+            neighbors = self._adjacency.setdefault(name, {})
+            for port in node_tmp["ports"]:
+                destination_name = self._nodes_by_id[port["destination_node_id"]]["common_name"]
+                neighbors.setdefault(destination_name, []).append(port)
+
+        self._unused_ports = switch_unused_ports(network_node_list)
+
+    @property
+    def nodes_by_name(self):
+        """Serialized nodes keyed by common name."""
+        return self._nodes_by_name
+
+    @property
+    def nodes_by_id(self):
+        """Serialized nodes keyed by node id."""
+        return self._nodes_by_id
+
+    def __contains__(self, name):
+        """Return True if a node with this common name is in the topology."""
+        return name in self._nodes_by_name
+
+    def node(self, name):
+        """Return the serialized node with this common name.
+
+        Args:
+            name: Node common name
+
+        Returns:
+            Serialized node dictionary
+        """
+        return self._nodes_by_name[name]
+
+    def node_by_id(self, node_id):
+        """Return the serialized node with this id.
+
+        Args:
+            node_id: Node id
+
+        Returns:
+            Serialized node dictionary
+        """
+        return self._nodes_by_id[node_id]
+
+    def rack(self, node_id):
+        """Return the rack of a node.
+
+        Args:
+            node_id: Node id
+
+        Returns:
+            Rack name from the node location
+        """
+        return self._nodes_by_id[node_id]["location"]["rack"]
+
+    def destination_racks(self, name):
+        """Return the rack at the far end of each connected port of a node.
+
+        Args:
+            name: Node common name
+
+        Returns:
+            List of rack names in port order
+        """
+        return [self.rack(port["destination_node_id"]) for port in self._nodes_by_name[name]["ports"]]
+
+    def ports_to(self, name, destination_name):
+        """Return the ports of a node that connect to another node.
+
+        Args:
+            name: Source node common name
+            destination_name: Destination node common name
+
+        Returns:
+            List of serialized ports in port order
+        """
+        return self._adjacency.get(name, {}).get(destination_name, [])
+
+    def pair_ports(self, switch_name, pair_name):
+        """Return the switch ports connected to its VSX/MLAG pair, naturally sorted.
+
+        Args:
+            switch_name: Switch hostname
+            pair_name: Hostname of the other switch in the pair
+
+        Returns:
+            List of port names
+        """
+        return natsort.natsorted(f"{port['port']}" for port in self.ports_to(switch_name, pair_name))
+
+    def unused_ports(self, name):
+        """Return the unused ports of a switch.
+
+        Args:
+            name: Switch hostname
+
+        Returns:
+            List of unused port numbers
+        """
+        return self._unused_ports[name]
@@ -0,0 +1,386 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""CANU trace utils for timing the phases of a command.
+
+Code marks its phases with `span()`, for example connecting to a switch, each
+REST or SSH command, parsing, annotating and rendering. Spans nest naturally
+and are recorded per thread, so the work done for each switch in a fleet run
+shows up on its own track. Work sent to a process pool with `process_map()` is
+recorded in the worker and merged into the trace as a track of that process.
+
+Nothing is recorded unless profiling was started with the global
+`canu --profile PATH` option. While it is off `span()` returns a shared no-op
+object, so instrumented code only pays for one function call. When the command
+finishes the spans are written to PATH as Chrome trace-event JSON, which can be
+opened in chrome://tracing or https://ui.perfetto.dev, and a summary table of
+the time spent in each phase is printed.
+"""
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import partial
+from urllib.parse import urlsplit
+
+import click
+import requests
+
+from canu.utils.deadline import time_left
+
+_profiler = None
+
+
+class _NullSpan:
+    """Span used while profiling is off, it does nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def set(self, **args):
+        """Ignore extra details about the span.
+
+        Args:
+            **args: Details of the span
+        """
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """A timed phase of a command, recorded when the `with` block ends."""
+
+    __slots__ = ("profiler", "name", "category", "args", "start")
+
+    def __init__(self, profiler, name, category, args):
+        """Create a Span.
+
+        Args:
+            profiler: Profiler the span is recorded in
+            name: Name of the phase, for example 'login'
+            category: Group of the phase, for example 'rest' or 'ssh'
+            args: Dictionary of details shown with the span, for example the switch IP
+        """
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        """Start timing the span.
+
+        Returns:
+            The Span
+        """
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Record the span, noting the exception if the block raised one.
+
+        Args:
+            exc_type: Exception type raised in the block
+            exc_value: Exception raised in the block
+            traceback: Traceback of the exception
+
+        Returns:
+            False so exceptions are never swallowed
+        """
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.profiler.record(self.name, self.category, self.start, end, self.args)
+        return False
+
+    def set(self, **args):
+        """Add details to the span once they are known, for example the vendor that was detected.
+
+        Args:
+            **args: Details of the span
+        """
+        self.args.update(args)
+
+
+class Profiler:
+    """Collects the spans of every thread for one command."""
+
+    def __init__(self):
+        """Create an empty Profiler."""
+        self.origin = time.perf_counter_ns()
+        self.pid = os.getpid()
+        self.events = []
+        self.threads = {}
+
+    def record(self, name, category, start, end, args):
+        """Record a finished span.
+
+        Args:
+            name: Name of the phase
+            category: Group of the phase
+            start: perf_counter_ns when the span started
+            end: perf_counter_ns when the span ended
+            args: Dictionary of details shown with the span
+        """
+        thread = threading.current_thread()
+        tid = (self.pid, thread.ident)
+        self.threads.setdefault(tid, thread.name)
+        # list.append is atomic, the worker threads don't need a lock
+        self.events.append((name, category, tid, start - self.origin, end - start, args))
+
+    def export(self):
+        """Return the spans recorded so far, to be merged into the profiler of another process.
+
+        Returns:
+            Dictionary of the origin, threads and events of the profiler
+        """
+        return {"origin": self.origin, "threads": self.threads, "events": self.events}
+
+    def merge(self, spans):
+        """Merge the spans exported by the profiler of a worker process.
+
+        perf_counter_ns is the same clock in every process of the host, so only the
+        origin of the worker is moved to the origin of this profiler.
+
+        Args:
+            spans: Dictionary from `export`
+        """
+        offset = spans["origin"] - self.origin
+        self.threads.update(spans["threads"])
+        self.events.extend(
+            (name, category, tid, start + offset, duration, args)
+            for name, category, tid, start, duration, args in spans["events"]
+        )
+
+    def trace_events(self):
+        """Return the spans as Chrome trace events.
+
+        Returns:
+            List of trace event dictionaries
+        """
+        events = [
+            {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "canu" if pid == self.pid else "canu worker"}}
+            for pid in sorted({pid for pid, _ in self.threads})
+        ]
+        events.extend(
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for (pid, tid), name in self.threads.items()
+        )
+        for name, category, (pid, tid), start, duration, args in self.events:
+            events.append(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": start / 1000,
+                    "dur": duration / 1000,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": args,
+                },
+            )
+        return events
+
+    def write_trace(self, filename):
+        """Write the spans to a Chrome trace-event JSON file.
+
+        Args:
+            filename: Path of the trace file
+        """
+        with open(filename, "w") as f:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, f)
+
+    def summary(self):
+        """Total the time spent in each phase.
+
+        Self time is the time of a span less the time of the spans nested in it on
+        the same thread, so it shows where the time actually went.
+
+        Returns:
+            List of [category, name, count, total ms, self ms, mean ms, max ms] rows, largest self time first
+        """
+        totals = defaultdict(lambda: [0, 0, 0, 0])
+        by_thread = defaultdict(list)
+        for event in self.events:
+            by_thread[event[2]].append(event)
+
+        for events in by_thread.values():
+            # Parents start first, or at the same time and last longer
+            events.sort(key=lambda event: (event[3], -event[4]))
+            stack = []
+            for name, category, _, start, duration, _ in events:
+                while stack and start >= stack[-1][0]:
+                    stack.pop()
+                if stack:
+                    totals[stack[-1][1]][2] -= duration
+                key = (category, name)
+                total = totals[key]
+                total[0] += 1
+                total[1] += duration
+                total[2] += duration
+                total[3] = max(total[3], duration)
+                stack.append((start + duration, key))
+
+        rows = [
+            [category, name, count, total / 1e6, self_time / 1e6, total / count / 1e6, longest / 1e6]
+            for (category, name), (count, total, self_time, longest) in totals.items()
+        ]
+        rows.sort(key=lambda row: row[4], reverse=True)
+        return rows
+
+    def print_summary(self):
+        """Print the summary table to stderr."""
+        from tabulate import tabulate
+
+        click.secho("Profile", fg="bright_white", err=True)
+        click.echo(
+            tabulate(
+                self.summary(),
+                headers=["Category", "Phase", "Count", "Total ms", "Self ms", "Mean ms", "Max ms"],
+                floatfmt=".1f",
+            ),
+            err=True,
+        )
+
+
+def span(name, category="canu", **args):
+    """Time a phase of a command.
+
+    Args:
+        name: Name of the phase, for example 'login'
+        category: Group of the phase, for example 'rest' or 'ssh'
+        **args: Details shown with the span, for example the switch IP
+
+    Returns:
+        A context manager that records the span, or a no-op one while profiling is off
+    """
+    profiler = _profiler
+    if profiler is None:
+        return _NULL_SPAN
+    return Span(profiler, name, category, args)
+
+
+class TracedSession(requests.Session):
+    """A `requests.Session` that times every request as a 'rest' span.
+
+    Mellanox JSON API requests are named after their 'cmd', everything else after
+    the method and URL path.
+    """
+
+    def request(self, method, url, *args, **kwargs):
+        """Send a request inside a span.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            *args: Positional arguments passed to `requests.Session.request`
+            **kwargs: Keyword arguments passed to `requests.Session.request`
+
+        Returns:
+            The `requests.Response`
+        """
+        # Inside a fleet run, requests time out at the deadline of the switch
+        timeout = time_left()
+        if timeout is not None and kwargs.get("timeout") is None:
+            kwargs["timeout"] = timeout
+        profiler = _profiler
+        if profiler is None:
+            return super().request(method, url, *args, **kwargs)
+
+        parts = urlsplit(url)
+        body = kwargs.get("json")
+        name = body.get("cmd") if isinstance(body, dict) else None
+        with Span(profiler, name or f"{method} {parts.path}", "rest", {"switch": parts.hostname}) as request_span:
+            response = super().request(method, url, *args, **kwargs)
+            request_span.set(status=response.status_code)
+        return response
+
+
+def _call_in_worker(profiled, func, *args):
+    """Call a function in a worker process, recording its spans when the parent process is profiling.
+
+    A forked worker inherits the profiler of the parent, so a fresh one is started for each call.
+
+    Args:
+        profiled: True when the parent process is profiling
+        func: Function to call
+        *args: Arguments of the function
+
+    Returns:
+        Tuple of the result of the function and the exported spans, or None when not profiled
+    """
+    global _profiler
+
+    _profiler = Profiler() if profiled else None
+    try:
+        result = func(*args)
+        return result, _profiler.export() if profiled else None
+    finally:
+        _profiler = None
+
+
+def process_map(executor, func, *iterables):
+    """Map a function over a `ProcessPoolExecutor`, merging the spans of the workers into this process.
+
+    Args:
+        executor: concurrent.futures.ProcessPoolExecutor
+        func: Picklable function to call in the workers
+        *iterables: Iterables of the arguments, as for `executor.map`
+
+    Yields:
+        Result of each call, in order
+    """
+    for result, spans in executor.map(partial(_call_in_worker, _profiler is not None, func), *iterables):
+        profiler = _profiler
+        if profiler is not None and spans is not None:
+            profiler.merge(spans)
+        yield result
+
+
+@contextmanager
+def profiling(filename):
+    """Record every span made inside the scope, then write the trace and print the summary.
+
+    Args:
+        filename: Path of the Chrome trace-event JSON file
+
+    Yields:
+        Profiler recording the spans
+    """
+    global _profiler
+
+    profiler = Profiler()
+    _profiler = profiler
+    try:
+        with span("command", "canu"):
+            yield profiler
+    finally:
+        _profiler = None
+        profiler.write_trace(filename)
+        profiler.print_summary()
@@ -0,0 +1,152 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""CANU TTP parser utils.
+
+Building a `ttp` parser parses its template, which costs far more than parsing
+a switch banner or config with it. Each template is compiled into a parser once
+per process and kept, and the parser is reset between uses. `parse_texts` feeds
+the outputs of a whole fleet through one parser, optionally split over a pool of
+worker processes that each compile the template once.
+"""
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from ttp import ttp
+
+from canu.utils.trace import span
+
+_parsers = {}
+_parsers_lock = threading.Lock()
+
+
+class CompiledParser:
+    """A TTP template compiled into a parser that can be used again."""
+
+    def __init__(self, template):
+        """Compile a template.
+
+        Args:
+            template: TTP template text, or the path of a template file
+        """
+        self.template = template
+        self.lock = threading.Lock()
+        with span("compile", "ttp"):
+            self.parser = ttp(template=template)
+
+    def parse_many(self, texts):
+        """Parse many texts with the template.
+
+        Args:
+            texts: List of texts to parse
+
+        Returns:
+            List with the result of each text, in the same order
+        """
+        if not texts:
+            return []
+        # ttp merges identical inputs, and many switches share a banner or config, so parse each text once
+        unique = list(dict.fromkeys(texts))
+        with self.lock, span("parse", "ttp", texts=len(unique)):
+            self.parser.clear_result()
+            self.parser.clear_input()
+            for text in unique:
+                self.parser.add_input(text)
+            self.parser.parse(one=True)
+            parsed = self.parser.result()[0]
+            results = {text: parsed[index] for index, text in enumerate(unique)}
+            self.parser.clear_result()
+            self.parser.clear_input()
+        return [results[text] for text in texts]
+
+    def parse(self, text):
+        """Parse a text with the template.
+
+        Args:
+            text: Text to parse
+
+        Returns:
+            Result of the text, the same as `ttp(text, template).result()[0][0]`
+        """
+        return self.parse_many([text])[0]
+
+
+def compiled_parser(template):
+    """Return the parser of a template, compiling it on first use in this process.
+
+    Args:
+        template: TTP template text, or the path of a template file
+
+    Returns:
+        CompiledParser object
+    """
+    with _parsers_lock:
+        if template not in _parsers:
+            _parsers[template] = CompiledParser(template)
+        return _parsers[template]
+
+
+def parse_text(template, text):
+    """Parse a text with a compiled template.
+
+    Args:
+        template: TTP template text, or the path of a template file
+        text: Text to parse
+
+    Returns:
+        Result of the text
+    """
+    return compiled_parser(template).parse(text)
+
+
+def _reset_parsers():
+    """Drop the parsers a worker process inherited, their locks may be held."""
+    global _parsers
+    _parsers = {}
+
+
+def _parse_chunk(template, texts):
+    return compiled_parser(template).parse_many(texts)
+
+
+def parse_texts(template, texts, workers=1):
+    """Parse many texts with a compiled template.
+
+    Args:
+        template: TTP template text, or the path of a template file
+        texts: Iterable of texts to parse
+        workers: Number of worker processes, 1 parses in this process
+
+    Returns:
+        List with the result of each text, in the same order
+    """
+    texts = [str(text) for text in texts]
+    workers = max(1, min(workers, len(texts)))
+    if workers == 1:
+        return compiled_parser(template).parse_many(texts)
+
+    size = -(-len(texts) // workers)
+    chunks = [texts[start : start + size] for start in range(0, len(texts), size)]
+    results = []
+    with ProcessPoolExecutor(max_workers=len(chunks), initializer=_reset_parsers) as pool:
+        for chunk_results in pool.map(_parse_chunk, [template] * len(chunks), chunks):
+            results.extend(chunk_results)
+    return results
@@ -20,19 +20,163 @@
 # ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 # OTHER DEALINGS IN THE SOFTWARE.
 """CANU vendor utils."""
+import logging
 import re
+import threading
+import time
 
 import click
 import requests
 from netmiko import NetmikoAuthenticationException, NetmikoTimeoutException, SSHDetect
 
-from canu.utils.ssh import netmiko_command
+from canu.utils.aruba_session import aruba_login, aruba_logout
+from canu.utils.cache import cache_path, load_json_cache, save_json_cache
+from canu.utils.ssh import connect_timeouts, netmiko_command, remember_device_type
+from canu.utils.trace import TracedSession, span
+
+log = logging.getLogger("vendor")
+
+# Detected vendors are remembered for a day so each switch is only probed once per day
+VENDOR_CACHE_FILE = "switch_vendors.json"
+VENDOR_CACHE_VERSION = 1
+VENDOR_CACHE_TTL = 24 * 60 * 60
+
+_vendor_cache = None
+_vendor_cache_file = None
+_vendor_cache_lock = threading.Lock()
+_refresh_vendor = False
+
+
+def _set_refresh_vendor(ctx, param, value):
+    global _refresh_vendor
+    _refresh_vendor = value
+    return value
+
+
+def refresh_vendor_option(function):
+    """Add the '--refresh-vendor' option to a command that detects switch vendors.
+
+    Args:
+        function: The click command function to decorate
+
+    Returns:
+        The decorated click command function
+    """
+    return click.option(
+        "--refresh-vendor",
+        help="Ignore cached switch vendors and detect them again",
+        is_flag=True,
+        default=False,
+        expose_value=False,
+        callback=_set_refresh_vendor,
+    )(function)
+
+
+def _load_vendor_cache():
+    global _vendor_cache, _vendor_cache_file
+    filename = cache_path(VENDOR_CACHE_FILE)
+    if _vendor_cache is None or filename != _vendor_cache_file:
+        _vendor_cache = load_json_cache(filename, VENDOR_CACHE_VERSION) or {}
+        _vendor_cache_file = filename
+    return _vendor_cache
+
+
+def cached_vendor(ip):
+    """Get the cached vendor of a switch if it was detected within the cache TTL.
+
+    Args:
+        ip: Switch ip
+
+    Returns:
+        vendor: The switch vendor, or None if it has to be detected
+    """
+    if _refresh_vendor:
+        return None
+    with _vendor_cache_lock:
+        entry = _load_vendor_cache().get(str(ip))
+    if entry is None or time.time() - entry.get("timestamp", 0) > VENDOR_CACHE_TTL:
+        return None
+    return entry.get("vendor")
+
+
+def update_vendor_cache(ip, vendor=None, switch_info=None):
+    """Remember the vendor, platform and system MAC of a switch.
+
+    If the system MAC differs from the cached one the switch was replaced, and the
+    old entry is thrown away.
+
+    Args:
+        ip: Switch ip
+        vendor: The switch vendor
+        switch_info: Optional dictionary with the switch platform_name and system_mac
+    """
+    ip = str(ip)
+    switch_info = switch_info or {}
+    vendor = vendor or switch_info.get("vendor")
+    with _vendor_cache_lock:
+        cache = _load_vendor_cache()
+        entry = cache.get(ip, {})
+        system_mac = switch_info.get("system_mac")
+        if system_mac and entry.get("system_mac") not in (None, system_mac):
+            log.debug(f"System MAC of {ip} changed from {entry['system_mac']} to {system_mac}")
+            entry = {}
+        if vendor and vendor != entry.get("vendor"):
+            entry = {"vendor": vendor, "timestamp": time.time()}
+        elif vendor:
+            entry["timestamp"] = time.time()
+        if not entry.get("vendor"):
+            return
+        for key in ("platform_name", "system_mac"):
+            if switch_info.get(key):
+                entry[key] = switch_info[key]
+        cache[ip] = entry
+        save_json_cache(_vendor_cache_file, VENDOR_CACHE_VERSION, cache)
+
+
+def forget_vendor(ip):
+    """Drop a switch from the vendor cache, for example after the cached vendor failed to connect.
+
+    Args:
+        ip: Switch ip
+    """
+    with _vendor_cache_lock:
+        cache = _load_vendor_cache()
+        if cache.pop(str(ip), None) is not None:
+            save_json_cache(_vendor_cache_file, VENDOR_CACHE_VERSION, cache)
 
 
 def switch_vendor(
     ip,
     credentials,
     return_error=False,
+):
+    """Get a switch vendor from the vendor cache, or by detecting it from the switch.
+
+    Args:
+        ip: Switch ip
+        credentials: Switch credentials
+        return_error: If True, raises requests exceptions, if False prints error and returns None
+
+    Returns:
+        vendor: The switch vendor.
+    """
+    vendor = cached_vendor(ip)
+    if vendor is not None:
+        log.debug(f"Using cached vendor {vendor} for {ip}")
+        return vendor
+
+    with span("vendor detect", "switch", switch=str(ip)) as detect_span:
+        vendor = detect_switch_vendor(ip, credentials, return_error)
+        detect_span.set(vendor=vendor)
+    if vendor is not None:
+        update_vendor_cache(ip, vendor)
+    return vendor
+
+
+def detect_switch_vendor(
+    ip,
+    credentials,
+    return_error=False,
 ):
     """Get a switch vendor by detecting it from the switch.
 
@@ -68,10 +212,12 @@ def switch_vendor(
         "host": ip,
         "username": credentials["username"],
         "password": credentials["password"],
+        **connect_timeouts(),
     }
     try:
         guesser = SSHDetect(**switch)
         best_match = guesser.autodetect()
+        remember_device_type(ip, best_match)
 
         if best_match == "dell_os10":
             vendor = "dell"
@@ -145,17 +291,11 @@ def check_aruba(ip, credentials):
     Returns:
         Bool if a switch is an Aruba
     """
-    session = requests.Session()
     try:
         # Login
-        login = session.post(
-            f"https://{ip}/rest/v10.04/login",
-            data=credentials,
-            verify=False,
-        )
-        login.raise_for_status()
+        session = aruba_login(ip, credentials)
         # Logout
-        session.post(f"https://{ip}/rest/v10.04/logout", verify=False)
+        aruba_logout(session)
 
     except (
         requests.exceptions.HTTPError,
@@ -177,7 +317,7 @@ def check_dell(ip, credentials):
     Returns:
         Bool if a switch is a Dell
     """
-    session = requests.Session()
+    session = TracedSession()
     try:
         url = f"https://{ip}/restconf/data/system-sw-state/sw-version/sw-build-version"
         auth = (credentials["username"], credentials["password"])
@@ -204,7 +344,7 @@ def check_mellanox(ip, credentials):
     Returns:
         Bool if a switch is a Mellanox
     """
-    session = requests.Session()
+    session = TracedSession()
     try:
         url = f"https://{ip}/admin/launch?script=rh&template=json-request&action=json-login"
         response = session.get(url, json=credentials, verify=False)
@@ -30,8 +30,10 @@ import requests
 from netmiko import NetmikoAuthenticationException, NetmikoTimeoutException
 
 from canu.style import Style
+from canu.utils.aruba_session import aruba_login, aruba_logout
 from canu.utils.sls import pull_sls_networks
-from canu.utils.vendor import switch_vendor
+from canu.utils.trace import TracedSession
+from canu.utils.vendor import refresh_vendor_option, switch_vendor
 
 
 @click.command(
@@ -53,6 +55,7 @@ from canu.utils.vendor import switch_vendor
     help="The network that BGP neighbors are checked.",
 )
 @click.option("--verbose", is_flag=True, help="Verbose mode")
+@refresh_vendor_option
 @click.pass_context
 def bgp(ctx, username, password, verbose, network):
     """Validate BGP neighbors.
@@ -269,15 +272,9 @@ def get_bgp_neighbors_aruba(ip, credentials, asn, network):
         bgp_neighbors: A dict with switch neighbors
         switch_info: A dict with switch info
     """
-    session = requests.Session()
     try:
         # Login
-        login = session.post(
-            f"https://{ip}/rest/v10.04/login",
-            data=credentials,
-            verify=False,
-        )
-        login.raise_for_status()
+        session = aruba_login(ip, credentials)
 
     except (
         requests.exceptions.HTTPError,
@@ -325,7 +322,7 @@ def get_bgp_neighbors_aruba(ip, credentials, asn, network):
             switch_info["vendor"] = "aruba"
 
             # Logout
-        session.post(f"https://{ip}/rest/v10.04/logout", verify=False)
+        aruba_logout(session)
 
     except requests.exceptions.RequestException:  # pragma: no cover
         click.secho(
@@ -352,7 +349,7 @@ def get_bgp_neighbors_dell(ip, credentials):
     Raises:
         Exception: Exception
     """
-    session = requests.Session()
+    session = TracedSession()
     try:
         auth = (credentials["username"], credentials["password"])
         url = f"https://{ip}/restconf/data/system-sw-state/sw-version"
@@ -405,7 +402,7 @@ def get_bgp_neighbors_mellanox(ip, credentials, network):
         ConnectionError: Connection error exception
         HTTPError: Authentication exception
     """
-    session = requests.Session()
+    session = TracedSession()
 
     # Login
     login = session.post(
@@ -37,6 +37,9 @@ from ruamel.yaml import YAML
 
 from canu.report.switch.cabling.cabling import get_lldp
 from canu.style import Style
+from canu.utils.neighbor_index import index_arp
+from canu.utils.snapshot import snapshot_options
+from canu.utils.vendor import refresh_vendor_option
 from canu.validate.shcd.shcd import node_list_warnings, print_node_list
 from network_modeling.NetworkNodeFactory import NetworkNodeFactory
 from network_modeling.NetworkPort import NetworkPort
@@ -66,15 +69,12 @@ def create_cache_structure_from_lldp(switch_info, lldp_dict, arp):
         "vendor": switch_info["vendor"],
     }
 
+    arp_lookup = index_arp(arp)
     for port_number, port in lldp_dict.items():
         for index, _entry in enumerate(port):
             arp_list = []
             if port[index]["chassis_name"] == "":
-                arp_list = [
-                    f"{arp[mac]['ip_address']}:{list(arp[mac]['port'])[0]}"
-                    for mac in arp
-                    if arp[mac]["mac"] == port[index]["mac_addr"]
-                ]
+                arp_list = arp_lookup.arp_entries(port[index]["mac_addr"])
             arp_list = ", ".join(arp_list)
             neighbor_description = f"{port[index]['chassis_description'][:54]} {str(arp_list)}"
             port_info = {
@@ -141,8 +141,10 @@ def create_cache_structure_from_lldp(switch_info, lldp_dict, arp):
     type=click.File("w"),
     default="-",
 )
+@snapshot_options
+@refresh_vendor_option
 @click.pass_context
-def cabling(ctx, architecture, ips, ips_file, username, password, log_, out):
+def cabling(ctx, architecture, ips, ips_file, username, password, log_, out, from_snapshot, max_age):
     """Validate network cabling.
 
     CANU can be used to validate that network cabling passes basic validation checks.
@@ -164,6 +166,8 @@ def cabling(ctx, architecture, ips, ips_file, username, password, log_, out):
         password: Switch password
         log_: Level of logging.
         out: Name of the output file
+        from_snapshot: Use saved LLDP snapshots instead of polling the switches
+        max_age: Oldest snapshot in seconds to use
     """
     logging.basicConfig(format="%(name)s - %(levelname)s: %(message)s", level=log_)
 
@@ -200,8 +204,13 @@ def cabling(ctx, architecture, ips, ips_file, username, password, log_, out):
                     end="\r",
                 )
                 try:
-                    # Get LLDP info directly (without caching to file)
-                    switch_info, lldp_dict, arp = get_lldp(str(ip), credentials, return_error=True)
+                    # Get LLDP info from the switch, or from its snapshot with --from-snapshot
+                    switch_info, lldp_dict, arp = get_lldp(
+                        str(ip),
+                        credentials,
+                        return_error=True,
+                        max_age=max_age if from_snapshot else None,
+                    )
 
                     if switch_info and lldp_dict:
                         # Create cache structure from live LLDP data
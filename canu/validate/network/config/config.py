@@ -0,0 +1,502 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""CANU commands that validate the running config of every switch against its generated config."""
+import ipaddress
+import json
+import logging
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from os import listdir, path
+
+import click
+import click_spinner
+import emoji
+from click_option_group import RequiredMutuallyExclusiveOptionGroup, optgroup
+from click_params import IPV4_ADDRESS, Ipv4AddressListParamType
+from hier_config import HConfig, Host
+
+from canu.style import Style
+from canu.utils.fleet import fleet_options, run_on_switches
+from canu.utils.sls import pull_sls_networks
+from canu.utils.trace import process_map, span
+from canu.utils.vendor import refresh_vendor_option
+from canu.validate.switch.config.config import aruba_banner, dell_options, get_switch_config, mellanox_options, options
+
+log = logging.getLogger("validate_network_config")
+
+# hier_config OS name and options of each switch vendor
+HIER_CONFIG_OS = {
+    "aruba": ("aoscx", options),
+    "dell": ("dellOS10", dell_options),
+    "mellanox": ("onyx", mellanox_options),
+}
+
+
+@click.command(
+    cls=Style.CanuHelpColorsCommand,
+)
+@optgroup.group(
+    "Running config sources",
+    cls=RequiredMutuallyExclusiveOptionGroup,
+)
+@optgroup.option(
+    "--ips",
+    help="Comma separated list of IPv4 addresses of switches",
+    type=Ipv4AddressListParamType(),
+)
+@optgroup.option(
+    "--ips-file",
+    help="File with one IPv4 address per line",
+    type=click.File("r"),
+)
+@optgroup.option(
+    "--sls-file",
+    help="SLS file in JSON format, the switches on '--network' are validated",
+    type=click.File("r"),
+)
+@optgroup.option(
+    "--running",
+    "running_folder",
+    help="Folder of running config files named <hostname>.cfg",
+    type=click.Path(exists=True, file_okay=False),
+)
+@click.option(
+    "--generated",
+    "generated_folder",
+    help="Folder of generated config files named <hostname>.cfg",
+    type=click.Path(exists=True, file_okay=False),
+    required=True,
+)
+@click.option(
+    "--network",
+    default="HMN",
+    show_default=True,
+    type=click.Choice(["HMN", "CMN"], case_sensitive=False),
+    help="The network that is used to connect to the switches.",
+)
+@click.option(
+    "--vendor",
+    type=click.Choice(["Aruba", "Dell", "Mellanox"], case_sensitive=False),
+    help="The vendor is needed if passing in the running configs from a folder",
+)
+@click.option("--username", default="admin", show_default=True, help="Switch username")
+@click.option(
+    "--password",
+    hide_input=True,
+    confirmation_prompt=False,
+    help="Switch password",
+)
+@fleet_options
+@click.option(
+    "--jobs",
+    "-j",
+    help="Number of switch configs to compare in parallel processes",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+)
+@click.option(
+    "--remediation",
+    is_flag=True,
+    help="Output the commands to get each switch from its running config to its generated config, Mellanox not supported",
+)
+@click.option("--json", "json_", is_flag=True, help="Output JSON")
+@click.option(
+    "--log",
+    "log_",
+    help="Level of logging.",
+    type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR"]),
+    default="ERROR",
+)
+@click.option(
+    "--out",
+    help="Output results to a file",
+    type=click.File("w"),
+    default="-",
+)
+@refresh_vendor_option
+@click.pass_context
+def config(
+    ctx,
+    ips,
+    ips_file,
+    sls_file,
+    running_folder,
+    generated_folder,
+    network,
+    vendor,
+    username,
+    password,
+    workers,
+    timeout,
+    jobs,
+    remediation,
+    json_,
+    log_,
+    out,
+):
+    """Validate the running config of all switches (Aruba, Dell, or Mellanox) on the network against their generated config.
+
+    Pass in the folder of generated configs with '--generated', e.g. the folder written by 'canu generate network config'.
+    The generated config of each switch is the file named after its hostname.
+
+    The running configs can be read from the switches using
+
+    - a comma separated list of IP addresses using the '--ips' option
+
+    - a file of IP addresses with one address per line using the '--ips-file' option
+
+    - the switches on the '--network' of an SLS file using the '--sls-file' option
+
+    OR from a folder of running config files named <hostname>.cfg using the '--running' and '--vendor' options.
+
+    Running configs are read from up to '--workers' switches at a time and compared in '--jobs' processes.
+    A summary table shows how many lines each switch is missing and has in addition to its generated config,
+    use '--json' to also get the unified diff and remediation config of every switch.
+
+    --------
+    \f
+    # noqa: D301, B950
+
+    Args:
+        ctx: CANU context settings
+        ips: Comma separated list of IPv4 addresses of switches
+        ips_file: File with one IPv4 address per line
+        sls_file: SLS JSON file
+        running_folder: Folder of running config files
+        generated_folder: Folder of generated config files
+        network: The network used to connect to the switches in the SLS file
+        vendor: Switch vendor of the running config files. Aruba, Dell, or Mellanox
+        username: Switch username
+        password: Switch password
+        workers: Number of switches to connect to concurrently
+        timeout: Seconds to wait for a single switch
+        jobs: Number of switch configs to compare in parallel processes
+        remediation: Output remediation config
+        json_: Bool indicating json output
+        log_: Level of logging
+        out: Name of the output file
+    """
+    logging.basicConfig(format="%(name)s - %(levelname)s: %(message)s", level=log_)
+
+    switches = []
+    errors = []
+    if running_folder:
+        if not vendor:
+            vendor = click.prompt(
+                "Please enter the vendor",
+                type=click.Choice(["Aruba", "Dell", "Mellanox"], case_sensitive=False),
+            )
+        switches = running_configs_from_folder(running_folder, vendor.lower())
+    else:
+        if ips_file:
+            ips = []
+            lines = [line.strip().replace(",", "") for line in ips_file]
+            ips.extend([ipaddress.ip_address(line) for line in lines if IPV4_ADDRESS(line)])
+        elif sls_file:
+            sls_variables = pull_sls_networks(json.load(sls_file))
+            ips = [ip for name, ip in sls_variables[network.upper() + "_IPs"].items() if "sw" in name]
+
+        if not password:
+            password = click.prompt(
+                "Enter the switch password",
+                type=str,
+                hide_input=True,
+            )
+        credentials = {"username": username, "password": password}
+        switches, errors = running_configs_from_switches(ips, credentials, workers, timeout)
+
+    # Pair each running config with the generated config of the same hostname
+    comparisons = []
+    for ip, hostname, switch_vendor, running in switches:
+        generated_file = path.join(generated_folder, f"{hostname}.cfg")
+        if not path.exists(generated_file):
+            errors.append([ip or hostname, f"No generated config {hostname}.cfg in {generated_folder}"])
+            continue
+        with open(generated_file, "r") as f:
+            comparisons.append((ip, hostname, switch_vendor, running, f.read()))
+
+    results = list(compare_switch_configs(comparisons, jobs))
+
+    if json_:
+        switch_json = {result["hostname"]: result for result in results}
+        for ip, error in errors:
+            switch_json[ip] = {"ip_address": ip, "status": "Error", "error": error}
+        click.echo(json.dumps(switch_json, indent=2), file=out)
+        return
+
+    dash = "-" * 80
+    if remediation:
+        for result in results:
+            if result["status"] != "Fail":
+                continue
+            click.echo(dash, file=out)
+            click.secho(f"\nRemediation Config for {result['hostname']}\n", fg="bright_white", file=out)
+            if result["remediation"] is None:
+                click.secho("Remediation not supported for Mellanox", fg="white", bg="red", file=out)
+            for line in result["remediation"] or []:
+                click.echo(line, file=out)
+
+    config_table(results, errors, out)
+    if len(errors) > 0:
+        click.echo("\n", file=out)
+        click.secho("Errors", fg="red", file=out)
+        click.echo(dash, file=out)
+        for error in errors:
+            click.echo("{:<15s} - {}".format(error[0], error[1]), file=out)
+    summary_table(results, errors, out)
+
+
+def running_configs_from_folder(running_folder, vendor):
+    """Read the running config files in a folder.
+
+    Args:
+        running_folder: Folder of running config files named <hostname>.cfg
+        vendor: Switch vendor of the files
+
+    Returns:
+        List of (ip, hostname, vendor, running config) tuples, ip is empty
+    """
+    switches = []
+    for filename in sorted(listdir(running_folder)):
+        if not filename.endswith(".cfg"):
+            continue
+        with open(path.join(running_folder, filename), "r") as f:
+            running = f.read()
+        if vendor == "mellanox":
+            running = "\n".join(line.strip() if line.startswith("   ") else line for line in running.splitlines())
+        switches.append(("", filename[: -len(".cfg")], vendor, running))
+    return switches
+
+
+def running_configs_from_switches(ips, credentials, workers, timeout):
+    """Read the running config of many switches concurrently.
+
+    Args:
+        ips: List of switch IPv4 addresses
+        credentials: Dictionary with username and password of the switches
+        workers: Number of switches to connect to concurrently
+        timeout: Seconds to wait for a single switch
+
+    Returns:
+        switches: List of (ip, hostname, vendor, running config) tuples
+        errors: List of [ip, error message] of the switches that could not be read
+    """
+    switches = []
+    errors = []
+    if not ips:
+        return switches, errors
+
+    def _progress(result, completed, total):
+        print(
+            f"  Collected {result.item} - Switch {completed} of {total}        ",
+            end="\r",
+        )
+
+    with click_spinner.spinner(
+        beep=False,
+        disable=False,
+        force=False,
+        stream=sys.stdout,
+    ):
+        results, timing = run_on_switches(
+            lambda ip: get_switch_config(str(ip), credentials, return_error=True),
+            ips,
+            workers=workers,
+            timeout=timeout,
+            progress=_progress,
+        )
+    log.info(timing)
+    print(
+        "                                                                 ",
+        end="\r",
+    )
+
+    for result in results:
+        ip = str(result.item)
+        if result.error is not None:
+            errors.append([ip, connection_error_message(ip, result.error)])
+            continue
+        hostname, running, vendor = result.value
+        if not hostname:
+            errors.append([ip, "Could not determine the vendor of the switch."])
+            continue
+        switches.append((ip, hostname.strip(), vendor, running))
+    return switches, errors
+
+
+def connection_error_message(ip, error):
+    """Return the message shown in the errors table for a switch that could not be read.
+
+    Args:
+        ip: IPv4 address of the switch
+        error: Exception raised reading the switch
+
+    Returns:
+        Error message
+    """
+    exception_type = type(error).__name__
+    if exception_type == "NetmikoTimeoutException":
+        return "Timeout error. Check the IP address and try again."
+    elif exception_type == "NetmikoAuthenticationException":
+        return "Authentication error. Check the credentials or IP address and try again"
+    elif exception_type == "TimeoutError":
+        return f"Timeout error. {error}."
+    return f"Error connecting to switch {ip}, {exception_type} {error}."
+
+
+def compare_switch_config(ip, hostname, vendor, running, generated):
+    """Compare the running config of a switch with its generated config.
+
+    Args:
+        ip: IPv4 address of the switch, may be empty
+        hostname: Switch hostname
+        vendor: Switch vendor. aruba, dell, or mellanox
+        running: Running config
+        generated: Generated config
+
+    Returns:
+        Dictionary with the status, number of added and removed lines, unified diff and remediation config
+    """
+    os_name, os_options = HIER_CONFIG_OS[vendor]
+    host = Host(hostname, os_name, os_options)
+    with span("diff", "config", switch=hostname):
+        running_config_hier = HConfig(host=host)
+        running_config_hier.load_from_string(running)
+        generated_config_hier = HConfig(host=host)
+        generated_config_hier.load_from_string(generated)
+        if vendor == "aruba":
+            aruba_banner(generated_config_hier)
+            aruba_banner(running_config_hier)
+
+        unified_diff = [
+            line for line in running_config_hier.unified_diff(generated_config_hier) if not line.startswith("? ")
+        ]
+        additions = sum(1 for line in unified_diff if line.lstrip().startswith("+"))
+        deletions = sum(1 for line in unified_diff if line.lstrip().startswith("-"))
+
+        remediation_config = None
+        if vendor != "mellanox":
+            remediation_config_hier = running_config_hier.config_to_get_to(generated_config_hier)
+            remediation_config = [line.cisco_style_text() for line in remediation_config_hier.all_children()]
+
+    return {
+        "ip_address": ip,
+        "hostname": hostname,
+        "vendor": vendor,
+        "status": "Pass" if additions == 0 and deletions == 0 else "Fail",
+        "additions": additions,
+        "deletions": deletions,
+        "unified_diff": unified_diff,
+        "remediation": remediation_config,
+    }
+
+
+def _compare_switch_config(comparison):
+    return compare_switch_config(*comparison)
+
+
+def compare_switch_configs(comparisons, jobs=1):
+    """Compare the running and generated config of each switch, in parallel processes when jobs is more than 1.
+
+    Args:
+        comparisons: List of (ip, hostname, vendor, running config, generated config) tuples
+        jobs: Number of worker processes
+
+    Yields:
+        Result of compare_switch_config for each switch, in the same order as comparisons
+    """
+    jobs = min(jobs, len(comparisons))
+    if jobs <= 1:
+        for comparison in comparisons:
+            yield _compare_switch_config(comparison)
+        return
+
+    log.debug(f"Comparing {len(comparisons)} switch configs with {jobs} processes")
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from process_map(executor, _compare_switch_config, comparisons)
+
+
+def config_table(results, errors, out="-"):
+    """Print a table with the result of each switch.
+
+    Args:
+        results: List of compare_switch_config results
+        errors: List of [ip, error message] of the switches that could not be validated
+        out: Defaults to stdout, but will print to the file name passed in
+    """
+    dash = "-" * 80
+    click.echo(dash, file=out)
+    click.echo(
+        "{:^4s}{:<8s}{:<16s}{:<24s}{:<10s}{:>9s}{:>9s}".format("", "STATUS", "IP", "HOSTNAME", "VENDOR", "MISSING", "EXTRA"),
+        file=out,
+    )
+    click.echo(dash, file=out)
+    for result in results:
+        click.echo(
+            "{:^3s}{:<8s}{:<16s}{:<24s}{:<10s}{:>9d}{:>9d}".format(
+                status_emoji(result["status"]),
+                result["status"],
+                result["ip_address"],
+                result["hostname"],
+                result["vendor"],
+                result["additions"],
+                result["deletions"],
+            ),
+            file=out,
+        )
+    for ip, _error in errors:
+        click.echo("{:^3s}{:<8s}{:<16s}".format(status_emoji("Error"), "Error", ip), file=out)
+
+
+def summary_table(results, errors, out="-"):
+    """Print the number of switches with each status.
+
+    Args:
+        results: List of compare_switch_config results
+        errors: List of [ip, error message] of the switches that could not be validated
+        out: Defaults to stdout, but will print to the file name passed in
+    """
+    click.echo("\nSummary", file=out)
+    click.echo("-" * 80, file=out)
+    network_summary = Counter(result["status"] for result in results)
+    if errors:
+        network_summary["Error"] = len(errors)
+    for status, number in network_summary.items():
+        click.echo(f"{status_emoji(status)} {status} - {number} switches", file=out)
+
+
+def status_emoji(status):
+    """Return the emoji of a switch status.
+
+    Args:
+        status: Pass, Fail, or Error
+
+    Returns:
+        Emoji string
+    """
+    if status == "Pass":
+        return emoji.emojize(":canoe:")
+    elif status == "Fail":
+        return emoji.emojize(":cross_mark:")
+    return emoji.emojize(":red_triangle_pointed_up:")
@@ -23,17 +23,16 @@
 import click
 
 from canu.style import Style
-from canu.validate.network.bgp import bgp
-from canu.validate.network.cabling import cabling
 
 
 @click.group(
-    cls=Style.CanuHelpColorsGroup,
+    cls=Style.CanuLazyHelpColorsGroup,
+    lazy_subcommands={
+        "bgp": "canu.validate.network.bgp.bgp:bgp",
+        "cabling": "canu.validate.network.cabling.cabling:cabling",
+        "config": "canu.validate.network.config.config:config",
+    },
 )
 @click.pass_context
 def network(ctx):
     """Commands that validate the network."""
-
-
-network.add_command(bgp.bgp)
-network.add_command(cabling.cabling)
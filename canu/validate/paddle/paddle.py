@@ -23,17 +23,21 @@
 import json
 import logging
 from collections import defaultdict
+from importlib import metadata
 
 import click
 
 from canu.style import Style
+from canu.utils.cache import cache_dir, cache_path, content_hash, file_hash, load_json_cache, save_json_cache
 from canu.validate.shcd.shcd import node_list_warnings, print_node_list
-from network_modeling.NetworkNodeFactory import NetworkNodeFactory
+from network_modeling.NetworkNodeFactory import NetworkNodeFactory, default_paddle_schema_file
 from network_modeling.NetworkPort import NetworkPort
 from network_modeling.NodeLocation import NodeLocation
 
 log = logging.getLogger("validate_paddle")
 
+CCJ_CACHE_VERSION = 2
+
 
 @click.command(
     cls=Style.CanuHelpColorsCommand,
@@ -105,20 +109,51 @@ def node_model_from_paddle(factory, ccj_json):
         node_list: A list of created nodes
         warnings: A list of warnings
     """
-    # Validate Paddle
-    factory.validate_paddle(ccj_json)
+    # A CCJ that already passed the schema checks is loaded from the cache and not validated again
+    cache_file = ccj_cache_file(factory, ccj_json)
+    validated_json = load_json_cache(cache_file, CCJ_CACHE_VERSION)
+
+    if validated_json is None:
+        # Validate Paddle
+        factory.validate_paddle(ccj_json)
+        save_json_cache(cache_file, CCJ_CACHE_VERSION, ccj_json)
+        validated_json = ccj_json
 
     # Get list of nodes
-    node_list = node_list_from_ccj_json(factory, ccj_json)
+    node_list = node_list_from_ccj_json(factory, validated_json)
 
     # Add location and Connect Ports
-    add_location_and_ports_from_ccj_json(node_list, ccj_json)
+    add_location_and_ports_from_ccj_json(node_list, validated_json)
 
     warnings = defaultdict(list)
     # FUTURE ==> warnings = factory.check_connections()
     return node_list, warnings
 
 
+def ccj_cache_file(factory, ccj_json):
+    """Return the cache file for a CCJ that passed the schema checks.
+
+    The file is keyed by the CCJ contents, the CCJ schema, the factory architecture and definitions,
+    and the CANU version.
+
+    Args:
+        factory: Node factory object
+        ccj_json: Paddle JSON file
+
+    Returns:
+        Path of the cache file, or None if caching is disabled
+    """
+    if cache_dir("ccj") is None:
+        return None
+    key = content_hash(
+        json.dumps(ccj_json, sort_keys=True),
+        file_hash(default_paddle_schema_file),
+        factory.fingerprint(),
+        metadata.version("canu"),
+    )
+    return cache_path("ccj", f"{key}.json")
+
+
 def node_list_from_ccj_json(factory, ccj_json):
     """Generate a list of nodes from the topology in the CCJ file.
 
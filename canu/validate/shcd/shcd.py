@@ -27,7 +27,7 @@ import json
 import logging
 import re
 import sys
-from collections import defaultdict
+from collections import defaultdict, namedtuple
 from importlib import metadata
 from os import path
 from pathlib import Path
@@ -35,9 +35,13 @@ from pathlib import Path
 import click
 import natsort
 from openpyxl import load_workbook
+from openpyxl.utils.cell import get_column_letter, range_boundaries
 
 from canu.style import Style
-from network_modeling.NetworkNodeFactory import NetworkNodeFactory
+from canu.utils.cache import cache_dir, cache_path, content_hash, file_hash, load_json_cache, save_json_cache
+from canu.utils.stream import JsonStream
+from canu.utils.topology_index import switch_unused_ports
+from network_modeling.NetworkNodeFactory import NetworkNodeFactory, paddle_validator
 from network_modeling.NetworkPort import NetworkPort
 from network_modeling.NodeLocation import NodeLocation
 
@@ -52,6 +56,14 @@ version = metadata.version("canu")
 
 log = logging.getLogger("validate_shcd")
 
+# Cells read from the SHCD tables, either streamed from the workbook or loaded from the cache
+ShcdCell = namedtuple("ShcdCell", ["value", "row", "coordinate"])
+
+SHCD_CACHE_VERSION = 1
+
+# The workbook opened for the current SHCD, so each run opens the spreadsheet at most once
+_open_workbook = {"spreadsheet": None, "workbook": None}
+
 
 @click.command(
     cls=Style.CanuHelpColorsCommand,
@@ -92,6 +104,11 @@ log = logging.getLogger("validate_shcd")
     default="-",
 )
 @click.option("--json", "json_", is_flag=True, help="Output JSON model to a file")
+@click.option(
+    "--ndjson",
+    is_flag=True,
+    help="Output the JSON model as newline delimited JSON, one topology node per line",
+)
 @click.option(
     "--log",
     "log_",
@@ -100,7 +117,7 @@ log = logging.getLogger("validate_shcd")
     default="ERROR",
 )
 @click.pass_context
-def shcd(ctx, architecture, shcd, tabs, corners, edge, out, json_, log_):
+def shcd(ctx, architecture, shcd, tabs, corners, edge, out, json_, ndjson, log_):
     """Validate a SHCD file.
 
     CANU can be used to validate that an SHCD (SHasta Cabling Diagram) passes basic validation checks.
@@ -124,6 +141,7 @@ def shcd(ctx, architecture, shcd, tabs, corners, edge, out, json_, log_):
         edge: Vendor of the edge router
         out: Filename for the JSON Topology if requested.
         json_: Bool indicating json output
+        ndjson: Bool indicating newline delimited json output
         log_: Level of logging.
     """
     logging.basicConfig(format="%(name)s - %(levelname)s: %(message)s", level=log_)
@@ -153,8 +171,8 @@ def shcd(ctx, architecture, shcd, tabs, corners, edge, out, json_, log_):
         edge=edge.lower(),
     )
 
-    if json_:
-        json_output(node_list, factory, architecture, ctx, out)
+    if json_ or ndjson:
+        json_output(node_list, factory, architecture, ctx, out, ndjson=ndjson)
     else:
         print_node_list(node_list, "SHCD", out)
 
@@ -180,7 +198,7 @@ def shcd_to_sheets(shcd, tabs, corners):
     sheets = []
 
     if not tabs:
-        wb = load_workbook(shcd, read_only=True, data_only=True)
+        wb = shcd_workbook(shcd)
         click.secho("What tabs would you like to check in the SHCD?")
         tab_options = wb.sheetnames
         for x in tab_options:
@@ -237,6 +255,91 @@ def shcd_to_sheets(shcd, tabs, corners):
     return sheets
 
 
+def shcd_workbook(spreadsheet):
+    """Open the SHCD workbook, reusing the handle if this spreadsheet is already open.
+
+    Args:
+        spreadsheet: The SHCD spreadsheet
+
+    Returns:
+        Read-only openpyxl workbook
+    """
+    if _open_workbook["spreadsheet"] is not spreadsheet:
+        close_shcd_workbook()
+        _open_workbook["spreadsheet"] = spreadsheet
+        _open_workbook["workbook"] = load_workbook(spreadsheet, read_only=True, data_only=True)
+    return _open_workbook["workbook"]
+
+
+def iter_shcd_range(ws, range_start, range_end):
+    """Stream the cells of a table on a worksheet one row at a time.
+
+    Args:
+        ws: Worksheet
+        range_start: Upper left cell of the table
+        range_end: Lower right cell of the table
+
+    Yields:
+        Tuple of ShcdCell for each row of the table
+    """
+    min_col, min_row, max_col, max_row = range_boundaries(f"{range_start}:{range_end}")
+    columns = [get_column_letter(column) for column in range(min_col, max_col + 1)]
+    rows = ws.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col, values_only=True)
+    for row_number, values in enumerate(rows, start=min_row):
+        yield tuple(ShcdCell(value, row_number, f"{columns[index]}{row_number}") for index, value in enumerate(values))
+
+
+def close_shcd_workbook():
+    """Close the open SHCD workbook, if any."""
+    if _open_workbook["workbook"] is not None:
+        _open_workbook["workbook"].close()
+    _open_workbook["spreadsheet"] = None
+    _open_workbook["workbook"] = None
+
+
+def save_shcd_cache(cache_file, tables):
+    """Save the cells read from the SHCD tables.
+
+    Tables containing values that can't be stored as JSON (e.g. dates) are not cached.
+
+    Args:
+        cache_file: Path of the cache file, may be None
+        tables: Dictionary of 'tab!range' to the rows of ShcdCell read from it
+
+    Returns:
+        True if the cache was written
+    """
+    json_types = (str, int, float, bool, type(None))
+    for rows in tables.values():
+        if not all(isinstance(cell.value, json_types) for row in rows for cell in row):
+            return False
+    return save_json_cache(cache_file, SHCD_CACHE_VERSION, tables)
+
+
+def shcd_cache_file(spreadsheet, sheets):
+    """Return the cache file for the tables of an SHCD.
+
+    The file is keyed by the contents of the spreadsheet and the tabs and corners read from it.
+
+    Args:
+        spreadsheet: The SHCD spreadsheet, an open binary file or a path
+        sheets: An array of tabs and their corners on the spreadsheet
+
+    Returns:
+        Path of the cache file, or None if caching is disabled
+    """
+    if cache_dir("shcd") is None:
+        return None
+    if hasattr(spreadsheet, "read"):
+        spreadsheet.seek(0)
+        spreadsheet_hash = content_hash(spreadsheet.read())
+        spreadsheet.seek(0)
+    else:
+        spreadsheet_hash = file_hash(spreadsheet)
+    key = content_hash(spreadsheet_hash, json.dumps([list(sheet) for sheet in sheets]))
+    return cache_path("shcd", f"{key}.json")
+
+
 def get_node_common_name(name, rack_number, rack_elevation, mapper):
     """Map SHCD device names to hostname.
 
@@ -509,7 +612,10 @@ def node_model_from_shcd(factory, spreadsheet, sheets, edge=None):
     node_name_list = []
     warnings = defaultdict(list)
 
-    wb = load_workbook(spreadsheet, read_only=True, data_only=True)
+    # Tables of an unchanged SHCD are read from the cache without opening the workbook
+    cache_file = shcd_cache_file(spreadsheet, sheets)
+    cached_tables = load_json_cache(cache_file, SHCD_CACHE_VERSION) or {}
+    tables = {}
 
     for tab in sheets:
 
@@ -522,14 +628,22 @@ def node_model_from_shcd(factory, spreadsheet, sheets, edge=None):
         log.info("---------------------------------------------")
         log.info("")
 
-        if sheet not in wb.sheetnames:
-            click.secho(f"Tab {sheet} not found in {spreadsheet.name}\n", fg="red")
-            click.secho(f"Available tabs: {wb.sheetnames}", fg="red")
-            sys.exit(1)
+        table = f"{sheet}!{range_start}:{range_end}"
+        if table in cached_tables:
+            log.debug(f"Using cached cells for tab {sheet}")
+            block = iter([ShcdCell(*cell) for cell in row] for row in cached_tables[table])
+        else:
+            wb = shcd_workbook(spreadsheet)
+            if sheet not in wb.sheetnames:
+                click.secho(f"Tab {sheet} not found in {spreadsheet.name}\n", fg="red")
+                click.secho(f"Available tabs: {wb.sheetnames}", fg="red")
+                sys.exit(1)
+            block = None
 
-        ws = wb[sheet]
         try:
-            block = ws[range_start:range_end]
+            if block is None:
+                block = iter_shcd_range(wb[sheet], range_start, range_end)
+            header = next(block, ())
         except ValueError as err:
             log.fatal(err)
             click.secho(f"Bad range of cells entered for tab {sheet}.", fg="red")
@@ -554,7 +668,7 @@ def node_model_from_shcd(factory, spreadsheet, sheets, edge=None):
         ]
         original_header = required_header.copy()
 
-        header = block[0]
+        tables[table] = [header]
         if len(header) == 0 or len(header) < len(required_header):
             click.secho(
                 f"Bad range of cells entered for tab {sheet}:{range_start}:{range_end}.",
@@ -611,8 +725,8 @@ def node_model_from_shcd(factory, spreadsheet, sheets, edge=None):
                 sys.exit(1)
 
         # Process Data
-        block = block[1:]
         for row in block:
+            tables[table].append(row)
             # Cable source
             try:
                 current_row = row[required_header[0]].row
@@ -896,7 +1010,9 @@ def node_model_from_shcd(factory, spreadsheet, sheets, edge=None):
                     )
                     sys.exit(1)
 
-    wb.close()
+    close_shcd_workbook()
+    if tables.keys() - cached_tables.keys():
+        save_shcd_cache(cache_file, tables)
     return node_list, warnings
 
 
@@ -1137,35 +1253,6 @@ def node_list_warnings(node_list, warnings, out="-"):
                 click.secho(f"{', '.join(cell_list)}\n", file=out)
 
 
-def switch_unused_ports(node_list):
-    """Create a dictionary of unused ports.
-
-    Args:
-        node_list: A list of nodes
-
-    Returns:
-        unused_ports: Dictionary of switches and their unused ports
-    """
-    unused_ports = {}
-    for node in node_list:
-        if "sw" in node.common_name() and "sw-hsn" not in node.common_name():
-
-            unused_ports[node.common_name()] = []
-            unused_block = []
-            logical_index = 1
-            for port in node.ports():
-                if port is None:
-                    unused_ports[node.common_name()].append(logical_index)
-                    unused_block.append(logical_index)
-                    logical_index += 1
-                    continue
-                if unused_block:
-                    unused_block = []  # reset
-                logical_index += 1
-            unused_ports[node.common_name()].pop()
-    return unused_ports
-
-
 def print_node_list(node_list, title, out="-"):
     """Print the nodes found in the SHCD.
 
@@ -1226,12 +1313,21 @@ def print_node_list(node_list, title, out="-"):
             logical_index += 1
 
 
-def json_output(node_list, factory, architecture, ctx, out):
-    """Create a schema-validated JSON Topology file from the model."""
-    topology = []
-    for node in node_list:
-        topology.append(node.serialize())
+def json_output(node_list, factory, architecture, ctx, out, ndjson=False):
+    """Create a schema-validated JSON Topology file from the model.
 
+    Every node is checked against the topology item schema and then serialized
+    again as it is written, so the whole topology is never held in memory. If any
+    node fails, the full CCJ is validated to report the errors and nothing is written.
+
+    Args:
+        node_list: List of nodes from the SHCD
+        factory: NetworkNodeFactory used to build the nodes
+        architecture: CSM architecture
+        ctx: CANU context settings
+        out: File to write the JSON Topology to
+        ndjson: Write newline delimited JSON, the header then one topology node per line
+    """
     paddle = {
         "canu_version": version,
         "architecture": architecture,
@@ -1244,10 +1340,14 @@ def json_output(node_list, factory, architecture, ctx, out):
                 "%Y-%m-%d %H:%M:%S",
             )
         ),
-        "topology": topology,
     }
 
-    factory.validate_paddle(paddle)
+    validator = paddle_validator()
+    node_validator = validator.evolve(schema=validator.schema["properties"]["topology"]["items"])
+    valid = validator.is_valid({**paddle, "topology": []})
+    valid = valid and all(node_validator.is_valid(node.serialize()) for node in node_list)
+    if not valid:
+        factory.validate_paddle({**paddle, "topology": [node.serialize() for node in node_list]})
 
-    json_model = json.dumps(paddle, indent=2)
-    click.echo(json_model, file=out)
+    with JsonStream(out, paddle, "topology", ndjson=ndjson) as stream:
+        stream.write_all(node.serialize() for node in node_list)
@@ -20,7 +20,6 @@
 # ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 # OTHER DEALINGS IN THE SOFTWARE.
 """CANU commands that validate the shcd against the current network cabling."""
-import datetime
 import ipaddress
 import logging
 import re
@@ -40,7 +39,9 @@ from ruamel.yaml import YAML
 
 from canu.report.switch.cabling.cabling import get_lldp
 from canu.style import Style
-from canu.validate.network.cabling.cabling import node_model_from_canu
+from canu.utils.snapshot import snapshot_options
+from canu.utils.vendor import refresh_vendor_option
+from canu.validate.network.cabling.cabling import create_cache_structure_from_lldp, node_model_from_canu
 from canu.validate.shcd.shcd import node_list_warnings, node_model_from_shcd, shcd_to_sheets
 from network_modeling.NetworkNodeFactory import NetworkNodeFactory
 
@@ -65,55 +66,6 @@ csm_options = canu_config["csm_versions"]
 log = logging.getLogger("validate_shcd_cabling")
 
 
-def create_cache_structure_from_lldp(switch_info, lldp_dict, arp):
-    """Create a cache structure from LLDP data that matches the expected format.
-
-    Args:
-        switch_info: Dictionary with switch platform_name, hostname and IP address
-        lldp_dict: Dictionary with LLDP information
-        arp: ARP dictionary
-
-    Returns:
-        Dictionary representing switch in cache format
-    """
-    switch = {
-        "ip_address": switch_info["ip"],
-        "cabling": defaultdict(list),
-        "updated_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "hostname": switch_info["hostname"],
-        "platform_name": switch_info["platform_name"],
-        "vendor": switch_info["vendor"],
-    }
-
-    for port_number, port in lldp_dict.items():
-        for index, _entry in enumerate(port):
-            arp_list = []
-            if port[index]["chassis_name"] == "":
-                arp_list = [
-                    f"{arp[mac]['ip_address']}:{list(arp[mac]['port'])[0]}"
-                    for mac in arp
-                    if arp[mac]["mac"] == port[index]["mac_addr"]
-                ]
-            arp_list = ", ".join(arp_list)
-            neighbor_description = f"{port[index]['chassis_description'][:54]} {str(arp_list)}"
-            port_info = {
-                "neighbor": port[index]["chassis_name"],
-                "neighbor_description": neighbor_description,
-                "neighbor_port": port[index]["port_id"],
-                "neighbor_port_description": re.sub(
-                    r"(Interface\s+\d+ as )",
-                    "",
-                    port[index]["port_description"],
-                ),
-                "neighbor_chassis_id": port[index]["chassis_id"],
-            }
-
-            switch["cabling"][port_number].append(port_info)
-
-    switch["cabling"] = dict(switch["cabling"])
-    return switch
-
-
 @click.command(
     cls=Style.CanuHelpColorsCommand,
 )
@@ -187,6 +139,8 @@ def create_cache_structure_from_lldp(switch_info, lldp_dict, arp):
     help="Print NCN MAC addresses",
     is_flag=True,
 )
+@snapshot_options
+@refresh_vendor_option
 @click.pass_context
 def shcd_cabling(
     ctx,
@@ -202,6 +156,8 @@ def shcd_cabling(
     password,
     log_,
     out,
+    from_snapshot,
+    max_age,
 ):
     """Validate a SHCD file against the current network cabling.
 
@@ -228,6 +184,8 @@ def shcd_cabling(
         password: Switch password
         log_: Level of logging
         out: Name of the output file
+        from_snapshot: Use saved LLDP snapshots instead of polling the switches
+        max_age: Oldest snapshot in seconds to use
     """
     logging.basicConfig(format="%(name)s - %(levelname)s: %(message)s", level=log_)
 
@@ -280,8 +238,13 @@ def shcd_cabling(
                     end="\r",
                 )
                 try:
-                    # Get LLDP info directly (without caching to file)
-                    switch_info, lldp_dict, arp = get_lldp(str(ip), credentials, return_error=True)
+                    # Get LLDP info from the switch, or from its snapshot with --from-snapshot
+                    switch_info, lldp_dict, arp = get_lldp(
+                        str(ip),
+                        credentials,
+                        return_error=True,
+                        max_age=max_age if from_snapshot else None,
+                    )
 
                     if switch_info and lldp_dict:
                         # Create network data structure from live LLDP data
@@ -34,7 +34,8 @@ from ruamel.yaml import YAML
 
 from canu.style import Style
 from canu.utils.ssh import netmiko_command, netmiko_commands
-from canu.utils.vendor import switch_vendor
+from canu.utils.trace import span
+from canu.utils.vendor import refresh_vendor_option, switch_vendor
 
 yaml = YAML()
 
@@ -125,6 +126,7 @@ with open(mellanox_options_file, "r") as options_f:
     help="Outputs commands to get from the running-config to generated config, Mellanox not supported",
     required=False,
 )
+@refresh_vendor_option
 @click.pass_context
 def config(
     ctx,
@@ -264,7 +266,8 @@ def config(
     if vendor == "aruba":
         aruba_banner(generated_config_hier)
         aruba_banner(running_config_hier)
-    unified_diff = list(running_config_hier.unified_diff(generated_config_hier))
+    with span("diff", "config", switch=hostname):
+        unified_diff = list(running_config_hier.unified_diff(generated_config_hier))
     for line in unified_diff:
         if "+" == line.strip()[0]:
             click.secho(line, fg="green", file=out)
@@ -308,9 +311,10 @@ def config(
             file=out,
         )
 
-        remediation_config_hier = running_config_hier.config_to_get_to(
-            generated_config_hier,
-        )
+        with span("remediation", "config", switch=hostname):
+            remediation_config_hier = running_config_hier.config_to_get_to(
+                generated_config_hier,
+            )
         for line in remediation_config_hier.all_children():
             click.echo(line.cisco_style_text(), file=out)
 
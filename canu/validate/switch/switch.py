@@ -23,15 +23,14 @@
 import click
 
 from canu.style import Style
-from canu.validate.switch.config import config
 
 
 @click.group(
-    cls=Style.CanuHelpColorsGroup,
+    cls=Style.CanuLazyHelpColorsGroup,
+    lazy_subcommands={
+        "config": "canu.validate.switch.config.config:config",
+    },
 )
 @click.pass_context
 def switch(ctx):
     """Commands that validate a switch."""
-
-
-switch.add_command(config.config)
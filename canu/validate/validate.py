@@ -23,25 +23,19 @@
 import click
 
 from canu.style import Style
-from canu.validate.network import network
-from canu.validate.paddle import paddle
-from canu.validate.paddle_cabling import paddle_cabling
-from canu.validate.shcd import shcd
-from canu.validate.shcd_cabling import shcd_cabling
-from canu.validate.switch import switch
 
 
 @click.group(
-    cls=Style.CanuHelpColorsGroup,
+    cls=Style.CanuLazyHelpColorsGroup,
+    lazy_subcommands={
+        "network": "canu.validate.network.network:network",
+        "paddle": "canu.validate.paddle.paddle:paddle",
+        "paddle-cabling": "canu.validate.paddle_cabling.paddle_cabling:paddle_cabling",
+        "shcd": "canu.validate.shcd.shcd:shcd",
+        "shcd-cabling": "canu.validate.shcd_cabling.shcd_cabling:shcd_cabling",
+        "switch": "canu.validate.switch.switch:switch",
+    },
 )
 @click.pass_context
 def validate(ctx):
     """CANU validate commands."""
-
-
-validate.add_command(network.network)
-validate.add_command(paddle.paddle)
-validate.add_command(paddle_cabling.paddle_cabling)
-validate.add_command(shcd.shcd)
-validate.add_command(shcd_cabling.shcd_cabling)
-validate.add_command(switch.switch)
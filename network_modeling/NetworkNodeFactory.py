@@ -32,6 +32,7 @@ import jsonschema
 import yamale
 from ruamel.yaml import YAML
 
+from canu.utils.cache import cache_path, content_hash, file_hash, load_json_cache, save_json_cache
 from .NetworkNode import NetworkNode
 
 yaml = YAML()
@@ -77,6 +78,44 @@ default_paddle_schema_file = path.join(
     "paddle-schema.json",
 )
 
+# Compiled CCJ schema validators keyed by schema file, shared by every factory
+_paddle_validators = {}
+
+# Validated hardware and architecture definitions keyed by a hash of their schema and data
+# files, and the architecture versions already checked against them, shared by every factory
+MODEL_CACHE_VERSION = 1
+_model_definitions = {}
+_validated_architectures = set()
+
+
+def paddle_validator(ccj_schema_file=default_paddle_schema_file):
+    """Return the compiled validator for a CCJ schema, loading and checking the schema once.
+
+    Args:
+        ccj_schema_file: Path of the CCJ JSON schema
+
+    Returns:
+        jsonschema Draft7Validator
+    """
+    validator = _paddle_validators.get(ccj_schema_file)
+    if validator is None:
+        with open(ccj_schema_file, "r") as file:
+            ccj_schema = json.load(file)
+
+        try:
+            jsonschema.Draft7Validator.check_schema(ccj_schema)
+        except jsonschema.exceptions.SchemaError as err:
+            click.secho(
+                f"Schema {ccj_schema} is invalid: {[x.message for x in err.context]}\n"
+                + "Cannot generate and write Topology JSON file.",
+                fg="red",
+            )
+            sys.exit(1)
+
+        validator = jsonschema.Draft7Validator(ccj_schema)
+        _paddle_validators[ccj_schema_file] = validator
+    return validator
+
 
 class NetworkNodeFactory:
     """A class to create a new network.
@@ -104,6 +143,8 @@ class NetworkNodeFactory:
         Generate a new network node from paddle.
     validate_paddle(schema):
         Validate JSON
+    fingerprint():
+        Hash the architecture version and the hardware and architecture definitions.
     """
 
     def __init__(
@@ -124,33 +165,82 @@ class NetworkNodeFactory:
             architecture_data : architecture_data
             architecture_version : architecture_version
         """
-        # Validate JSON data against the schema
-        self.__yaml_validate(hardware_schema, hardware_data)
-        self.__yaml_validate(architecture_schema, architecture_data)
-
-        # Load yaml data as JSON
-        with open(hardware_data) as file:
-            self.__hardware_data = yaml.load(file)
-            self.__hardware_data = self.__hardware_data["network_hardware"]  # TODO ?
-        with open(architecture_data) as file:
-            self.__architecture_data = yaml.load(file)
+        # Validated definitions are shared by every factory using the same files
+        self.__definitions_key, definitions = self.__load_definitions(
+            hardware_schema,
+            hardware_data,
+            architecture_schema,
+            architecture_data,
+        )
+        self.__hardware_data = definitions["hardware"]
+        self.__architecture_data = definitions["architecture"]
 
-        # Perform any cleanup required
-        self.__cleanup_hardware_port_speeds()
+        # Index the definitions once instead of scanning them for every node.
+        # Later definitions win, matching the linear scans these replace.
+        self.__hardware_by_model = {}
+        for component in self.__hardware_data:
+            self.__hardware_by_model[component["model"]] = component
+        self.__architecture_components = {}
+        for version_name, version in self.__architecture_data.items():
+            for component in version.get("components", []):
+                self.__architecture_components[(version_name, component["name"])] = component
+        self.__lookup_mapper = None
+        self.__fingerprint = None
 
         # Initialize
         self.__architecture_version = architecture_version
         self.__node_id = -1
 
-        # Defensively validate data for architecture/hardware mismatches
-        # NOTE: Arguably this should be done more lazily outside of __init__
-        self.__validate_architecture_version()
-        self.__validate_model_definition()
-        self.__validate_port_definitions()
-        self.__validate_lookup_mapper()
+        # Defensively validate data for architecture/hardware mismatches, once per
+        # architecture version and set of definitions
+        validated = (self.__definitions_key, architecture_version)
+        if self.__definitions_key is None or validated not in _validated_architectures:
+            self.__validate_architecture_version()
+            self.__validate_model_definition()
+            self.__validate_port_definitions()
+            self.__validate_lookup_mapper()
+            _validated_architectures.add(validated)
 
         self.__warn_architecture_deprecation()
 
+    # Schema validation only runs when the definition files change. The validated data
+    # is kept for the process and in the CANU cache, keyed by a hash of the files.
+    def __load_definitions(self, hardware_schema, hardware_data, architecture_schema, architecture_data):
+        try:
+            key = content_hash(
+                str(MODEL_CACHE_VERSION),
+                file_hash(hardware_schema, hardware_data, architecture_schema, architecture_data),
+            )
+        except OSError:
+            # Missing files are reported by the schema validation below
+            key = None
+
+        definitions = _model_definitions.get(key)
+        if definitions is not None:
+            return key, definitions
+
+        cache_file = cache_path("models", f"{key}.json") if key else None
+        definitions = load_json_cache(cache_file, MODEL_CACHE_VERSION)
+        if definitions is None:
+            # Validate JSON data against the schema
+            self.__yaml_validate(hardware_schema, hardware_data)
+            self.__yaml_validate(architecture_schema, architecture_data)
+
+            # Load yaml data as JSON
+            with open(hardware_data) as file:
+                hardware = yaml.load(file)["network_hardware"]  # TODO ?
+            with open(architecture_data) as file:
+                architecture = yaml.load(file)
+
+            # Perform any cleanup required and keep plain data so cached and fresh definitions match
+            self.__cleanup_hardware_port_speeds(hardware)
+            definitions = json.loads(json.dumps({"hardware": hardware, "architecture": architecture}))
+            save_json_cache(cache_file, MODEL_CACHE_VERSION, definitions)
+
+        if key:
+            _model_definitions[key] = definitions
+        return key, definitions
+
     def __yaml_validate(self, schema_file, data_file):
         try:
             schema = yamale.make_schema(schema_file)
@@ -163,8 +253,8 @@ class NetworkNodeFactory:
 
     # For convenience to users the yamale schema allows port speeds as int or list.
     # Convert integers to lists here for consistency.
-    def __cleanup_hardware_port_speeds(self):
-        for component in self.__hardware_data:
+    def __cleanup_hardware_port_speeds(self, hardware_data):
+        for component in hardware_data:
             for port in component["ports"]:
                 if isinstance(port["speed"], int):
                     port["speed"] = [port["speed"]]
@@ -187,20 +277,13 @@ class NetworkNodeFactory:
     # The model of a component used in the architecture MUST be a component model in the hardware.
     # This is used as the "primary key" to match up.
     def __validate_model_definition(self):
-        hardware_data = self.__hardware_data
         architecture_data = self.__architecture_data
         architecture_version = self.__architecture_version
-        hw_models = []
-        hw_ports_by_model = []
-        for component in hardware_data:
-            hw_models.append(component["model"])
-            # TODO: Take the following out or test it later!
-            hw_ports_by_model.append(component["ports"])
 
         for arch_component in architecture_data[architecture_version]["components"]:
             arch_name = arch_component["name"]
             arch_model = arch_component["model"]
-            if arch_model not in hw_models:
+            if arch_model not in self.__hardware_by_model:
                 log.error(
                     "Architecture model {} for {} not found in hardware data".format(
                         arch_component["model"],
@@ -218,33 +301,30 @@ class NetworkNodeFactory:
     def __validate_port_definitions(self):
         architecture_data = self.__architecture_data
         architecture_version = self.__architecture_version
-        hardware_data = self.__hardware_data
         for arch_component in architecture_data[architecture_version]["components"]:
             arch_model = arch_component["model"]
             arch_connections = arch_component["connections"]
 
-            for hw_component in hardware_data:
-                hw_model = hw_component["model"]
-                hw_connections = hw_component["ports"]
-
-                if hw_model != arch_model:
-                    continue
-
-                # Now see if the arch defined speeds are allowed by the hardware
-                found = False
-                for arch_conn in arch_connections:
-                    for hw_conn in hw_connections:
-                        if arch_conn["speed"] in hw_conn["speed"]:
-                            found = True
-                            break
-
-                if not found:
-                    raise Exception(
-                        f"{__name__}: Validation of {arch_model} architecture against hardware failed for speeds",
-                    )
-                log.debug(
-                    f"Validated {arch_model} architecture against hardware for speeds",
+            hw_component = self.__hardware_by_model.get(arch_model)
+            if hw_component is None:
+                continue
+            hw_connections = hw_component["ports"]
+
+            # Now see if the arch defined speeds are allowed by the hardware
+            found = False
+            for arch_conn in arch_connections:
+                for hw_conn in hw_connections:
+                    if arch_conn["speed"] in hw_conn["speed"]:
+                        found = True
+                        break
+
+            if not found:
+                raise Exception(
+                    f"{__name__}: Validation of {arch_model} architecture against hardware failed for speeds",
                 )
+            log.debug(
+                f"Validated {arch_model} architecture against hardware for speeds",
+            )
 
     def __validate_lookup_mapper(self):
         version = self.__architecture_version
@@ -296,15 +376,7 @@ class NetworkNodeFactory:
         version_name = self.__architecture_version
 
         # Start by finding the architectural definition
-        # TODO:  Remove this section - it's already in a check but this should be
-        # unnecessary if we pointed to the correct arch version in __init__
-        architecture_data = self.__architecture_data
-        node_architecture = None
-        for k, v in architecture_data.items():
-            if k == version_name:
-                for component in v["components"]:
-                    if component["name"] == node_type:
-                        node_architecture = component
+        node_architecture = self.__architecture_components.get((version_name, node_type))
         if node_architecture is None:
             raise Exception(
                 f"{__name__}: Error finding node architecture definition {node_type} in version {version_name}",
@@ -314,11 +386,7 @@ class NetworkNodeFactory:
         model = node_architecture["model"]
 
         # Find the hardware definition based on model
-        hardware_data = self.__hardware_data
-        node_hardware = None
-        for v in hardware_data:
-            if v["model"] == model:
-                node_hardware = v
+        node_hardware = self.__hardware_by_model.get(model)
         if node_hardware is None:
             raise Exception(
                 f"{__name__}: Error finding node hardware definition {node_hardware} in hardware",
@@ -349,21 +417,16 @@ class NetworkNodeFactory:
         node_type = ccj_node["type"]
 
         # The architectural "model" is the "primary key" for hardware
-        node_architecture = None
-        components = self.__architecture_data[self.__architecture_version]["components"]
-        for component in components:
-            if component["name"] == node_architecture_type:
-                node_architecture = component
+        node_architecture = self.__architecture_components.get(
+            (self.__architecture_version, node_architecture_type),
+        )
         if node_architecture is None:
             raise Exception(
                 f"{__name__}: Error finding node architecture definition {node_type} in version {self.__architecture_version}",
             )
 
         # Find the hardware definition based on model
-        node_hardware = None
-        for hardware_definition in self.__hardware_data:
-            if hardware_definition["model"] == model:
-                node_hardware = hardware_definition
+        node_hardware = self.__hardware_by_model.get(model)
         if node_hardware is None:
             raise Exception(
                 f"{__name__}: Error finding node hardware definition {node_hardware} in hardware",
@@ -384,36 +447,39 @@ class NetworkNodeFactory:
 
     # In the future SHCD and device names should match Shasta naming, but for now
     # there is a map required.  Convert architecture yaml data to tuple.
+    # The mapper is built on first use and the same tuple is returned afterwards.
     def lookup_mapper(self):
         """Convert architecture yaml data to tuple."""
-        lookup_mapper = self.__architecture_data[self.__architecture_version]["lookup_mapper"]
-        lookup_mapper_as_tuple = []
-        for lookup in lookup_mapper:
-            lookup_mapper_as_tuple.append(
+        if self.__lookup_mapper is None:
+            lookup_mapper = self.__architecture_data[self.__architecture_version]["lookup_mapper"]
+            self.__lookup_mapper = tuple(
                 (
-                    lookup["lookup_name"] + [lookup["shasta_name"]],
+                    tuple(lookup["lookup_name"] + [lookup["shasta_name"]]),
                     lookup["shasta_name"],
                     lookup["architecture_type"],
-                ),
+                )
+                for lookup in lookup_mapper
             )
-        return lookup_mapper_as_tuple
+        return self.__lookup_mapper
+
+    def fingerprint(self):
+        """Return a hash of the architecture version and the hardware and architecture definitions."""
+        if self.__fingerprint is None:
+            definitions = json.dumps(
+                [self.__architecture_version, self.__hardware_data, self.__architecture_data],
+                sort_keys=True,
+                default=str,
+            )
+            self.__fingerprint = content_hash(definitions)
+        return self.__fingerprint
 
     def validate_paddle(self, ccj_json, ccj_schema_file=default_paddle_schema_file):
         """Validate that the CCJ works and passes schema validation checks."""
-        with open(ccj_schema_file, "r") as file:
-            ccj_schema = json.load(file)
+        validator = paddle_validator(ccj_schema_file)
 
-        validator = jsonschema.Draft7Validator(ccj_schema)
-
-        try:
-            validator.check_schema(ccj_schema)
-        except jsonschema.exceptions.SchemaError as err:
-            click.secho(
-                f"Schema {ccj_schema} is invalid: {[x.message for x in err.context]}\n"
-                + "Cannot generate and write Topology JSON file.",
-                fg="red",
-            )
-            sys.exit(1)
+        # Only collect and sort the errors of a CCJ that fails
+        if validator.is_valid(ccj_json):
+            return
 
         errors = sorted(validator.iter_errors(ccj_json), key=str)
 
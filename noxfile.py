@@ -37,7 +37,7 @@ else:
 
 COVERAGE_FAIL = 85
 ERROR_ON_GENERATE = True
-locations = "canu", "tests", "noxfile.py", "network_modeling", "docs/templates/conf.py"
+locations = "canu", "tests", "benchmarks", "noxfile.py", "network_modeling", "docs/templates/conf.py"
 nox.options.sessions = "tests", "lint", "cover", "docs"
 
 
@@ -104,6 +104,14 @@ def cover(session):
     session.run("coverage", "erase")
 
 
+@nox.session(python="3")
+def benchmarks(session):
+    """Run the performance benchmarks."""
+    session.install(".")
+    session.run("python", "-m", "benchmarks.ipam")
+    session.run("python", "-m", "benchmarks.scale", *session.posargs)
+
+
 # Docs start as md templates in '/docs/templates'
 # sphinx_click runs CANU and generates docs from the flags and docstrings
 # myst-parser allows it all to be read in as markdown
@@ -20,6 +20,8 @@
 # ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 # OTHER DEALINGS IN THE SOFTWARE.
 # -*- mode: python ; coding: utf-8 -*-
+from glob import glob
+
 from PyInstaller.utils.hooks import (
     collect_data_files,
     collect_submodules,
@@ -222,6 +224,11 @@ added_files += [
         "network_modeling/configs/templates/1.7/dellmellanox/full",
     ),
 ]
+
+# Templates precompiled by `python -m canu.utils.templates`, if they were built
+for compiled_templates in glob("network_modeling/configs/compiled/*"):
+    added_files.append((f"{compiled_templates}/*", compiled_templates))
+
 a = Analysis(
     ["canu/cli.py"],
     pathex=["canu"],
@@ -40,8 +40,8 @@ folder = "./"
 test_secret = "dGVzdC1zZWNyZXQ="  # base64 encoded "test-secret"
 
 
-@patch("canu.utils.sls.config.load_kube_config")
-@patch("canu.utils.sls.client.CoreV1Api")
+@patch("kubernetes.config.load_kube_config")
+@patch("kubernetes.client.CoreV1Api")
 @responses.activate
 def test_backup_network_sls_address_bad(mock_core_v1, mock_load_kube_config):
     """Test that the `canu backup network config` command errors with bad SLS address."""
@@ -0,0 +1,129 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""Test the CANU CLI startup import budget.
+
+Each case runs a command in a fresh interpreter and checks which heavy
+dependencies were imported. A change that makes a command import more than its
+budget (e.g. an eager import in a command group) fails here.
+"""
+import json
+import subprocess
+import sys
+
+import click
+import pytest
+
+from canu.cli import cli
+
+HEAVY_MODULES = [
+    "aiohttp",
+    "hier_config",
+    "jinja2",
+    "jsonschema",
+    "kubernetes",
+    "mac_vendor_lookup",
+    "netmiko",
+    "nornir",
+    "openpyxl",
+    "paramiko",
+    "scrapli",
+    "ttp",
+    "yamale",
+]
+
+MODEL = ["jsonschema", "yamale"]
+SSH = ["netmiko", "paramiko", "ttp"]
+
+# Heavy modules each command is allowed to import when it starts
+STARTUP_BUDGET = {
+    "--help": [],
+    "init --help": [],
+    "validate shcd --help": MODEL + ["openpyxl"],
+    "validate paddle --help": MODEL + ["openpyxl"],
+    "generate network config --help": MODEL + ["hier_config", "jinja2", "openpyxl", "ttp"],
+    "report switch firmware --help": SSH,
+    "report network cabling --help": SSH + ["jsonschema"],
+}
+
+STARTUP_SCRIPT = """
+import json
+import sys
+
+from canu.cli import cli
+
+try:
+    cli.main(sys.argv[1:], prog_name="canu", standalone_mode=False)
+except SystemExit:
+    pass
+print(json.dumps(sorted(module for module in {heavy} if module in sys.modules)), file=sys.stderr)
+"""
+
+
+def imported_heavy_modules(script, *args):
+    """Run a script in a fresh interpreter and return the heavy modules it imported.
+
+    Args:
+        script: Python source that prints the imported heavy modules as JSON on stderr
+        *args: Arguments passed to the script
+
+    Returns:
+        List of heavy module names
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", script, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stderr.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("command", list(STARTUP_BUDGET))
+def test_cli_startup_budget(command):
+    """Test that a command only imports the heavy modules in its startup budget."""
+    imported = imported_heavy_modules(STARTUP_SCRIPT.format(heavy=HEAVY_MODULES), *command.split())
+    assert set(imported) <= set(STARTUP_BUDGET[command])
+
+
+def test_inventory_startup_budget():
+    """Test that `canu-inventory`, which Ansible runs repeatedly, does not import switch or Kubernetes libraries."""
+    script = (
+        "import json, sys\n"
+        "import canu.inventory.ansible\n"
+        f"print(json.dumps(sorted(m for m in {HEAVY_MODULES} if m in sys.modules)), file=sys.stderr)\n"
+    )
+    assert imported_heavy_modules(script) == []
+
+
+def test_cli_lazy_subcommands():
+    """Test that every lazy subcommand imports, and that listed short help matches the command."""
+
+    def walk(group, ctx):
+        for name in group.list_commands(ctx):
+            command = group.get_command(ctx, name)
+            assert command is not None, f"{ctx.command_path} {name}"
+            if name in getattr(group, "lazy_short_help", {}):
+                assert group.lazy_short_help[name] == command.get_short_help_str(limit=1000)
+            if isinstance(command, click.Group):
+                walk(command, click.Context(command, info_name=name, parent=ctx))
+
+    walk(cli, click.Context(cli, info_name="canu"))
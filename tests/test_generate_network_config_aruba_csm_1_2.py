@@ -87,6 +87,110 @@ def test_network_config():
         assert "sw-leaf-bmc-001 Config Generated" in str(result.output)
 
 
+def test_network_config_jobs():
+    """Test that `canu generate network config --jobs` writes the same files as a serial run."""
+    with runner.isolated_filesystem():
+        configs = {}
+        for jobs in ["1", "3"]:
+            result = runner.invoke(
+                cli,
+                [
+                    "generate",
+                    "network",
+                    "config",
+                    "--csm",
+                    csm,
+                    "--architecture",
+                    architecture,
+                    "--shcd",
+                    test_file,
+                    "--tabs",
+                    tabs,
+                    "--corners",
+                    corners,
+                    "--sls-file",
+                    sls_file,
+                    "--folder",
+                    f"{folder_name}_{jobs}",
+                    "--jobs",
+                    jobs,
+                ],
+            )
+            assert result.exit_code == 0
+            configs[jobs] = (
+                result.output,
+                {
+                    config_file.name: config_file.read_bytes()
+                    for config_file in Path(f"{folder_name}_{jobs}").glob("*.cfg")
+                },
+            )
+
+        assert len(configs["1"][1]) == 11
+        assert configs["1"] == configs["3"]
+
+
+def test_network_config_incremental():
+    """Test that a rerun of `canu generate network config` only regenerates switches whose inputs changed."""
+    ccj_file = path.join(test_file_directory, "data", "Full_Architecture_Golden_Config_1.1.5.json")
+    with runner.isolated_filesystem():
+        with open(ccj_file, "r") as f:
+            ccj_json = json.load(f)
+
+        def _generate(*flags):
+            with open("ccj.json", "w") as f:
+                json.dump(ccj_json, f)
+            result = runner.invoke(
+                cli,
+                [
+                    "generate",
+                    "network",
+                    "config",
+                    "--csm",
+                    csm,
+                    "--ccj",
+                    "ccj.json",
+                    "--sls-file",
+                    sls_file,
+                    "--folder",
+                    folder_name,
+                    *flags,
+                ],
+            )
+            assert result.exit_code == 0
+            return str(result.output)
+
+        assert "Skipped" not in _generate()
+        spine_config = Path(folder_name, "sw-spine-001.cfg").read_text()
+
+        output = _generate()
+        assert "sw-spine-001 Config Unchanged" in output
+        assert "Skipped 11 of 11 unchanged switch configs" in output
+
+        # Moving a UAN only changes the leaf and leaf-bmc switches it is cabled to
+        uan = next(node for node in ccj_json["topology"] if node["common_name"] == "uan001")
+        uan["location"]["elevation"] = "u40"
+        output = _generate()
+        assert "sw-leaf-003 Config Generated" in output
+        assert "sw-leaf-bmc-001 Config Generated" in output
+        assert "sw-leaf-001 Config Unchanged" in output
+        assert "sw-spine-001 Config Unchanged" in output
+        assert Path(folder_name, "sw-spine-001.cfg").read_text() == spine_config
+
+        # Edited configs are regenerated
+        with open(Path(folder_name, "sw-spine-001.cfg"), "a") as f:
+            f.write("interface 1/1/1\n")
+        output = _generate()
+        assert "sw-spine-001 Config Generated" in output
+        assert Path(folder_name, "sw-spine-001.cfg").read_text() == spine_config
+
+        # Skipped configs match a full regeneration
+        incremental = {config_file.name: config_file.read_bytes() for config_file in Path(folder_name).glob("*.cfg")}
+        assert "Skipped" not in _generate("--force")
+        assert incremental == {
+            config_file.name: config_file.read_bytes() for config_file in Path(folder_name).glob("*.cfg")
+        }
+
+
 def test_network_custom_config():
     """Test that the `canu generate network config custom` command runs and generates config custom."""
     with runner.isolated_filesystem():
@@ -20,9 +20,12 @@
 # ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 # OTHER DEALINGS IN THE SOFTWARE.
 """Test NetworkFactory in the model."""
+from pathlib import Path
+
 import pytest
 
-from network_modeling.NetworkNodeFactory import NetworkNodeFactory
+from network_modeling import NetworkNodeFactory as NetworkNodeFactoryModule
+from network_modeling.NetworkNodeFactory import NetworkNodeFactory, default_architecture_spec_file
 
 
 def mock_yaml_validate(self, schema_file, data_file):
@@ -179,3 +182,65 @@ network_hardware:
         )
     assert e.type == Exception
     assert "Validation of test_node architecture against hardware failed for speeds" in str(e)
+
+
+def test_node_factory_lookup_mapper_memoized():
+    """Test that lookup_mapper is built once and matches the architecture definition."""
+    factory = NetworkNodeFactory(architecture_version="network_v2")
+
+    mapper = factory.lookup_mapper()
+    assert factory.lookup_mapper() is mapper
+    for lookup_names, shasta_name, architecture_type in mapper:
+        assert lookup_names[-1] == shasta_name
+        assert isinstance(architecture_type, str)
+    assert ("sw-spine", "spine") in [(shasta_name, arch) for _, shasta_name, arch in mapper]
+
+
+def test_node_factory_generate_node_indexed():
+    """Test that generate_node resolves the architecture component and hardware by model."""
+    factory = NetworkNodeFactory(architecture_version="network_v2")
+
+    node = factory.generate_node("spine")
+    assert node.arch_type() == "spine"
+    assert node.id() == 0
+    assert factory.generate_node("spine").id() == 1
+
+    with pytest.raises(Exception) as e:
+        factory.generate_node("not_a_component")
+    assert "Error finding node architecture definition not_a_component in version network_v2" in str(e)
+
+
+def test_node_factory_definitions_cached(tmp_path, monkeypatch):
+    """Test that the definitions are only validated again when their files change.
+
+    Args:
+        tmp_path: built-in Path
+        monkeypatch: built-in patcher
+    """
+    monkeypatch.setattr(NetworkNodeFactoryModule, "_model_definitions", {})
+    monkeypatch.setattr(NetworkNodeFactoryModule, "_validated_architectures", set())
+    architecture_file = tmp_path / "cray-network-architecture.yaml"
+    architecture_file.write_text(Path(default_architecture_spec_file).read_text())
+    factory = NetworkNodeFactory(architecture_version="network_v2", architecture_data=architecture_file)
+
+    validated = []
+    monkeypatch.setattr(
+        NetworkNodeFactory,
+        "_NetworkNodeFactory__yaml_validate",
+        lambda self, schema_file, data_file: validated.append(data_file),
+    )
+
+    # Shared in the process, then loaded from the cache in a new process
+    cached = NetworkNodeFactory(architecture_version="network_v2", architecture_data=architecture_file)
+    monkeypatch.setattr(NetworkNodeFactoryModule, "_model_definitions", {})
+    monkeypatch.setattr(NetworkNodeFactoryModule, "_validated_architectures", set())
+    reloaded = NetworkNodeFactory(architecture_version="network_v2", architecture_data=architecture_file)
+    assert validated == []
+    assert cached.fingerprint() == factory.fingerprint()
+    assert reloaded.fingerprint() == factory.fingerprint()
+    assert reloaded.generate_node("spine").arch_type() == "spine"
+
+    # Changing a definition validates it again
+    architecture_file.write_text(architecture_file.read_text() + "\n")
+    NetworkNodeFactory(architecture_version="network_v2", architecture_data=architecture_file)
+    assert architecture_file in validated
@@ -20,6 +20,7 @@
 # ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 # OTHER DEALINGS IN THE SOFTWARE.
 """Test CANU report network cabling commands."""
+import json
 from unittest.mock import patch
 
 import requests
@@ -28,6 +29,7 @@ from click import testing
 from netmiko import NetmikoAuthenticationException, NetmikoTimeoutException
 
 from canu.cli import cli
+from canu.report.network.cabling.cabling import equipment_table
 
 from .test_report_switch_cabling import (
     arp_neighbors_mellanox,
@@ -550,6 +552,116 @@ def test_network_cabling_bad_ip_file(get_lldp, switch_vendor):
         assert "check the entered username, IP address and password" in str(result.output)
 
 
+@patch("canu.report.network.cabling.cabling.get_lldp")
+def test_network_cabling_workers_keeps_order(get_lldp):
+    """Test that `canu report network cabling --workers` keeps the errors table in input order."""
+    bad_ips = ["192.168.1.97", "192.168.1.98", "192.168.1.99"]
+
+    with runner.isolated_filesystem():
+        get_lldp.side_effect = requests.exceptions.ConnectionError
+
+        result = runner.invoke(
+            cli,
+            [
+                "report",
+                "network",
+                "cabling",
+                "--ips",
+                ",".join(bad_ips),
+                "--workers",
+                "3",
+                "--username",
+                username,
+                "--password",
+                password,
+            ],
+        )
+        assert result.exit_code == 0
+        assert get_lldp.call_count == 3
+        positions = [str(result.output).index(f"{bad_ip}    ") for bad_ip in bad_ips]
+        assert positions == sorted(positions)
+        assert "Collected 3 switches in" in str(result.output)
+
+
+@patch("canu.report.network.cabling.cabling.get_lldp")
+def test_network_cabling_ndjson(get_lldp):
+    """Test that `canu report network cabling --ndjson` writes a record per switch and per error."""
+    switch_info = {"platform_name": "X86-64", "hostname": "sw-test01", "system_mac": "aa:aa:aa:aa:aa:aa"}
+    switch_dict = {
+        "1/1/1": [
+            {
+                "chassis_name": "sw-test02",
+                "chassis_description": "Test switch 2",
+                "port_id": "1/1/1",
+                "port_description": "",
+                "mac_addr": "bb:bb:bb:bb:bb:01",
+                "chassis_id": "bb:bb:bb:bb:bb:bb",
+            },
+        ],
+    }
+    arp = {"192.168.1.2,vlan1": {"mac": "bb:bb:bb:bb:bb:bb", "ip_address": "192.168.1.2", "port": ["vlan1"]}}
+
+    def _get_lldp(ip, credentials, return_error):
+        if ip == "192.168.1.99":
+            raise requests.exceptions.ConnectionError
+        return switch_info, switch_dict, arp
+
+    get_lldp.side_effect = _get_lldp
+    args = ["report", "network", "cabling", "--ips", "192.168.1.1,192.168.1.99"]
+    args += ["--username", username, "--password", password, "--out", "cabling.json"]
+
+    with runner.isolated_filesystem():
+        result = runner.invoke(cli, args + ["--ndjson"])
+        assert result.exit_code == 0
+        with open("cabling.json") as f:
+            records = [json.loads(line) for line in f]
+        assert records[0] == {"view": "switch"}
+        assert records[1]["ip"] == "192.168.1.1"
+        assert records[1]["lldp"] == switch_dict
+        assert records[2]["ip"] == "192.168.1.99"
+        assert "check the entered username" in records[2]["error"]
+
+        result = runner.invoke(cli, args + ["--json", "--view", "equipment"])
+        assert result.exit_code == 0
+        with open("cabling.json") as f:
+            cabling_json = json.load(f)
+        equipment = {record["mac"]: record for record in cabling_json["records"] if "mac" in record}
+        assert list(equipment) == ["aa:aa:aa:aa:aa:aa", "bb:bb:bb:bb:bb:bb"]
+        assert equipment["bb:bb:bb:bb:bb:bb"]["hostname"] == "sw-test02"
+        assert equipment["bb:bb:bb:bb:bb:bb"]["arp"] == ["192.168.1.2:vlan1"]
+        assert equipment["bb:bb:bb:bb:bb:bb"]["connections_from"]["1/1/1"]["hostname"] == "sw-test01"
+        assert cabling_json["records"][-1]["ip"] == "192.168.1.99"
+
+
+def test_network_cabling_equipment_table_order():
+    """Test that the equipment table lists switches first and keeps LLDP names from earlier switches."""
+
+    def _lldp(name, mac):
+        return {
+            "chassis_name": name,
+            "chassis_description": "",
+            "port_id": "1/1/1",
+            "port_description": "",
+            "mac_addr": mac,
+            "chassis_id": mac,
+        }
+
+    switch_data = [
+        [
+            {"hostname": "sw-test01", "system_mac": "aa"},
+            {"1/1/1": [_lldp("ncn-m001", "cc")], "1/1/2": [_lldp("sw-lldp02", "bb")]},
+            {},
+        ],
+        [{"hostname": "sw-test02", "system_mac": "bb"}, {"1/1/1": [_lldp("sw-test01", "aa")]}, {}],
+    ]
+    equipment_json = equipment_table(switch_data)
+
+    assert list(equipment_json) == ["aa", "bb", "cc"]
+    assert equipment_json["bb"]["hostname"] == "sw-lldp02"
+    assert equipment_json["aa"]["hostname"] == "sw-test01"
+    assert equipment_json["aa"]["connections_from"]["1/1/1"]["hostname"] == "sw-lldp02"
+
+
 @patch("canu.report.switch.cabling.cabling.switch_vendor")
 @responses.activate
 def test_network_cabling_bad_password(switch_vendor):
@@ -26,8 +26,11 @@ from collections import defaultdict
 import pytest
 
 from canu.utils.sls_utils.ipam import (
+    free_ipv4_addresses,
+    free_ipv4_ranges,
     free_ipv4_subnets,
     hosts_from_prefixlength,
+    IPv4Ranges,
     is_supernet_hacked,
     last_free_ipv4_address,
     next_free_ipv4_address,
@@ -36,6 +39,7 @@ from canu.utils.sls_utils.ipam import (
     temp_is_subnet_of,
 )
 from canu.utils.sls_utils.Networks import Network, Subnet
+from canu.utils.sls_utils.Reservations import Reservation
 
 
 def test_raises_value_error_if_input_not_network():
@@ -167,3 +171,62 @@ def test_prefixlength_from_hosts():
 def test_hosts_from_prefixlength():
     """Test determining the number of hosts in a given CIDR/prefix."""
     assert hosts_from_prefixlength(24) == 254
+
+
+def test_ipv4_ranges():
+    """Test reserving and querying free address ranges."""
+    ranges = IPv4Ranges.from_network("192.168.0.0/24")
+    assert ranges.reserve("192.168.0.10", "192.168.0.19")
+    assert ranges.reserve(ipaddress.IPv4Network("192.168.0.128/25"))
+    assert not ranges.reserve("192.168.0.15")
+    assert ranges.reserve("192.168.0.9", "192.168.0.20")
+
+    assert list(ranges) == [
+        (ipaddress.IPv4Address("192.168.0.0"), ipaddress.IPv4Address("192.168.0.8")),
+        (ipaddress.IPv4Address("192.168.0.21"), ipaddress.IPv4Address("192.168.0.127")),
+    ]
+    assert ranges.count() == 9 + 107
+    assert "192.168.0.8" in ranges
+    assert "192.168.0.9" not in ranges
+    assert ranges.is_free(ipaddress.IPv4Network("192.168.0.32/27"))
+    assert not ranges.is_free("192.168.0.0", "192.168.0.21")
+
+    assert ranges.next_free() == ipaddress.IPv4Address("192.168.0.0")
+    assert ranges.next_free("192.168.0.9") == ipaddress.IPv4Address("192.168.0.21")
+    assert ranges.next_free("192.168.0.128") is None
+    assert ranges.last_free() == ipaddress.IPv4Address("192.168.0.127")
+    assert ranges.last_free("192.168.0.20") == ipaddress.IPv4Address("192.168.0.8")
+    assert IPv4Ranges().last_free() is None
+
+    assert ranges.free_subnets()[0] == ipaddress.IPv4Network("192.168.0.8/32")
+    assert ranges.free_subnets()[-1] == ipaddress.IPv4Network("192.168.0.64/26")
+
+    assert ranges.reserve_all(["192.168.0.0", "192.168.0.9", "192.168.0.22", "192.168.0.127", "10.0.0.1"]) == 3
+    assert ranges.next_free() == ipaddress.IPv4Address("192.168.0.1")
+    assert ranges.next_free("192.168.0.9") == ipaddress.IPv4Address("192.168.0.21")
+    assert ranges.next_free("192.168.0.22") == ipaddress.IPv4Address("192.168.0.23")
+    assert ranges.last_free() == ipaddress.IPv4Address("192.168.0.126")
+
+
+def test_free_ipv4_ranges_large_subnet():
+    """Test a /16 subnet with thousands of reservations without listing its addresses."""
+    subnet = Subnet("test1", "10.252.0.0/16", "10.252.0.1", 1)
+    network = ipaddress.IPv4Network("10.252.0.0/16")
+    reserved = [network[i] for i in range(2, 60000, 7)]
+    subnet.reservations({str(ip): Reservation(str(ip), ip, [], "") for ip in reserved})
+
+    free_ranges = free_ipv4_ranges(subnet)
+    assert len(free_ranges) == len(reserved)
+    assert free_ranges.count() == network.num_addresses - 2 - 1 - len(reserved)
+    assert free_ranges.next_free() == ipaddress.IPv4Address("10.252.0.3")
+    assert free_ranges.next_free(reserved[-1]) == reserved[-1] + 1
+    assert free_ranges.last_free() == ipaddress.IPv4Address("10.252.255.254")
+    assert next_free_ipv4_address(subnet, reserved[100]) is None
+    assert last_free_ipv4_address(subnet, reserved[100] + 1) == reserved[100] + 1
+
+
+def test_free_ipv4_addresses():
+    """Test that the free addresses exclude the network, broadcast, gateway and reservations."""
+    subnet = Subnet("test1", "192.168.0.0/29", "192.168.0.1", 1)
+    subnet.reservations({"ncn-w001": Reservation("ncn-w001", "192.168.0.4", [], "")})
+    assert free_ipv4_addresses(subnet) == {ipaddress.IPv4Address(f"192.168.0.{i}") for i in (2, 3, 5, 6)}
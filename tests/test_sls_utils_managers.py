@@ -20,13 +20,16 @@
 # ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 # OTHER DEALINGS IN THE SOFTWARE.
 """Test SLS utilities Manager convenience classes."""
+import copy
 import ipaddress
+import pickle
 from collections import UserDict
 
 import pytest
 
 from canu.utils.sls_utils.Managers import NetworkManager, SubnetManager
 from canu.utils.sls_utils.Networks import Network, Subnet
+from canu.utils.sls_utils.Reservations import Reservation
 
 
 @pytest.fixture
@@ -76,6 +79,93 @@ def test_networkmanager_get(network_dict):
     assert nm.get("10.2.0.0/24") == nm.data["HMN"]
 
 
+def test_networkmanager_ipv4_index(network_dict):
+    """Test finding the network, subnet and reservation that own an IPv4 address."""
+    nm = NetworkManager(network_dict)
+    # Supernet hacked subnets share the CIDR of the network
+    bootstrap = Subnet("bootstrap_dhcp", "10.1.0.0/24", "10.1.0.1", 1)
+    hardware = Subnet("network_hardware", "10.1.0.0/24", "10.1.0.1", 1)
+    hardware.reservations({"sw-spine-001": Reservation("sw-spine-001", "10.1.0.2", [], "")})
+    pool = Subnet("pool", "10.1.0.128/26", "10.1.0.129", 2)
+    pool.reservations({"istio": Reservation("istio", "10.1.0.130", [], "")})
+    nm["NMN"].subnets({"bootstrap_dhcp": bootstrap, "network_hardware": hardware, "pool": pool})
+
+    assert nm.ipv4_index().owner("10.1.0.2") == (nm["NMN"], hardware, hardware.reservations()["sw-spine-001"])
+    assert nm.ipv4_index().owner("10.1.0.3") == (nm["NMN"], bootstrap, None)
+    assert nm.ipv4_index().subnet("10.1.0.131") is pool
+    assert nm.ipv4_index().reservation("10.1.0.130").name() == "istio"
+    assert nm.ipv4_index().network("10.2.0.9") is nm["HMN"]
+    assert nm.ipv4_index().owner("10.2.0.9") == (nm["HMN"], None, None)
+    assert nm.ipv4_index().owner("10.9.0.1") == (None, None, None)
+
+    # Changing the networks or subnets rebuilds the index
+    index = nm.ipv4_index()
+    assert nm.ipv4_index() is index
+    pool.reservations({"spire": Reservation("spire", "10.1.0.130", [], "")})
+    assert nm.ipv4_index().reservation("10.1.0.130").name() == "spire"
+    can = Network("CAN", "ethernet", "10.1.0.0/16")
+    nm["CAN"] = can
+    assert nm.get("10.1.0.0/16") is can
+    assert nm.ipv4_index().network("10.1.1.1") is can
+    del nm["CAN"]
+    assert nm.ipv4_index().network("10.1.1.1") is None
+
+
+def test_networkmanager_ipv4_index_in_place(network_dict):
+    """Test that subnets and reservations changed in place rebuild the index, and unrelated networks don't."""
+    nm = NetworkManager(network_dict)
+    index = nm.ipv4_index()
+    assert index.subnet("10.1.0.5") is None
+
+    # Networks outside of the manager don't invalidate its index
+    Network("CAN", "ethernet", "10.3.0.0/24").subnets()["x"] = Subnet("x", "10.3.0.0/25", "10.3.0.1", 3)
+    assert nm.ipv4_index() is index
+
+    subnet = Subnet("new", "10.1.0.0/25", "10.1.0.1", 2)
+    nm["NMN"].subnets()["new"] = subnet
+    assert nm.ipv4_index().subnet("10.1.0.5") is subnet
+
+    subnet.reservations()["ncn-m001"] = Reservation("ncn-m001", "10.1.0.5", [], "")
+    assert nm.ipv4_index().reservation("10.1.0.5").name() == "ncn-m001"
+    subnet.reservations().update({"ncn-m002": Reservation("ncn-m002", "10.1.0.6", [], "")})
+    assert nm.ipv4_index().reservation("10.1.0.6").name() == "ncn-m002"
+    subnet.reservations().pop("ncn-m001")
+    assert nm.ipv4_index().reservation("10.1.0.5") is None
+
+    subnet.ipv4_address("10.1.0.128/25")
+    assert nm.ipv4_index().subnet("10.1.0.5") is None
+    del nm["NMN"].subnets()["new"]
+    index = nm.ipv4_index()
+    assert index.subnet("10.1.0.130") is None
+
+    # Subnets removed from a network, and reads, don't invalidate the index
+    subnet.ipv4_address("10.1.0.0/25")
+    assert nm.ipv4_index() is index
+    nm["NMN"].subnets({"new": subnet})
+    assert nm.ipv4_index().subnet("10.1.0.5") is subnet
+    nm["NMN"].subnets({})
+    index = nm.ipv4_index()
+    subnet.ipv4_address("10.1.0.128/25")
+    assert nm.ipv4_index() is index
+
+
+def test_networkmanager_ipv4_index_copies(network_dict):
+    """Test that copied and unpickled managers track their own networks."""
+    nm = NetworkManager(network_dict)
+    copied = pickle.loads(pickle.dumps(nm))
+    assert copied.ipv4_index().subnet("10.1.0.5") is None
+
+    subnet = Subnet("new", "10.1.0.0/25", "10.1.0.1", 2)
+    copied["NMN"].subnets()["new"] = subnet
+    assert copied.ipv4_index().subnet("10.1.0.5") is subnet
+    assert nm.ipv4_index().subnet("10.1.0.5") is None
+
+    shallow = copy.copy(nm)
+    nm.ipv4_index()
+    nm["NMN"].subnets()["new"] = subnet
+    assert shallow.ipv4_index().subnet("10.1.0.5") is subnet
+
+
 def test_networkmanager_to_sls(network_dict):
     """Test serializing a NetworkManager object to SLS JSON."""
     nm = NetworkManager(network_dict)
@@ -108,6 +198,15 @@ def test_subnetmanager_get(subnet_dict):
     assert sm.get("10.1.0.0/25") == sm.data["subnet1"]
 
 
+def test_subnetmanager_ipv4_index(subnet_dict):
+    """Test finding the subnet that owns an IPv4 address."""
+    sm = SubnetManager(subnet_dict)
+    assert sm.ipv4_index().subnet("10.2.0.100") is sm["subnet2"]
+    assert sm.ipv4_index().subnet("10.2.0.200") is None
+    sm["subnet3"] = Subnet("subnet3", "10.2.0.128/25", "10.2.0.129", 3)
+    assert sm.ipv4_index().subnet("10.2.0.200") is sm["subnet3"]
+
+
 def test_subnetmanager_to_sls(subnet_dict):
     """Test serialization of a SubnetManager object to SLS JSON."""
     sm = SubnetManager(subnet_dict)
@@ -153,6 +153,16 @@ def test_network_subnets(network):
     assert subnet in network.subnets()
 
 
+def test_network_subnets_copied(network):
+    """Test that a dict of subnets is copied by the setter and changed through the getter."""
+    subnets = {}
+    network.subnets(subnets)
+    subnets["test_subnet"] = Subnet("test_subnet", "192.168.0.0/25", "192.168.0.1", 13)
+    assert "test_subnet" not in network.subnets()
+    network.subnets()["test_subnet"] = subnets["test_subnet"]
+    assert "test_subnet" in network.subnets()
+
+
 def test_network_bgp(network_data, network):
     """Test resetting bgp."""
     assert network.bgp() == [network_data["MyASN"], network_data["PeerASN"]]
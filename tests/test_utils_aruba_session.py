@@ -0,0 +1,96 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""Test the CANU Aruba REST session pool."""
+import responses
+
+from canu.utils.aruba_session import aruba_login, aruba_logout, aruba_session_pool
+
+ip = "192.168.1.1"
+credentials = {"username": "admin", "password": "admin"}
+
+
+def _count(method, url):
+    return len([call for call in responses.calls if call.request.method == method and call.request.url == url])
+
+
+@responses.activate
+def test_aruba_session_pool_logs_in_once():
+    """Test that sessions are shared inside a pool and logged out when it closes."""
+    responses.add(responses.POST, f"https://{ip}/rest/v10.04/login")
+    responses.add(responses.POST, f"https://{ip}/rest/v10.04/logout")
+    responses.add(responses.GET, f"https://{ip}/rest/v10.04/firmware", json={})
+
+    with aruba_session_pool():
+        for _ in range(3):
+            session = aruba_login(ip, credentials)
+            session.get(session.url("firmware")).raise_for_status()
+            aruba_logout(session)
+        assert _count("POST", f"https://{ip}/rest/v10.04/logout") == 0
+
+    assert _count("POST", f"https://{ip}/rest/v10.04/login") == 1
+    assert _count("POST", f"https://{ip}/rest/v10.04/logout") == 1
+
+
+@responses.activate
+def test_aruba_session_pool_replaces_credentials():
+    """Test that a pooled session is logged out when it is replaced by one with new credentials."""
+    responses.add(responses.POST, f"https://{ip}/rest/v10.04/login")
+    responses.add(responses.POST, f"https://{ip}/rest/v10.04/logout")
+
+    with aruba_session_pool():
+        old = aruba_login(ip, credentials)
+        new = aruba_login(ip, {"username": "admin", "password": "new"})
+        assert new is not old
+        assert not old.logged_in
+        assert _count("POST", f"https://{ip}/rest/v10.04/logout") == 1
+
+    assert _count("POST", f"https://{ip}/rest/v10.04/login") == 2
+    assert _count("POST", f"https://{ip}/rest/v10.04/logout") == 2
+
+
+@responses.activate
+def test_aruba_session_without_pool():
+    """Test that a session outside of a pool logs out when released."""
+    responses.add(responses.POST, f"https://{ip}/rest/v10.04/login")
+    responses.add(responses.POST, f"https://{ip}/rest/v10.04/logout")
+
+    for _ in range(2):
+        aruba_logout(aruba_login(ip, credentials))
+
+    assert _count("POST", f"https://{ip}/rest/v10.04/login") == 2
+    assert _count("POST", f"https://{ip}/rest/v10.04/logout") == 2
+
+
+@responses.activate
+def test_aruba_session_reauthenticates_on_401():
+    """Test that an expired session logs in again and retries the request."""
+    responses.add(responses.POST, f"https://{ip}/rest/v10.04/login")
+    responses.add(responses.POST, f"https://{ip}/rest/v10.04/logout")
+    responses.add(responses.GET, f"https://{ip}/rest/v10.04/firmware", status=401)
+    responses.add(responses.GET, f"https://{ip}/rest/v10.04/firmware", json={"current_version": "1"})
+
+    with aruba_session_pool():
+        session = aruba_login(ip, credentials)
+        response = session.get(session.url("firmware"))
+
+    assert response.json() == {"current_version": "1"}
+    assert _count("POST", f"https://{ip}/rest/v10.04/login") == 2
@@ -0,0 +1,130 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""Test the CANU fleet collection utils."""
+import socket
+import threading
+import time
+
+import pytest
+import requests
+
+from canu.utils.deadline import time_left
+from canu.utils.fleet import FleetRun, run_on_switches
+from canu.utils.trace import TracedSession
+
+
+def test_run_on_switches_keeps_order():
+    """Test that results come back in input order even when later switches answer first."""
+    delays = {"a": 0.3, "b": 0.1, "c": 0.0}
+
+    def collect(item):
+        time.sleep(delays[item])
+        return item.upper()
+
+    results, timing = run_on_switches(collect, ["a", "b", "c"], workers=3)
+
+    assert [result.item for result in results] == ["a", "b", "c"]
+    assert [result.value for result in results] == ["A", "B", "C"]
+    assert timing.switches == 3
+    assert timing.serial_time >= timing.wall_time
+
+
+def test_run_on_switches_records_errors():
+    """Test that listed exceptions are recorded per switch and others are raised."""
+
+    def collect(item):
+        if item == "bad":
+            raise ConnectionError(item)
+        return item
+
+    results, _ = run_on_switches(collect, ["good", "bad"], exceptions=(ConnectionError,))
+    assert results[0].error is None
+    assert isinstance(results[1].error, ConnectionError)
+
+    with pytest.raises(ConnectionError):
+        run_on_switches(collect, ["good", "bad"], exceptions=(KeyError,))
+
+
+def test_run_on_switches_timeout():
+    """Test that a switch over its timeout is reported without waiting for it."""
+
+    def collect(item):
+        if item == "slow":
+            time.sleep(3)
+        return item
+
+    start = time.monotonic()
+    results, _ = run_on_switches(collect, ["slow", "fast"], workers=2, timeout=1)
+
+    assert time.monotonic() - start < 3
+    assert isinstance(results[0].error, TimeoutError)
+    assert results[1].value == "fast"
+
+
+def test_run_on_switches_timeout_ends_connections():
+    """Test that requests to a switch that stops answering time out at its deadline."""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    port = server.getsockname()[1]
+    ended = threading.Event()
+    errors = []
+
+    def collect(item):
+        assert time_left() <= 1
+        try:
+            return TracedSession().get(f"http://127.0.0.1:{port}/{item}")
+        except requests.exceptions.Timeout as err:
+            errors.append(err)
+            raise
+        finally:
+            ended.set()
+
+    try:
+        results, _ = run_on_switches(collect, ["silent"], workers=1, timeout=1)
+        assert isinstance(results[0].error, (TimeoutError, requests.exceptions.Timeout))
+        # The abandoned thread does not hold on to the connection
+        assert ended.wait(3)
+        assert errors
+    finally:
+        server.close()
+    assert time_left(5) == 5
+
+
+def test_fleet_run_streams_in_order():
+    """Test that each result is handed over once every earlier switch has finished."""
+    delays = {"a": 0.0, "b": 0.4, "c": 0.0}
+    yielded = []
+
+    def collect(item):
+        time.sleep(delays[item])
+        return item
+
+    run = FleetRun(collect, ["a", "b", "c"], workers=3)
+    start = time.monotonic()
+    for result in run:
+        yielded.append((result.item, time.monotonic() - start))
+
+    assert [item for item, _ in yielded] == ["a", "b", "c"]
+    # The first switch is available before the slow one is done
+    assert yielded[0][1] < 0.3
+    assert run.timing.switches == 3
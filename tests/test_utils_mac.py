@@ -0,0 +1,95 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""Test CANU mac utils."""
+import mmap
+from os import listdir
+
+import pytest
+
+from canu.utils import mac
+from canu.utils.cache import cache_dir
+from canu.utils.mac import OuiIndex, build_oui_index, find_mac, find_macs
+
+
+@pytest.fixture
+def fresh_index(monkeypatch):
+    """Forget the shared OUI index so the next lookup builds it again."""
+    monkeypatch.setattr(mac, "_oui_index", None)
+
+
+def vendor_file(tmp_path, lines):
+    """Write a mac vendors file and return its path."""
+    vendors = tmp_path / "mac_vendors"
+    vendors.write_text("\n".join(lines) + "\n", encoding="utf8")
+    return str(vendors)
+
+
+def test_oui_index_matches_vendor_file(tmp_path):
+    """Test that every prefix is found with its vendor, the last line winning for duplicates."""
+    vendors = vendor_file(tmp_path, ["00AABB:Vendor Two", "000000:Vendor One", "00AABB:Vendor Three", "FFFFFF:Vendör"])
+    index = OuiIndex(build_oui_index(vendors))
+
+    assert len(index) == 3
+    assert index.lookup(bytes.fromhex("000000")) == "Vendor One"
+    assert index.lookup(bytes.fromhex("00AABB")) == "Vendor Three"
+    assert index.lookup(bytes.fromhex("FFFFFF")) == "Vendör"
+    assert index.lookup(bytes.fromhex("00AABA")) is None
+    assert index.lookup(bytes.fromhex("FFFFFE")) is None
+
+
+def test_oui_index_rejects_other_files():
+    """Test that a buffer without the index header is refused."""
+    with pytest.raises(ValueError):
+        OuiIndex(b"000000:Vendor One\n")
+
+
+def test_find_mac(fresh_index):
+    """Test looking up mac addresses in the usual formats."""
+    assert find_mac("00:40:a6:00:00:00") == "Cray, Inc."
+    assert find_mac("0040.A600.0000") == "Cray, Inc."
+    assert find_mac("00-40-A6-00-00-00") == "Cray, Inc."
+    assert isinstance(mac._oui_index.buffer, mmap.mmap)
+    assert [name for name in listdir(cache_dir("oui")) if name.endswith(".idx")]
+
+
+def test_find_mac_invalid(fresh_index):
+    """Test that invalid or unknown mac addresses have no vendor."""
+    assert find_mac("not a mac") == ""
+    assert find_mac("00:40") == ""
+    assert find_mac("00:40:a6:00:00:00:00") == ""
+    assert find_mac("ff:ff:fe:00:00:00") == ""
+
+
+def test_find_mac_without_cache(fresh_index, monkeypatch):
+    """Test that the index is built in memory when caching is disabled."""
+    monkeypatch.setenv("CANU_CACHE_DIR", "")
+
+    assert find_mac("00:40:a6:00:00:00") == "Cray, Inc."
+    assert isinstance(mac._oui_index.buffer, bytes)
+
+
+def test_find_macs(fresh_index):
+    """Test looking up many mac addresses at once."""
+    macs = ["00:40:a6:00:00:01", "b4:2e:99:00:00:00", "not a mac", "00:40:a6:00:00:01"]
+
+    assert find_macs(macs) == {mac_address: find_mac(mac_address) for mac_address in macs}
+    assert find_macs(macs)["00:40:a6:00:00:01"] == "Cray, Inc."
@@ -0,0 +1,144 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""Test the CANU neighbor index and the LLDP annotations that use it."""
+import ipaddress
+
+import pytest
+
+from canu.report.switch.cabling.cabling import (
+    add_heuristic_metadata_to_lldp,
+    add_kea_metadata_to_lldp,
+    add_sls_metadata_to_lldp,
+    add_smd_metadata_to_lldp,
+)
+from canu.utils.neighbor_index import NeighborIndex, index_arp
+from canu.utils.sls_utils.Networks import Network, Subnet
+from canu.utils.sls_utils.Reservations import Reservation
+
+arp = {
+    "192.168.4.4,vlan2": {"mac": "aa:bb:cc:dd:ee:01", "ip_address": "192.168.4.4", "port": {"vlan2": ""}},
+    "10.1.1.1,vlan1": {"mac": "aa:bb:cc:dd:ee:01", "ip_address": "10.1.1.1", "port": {"vlan1": ""}},
+    "192.168.4.5,vlan2": {"mac": "aa:bb:cc:dd:ee:02", "ip_address": "192.168.4.5", "port": {"vlan2": ""}},
+}
+kea_json = [
+    {
+        "arguments": {
+            "leases": [
+                {
+                    "hw-address": "aa:bb:cc:dd:ee:03",
+                    "hostname": "ncn-m001",
+                    "subnet-id": 2,
+                    "ip-address": "192.168.4.10",
+                },
+            ],
+        },
+    },
+]
+smd_json = [{"MACAddress": "aa:bb:cc:dd:ee:04", "ComponentID": "x3000c0s1b0n0"}]
+
+
+@pytest.fixture
+def sls_json():
+    """Construct SLS networks with a few NCN reservations."""
+    nmn = Network("NMN", "ethernet", "192.168.0.0/17")
+    nmn.full_name("Node Management Network")
+    nmn.mtu(9000)
+    subnet = Subnet("bootstrap_dhcp", "192.168.4.0/24", "192.168.4.1", 2)
+    subnet.reservations(
+        {
+            name: Reservation(name, ipaddress.IPv4Address(ip), [], "")
+            for name, ip in [("ncn-w001", "192.168.4.4"), ("ncn-w002", "192.168.4.5")]
+        },
+    )
+    nmn.subnets({subnet.name(): subnet})
+    hmn = Network("HMN", "ethernet", "192.168.128.0/17")
+    hmn.full_name("Hardware Management Network")
+    hmn.mtu(9000)
+    return {"Networks": {nmn.name(): nmn.to_sls(), hmn.name(): hmn.to_sls()}}
+
+
+def _lldp(mac):
+    return {
+        "chassis_id": "",
+        "mac_addr": mac,
+        "chassis_description": "",
+        "chassis_name": "",
+        "port_description": "",
+        "port_id": mac,
+        "port_id_subtype": "link_local_addr",
+        "data_sources": "LLDP",
+    }
+
+
+def test_index_arp():
+    """Test that ARP entries are hashed by MAC in ARP table order."""
+    arp_lookup = index_arp(arp)
+
+    assert arp_lookup.arp_entries("aa:bb:cc:dd:ee:01") == ["192.168.4.4:vlan2", "10.1.1.1:vlan1"]
+    assert arp_lookup.arp_entries("aa:bb:cc:dd:ee:99") == []
+
+
+def test_neighbor_index_sls(sls_json):
+    """Test SLS lookups by IP and by annotated ARP data."""
+    index = NeighborIndex(sls_json=sls_json)
+
+    assert index.sls_name("192.168.4.4") == "ncn-w001"
+    assert index.sls_name("192.168.4.250") is None
+    assert index.sls_name_for_arp_data("192.168.4.5:vlan2, 192.168.4.4:vlan2") == "ncn-w001"
+    # Only a whole IP matches, not one that ends with a reserved IP
+    assert index.sls_name_for_arp_data("1192.168.4.4:vlan2") is None
+
+
+def test_neighbor_index_heuristic():
+    """Test that heuristics match the OUI of the MAC and the switch type."""
+    index = NeighborIndex()
+
+    assert index.heuristic("14:02:ec:00:00:01", "sw-spine-001")["hint"] == "OCP Port"
+    assert index.heuristic("14:02:ec:00:00:01", "sw-leaf-bmc-001") is None
+    assert index.heuristic("00:00:00:14:02:ec", "sw-spine-001") is None
+
+
+def test_annotate_lldp_with_shared_index(sls_json):
+    """Test that every annotator fills in missing names from one shared index."""
+    index = NeighborIndex(kea_json=kea_json, sls_json=sls_json, smd_json=smd_json)
+
+    switch_dict = {
+        "1/1/1": [_lldp("aa:bb:cc:dd:ee:01")],
+        "1/1/2": [_lldp("aa:bb:cc:dd:ee:03")],
+        "1/1/3": [_lldp("aa:bb:cc:dd:ee:04")],
+        "1/1/4": [_lldp("14:02:ec:00:00:01")],
+    }
+    arp_lookup = index_arp(arp)
+    for port in switch_dict.values():
+        port[0]["arp_data"] = ", ".join(arp_lookup.arp_entries(port[0]["mac_addr"]))
+
+    add_kea_metadata_to_lldp(switch_dict, None, index)
+    add_sls_metadata_to_lldp(switch_dict, None, index)
+    add_smd_metadata_to_lldp(switch_dict, None, index)
+    add_heuristic_metadata_to_lldp({"hostname": "sw-spine-001"}, switch_dict, index)
+
+    assert switch_dict["1/1/1"][0]["chassis_name"] == "ncn-w001"
+    assert switch_dict["1/1/1"][0]["data_sources"] == "LLDP, SLS"
+    assert switch_dict["1/1/2"][0]["chassis_name"] == "ncn-m001"
+    assert switch_dict["1/1/3"][0]["chassis_name"] == "x3000c0s1b0n0"
+    assert switch_dict["1/1/4"][0]["data_sources"] == "LLDP, Heuristic"
+    assert switch_dict["1/1/4"][0]["chassis_description"] == " OCP Port"
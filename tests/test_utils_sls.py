@@ -0,0 +1,101 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""Test the CANU SLS model."""
+import json
+from os import path
+from pathlib import Path
+from unittest.mock import patch
+
+from canu.utils import sls
+from canu.utils.inventory import inventory
+from canu.utils.sls import parse_sls_for_config, parse_sls_for_inventory, sls_model
+
+test_file_directory = Path(__file__).resolve().parent
+
+sls_file = path.join(test_file_directory, "data", "sls_input_file_csm_1.2.json")
+
+
+def load_sls():
+    """Load the SLS test data with a switch in its hardware.
+
+    Returns:
+        SLS dump
+    """
+    with open(sls_file) as f:
+        sls_json = json.load(f)
+    sls_json["Hardware"] = {
+        "x3000c0h33s1": {
+            "Xname": "x3000c0h33s1",
+            "Type": "comptype_hl_switch",
+            "ExtraProperties": {"Aliases": ["sw-spine-001"], "Brand": "Aruba"},
+        },
+    }
+    return sls_json
+
+
+def test_sls_model_shared_by_content(monkeypatch):
+    """Test that one model is shared for the same SLS content, however it was loaded.
+
+    Args:
+        monkeypatch: built-in patcher
+    """
+    monkeypatch.setattr(sls, "_sls_models", {})
+    sls_json = load_sls()
+    model = sls_model(sls_json)
+
+    assert sls_model(load_sls()) is model
+    assert model.config_variables is model.config_variables
+    assert model.config_variables["NMN_IPs"] == parse_sls_for_config(list(sls_json["Networks"].values()))["NMN_IPs"]
+    assert model.inventory_variables["HMN_IPs"] == parse_sls_for_inventory(list(sls_json["Networks"].values()))["HMN_IPs"]
+    assert len(model.hardware) == len(sls_json["Hardware"])
+
+    # The /networks API returns a list of networks
+    networks = sls_model(list(sls_json["Networks"].values()))
+    assert networks is not model
+    assert networks.config_variables["CMN_IPs"] == model.config_variables["CMN_IPs"]
+    assert networks.hardware == []
+
+    # Different content gets its own model, and changing the input doesn't change a model
+    sls_json["Networks"]["NMN"]["ExtraProperties"]["CIDR"] = "10.255.0.0/17"
+    assert sls_model(sls_json) is not model
+    assert str(model.config_variables["NMN"]) == "192.168.3.0/17"
+
+
+def test_inventory_from_sls_model(monkeypatch):
+    """Test that the inventory is built from the shared model without calling SLS.
+
+    Args:
+        monkeypatch: built-in patcher
+    """
+    monkeypatch.setattr(sls, "_sls_models", {})
+    sls_json = load_sls()
+
+    with patch("canu.utils.sls.sls_dump") as sls_dump:
+        switch_inventory, sls_variables = inventory("admin", "admin", "HMN", sls_inventory=True, dumpstate=sls_json)
+        sls_variables["CSM_VRF"] = "Customer"
+    sls_dump.assert_not_called()
+
+    hosts = switch_inventory["options"]["hosts"]
+    assert hosts["sw-spine-001"]["data"]["type"] == "spine"
+    assert hosts["sw-spine-001"]["groups"] == ["aruba"]
+    assert hosts["sw-spine-001"]["hostname"] == sls_variables["HMN_IPs"]["sw-spine-001"]
+    assert "CSM_VRF" not in sls_model(sls_json).inventory_variables
@@ -0,0 +1,142 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""Test the CANU SSH connection pool."""
+from unittest.mock import patch
+
+from canu.utils import ssh
+from canu.utils.ssh import netmiko_command, netmiko_commands, remember_device_type, ssh_connection_pool
+
+ip = "192.168.1.1"
+credentials = {"username": "admin", "password": "admin"}
+
+
+@patch("netmiko.ConnectHandler")
+def test_ssh_pool_reuses_connection(connect_handler):
+    """Test that commands inside a pool share one connection that is closed with the pool."""
+    connection = connect_handler.return_value
+    connection.is_alive.return_value = True
+
+    with ssh_connection_pool():
+        netmiko_command(ip, credentials, "show running-config")
+        netmiko_command(ip, credentials, "sh run | i host")
+        connection.disconnect.assert_not_called()
+        assert connect_handler.call_count == 1
+
+        # A different device_type needs a new connection
+        netmiko_commands(ip, credentials, ["show version"], "aruba")
+
+    assert connect_handler.call_count == 2
+    assert connection.disconnect.call_count == 2
+
+
+@patch("netmiko.ConnectHandler")
+def test_ssh_without_pool(connect_handler):
+    """Test that every command outside of a pool gets its own connection."""
+    netmiko_command(ip, credentials, "show version")
+    netmiko_command(ip, credentials, "show version")
+
+    assert connect_handler.call_count == 2
+    assert connect_handler.return_value.disconnect.call_count == 2
+
+
+@patch("netmiko.ConnectHandler")
+def test_ssh_pool_evicts_idle_and_dead(connect_handler):
+    """Test that idle or dead connections are replaced."""
+    connection = connect_handler.return_value
+    connection.is_alive.return_value = False
+
+    with ssh_connection_pool():
+        netmiko_command(ip, credentials, "show version")
+        netmiko_command(ip, credentials, "show version")
+        assert connect_handler.call_count == 2
+
+        connection.is_alive.return_value = True
+        with patch("canu.utils.ssh.SSH_IDLE_TIMEOUT", -1):
+            netmiko_command(ip, credentials, "show version")
+        assert connect_handler.call_count == 3
+
+
+class RacingPool(dict):
+    """Pool that hands out an evicted entry on the first lookup, like a lookup racing an eviction."""
+
+    def __init__(self, stale):
+        """Create the pool.
+
+        Args:
+            stale: Evicted pool entry returned by the first lookup
+        """
+        super().__init__()
+        self.stale = stale
+
+    def get(self, key, default=None):
+        """Return the stale entry once, then the real one.
+
+        Args:
+            key: Pool key
+            default: Value when the key is missing
+
+        Returns:
+            Pool entry
+        """
+        stale, self.stale = self.stale, None
+        return stale or super().get(key, default)
+
+
+@patch("netmiko.ConnectHandler")
+def test_ssh_pool_evict_skips_connection_in_use(connect_handler):
+    """Test that a connection being used is not evicted, and an evicted entry is looked up again."""
+    connection = connect_handler.return_value
+    connection.is_alive.return_value = True
+
+    with ssh_connection_pool():
+        netmiko_command(ip, credentials, "show version")
+        key = (ip, credentials["username"])
+        pooled = ssh._pool[key]
+
+        with pooled.lock, patch("canu.utils.ssh.SSH_IDLE_TIMEOUT", -1):
+            ssh._evict_idle_connections()
+        assert ssh._pool[key] is pooled
+        connection.disconnect.assert_not_called()
+
+        # Evicted after another thread found it, but before it took the lock
+        with patch("canu.utils.ssh.SSH_IDLE_TIMEOUT", -1):
+            ssh._evict_idle_connections()
+        assert pooled.evicted
+        assert pooled.connection is None
+        assert connection.disconnect.call_count == 1
+        racing_pool = RacingPool(pooled)
+        with patch.object(ssh, "_pool", racing_pool):
+            netmiko_command(ip, credentials, "show version")
+        assert racing_pool[key] is not pooled
+        assert connect_handler.call_count == 2
+
+
+@patch("netmiko.ConnectHandler")
+def test_ssh_remembered_device_type(connect_handler):
+    """Test that a detected device_type replaces autodetect."""
+    remember_device_type("192.168.1.2", "dell_os10")
+    try:
+        netmiko_command("192.168.1.2", credentials, "show version")
+    finally:
+        ssh._detected_device_types.clear()
+
+    assert connect_handler.call_args.kwargs["device_type"] == "dell_os10"
@@ -0,0 +1,70 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""Test the CANU stream utils."""
+import io
+import json
+
+from canu.utils.stream import JsonStream
+
+
+def test_json_stream_matches_json_dumps():
+    """Test that the streamed document is the same as dumping the whole document."""
+    header = {"canu_version": "1.0.0", "tabs": None, "corners": ["J14", "T30"]}
+    records = [{"common_name": "sw-spine-001", "ports": [{"port": 1}]}, {"common_name": "a\nb"}, [], {}]
+
+    for topology in ([], records):
+        out = io.StringIO()
+        with JsonStream(out, header, "topology") as stream:
+            assert stream.write_all(iter(topology)) == len(topology)
+        assert out.getvalue() == json.dumps({**header, "topology": topology}, indent=2) + "\n"
+
+    out = io.StringIO()
+    JsonStream(out, {}, "records").close()
+    assert json.loads(out.getvalue()) == {"records": []}
+
+
+def test_json_stream_ndjson():
+    """Test that NDJSON has the header on the first line and one record per line."""
+    out = io.StringIO()
+    with JsonStream(out, {"view": "switch"}, "records", ndjson=True) as stream:
+        stream.write({"ip": "192.168.1.1"})
+        stream.write({"ip": "192.168.1.2", "error": "Timeout"})
+
+    lines = out.getvalue().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"view": "switch"},
+        {"ip": "192.168.1.1"},
+        {"ip": "192.168.1.2", "error": "Timeout"},
+    ]
+
+
+def test_json_stream_not_closed_on_error():
+    """Test that a stream is left unterminated when the producer raises."""
+    out = io.StringIO()
+    try:
+        with JsonStream(out, {"view": "switch"}, "records") as stream:
+            stream.write({"ip": "192.168.1.1"})
+            raise ValueError("switch went away")
+    except ValueError:
+        pass
+    assert not stream.closed
+    assert not out.getvalue().endswith("}\n")
@@ -0,0 +1,77 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""Test CANU switch template utils."""
+from os import listdir
+
+import pytest
+
+from canu.utils import templates
+from canu.utils.cache import cache_dir
+from canu.utils.templates import precompile_templates, template_environment
+
+template_name = "1.2/aruba/common/banner-motd.j2"
+
+
+def no_compile(*args, **kwargs):
+    """Fail a test that compiles a template from source."""
+    pytest.fail("Template was compiled from source")
+
+
+def test_template_bytecode_cached():
+    """Test that a compiled template is reused by later environments."""
+    template_environment("switch").get_template(template_name)
+    assert listdir(cache_dir("jinja", "switch"))
+
+    env = template_environment("switch")
+    env.compile = no_compile
+    assert env.get_template(template_name).name == template_name
+
+
+def test_template_precompiled(tmp_path, monkeypatch):
+    """Test that precompiled templates are used when there is no bytecode cache."""
+    precompiled = tmp_path / "compiled"
+    assert precompile_templates(precompiled) > 0
+    assert listdir(precompiled / "switch")
+
+    monkeypatch.setenv("CANU_CACHE_DIR", "")
+    monkeypatch.setattr(templates, "precompiled_templates_folder", str(precompiled))
+    env = template_environment("switch")
+    env.compile = no_compile
+    env.get_template(template_name)
+
+
+def test_template_cache_key_jinja_version(monkeypatch):
+    """Test that bytecode compiled by another Jinja release is not used.
+
+    Args:
+        monkeypatch: built-in patcher
+    """
+    template_environment("switch").get_template(template_name)
+
+    monkeypatch.setattr(templates.jinja2, "__version__", "0.0.0")
+    env = template_environment("switch")
+    env.bytecode_cache.precompiled_directory = None
+    compiled = []
+    compile_source = env.compile
+    env.compile = lambda *args, **kwargs: compiled.append(args) or compile_source(*args, **kwargs)
+    env.get_template(template_name)
+    assert compiled
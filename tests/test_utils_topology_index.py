@@ -0,0 +1,96 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""Test CANU topology index."""
+import json
+from os import path
+from pathlib import Path
+
+from canu.generate.switch.config.config import get_pair_connections, get_switch_nodes
+from canu.utils.sls import parse_sls_for_config
+from canu.utils.topology_index import TopologyIndex, switch_unused_ports
+from canu.validate.shcd.shcd import node_model_from_shcd, shcd_to_sheets
+from network_modeling.NetworkNodeFactory import NetworkNodeFactory
+
+test_file_directory = Path(__file__).resolve().parent
+
+test_file = path.join(test_file_directory, "data", "Full_Architecture_Golden_Config_1.1.5.xlsx")
+tabs = "SWITCH_TO_SWITCH,NON_COMPUTE_NODES,HARDWARE_MANAGEMENT,COMPUTE_NODES"
+corners = "J14,T44,J14,T48,J14,T28,J14,T27"
+sls_file = path.join(test_file_directory, "data", "sls_input_file_csm_1.2.json")
+architecture = "network_v2"
+
+factory = NetworkNodeFactory(architecture_version=architecture)
+with open(test_file, "rb") as shcd:
+    sheets = shcd_to_sheets(shcd, tabs, corners)
+    network_node_list, _ = node_model_from_shcd(factory=factory, spreadsheet=shcd, sheets=sheets)
+with open(sls_file) as sls_f:
+    sls_variables = parse_sls_for_config(list(json.load(sls_f)["Networks"].values()))
+
+switch_names = [
+    node.common_name()
+    for node in network_node_list
+    if node.common_name().startswith(("sw-spine", "sw-leaf", "sw-cdu"))
+]
+
+
+def test_topology_index_lookups():
+    """Test that the topology index hashes the serialized nodes by name and id."""
+    topology = TopologyIndex(network_node_list)
+
+    for node in network_node_list:
+        serialized = node.serialize()
+        assert topology.node(node.common_name()) == serialized
+        assert topology.node_by_id(node.id()) == serialized
+        assert node.common_name() in topology
+    assert "sw-spine-999" not in topology
+
+    cdu_racks = topology.destination_racks("sw-cdu-001")
+    assert cdu_racks == [
+        topology.rack(port["destination_node_id"]) for port in topology.node("sw-cdu-001")["ports"]
+    ]
+
+
+def test_topology_index_ports_to():
+    """Test that the adjacency map returns the ports between two nodes."""
+    topology = TopologyIndex(network_node_list)
+
+    ports = topology.ports_to("sw-spine-001", "sw-spine-002")
+    assert ports
+    for port in ports:
+        assert topology.node_by_id(port["destination_node_id"])["common_name"] == "sw-spine-002"
+    assert topology.ports_to("sw-spine-001", "not-a-node") == []
+    assert topology.ports_to("not-a-node", "sw-spine-002") == []
+
+
+def test_topology_index_matches_serial_lookups():
+    """Test that pair connections and unused ports match the per-switch lookups."""
+    topology = TopologyIndex(network_node_list)
+    unused_ports = switch_unused_ports(network_node_list)
+
+    for switch_name in switch_names:
+        nodes, unknown = get_switch_nodes(architecture, switch_name, network_node_list, factory, sls_variables)
+        assert get_switch_nodes(architecture, switch_name, network_node_list, factory, sls_variables, topology) == (
+            nodes,
+            unknown,
+        )
+        assert get_pair_connections(nodes, switch_name, topology) == get_pair_connections(nodes, switch_name)
+        assert topology.unused_ports(switch_name) == unused_ports[switch_name]
@@ -0,0 +1,175 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""Test the CANU trace utils."""
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+import requests
+import responses
+from click import testing
+
+from canu.cli import cli
+from canu.utils import trace
+from canu.utils.trace import TracedSession, process_map, profiling, span
+
+runner = testing.CliRunner()
+
+
+def test_span_disabled():
+    """Test that spans are shared no-ops while profiling is off."""
+    assert trace._profiler is None
+    with span("login", "rest", switch="192.168.1.1") as login_span:
+        login_span.set(status=200)
+    assert span("parse") is login_span
+
+
+def test_profiling_trace_and_summary(tmp_path, capsys):
+    """Test that nested spans are written as trace events and totalled with their self time.
+
+    Args:
+        tmp_path: built-in Path
+        capsys: built-in capture
+    """
+    trace_file = tmp_path / "trace.json"
+
+    def parse():
+        with span("parse", "switch"):
+            time.sleep(0.01)
+
+    with profiling(str(trace_file)) as profiler:
+        assert trace._profiler is profiler
+        with span("switch", "fleet", switch="192.168.1.1") as switch_span:
+            with span("show lldp", "ssh"):
+                time.sleep(0.02)
+            parse()
+            switch_span.set(vendor="dell")
+        try:
+            with span("login", "rest"):
+                raise ValueError("rejected")
+        except ValueError:
+            pass
+
+    assert trace._profiler is None
+    events = json.loads(trace_file.read_text())["traceEvents"]
+    spans = {event["name"]: event for event in events if event["ph"] == "X"}
+    assert set(spans) == {"command", "switch", "show lldp", "parse", "login"}
+    assert spans["switch"]["args"] == {"switch": "192.168.1.1", "vendor": "dell"}
+    assert spans["login"]["args"] == {"error": "ValueError"}
+    assert spans["show lldp"]["ts"] >= spans["switch"]["ts"]
+    assert any(event["ph"] == "M" and event["name"] == "thread_name" for event in events)
+
+    rows = {(row[0], row[1]): row for row in profiler.summary()}
+    count, total, self_time = rows[("fleet", "switch")][2:5]
+    assert count == 1
+    assert self_time < total - 25
+    assert rows[("ssh", "show lldp")][3] == rows[("ssh", "show lldp")][4]
+    assert "Self ms" in capsys.readouterr().err
+
+
+@responses.activate
+def test_traced_session(tmp_path):
+    """Test that REST requests are named after their command or path.
+
+    Args:
+        tmp_path: built-in Path
+    """
+    responses.add(responses.POST, "https://192.168.1.1/admin/launch", json={"status": "OK"})
+    responses.add(responses.GET, "https://192.168.1.2/rest/v10.04/system", json={})
+
+    with profiling(str(tmp_path / "trace.json")) as profiler:
+        session = TracedSession()
+        session.post("https://192.168.1.1/admin/launch", json={"cmd": "show lldp interfaces ethernet remote"})
+        session.get("https://192.168.1.2/rest/v10.04/system?attributes=hostname")
+
+    rest = [(name, args) for name, category, _, _, _, args in profiler.events if category == "rest"]
+    assert rest == [
+        ("show lldp interfaces ethernet remote", {"switch": "192.168.1.1", "status": 200}),
+        ("GET /rest/v10.04/system", {"switch": "192.168.1.2", "status": 200}),
+    ]
+
+
+def _render(name):
+    with span("render", "config", switch=name):
+        return name, os.getpid()
+
+
+def test_process_map(tmp_path):
+    """Test that spans recorded in worker processes are merged into the trace.
+
+    Args:
+        tmp_path: built-in Path
+    """
+    names = ["sw-spine-001", "sw-spine-002", "sw-leaf-001"]
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert [name for name, _ in process_map(executor, _render, names)] == names
+
+        trace_file = tmp_path / "trace.json"
+        with profiling(str(trace_file)) as profiler:
+            results = list(process_map(executor, _render, names))
+
+    assert [name for name, _ in results] == names
+    renders = [event for event in profiler.events if event[0] == "render"]
+    assert sorted(args["switch"] for *_, args in renders) == sorted(names)
+    assert {tid[0] for _, _, tid, *_ in renders} == {pid for _, pid in results}
+    assert all(start >= 0 for _, _, _, start, *_ in renders)
+
+    events = json.loads(trace_file.read_text())["traceEvents"]
+    processes = {event["pid"]: event["args"]["name"] for event in events if event["name"] == "process_name"}
+    assert processes[os.getpid()] == "canu"
+    assert all(processes[pid] == "canu worker" for _, pid in results)
+
+
+@patch("canu.report.network.cabling.cabling.get_lldp")
+def test_cli_profile(get_lldp):
+    """Test that `canu --profile` writes a trace with a span for every switch."""
+    get_lldp.side_effect = requests.exceptions.ConnectionError
+    ips = ["192.168.1.97", "192.168.1.98"]
+
+    with runner.isolated_filesystem():
+        result = runner.invoke(
+            cli,
+            [
+                "--profile",
+                "trace.json",
+                "report",
+                "network",
+                "cabling",
+                "--ips",
+                ",".join(ips),
+                "--username",
+                "admin",
+                "--password",
+                "admin",
+            ],
+        )
+        assert result.exit_code == 0
+        assert "Self ms" in result.output
+        with open("trace.json") as f:
+            events = json.load(f)["traceEvents"]
+
+    switches = [event["args"] for event in events if event["name"] == "switch"]
+    assert sorted(args["switch"] for args in switches) == ips
+    assert all(args["error"] == "ConnectionError" for args in switches)
+    assert trace._profiler is None
@@ -0,0 +1,88 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""Test CANU TTP parser utils."""
+from ttp import ttp
+
+from canu.utils import ttp_parsers
+from canu.utils.ttp_parsers import compiled_parser, parse_text, parse_texts
+
+banner_template = "# CSM version:  {{ csm_version }}\n# CANU version: {{ canu_version }}"
+interface_template = """
+<group name="interfaces">
+interface {{ interface }}
+    lag {{ lag }}
+</group>
+"""
+banners = [
+    "banner exec\n# CSM version:  1.2\n# CANU version: 1.6.5\n",
+    "no banner",
+    "# CSM version:  1.3\n# CANU version: 1.7.0\n",
+]
+
+
+def fresh_result(template, text):
+    """Parse a text with a new ttp parser.
+
+    Args:
+        template: TTP template
+        text: Text to parse
+
+    Returns:
+        Result of the text
+    """
+    parser = ttp(data=text, template=template)
+    parser.parse()
+    return parser.result()[0][0]
+
+
+def test_parser_compiled_once(monkeypatch):
+    """Test that a template is compiled once and the parser is reused.
+
+    Args:
+        monkeypatch: built-in patcher
+    """
+    monkeypatch.setattr(ttp_parsers, "_parsers", {})
+    parser = compiled_parser(banner_template)
+    assert compiled_parser(banner_template) is parser
+
+    monkeypatch.setattr(ttp_parsers, "ttp", None)
+    assert parse_text(banner_template, banners[0]) == {"csm_version": "1.2", "canu_version": "1.6.5"}
+    assert parse_text(banner_template, banners[1]) == {}
+    assert parse_text(banner_template, "") == {}
+
+
+def test_parse_matches_fresh_parser():
+    """Test that a reused parser gives the same results as a new parser for each text."""
+    config = "interface 1/1/1\n    lag 1\ninterface 1/1/2\n    lag 2\n"
+    for text in (config, "interface 1/1/3", config):
+        assert parse_text(interface_template, text) == fresh_result(interface_template, text)
+    for text in banners:
+        assert parse_text(banner_template, text) == fresh_result(banner_template, text)
+
+
+def test_parse_texts_batch():
+    """Test that a batch of texts, with repeated texts, is parsed in order."""
+    expected = [fresh_result(banner_template, text) for text in banners]
+    assert parse_texts(banner_template, banners) == expected
+    assert parse_texts(banner_template, banners * 2) == expected * 2
+    assert parse_texts(banner_template, banners * 3, workers=2) == expected * 3
+    assert parse_texts(banner_template, []) == []
@@ -0,0 +1,98 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""Test the CANU switch vendor cache."""
+import json
+import time
+from unittest.mock import patch
+
+from click import testing
+
+from canu.cli import cli
+from canu.utils import vendor
+from canu.utils.vendor import cached_vendor, switch_vendor, update_vendor_cache
+
+ip = "192.168.1.1"
+credentials = {"username": "admin", "password": "admin"}
+runner = testing.CliRunner()
+
+
+@patch("canu.utils.vendor.check_aruba")
+def test_switch_vendor_cached(check_aruba, canu_cache_dir):
+    """Test that a detected vendor is written to disk and not probed again."""
+    check_aruba.return_value = True
+
+    assert switch_vendor(ip, credentials) == "aruba"
+    assert switch_vendor(ip, credentials) == "aruba"
+    assert check_aruba.call_count == 1
+
+    with open(canu_cache_dir / vendor.VENDOR_CACHE_FILE) as f:
+        assert json.load(f)["data"][ip]["vendor"] == "aruba"
+
+
+@patch("canu.utils.vendor.check_aruba")
+def test_switch_vendor_cache_expires(check_aruba):
+    """Test that a cached vendor older than the TTL is detected again."""
+    check_aruba.return_value = True
+    update_vendor_cache(ip, "aruba")
+
+    with patch("canu.utils.vendor.time.time", return_value=time.time() + vendor.VENDOR_CACHE_TTL + 1):
+        assert cached_vendor(ip) is None
+        switch_vendor(ip, credentials)
+    assert check_aruba.call_count == 1
+
+
+def test_switch_vendor_cache_system_mac_changed():
+    """Test that a new system MAC on the same IP replaces the cached switch."""
+    update_vendor_cache(ip, "aruba", {"system_mac": "aa:aa:aa:aa:aa:aa", "platform_name": "8325"})
+    update_vendor_cache(ip, "dell", {"system_mac": "bb:bb:bb:bb:bb:bb"})
+
+    assert cached_vendor(ip) == "dell"
+    assert "platform_name" not in vendor._load_vendor_cache()[ip]
+
+
+@patch("canu.report.switch.firmware.firmware.get_firmware_aruba")
+@patch("canu.utils.vendor.check_aruba")
+def test_switch_vendor_refresh_vendor(check_aruba, get_firmware_aruba):
+    """Test that '--refresh-vendor' ignores the cached vendor."""
+    check_aruba.return_value = True
+    get_firmware_aruba.return_value = (None, None)
+    update_vendor_cache(ip, "aruba")
+
+    for args in ([], ["--refresh-vendor"]):
+        runner.invoke(
+            cli,
+            [
+                "report",
+                "switch",
+                "firmware",
+                "--csm",
+                "1.2",
+                "--ip",
+                ip,
+                "--username",
+                credentials["username"],
+                "--password",
+                credentials["password"],
+                *args,
+            ],
+        )
+    assert check_aruba.call_count == 1
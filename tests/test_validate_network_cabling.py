@@ -96,6 +96,66 @@ def test_validate_cabling(netmiko_command, switch_vendor):
         assert "sw-spine-001 connects to 4 nodes:" in str(result.output)
 
 
+@patch("canu.report.switch.cabling.cabling.switch_vendor")
+@patch("canu.report.switch.cabling.cabling.netmiko_command")
+@responses.activate
+def test_validate_cabling_from_snapshot(netmiko_command, switch_vendor):
+    """Test that `canu validate network cabling --from-snapshot` reuses the last collection without polling."""
+    with runner.isolated_filesystem():
+        switch_vendor.return_value = "aruba"
+        netmiko_command.return_value = mac_address_table
+
+        responses.add(
+            responses.POST,
+            f"https://{ip}/rest/v10.04/login",
+        )
+        responses.add(
+            responses.GET,
+            f"https://{ip}/rest/v10.04/system?attributes=platform_name,hostname,system_mac",
+            json=switch_info1,
+        )
+        responses.add(
+            responses.GET,
+            f"https://{ip}/rest/v10.04/system/interfaces/*/lldp_neighbors?depth=2",
+            json=lldp_neighbors_json1,
+        )
+        responses.add(
+            responses.GET,
+            f"https://{ip}/rest/v10.04/system/vrfs/default/neighbors?depth=2",
+            json=arp_neighbors_json1,
+        )
+        responses.add(
+            responses.POST,
+            f"https://{ip}/rest/v10.04/logout",
+        )
+
+        command = [
+            "validate",
+            "network",
+            "cabling",
+            "--architecture",
+            architecture,
+            "--ips",
+            ips,
+            "--username",
+            username,
+            "--password",
+            password,
+        ]
+        live = runner.invoke(cli, command)
+        assert live.exit_code == 0
+        assert switch_vendor.call_count == 1
+
+        snapshot = runner.invoke(cli, [*command, "--from-snapshot"])
+        assert snapshot.exit_code == 0
+        assert switch_vendor.call_count == 1
+        assert snapshot.output == live.output
+
+        # A snapshot older than --max-age is ignored and the switch is polled again
+        runner.invoke(cli, [*command, "--from-snapshot", "--max-age", "0"])
+        assert switch_vendor.call_count == 2
+
+
 @patch("canu.report.switch.cabling.cabling.switch_vendor")
 @patch("canu.report.switch.cabling.cabling.netmiko_command")
 @responses.activate
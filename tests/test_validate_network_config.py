@@ -0,0 +1,191 @@
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""Test CANU validate network config commands."""
+import json
+import shutil
+from os import path
+from pathlib import Path
+from unittest.mock import patch
+
+from click import testing
+from netmiko import NetmikoTimeoutException
+
+from canu.cli import cli
+
+test_file_directory = Path(__file__).resolve().parent
+
+generated_folder = path.join(test_file_directory, "data", "golden_configs", "full_configs_1.7")
+sls_file = path.join(test_file_directory, "data", "sls_input_file_csm_1.2.json")
+username = "admin"
+password = "admin"
+runner = testing.CliRunner()
+
+
+def generated_config(hostname):
+    """Return the generated config of a switch."""
+    with open(path.join(generated_folder, f"{hostname}.cfg"), "r") as f:
+        return f.read()
+
+
+def running_folder():
+    """Copy the spine configs into a running config folder, with sw-spine-002 changed."""
+    Path("running").mkdir()
+    for hostname in ["sw-spine-001", "sw-spine-002"]:
+        shutil.copy(path.join(generated_folder, f"{hostname}.cfg"), "running")
+    with open(path.join("running", "sw-spine-002.cfg"), "a") as f:
+        f.write("nae-script abc\n")
+    with open(path.join("running", "sw-spine-009.cfg"), "w") as f:
+        f.write("hostname sw-spine-009\n")
+    return "running"
+
+
+def test_validate_network_config_running_folder():
+    """Test that the `canu validate network config` command compares a folder of running configs."""
+    with runner.isolated_filesystem():
+        result = runner.invoke(
+            cli,
+            [
+                "validate",
+                "network",
+                "config",
+                "--running",
+                running_folder(),
+                "--vendor",
+                "aruba",
+                "--generated",
+                generated_folder,
+                "--remediation",
+            ],
+        )
+        assert result.exit_code == 0
+        assert "Remediation Config for sw-spine-002\n\nno nae-script abc\n" in str(result.output)
+        assert "Pass                    sw-spine-001            aruba             0        0" in str(result.output)
+        assert "Fail                    sw-spine-002            aruba             0        1" in str(result.output)
+        assert "sw-spine-009    - No generated config sw-spine-009.cfg" in str(result.output)
+        assert "Pass - 1 switches" in str(result.output)
+        assert "Fail - 1 switches" in str(result.output)
+        assert "Error - 1 switches" in str(result.output)
+
+
+def test_validate_network_config_jobs():
+    """Test that comparing configs in parallel processes gives the same results as a serial run."""
+    with runner.isolated_filesystem():
+        folder = running_folder()
+        outputs = []
+        for jobs in ["1", "2"]:
+            result = runner.invoke(
+                cli,
+                [
+                    "validate",
+                    "network",
+                    "config",
+                    "--running",
+                    folder,
+                    "--vendor",
+                    "aruba",
+                    "--generated",
+                    generated_folder,
+                    "--jobs",
+                    jobs,
+                    "--json",
+                ],
+            )
+            assert result.exit_code == 0
+            outputs.append(json.loads(result.output))
+        assert outputs[0] == outputs[1]
+        assert outputs[0]["sw-spine-002"]["unified_diff"] == ["- nae-script abc"]
+        assert outputs[0]["sw-spine-002"]["remediation"] == ["no nae-script abc"]
+
+
+@patch("canu.validate.network.config.config.get_switch_config")
+def test_validate_network_config_ips(get_switch_config):
+    """Test that the `canu validate network config` command reads the running config of each switch."""
+    switch_configs = {
+        "192.168.1.1": ("sw-spine-001", generated_config("sw-spine-001"), "aruba"),
+        "192.168.1.2": ("sw-spine-002", generated_config("sw-spine-002").replace("vsx\n", "vsx\n    role primary\n"), "aruba"),
+        "192.168.1.3": (None, None, None),
+    }
+
+    def _get_switch_config(ip, credentials, return_error=False):
+        if ip == "192.168.1.4":
+            raise NetmikoTimeoutException
+        return switch_configs[ip]
+
+    get_switch_config.side_effect = _get_switch_config
+    with runner.isolated_filesystem():
+        result = runner.invoke(
+            cli,
+            [
+                "validate",
+                "network",
+                "config",
+                "--ips",
+                "192.168.1.1,192.168.1.2,192.168.1.3,192.168.1.4",
+                "--username",
+                username,
+                "--password",
+                password,
+                "--generated",
+                generated_folder,
+                "--json",
+            ],
+        )
+        assert result.exit_code == 0
+        switch_json = json.loads(result.output[result.output.index("{") :])
+        assert switch_json["sw-spine-001"]["status"] == "Pass"
+        assert switch_json["sw-spine-001"]["ip_address"] == "192.168.1.1"
+        assert switch_json["sw-spine-002"]["status"] == "Fail"
+        assert switch_json["192.168.1.3"] == {
+            "ip_address": "192.168.1.3",
+            "status": "Error",
+            "error": "Could not determine the vendor of the switch.",
+        }
+        assert switch_json["192.168.1.4"]["error"] == "Timeout error. Check the IP address and try again."
+
+
+@patch("canu.validate.network.config.config.get_switch_config")
+def test_validate_network_config_sls_file(get_switch_config):
+    """Test that the switches on the network of an SLS file are validated."""
+    get_switch_config.side_effect = lambda ip, credentials, return_error=False: (
+        "sw-spine-001",
+        generated_config("sw-spine-001"),
+        "aruba",
+    )
+    with runner.isolated_filesystem():
+        result = runner.invoke(
+            cli,
+            [
+                "validate",
+                "network",
+                "config",
+                "--sls-file",
+                sls_file,
+                "--password",
+                password,
+                "--generated",
+                generated_folder,
+            ],
+        )
+        assert result.exit_code == 0
+        ips = sorted(str(call.args[0]) for call in get_switch_config.call_args_list)
+        assert ips == sorted(f"192.168.0.{x}" for x in [2, 3, 4, 5, 6, 7, 12, 13, 14, 15, 16, 17])
+        assert "Pass - 12 switches" in str(result.output)
@@ -23,10 +23,13 @@
 import json
 from os import path
 from pathlib import Path
+from unittest.mock import patch
 
 from click import testing
 
 from canu.cli import cli
+from canu.validate.paddle.paddle import node_model_from_paddle
+from network_modeling.NetworkNodeFactory import NetworkNodeFactory, paddle_validator
 
 test_file_directory = Path(__file__).resolve().parent
 test_file_name = "Full_Architecture_Golden_Config_1.1.5.json"
@@ -215,3 +218,35 @@ bad_ccj = {
         },
     ],
 }
+
+
+def test_validate_paddle_cached_model():
+    """Test that a repeat load of the same CCJ skips validation and builds the nodes through the factory."""
+    with open(test_file) as f:
+        ccj_json = json.load(f)
+    factory = NetworkNodeFactory(architecture_version=ccj_json["architecture"])
+
+    cold_nodes, _ = node_model_from_paddle(factory, ccj_json)
+
+    warm_factory = NetworkNodeFactory(architecture_version=ccj_json["architecture"])
+    with patch.object(warm_factory, "validate_paddle") as mock_validate:
+        warm_nodes, warnings = node_model_from_paddle(warm_factory, ccj_json)
+        mock_validate.assert_not_called()
+
+    assert [node.serialize() for node in warm_nodes] == [node.serialize() for node in cold_nodes]
+    assert warm_nodes[0] is not cold_nodes[0]
+    assert len(warnings) == 0
+    # The factory counted the nodes it built
+    assert warm_factory.generate_node("spine").id() == factory.generate_node("spine").id()
+
+    # A changed CCJ is validated and built again
+    ccj_json["topology"][0]["location"]["rack"] = "x9999"
+    with patch.object(factory, "validate_paddle") as mock_validate:
+        changed_nodes, _ = node_model_from_paddle(factory, ccj_json)
+        mock_validate.assert_called_once()
+    assert changed_nodes[0].serialize()["location"]["rack"] == "x9999"
+
+
+def test_validate_paddle_validator_compiled_once():
+    """Test that the CCJ schema validator is compiled once and shared."""
+    assert paddle_validator() is paddle_validator()
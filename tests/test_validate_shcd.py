@@ -23,8 +23,10 @@
 import json
 from os import path
 from pathlib import Path
+from unittest.mock import patch
 
 from click import testing
+from openpyxl import load_workbook
 
 from canu.cli import cli
 
@@ -62,6 +64,37 @@ def test_validate_shcd():
         assert "sw-spine-002 connects to 17 nodes:" in str(result.output)
 
 
+def test_validate_shcd_cached():
+    """Test that a repeat `canu validate shcd` run reads the unchanged SHCD from the cache."""
+    args = [
+        "validate",
+        "shcd",
+        "--architecture",
+        architecture,
+        "--shcd",
+        test_file,
+        "--tabs",
+        tabs,
+        "--corners",
+        corners,
+    ]
+    with runner.isolated_filesystem():
+        first = runner.invoke(cli, args)
+        assert first.exit_code == 0
+
+        with patch("canu.validate.shcd.shcd.load_workbook") as mock_load_workbook:
+            second = runner.invoke(cli, args)
+            mock_load_workbook.assert_not_called()
+        assert second.exit_code == 0
+        assert second.output == first.output
+
+        # Different corners are a different table and read the workbook again
+        with patch("canu.validate.shcd.shcd.load_workbook", wraps=load_workbook) as mock_load_workbook:
+            third = runner.invoke(cli, args[:-1] + ["I14,S30"])
+            mock_load_workbook.assert_called_once()
+        assert third.exit_code == 0
+
+
 def test_validate_shcd_full():
     """Test that the `canu validate shcd` command runs and returns valid cabling with '--architecture full' flag."""
     full_architecture = "full"
@@ -397,6 +430,22 @@ def test_validate_shcd_json():
         assert result_json["topology"][-1]["location"]["elevation"] == "u13"
 
 
+def test_validate_shcd_ndjson():
+    """Test that the `canu validate shcd` command streams the same model as newline delimited JSON."""
+    with runner.isolated_filesystem():
+        args = ["validate", "shcd", "--architecture", architecture, "--shcd", test_file, "--tabs", tabs, "--corners", corners]
+        result_json = json.loads(runner.invoke(cli, args + ["--json"]).output)
+        result = runner.invoke(cli, args + ["--ndjson"])
+        assert result.exit_code == 0
+
+        lines = [json.loads(line) for line in result.output.splitlines()]
+        header = dict(result_json)
+        topology = header.pop("topology")
+        assert lines[0]["shcd_file"] == header["shcd_file"]
+        assert lines[0].keys() == header.keys()
+        assert lines[1:] == topology
+
+
 def test_validate_shcd_vi():
     """Test that the `canu validate shcd` command runs and returns valid cabling for Dell and Mellanox V1 arch."""
     architecture_v1 = "v1"